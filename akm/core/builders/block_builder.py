@@ -10,16 +10,26 @@ from dataclasses import dataclass
 from akm.core.models.block import Block
 from akm.core.models.transaction import Transaction
 from akm.core.config.consensus_config import ConsensusConfig
+from akm.core.builders.block_template import BlockTemplate
+from akm.core.builders.mining_engine import MiningEngine
 
 # Servicios
 from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
 from akm.core.services.block_hasher import BlockHasher
+from akm.core.services.mining_hasher import MiningHasher
+from akm.core.services.mining_telemetry import MiningTelemetry
 from akm.core.utils.difficulty_utils import DifficultyUtils
 
 logger = logging.getLogger(__name__)
 
 class BlockBuilder:
 
+    # Nonces entre consultas a interrupt_event en el minado en proceso
+    INTERRUPT_CHECK_INTERVAL = 4096
+
+    # Segundos entre logs de hashrate durante una ronda larga
+    HASHRATE_LOG_INTERVAL = 30
+
     @dataclass
     class _MiningCandidate:
         index: int
@@ -56,6 +66,9 @@ class BlockBuilder:
                 merkle_root=merkle_root
             )
 
+            # Prefijo serializado una sola vez; por nonce solo cambian 4 bytes
+            hasher = MiningHasher(BlockHasher.serialize_prefix(candidate), target)
+
             nonce = 0
             start_time = time.time()
 
@@ -65,17 +78,19 @@ class BlockBuilder:
                     logger.info(f"Minería interrumpida en bloque #{index}.")
                     return None  
 
-                candidate.nonce = nonce
-                block_hash = BlockHasher.calculate(candidate)
-                
-                if int(block_hash, 16) <= target:
+                chunk_end = min(nonce + BlockBuilder.INTERRUPT_CHECK_INTERVAL, max_nonce + 1)
+                found = hasher.scan(nonce, chunk_end)
+
+                if found is not None:
+                    candidate.nonce = found
+                    block_hash = BlockHasher.calculate(candidate)
                     elapsed = time.time() - start_time
-                    hash_power = nonce / elapsed if elapsed > 0 else 0
+                    hash_power = (found + 1) / elapsed if elapsed > 0 else 0
 
                     logger.info(
                         f"Bloque #{index} minado. "
                         f"Hash: {block_hash[:10]}... | "
-                        f"Nonce: {nonce} | "
+                        f"Nonce: {found} | "
                         f"Vel: {hash_power:.0f} h/s"
                     )
                     
@@ -85,16 +100,132 @@ class BlockBuilder:
                         previous_hash=previous_hash,
                         bits=bits,
                         merkle_root=merkle_root,
-                        nonce=nonce,
+                        nonce=found,
                         block_hash=block_hash,
                         transactions=transactions
                     )
 
-                nonce += 1
+                nonce = chunk_end
             
             logger.info(f"Minería fallida: Rango de nonce agotado en bloque #{index}.")
             return None
 
         except Exception:
             logger.exception(f"Bug detectado en el constructor del bloque #{index}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def build_from_template(
+        template: BlockTemplate,
+        interrupt_event: Optional[threading.Event] = None,
+        batch_size: int = 50_000,
+        engine: Optional[MiningEngine] = None,
+        telemetry: Optional[MiningTelemetry] = None
+    ) -> Optional[Block]:
+        """
+        Minado sobre una plantilla viva. Cada lote de nonces (batch_size por
+        proceso) se delega al motor de minado; entre lotes se consulta la
+        versión de la plantilla: si llegó una TX nueva (o salió alguna) se
+        cambia el contenido del header en caliente sin abandonar la ronda.
+        Al agotar el nonce se rota el extra-nonce de la coinbase: la ronda
+        solo termina con un bloque válido o con interrupt_event.
+        La telemetría (si se provee) se actualiza una vez por lote.
+        """
+        index = template.index
+        try:
+            config = ConsensusConfig()
+            max_nonce = config.max_nonce
+            engine = engine or MiningEngine(threads=1)
+
+            snapshot = template.snapshot()
+            target = DifficultyUtils.bits_to_target(snapshot.bits)
+
+            logger.info(
+                f"Minería iniciada: Bloque #{index} (Diff: {snapshot.bits}) | "
+                f"TXs: {len(snapshot.transactions)} | Procesos: {engine.threads}"
+            )
+
+            candidate = BlockBuilder._MiningCandidate(
+                index=index,
+                timestamp=int(time.time()),
+                previous_hash=snapshot.previous_hash,
+                bits=snapshot.bits,
+                merkle_root=snapshot.merkle_root
+            )
+            prefix = BlockHasher.serialize_prefix(candidate)
+
+            nonce = 0
+            hashes_before = engine.total_hashes
+            start_time = time.time()
+            last_log = start_time
+            if telemetry:
+                telemetry.record_round_started(index, template.created_at)
+
+            while True:
+                if nonce > max_nonce:
+                    # Rango de 32 bits agotado: extra-nonce + timestamp nuevos, sin salir del bucle
+                    snapshot = template.roll_extra_nonce()
+                    candidate.merkle_root = snapshot.merkle_root
+                    candidate.timestamp = int(time.time())
+                    prefix = BlockHasher.serialize_prefix(candidate)
+                    nonce = 0
+                    logger.info(f"Rango de nonce agotado en bloque #{index}: extra-nonce {template.extra_nonce}.")
+
+                batch_end = min(nonce + batch_size * engine.threads, max_nonce + 1)
+                batch_hashes_before = engine.total_hashes
+                batch_start = time.perf_counter()
+                found = engine.search(prefix, target, nonce, batch_end, interrupt_event)
+                if telemetry:
+                    telemetry.record_batch(engine.total_hashes - batch_hashes_before, time.perf_counter() - batch_start)
+
+                if interrupt_event and interrupt_event.is_set():
+                    logger.info(f"Minería interrumpida en bloque #{index}.")
+                    if telemetry:
+                        telemetry.record_round_interrupted()
+                    return None
+
+                if found is not None:
+                    candidate.nonce = found
+                    block_hash = BlockHasher.calculate(candidate)
+
+                    elapsed = time.time() - start_time
+                    hashes_done = engine.total_hashes - hashes_before
+                    hash_power = hashes_done / elapsed if elapsed > 0 else 0
+
+                    logger.info(
+                        f"Bloque #{index} minado. "
+                        f"Hash: {block_hash[:10]}... | "
+                        f"Nonce: {found} | "
+                        f"Vel: {hash_power:.0f} h/s ({engine.threads} procesos)"
+                    )
+
+                    return Block(
+                        index=index,
+                        timestamp=candidate.timestamp,
+                        previous_hash=candidate.previous_hash,
+                        bits=candidate.bits,
+                        merkle_root=candidate.merkle_root,
+                        nonce=found,
+                        block_hash=block_hash,
+                        transactions=list(snapshot.transactions)
+                    )
+
+                nonce = batch_end
+
+                now = time.time()
+                if now - last_log >= BlockBuilder.HASHRATE_LOG_INTERVAL:
+                    last_log = now
+                    logger.info(f"⛏️ Bloque #{index}: {engine.hashrate:.0f} h/s | Nonce {nonce:,}")
+
+                # Intercambio de plantilla entre lotes (sin reiniciar la ronda)
+                if template.version != snapshot.version:
+                    snapshot = template.snapshot()
+                    candidate.merkle_root = snapshot.merkle_root
+                    candidate.timestamp = int(time.time())
+                    prefix = BlockHasher.serialize_prefix(candidate)
+                    nonce = 0
+                    logger.debug(f"Plantilla #{index} actualizada (v{snapshot.version}) | TXs: {len(snapshot.transactions)}")
+
+        except Exception:
+            logger.exception(f"Bug detectado en el constructor del bloque #{index}")
+            return None
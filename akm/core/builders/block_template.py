@@ -0,0 +1,258 @@
+# akm/core/builders/block_template.py
+
+import time
+import heapq
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+# Modelos
+from akm.core.models.block import Block
+from akm.core.models.transaction import Transaction
+
+# Servicios
+from akm.core.factories.transaction_factory import TransactionFactory
+from akm.core.services.merkle_tree import MerkleTree
+
+logger = logging.getLogger(__name__)
+
+class BlockTemplate:
+    """
+    Plantilla viva del próximo bloque a minar.
+    Se mantiene al día con los eventos del Mempool (altas/bajas) sin reconstruirse:
+    la selección por comisión, la suma de fees y la raíz Merkle se actualizan
+    de forma incremental. El minero consulta 'version' entre lotes de nonces.
+    """
+
+    @dataclass(frozen=True)
+    class Snapshot:
+        version: int
+        index: int
+        previous_hash: str
+        bits: str
+        merkle_root: str
+        transactions: Tuple[Transaction, ...]
+        extra_nonce: int
+
+    def __init__(
+        self,
+        index: int,
+        previous_hash: str,
+        bits: str,
+        miner_address: str,
+        subsidy: int,
+        max_tx_count: int,
+        transactions: List[Transaction]
+    ) -> None:
+        self._index = index
+        self._previous_hash = previous_hash
+        self._bits = bits
+        self._miner_address = miner_address
+        self._subsidy = subsidy
+        self._max_tx_count = max_tx_count
+        self._created_at = time.time()
+        self._lock = threading.Lock()
+
+        # Slots de TXs (sin coinbase). La hoja Merkle del slot i es la i+1.
+        self._txs: List[Transaction] = []
+        self._slot_by_hash: Dict[str, int] = {}
+        self._fee_heap: List[Tuple[int, str]] = []
+        self._total_fees = 0
+        self._version = 0
+        self._extra_nonce = 0
+
+        # Pre-validación en segundo plano: versión y TXs (sin coinbase) ya verificadas
+        self._validated_version = -1
+        self._validated_tx_hashes: Optional[Tuple[str, ...]] = None
+        self._validated_reward = 0
+
+        for tx in transactions[:max_tx_count]:
+            if tx.tx_hash in self._slot_by_hash:
+                continue
+            self._slot_by_hash[tx.tx_hash] = len(self._txs)
+            self._txs.append(tx)
+            heapq.heappush(self._fee_heap, (tx.fee, tx.tx_hash))
+            self._total_fees += tx.fee
+
+        self._coinbase = self._build_coinbase()
+        self._coinbase_dirty = False
+        self._merkle = MerkleTree.from_hashes([self._coinbase.tx_hash] + [tx.tx_hash for tx in self._txs])
+
+    # --- Getters ---
+    @property
+    def index(self) -> int: return self._index
+    @property
+    def previous_hash(self) -> str: return self._previous_hash
+    @property
+    def bits(self) -> str: return self._bits
+    @property
+    def miner_address(self) -> str: return self._miner_address
+    @property
+    def created_at(self) -> float: return self._created_at
+    @property
+    def version(self) -> int: return self._version
+    @property
+    def extra_nonce(self) -> int: return self._extra_nonce
+
+    @property
+    def total_fees(self) -> int:
+        with self._lock:
+            return self._total_fees
+
+    @property
+    def tx_count(self) -> int:
+        with self._lock:
+            return len(self._txs)
+
+    @property
+    def is_validated(self) -> bool:
+        """True si el contenido vigente (versión actual) ya pasó la pre-validación."""
+        with self._lock:
+            return self._validated_version == self._version
+
+    # --- Pre-validación ---
+
+    def mark_validated(self, snapshot: 'BlockTemplate.Snapshot') -> None:
+        """Marca de confianza: el contenido de esa fotografía cumple las reglas de bloque."""
+        with self._lock:
+            self._validated_version = snapshot.version
+            self._validated_tx_hashes = tuple(tx.tx_hash for tx in snapshot.transactions[1:])
+            self._validated_reward = BlockTemplate._reward_of(snapshot.transactions[0])
+
+    def matches_validated(self, block: Block) -> bool:
+        """
+        ¿El bloque (propio) se armó con un contenido pre-validado de esta plantilla?
+        La coinbase puede diferir solo en el extra-nonce: misma altura y mismas fees.
+        """
+        with self._lock:
+            validated = self._validated_tx_hashes
+            reward = self._validated_reward
+            if validated is None or not block.transactions:
+                return False
+            if block.previous_hash != self._previous_hash or block.index != self._index or block.bits != self._bits:
+                return False
+        if BlockTemplate._reward_of(block.transactions[0]) != reward:
+            return False
+        return tuple(tx.tx_hash for tx in block.transactions[1:]) == validated
+
+    # --- Eventos del Mempool ---
+
+    def add_transaction(self, tx: Transaction) -> bool:
+        """
+        Incorpora una TX recién admitida. Si la plantilla está llena,
+        desplaza a la TX de menor comisión solo si la nueva paga más.
+        """
+        leaf = MerkleTree.to_digest(tx.tx_hash)
+        with self._lock:
+            if tx.tx_hash in self._slot_by_hash:
+                return False
+
+            if len(self._txs) < self._max_tx_count:
+                slot = len(self._txs)
+                self._txs.append(tx)
+                self._merkle.append_leaf(leaf)
+            else:
+                cheapest = self._peek_cheapest()
+                if cheapest is None or tx.fee <= self._txs[cheapest].fee:
+                    return False
+
+                evicted = self._txs[cheapest]
+                del self._slot_by_hash[evicted.tx_hash]
+                self._total_fees -= evicted.fee
+
+                slot = cheapest
+                self._txs[slot] = tx
+                self._merkle.set_leaf(slot + 1, leaf)
+
+            self._slot_by_hash[tx.tx_hash] = slot
+            heapq.heappush(self._fee_heap, (tx.fee, tx.tx_hash))
+            self._total_fees += tx.fee
+            self._coinbase_dirty = True
+            self._version += 1
+            return True
+
+    def remove_transactions(self, txs: List[Transaction]) -> int:
+        """Retira TXs (minadas o expulsadas). El último slot ocupa el hueco: O(log n)."""
+        removed = 0
+        with self._lock:
+            for tx in txs:
+                slot = self._slot_by_hash.pop(tx.tx_hash, None)
+                if slot is None:
+                    continue
+
+                self._total_fees -= self._txs[slot].fee
+                last = len(self._txs) - 1
+                if slot != last:
+                    moved = self._txs[last]
+                    self._txs[slot] = moved
+                    self._slot_by_hash[moved.tx_hash] = slot
+                    self._merkle.set_leaf(slot + 1, MerkleTree.to_digest(moved.tx_hash))
+
+                self._txs.pop()
+                self._merkle.pop_leaf()
+                removed += 1
+
+            if removed:
+                self._coinbase_dirty = True
+                self._version += 1
+        return removed
+
+    # --- Lectura para el minero ---
+
+    def snapshot(self) -> 'BlockTemplate.Snapshot':
+        """Fotografía consistente (header + TXs) para el bucle de nonces."""
+        with self._lock:
+            return self._snapshot_locked()
+
+    def roll_extra_nonce(self) -> 'BlockTemplate.Snapshot':
+        """
+        Espacio de nonces agotado: nuevo extra-nonce en la coinbase.
+        Solo cambia la hoja 0, así que se recalcula únicamente la rama
+        izquierda del Árbol de Merkle (O(log n)). La versión no cambia:
+        el contenido de TXs sigue siendo el mismo.
+        """
+        with self._lock:
+            self._extra_nonce += 1
+            self._coinbase_dirty = True
+            return self._snapshot_locked()
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _snapshot_locked(self) -> 'BlockTemplate.Snapshot':
+        if self._coinbase_dirty:
+            self._coinbase = self._build_coinbase()
+            self._merkle.set_leaf(0, MerkleTree.to_digest(self._coinbase.tx_hash))
+            self._coinbase_dirty = False
+
+        return BlockTemplate.Snapshot(
+            version=self._version,
+            index=self._index,
+            previous_hash=self._previous_hash,
+            bits=self._bits,
+            merkle_root=self._merkle.root_hex,
+            transactions=(self._coinbase, *self._txs),
+            extra_nonce=self._extra_nonce
+        )
+
+    @staticmethod
+    def _reward_of(coinbase: Transaction) -> int:
+        return sum(out.value_alba for out in coinbase.outputs)
+
+    def _build_coinbase(self) -> Transaction:
+        return TransactionFactory.create_coinbase(
+            miner_address=self._miner_address,
+            block_height=self._index,
+            total_reward=self._subsidy + self._total_fees,
+            extra_nonce=str(self._extra_nonce) if self._extra_nonce else ""
+        )
+
+    def _peek_cheapest(self) -> Optional[int]:
+        # Borrado perezoso: descartamos entradas del heap que ya no ocupan slot
+        while self._fee_heap:
+            fee, tx_hash = self._fee_heap[0]
+            slot = self._slot_by_hash.get(tx_hash)
+            if slot is not None and self._txs[slot].fee == fee:
+                return slot
+            heapq.heappop(self._fee_heap)
+        return None
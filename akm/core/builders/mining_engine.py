@@ -0,0 +1,262 @@
+# akm/core/builders/mining_engine.py
+
+import os
+import time
+import queue
+import logging
+import threading
+import multiprocessing as mp
+from typing import Any, List, Optional, Tuple
+
+from akm.core.services.mining_hasher import MiningHasher
+
+logger = logging.getLogger(__name__)
+
+# Por defecto, cada cuántos nonces un worker revisa si su trabajo sigue vigente
+CHECK_INTERVAL = 4096
+
+# Intervalo con el que el hilo principal vigila interrupt_event y resultados
+POLL_INTERVAL_SEC = 0.005
+
+def _scan_range(
+    prefix: bytes,
+    target: int,
+    start: int,
+    end: int,
+    job_id: int,
+    current_job: Any,
+    counters: Any,
+    slot: int,
+    check_interval: int = CHECK_INTERVAL
+) -> Optional[int]:
+    """
+    Recorre [start, end) sobre el prefijo fijo del header (todo menos el nonce).
+    Se abandona en cuanto 'current_job' deja de ser el trabajo asignado.
+    """
+    hasher = MiningHasher(prefix, target)
+
+    nonce = start
+    while nonce < end:
+        if current_job.value != job_id:
+            return None
+
+        chunk_end = min(nonce + check_interval, end)
+        found = hasher.scan(nonce, chunk_end)
+        if found is not None:
+            counters[slot] += found - nonce + 1
+            return found
+
+        counters[slot] += chunk_end - nonce
+        nonce = chunk_end
+
+    return None
+
+def _worker_main(slot: int, jobs: Any, results: Any, current_job: Any, counters: Any) -> None:
+    """Bucle de un proceso de minado: espera rangos de nonces hasta recibir None."""
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+
+        job_id, prefix, target, start, end, check_interval = job
+        if current_job.value != job_id:
+            continue
+
+        nonce = _scan_range(prefix, target, start, end, job_id, current_job, counters, slot, check_interval)
+        if current_job.value == job_id:
+            results.put((job_id, nonce))
+
+class MiningEngine:
+    """
+    Motor de búsqueda de nonces multiproceso (el bucle en un solo hilo queda
+    atado al GIL). El espacio de nonces de cada lote se reparte en rangos
+    contiguos entre N procesos persistentes; todos reciben el mismo prefijo fijo
+    del header y solo varían los 4 bytes del nonce.
+
+    Cancelación: un contador compartido identifica el trabajo vigente. Al
+    interrumpir (o al hallar un nonce) se invalida y cada worker lo detecta en
+    su siguiente chequeo (cada 'check_interval' nonces, milisegundos).
+    """
+
+    def __init__(self, threads: Optional[int] = None, check_interval: int = CHECK_INTERVAL) -> None:
+        self._threads = max(1, threads if threads and threads > 0 else (os.cpu_count() or 1))
+        self._check_interval = max(1, check_interval)
+        self._lock = threading.Lock()
+        self._workers: List[Any] = []
+        self._job_queues: List[Any] = []
+        self._results: Any = None
+        self._current_job: Any = None
+        self._counters: Any = None
+        self._next_job_id = 0
+        self._local_hashes = 0
+        self._hashrate = 0.0
+
+    @property
+    def threads(self) -> int: return self._threads
+    @property
+    def check_interval(self) -> int: return self._check_interval
+    @property
+    def hashrate(self) -> float: return self._hashrate
+
+    @property
+    def total_hashes(self) -> int:
+        """Hashes acumulados por todos los workers desde la creación del motor."""
+        counters = self._counters
+        shared = sum(counters[:]) if counters is not None else 0
+        return self._local_hashes + shared
+
+    def search(
+        self,
+        prefix: bytes,
+        target: int,
+        start_nonce: int,
+        end_nonce: int,
+        interrupt_event: Optional[threading.Event] = None
+    ) -> Optional[int]:
+        """
+        Busca un nonce en [start_nonce, end_nonce) cuyo doble SHA-256 sea <= target.
+        Devuelve None si el rango se agota o si 'interrupt_event' se activa.
+        """
+        if end_nonce <= start_nonce:
+            return None
+
+        with self._lock:
+            hashes_before = self.total_hashes
+            start_time = time.perf_counter()
+
+            if self._threads == 1:
+                found = self._search_local(prefix, target, start_nonce, end_nonce, interrupt_event)
+            else:
+                found = self._search_parallel(prefix, target, start_nonce, end_nonce, interrupt_event)
+
+            elapsed = time.perf_counter() - start_time
+            if elapsed > 0:
+                self._hashrate = (self.total_hashes - hashes_before) / elapsed
+            return found
+
+    def shutdown(self) -> None:
+        """Detiene los procesos de minado (Ej: al cerrar el nodo)."""
+        with self._lock:
+            if not self._workers:
+                return
+
+            self._current_job.value = -1
+            self._local_hashes += sum(self._counters[:])
+            self._counters = None
+            for jobs in self._job_queues:
+                jobs.put(None)
+            for worker in self._workers:
+                worker.join(timeout=1)
+                if worker.is_alive():
+                    worker.terminate()
+
+            self._workers = []
+            self._job_queues = []
+            logger.info("Procesos de minado detenidos.")
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _search_local(
+        self,
+        prefix: bytes,
+        target: int,
+        start: int,
+        end: int,
+        interrupt_event: Optional[threading.Event]
+    ) -> Optional[int]:
+        hasher = MiningHasher(prefix, target)
+
+        nonce = start
+        while nonce < end:
+            if interrupt_event and interrupt_event.is_set():
+                return None
+
+            chunk_end = min(nonce + self._check_interval, end)
+            found = hasher.scan(nonce, chunk_end)
+            if found is not None:
+                self._local_hashes += found - nonce + 1
+                return found
+
+            self._local_hashes += chunk_end - nonce
+            nonce = chunk_end
+
+        return None
+
+    def _search_parallel(
+        self,
+        prefix: bytes,
+        target: int,
+        start: int,
+        end: int,
+        interrupt_event: Optional[threading.Event]
+    ) -> Optional[int]:
+        self._ensure_workers()
+
+        self._next_job_id += 1
+        job_id = self._next_job_id
+        self._current_job.value = job_id
+
+        ranges = self._split_range(start, end)
+        for slot, (range_start, range_end) in enumerate(ranges):
+            self._job_queues[slot].put((job_id, prefix, target, range_start, range_end, self._check_interval))
+
+        pending = len(ranges)
+        found: Optional[int] = None
+        try:
+            while pending:
+                if interrupt_event and interrupt_event.is_set():
+                    break
+
+                try:
+                    result_job, nonce = self._results.get(timeout=POLL_INTERVAL_SEC)
+                except queue.Empty:
+                    continue
+
+                # Resultados de trabajos ya cancelados se descartan
+                if result_job != job_id:
+                    continue
+
+                pending -= 1
+                if nonce is not None:
+                    found = nonce
+                    break
+        finally:
+            # Invalida el trabajo: los workers que sigan buscando lo abandonan
+            self._current_job.value = 0
+
+        return found
+
+    def _split_range(self, start: int, end: int) -> List[Tuple[int, int]]:
+        total = end - start
+        workers = min(self._threads, total)
+        step = total // workers
+        ranges: List[Tuple[int, int]] = []
+        for i in range(workers):
+            range_start = start + i * step
+            range_end = end if i == workers - 1 else range_start + step
+            ranges.append((range_start, range_end))
+        return ranges
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+
+        # 'spawn': el nodo ya tiene hilos (P2P, API); fork podría heredar candados tomados
+        ctx = mp.get_context("spawn")
+        self._results = ctx.Queue()
+        self._current_job = ctx.Value('q', 0, lock=False)
+        self._counters = ctx.Array('Q', self._threads, lock=False)
+
+        for slot in range(self._threads):
+            jobs = ctx.Queue()
+            worker = ctx.Process(
+                target=_worker_main,
+                args=(slot, jobs, self._results, self._current_job, self._counters),
+                name=f"akm-miner-{slot}",
+                daemon=True
+            )
+            worker.start()
+            self._job_queues.append(jobs)
+            self._workers.append(worker)
+
+        logger.info(f"⛏️ Motor de minado: {self._threads} procesos iniciados.")
@@ -28,6 +28,18 @@ class ConsensusConfig:
         self._genesis_exponent = int(os.getenv("AKM_GENESIS_EXPONENT", 0x20))
         
         self._mempool_max_size = int(os.getenv("AKM_MEMPOOL_MAX", 5000))
+        self._validation_cache_size = int(os.getenv("AKM_VALIDATION_CACHE_MAX", 50_000))
+        self._signature_cache_size = int(os.getenv("AKM_SIG_CACHE_MAX", 100_000))
+        # Procesos para verificar firmas de bloques (0 = uno por núcleo, 1 = en línea)
+        self._script_verify_workers = int(os.getenv("AKM_SCRIPT_WORKERS", 0))
+        # Verificación de firmas: "auto" (el más rápido instalado), "ecdsa" (referencia) u "openssl"
+        self._signature_backend = os.getenv("AKM_SIG_BACKEND", "auto").lower()
+        # Pipeline de Sync: cola por etapa (0 = bloque a bloque), bloques por commit e hilos para Merkle/integridad
+        self._sync_pipeline_depth = int(os.getenv("AKM_SYNC_PIPELINE_DEPTH", 16))
+        self._sync_commit_batch = int(os.getenv("AKM_SYNC_COMMIT_BATCH", 64))
+        self._sync_workers = int(os.getenv("AKM_SYNC_WORKERS", 2))
+        self._orphan_pool_max = int(os.getenv("AKM_ORPHAN_MAX", 100))
+        self._orphan_per_peer_max = int(os.getenv("AKM_ORPHAN_PER_PEER", 20))
         self._max_block_size_bytes = int(os.getenv("AKM_MAX_BLOCK_SIZE", 1_000_000))
         self._max_nonce = int(os.getenv("AKM_MAX_NONCE", 4294967295))
         
@@ -55,6 +67,24 @@ class ConsensusConfig:
     @property
     def mempool_max_size(self) -> int: return self._mempool_max_size
     @property
+    def validation_cache_size(self) -> int: return self._validation_cache_size
+    @property
+    def signature_cache_size(self) -> int: return self._signature_cache_size
+    @property
+    def script_verify_workers(self) -> int: return self._script_verify_workers
+    @property
+    def signature_backend(self) -> str: return self._signature_backend
+    @property
+    def sync_pipeline_depth(self) -> int: return self._sync_pipeline_depth
+    @property
+    def sync_commit_batch(self) -> int: return self._sync_commit_batch
+    @property
+    def sync_workers(self) -> int: return self._sync_workers
+    @property
+    def orphan_pool_max(self) -> int: return self._orphan_pool_max
+    @property
+    def orphan_per_peer_max(self) -> int: return self._orphan_per_peer_max
+    @property
     def max_block_size_bytes(self) -> int: return self._max_block_size_bytes
     @property
     def max_nonce(self) -> int: return self._max_nonce
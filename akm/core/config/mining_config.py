@@ -7,15 +7,36 @@ class MiningConfig:
     """
     def __init__(self):
         self._default_miner_address = os.getenv("AKM_MINER_ADDRESS", "")
-        self._mining_threads = int(os.getenv("AKM_MINING_THREADS", 1))
+        # 0 o sin definir: un proceso de minado por núcleo
+        self._mining_threads = self._resolve_threads(int(os.getenv("AKM_MINING_THREADS", 0)))
         self._coinbase_message = os.getenv("AKM_COINBASE_MSG", "Mined by AKM")
 
+        # Lote de nonces por proceso entre consultas de plantilla/telemetría,
+        # y cada cuántos nonces se revisa la interrupción
+        self._batch_size = int(os.getenv("AKM_MINING_BATCH_SIZE", 50_000))
+        self._check_interval = int(os.getenv("AKM_MINING_CHECK_INTERVAL", 4096))
+
+        # Work Server local (0 = deshabilitado)
+        self._work_server_host = os.getenv("AKM_WORK_SERVER_HOST", "127.0.0.1")
+        self._work_server_port = int(os.getenv("AKM_WORK_SERVER_PORT", 0))
+        self._work_share_bits = os.getenv("AKM_WORK_SHARE_BITS", "")
+
     @property
     def default_miner_address(self) -> str: return self._default_miner_address
     @property
     def mining_threads(self) -> int: return self._mining_threads
     @property
     def coinbase_message(self) -> str: return self._coinbase_message
+    @property
+    def batch_size(self) -> int: return self._batch_size
+    @property
+    def check_interval(self) -> int: return self._check_interval
+    @property
+    def work_server_host(self) -> str: return self._work_server_host
+    @property
+    def work_server_port(self) -> int: return self._work_server_port
+    @property
+    def work_share_bits(self) -> str: return self._work_share_bits
 
     def update_from_dict(self, data: Dict[str, Any]) -> None:
         """
@@ -30,4 +51,17 @@ class MiningConfig:
             self._coinbase_message = str(data["coinbase_message"])
             
         if "threads" in data: 
-            self._mining_threads = int(data["threads"])
\ No newline at end of file
+            self._mining_threads = self._resolve_threads(int(data["threads"]))
+
+        if "batch_size" in data:
+            self._batch_size = int(data["batch_size"])
+
+        if "check_interval" in data:
+            self._check_interval = int(data["check_interval"])
+
+        if "work_server_port" in data:
+            self._work_server_port = int(data["work_server_port"])
+
+    @staticmethod
+    def _resolve_threads(threads: int) -> int:
+        return threads if threads > 0 else (os.cpu_count() or 1)
\ No newline at end of file
@@ -50,4 +50,17 @@ class ProtocolConstants:
     
     # --- Protocolo de Verificación de Pagos (Merkle) ---
     MSG_GET_MERKLE_PROOF: Final[str] = "GET_MERKLE_PROOF"
-    MSG_MERKLE_PROOF: Final[str]     = "MERKLE_PROOF"
\ No newline at end of file
+    MSG_MERKLE_PROOF: Final[str]     = "MERKLE_PROOF"
+
+    # --- Protocolo de Estimación de Comisiones (Wallets) ---
+    MSG_GET_FEE_ESTIMATE: Final[str] = "GET_FEE_ESTIMATE"
+    MSG_FEE_ESTIMATE: Final[str]     = "FEE_ESTIMATE"
+
+    # ==========================================================================
+    # 4. PROTOCOLO DE TRABAJO (Work Server local, estilo Stratum)
+    # ==========================================================================
+    MSG_WORK_SUBSCRIBE: Final[str] = "WORK_SUBSCRIBE"  # Worker se registra y pide trabajo
+    MSG_WORK_GET: Final[str]       = "WORK_GET"        # Worker agotó su rango de nonces
+    MSG_WORK_JOB: Final[str]       = "WORK_JOB"        # Servidor entrega una unidad de trabajo
+    MSG_WORK_SUBMIT: Final[str]    = "WORK_SUBMIT"     # Worker envía un share
+    MSG_WORK_RESULT: Final[str]    = "WORK_RESULT"     # Servidor acepta/rechaza el share
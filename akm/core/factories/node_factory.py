@@ -7,19 +7,28 @@ from typing import Dict, Any, cast, Union
 from akm.core.config.consensus_config import ConsensusConfig
 from akm.core.config.network_config import NetworkConfig
 from akm.core.config.mining_config import MiningConfig
+from akm.core.config.protocol_constants import ProtocolConstants
 
 # Infraestructura
 from akm.infra.persistence.repository_factory import RepositoryFactory
 from akm.infra.network.p2p_service import P2PService
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
 
 # Gestores
 from akm.core.managers.gossip_manager import GossipManager
 from akm.core.managers.utxo_set import UTXOSet
 from akm.core.services.mempool import Mempool
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.signature_batch_verifier import SignatureBatchVerifier
+from akm.core.services.signature_cache import SignatureCache
+from akm.core.services.fee_estimator import FeeEstimator
+from akm.core.services.orphan_pool import OrphanPool
 from akm.core.managers.chain_reorg_manager import ChainReorgManager
 from akm.core.validators.block_rules_validator import BlockRulesValidator
 from akm.core.managers.consensus_orchestrator import ConsensusOrchestrator
+from akm.core.managers.block_sync_pipeline import BlockSyncPipeline
 from akm.core.managers.mining_manager import MiningManager
+from akm.core.builders.mining_engine import MiningEngine
 
 # Lógica Pura
 from akm.core.consensus.difficulty_adjuster import DifficultyAdjuster
@@ -107,7 +116,10 @@ class NodeFactory:
                 utxo_set=cast(UTXOSet, deps['utxo_set']),
                 mempool=cast(Mempool, deps['mempool']),
                 consensus=cast(ConsensusOrchestrator, deps['consensus']),
-                reorg_manager=cast(ChainReorgManager, deps['reorg'])
+                reorg_manager=cast(ChainReorgManager, deps['reorg']),
+                validation_cache=cast(ValidationCache, deps['validation_cache']),
+                fee_estimator=cast(FeeEstimator, deps['fee_estimator']),
+                orphan_pool=cast(OrphanPool, deps['orphan_pool'])
             )
             logger.info("Full Node ensamblado.")
             return node
@@ -127,7 +139,9 @@ class NodeFactory:
                 blockchain=cast(Blockchain, deps['blockchain']),
                 mempool=cast(Mempool, deps['mempool']),
                 difficulty_adjuster=cast(DifficultyAdjuster, deps['diff_adjuster']),
-                subsidy_calculator=cast(SubsidyCalculator, deps['subsidy_calculator'])
+                subsidy_calculator=cast(SubsidyCalculator, deps['subsidy_calculator']),
+                mining_engine=MiningEngine(mining_config.mining_threads, mining_config.check_interval),
+                block_rules_validator=cast(BlockRulesValidator, deps['rules_validator'])
             )
 
             node = MinerNode(
@@ -139,7 +153,10 @@ class NodeFactory:
                 consensus=cast(ConsensusOrchestrator, deps['consensus']),
                 reorg_manager=cast(ChainReorgManager, deps['reorg']),
                 mining_manager=mining_manager,
-                mining_config=mining_config 
+                mining_config=mining_config,
+                validation_cache=cast(ValidationCache, deps['validation_cache']),
+                fee_estimator=cast(FeeEstimator, deps['fee_estimator']),
+                orphan_pool=cast(OrphanPool, deps['orphan_pool'])
             )
             logger.info("Miner Node ensamblado.")
             return node
@@ -165,6 +182,11 @@ class NodeFactory:
             utxo_set = UTXOSet(utxo_repo)
             blockchain = Blockchain(blockchain_repo, utxo_set)
             mempool = Mempool()
+            fee_estimator = FeeEstimator(
+                mempool,
+                height_provider=lambda: blockchain.height,
+                block_capacity=getattr(ProtocolConstants, 'MAX_TX_PER_BLOCK', 2000)
+            )
             
             # 4. Servicios de Red
             p2p_service = P2PService(network_config) 
@@ -176,11 +198,30 @@ class NodeFactory:
             diff_adjuster = DifficultyAdjuster()
             
             # 6. Validadores y Orquestadores
-            rules_validator = BlockRulesValidator(utxo_set)
+            validation_cache = ValidationCache(consensus_config.validation_cache_size)
+            # Firmas ya verificadas: compartidas por Mempool, bloques y SignatureVerifierService
+            signature_cache = SignatureCache(consensus_config.signature_cache_size)
+            SignatureCache.install_shared(signature_cache)
+            # Backend de verificación detectado al arrancar (AKM_SIG_BACKEND)
+            signature_backend = SignatureBackendFactory.create(consensus_config.signature_backend)
+            SignatureBackendFactory.install(signature_backend)
+            logger.info(f"🔏 Backend de firmas: {signature_backend.name.upper()} (disponibles: {', '.join(SignatureBackendFactory.available())})")
+            signature_verifier = SignatureBatchVerifier(consensus_config.script_verify_workers, signature_cache)
+            rules_validator = BlockRulesValidator(utxo_set, validation_cache, signature_verifier)
             reorg_manager = ChainReorgManager(blockchain, utxo_set, mempool)
+            reorg_manager.subscribe(fee_estimator.on_blocks_connected)
+            
+            sync_pipeline = None
+            if consensus_config.sync_pipeline_depth > 0:
+                sync_pipeline = BlockSyncPipeline(
+                    blockchain, reorg_manager, rules_validator,
+                    depth=consensus_config.sync_pipeline_depth,
+                    commit_batch=consensus_config.sync_commit_batch,
+                    workers=consensus_config.sync_workers
+                )
             
             consensus = ConsensusOrchestrator(
-                blockchain, utxo_set, mempool, reorg_manager, rules_validator
+                blockchain, utxo_set, mempool, reorg_manager, rules_validator, sync_pipeline
             )
 
             return {
@@ -190,7 +231,14 @@ class NodeFactory:
                 'utxo_set': utxo_set,
                 'mempool': mempool,
                 'consensus': consensus,
+                'rules_validator': rules_validator,
                 'reorg': reorg_manager,
+                'validation_cache': validation_cache,
+                'fee_estimator': fee_estimator,
+                'orphan_pool': OrphanPool(
+                    max_orphans=consensus_config.orphan_pool_max,
+                    max_per_peer=consensus_config.orphan_per_peer_max
+                ),
                 'diff_adjuster': diff_adjuster,
                 'subsidy_calculator': subsidy_calculator
             }
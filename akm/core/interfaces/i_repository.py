@@ -27,6 +27,13 @@ class IBlockchainRepository(ABC):
         """
         pass
 
+    def save_blocks(self, blocks_data: List[Dict[str, Any]]) -> bool:
+        """
+        Agrega bloques contiguos al final de la cadena (Sync por lotes).
+        Por defecto uno a uno; los motores con transacciones lo hacen en un solo commit.
+        """
+        return all(self.save_block(block_data) for block_data in blocks_data)
+
     @abstractmethod
     def get_block_by_hash(self, block_hash: str) -> Optional[Dict[str, Any]]:
         """Recupera los datos de un bloque por su hash."""
@@ -0,0 +1,43 @@
+# akm/core/interfaces/i_signature_backend.py
+
+import logging
+from abc import ABC, abstractmethod
+
+logger = logging.getLogger(__name__)
+
+class ISignatureBackend(ABC):
+    """
+    [Abstracción Criptográfica]
+    Contrato para verificar firmas ECDSA sobre SECP256k1.
+
+    Todas las implementaciones deben aceptar exactamente las mismas firmas
+    que la implementación de referencia (ecdsa en Python puro): un backend
+    más rápido que acepte o rechace algo distinto partiría el consenso.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Nombre con el que se selecciona en la configuración (AKM_SIG_BACKEND)."""
+        pass
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Indica si las dependencias del backend están instaladas y funcionan."""
+        return True
+
+    @abstractmethod
+    def verify(self, sighash: bytes, public_key: bytes, signature: bytes) -> bool:
+        """
+        Verifica una firma DER sobre el digest 'sighash'.
+
+        Args:
+            sighash: Digest ya calculado (32 bytes en el protocolo).
+            public_key: Clave pública (raw de 64 bytes, comprimida o sin comprimir).
+            signature: Firma en formato DER.
+
+        Returns:
+            bool: True si la firma es válida. Nunca lanza: claves o firmas
+            mal codificadas devuelven False.
+        """
+        pass
@@ -0,0 +1,218 @@
+# akm/core/managers/block_sync_pipeline.py
+
+import queue
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Sequence
+
+from akm.core.models.block import Block
+from akm.core.models.blockchain import Blockchain
+from akm.core.managers.chain_reorg_manager import ChainReorgManager
+from akm.core.validators.block_validator import BlockValidator
+from akm.core.validators.block_rules_validator import BlockRulesValidator
+
+logger = logging.getLogger(__name__)
+
+# Marca de fin de flujo entre etapas
+_END = object()
+
+@dataclass
+class SyncBatchResult:
+    """Resultado de un tramo: 'consumed' bloques decididos (aceptados, rechazados o descendientes de uno rechazado)."""
+    consumed: int = 0
+    committed: int = 0
+    rejected: Optional[Block] = None
+
+class BlockSyncPipeline:
+    """
+    Importación por etapas de un tramo contiguo de un SYNC_BATCH que extiende el tip:
+    1. Headers (hilo llamador): enlace con el anterior, hash y PoW. Barato; corta el tramo.
+    2. Cuerpo (pool de hilos): Merkle e integridad de TXs, sin contexto, en paralelo.
+    3. Contexto (un hilo, en orden): reglas de contenido contra los UTXOs y aplicación al estado.
+       Es secuencial: cada bloque gasta outputs creados por los anteriores.
+    4. Commit (un hilo): persiste los bloques aplicados en lotes, con un solo commit por lote.
+       Solo tras persistir se limpian del Mempool sus TXs y se avisa a los observadores.
+    Cada etapa lee de su propia cola acotada ('depth'): mientras el disco escribe un lote,
+    los siguientes bloques ya se están verificando.
+    """
+
+    DEFAULT_DEPTH = 16
+    DEFAULT_COMMIT_BATCH = 64
+    DEFAULT_WORKERS = 2
+
+    @dataclass
+    class _Run:
+        verified: 'queue.Queue[Any]'
+        applied: 'queue.Queue[Any]'
+        stop: threading.Event = field(default_factory=threading.Event)
+        consumed: int = 0
+        committed: int = 0
+        rejected: Optional[Block] = None
+        commit_failed: bool = False
+
+    def __init__(
+        self,
+        blockchain: Blockchain,
+        reorg_manager: ChainReorgManager,
+        rules_validator: BlockRulesValidator,
+        depth: int = DEFAULT_DEPTH,
+        commit_batch: int = DEFAULT_COMMIT_BATCH,
+        workers: int = DEFAULT_WORKERS
+    ) -> None:
+        self._blockchain = blockchain
+        self._reorg_manager = reorg_manager
+        self._validator = rules_validator
+        self._depth = max(1, depth)
+        self._commit_batch = max(1, commit_batch)
+        self._workers = max(1, workers)
+
+    # --- Getters ---
+    @property
+    def depth(self) -> int: return self._depth
+    @property
+    def commit_batch(self) -> int: return self._commit_batch
+
+    @staticmethod
+    def links(block: Block, parent: Optional[Block]) -> bool:
+        """El bloque es el hijo directo de 'parent' (o el Génesis si la cadena está vacía)."""
+        if parent is None:
+            return block.index == 0
+        return block.previous_hash == parent.hash and block.index == parent.index + 1
+
+    def run(self, blocks: Sequence[Block], tip: Optional[Block]) -> SyncBatchResult:
+        """
+        Procesa el tramo de 'blocks' que encadena desde 'tip'. Se detiene en el primer
+        bloque que no enlaza (queda sin consumir) o en el primero inválido.
+        Retorna al terminar de persistir: la cadena queda en un estado consistente.
+        Si falla un commit, el estado se reconstruye desde lo persistido.
+        """
+        run = BlockSyncPipeline._Run(
+            verified=queue.Queue(maxsize=self._depth),
+            applied=queue.Queue(maxsize=self._depth)
+        )
+        state_thread = threading.Thread(target=self._state_stage, args=(run,), name="akm-sync-state", daemon=True)
+        commit_thread = threading.Thread(target=self._commit_stage, args=(run,), name="akm-sync-commit", daemon=True)
+        state_thread.start()
+        commit_thread.start()
+
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="akm-sync-body") as executor:
+            try:
+                self._header_stage(run, blocks, tip, executor)
+            finally:
+                run.verified.put(_END)
+                state_thread.join()
+                commit_thread.join()
+
+        if run.commit_failed:
+            self._rollback_state()
+        if run.rejected is not None:
+            logger.warning(f"⛔ Sync: Bloque #{run.rejected.index} ({run.rejected.hash[:8]}) rechazado. Tramo cortado.")
+        return SyncBatchResult(consumed=run.consumed, committed=run.committed, rejected=run.rejected)
+
+    # --- ETAPAS ---
+
+    def _header_stage(self, run: 'BlockSyncPipeline._Run', blocks: Sequence[Block], tip: Optional[Block], executor: ThreadPoolExecutor) -> None:
+        parent = tip
+        for block in blocks:
+            if run.stop.is_set() or not self.links(block, parent):
+                return
+
+            run.consumed += 1
+            if not BlockValidator.validate_header_pow(block):
+                logger.info(f"Sync: Header #{block.index} ({block.hash[:8]}) con hash o PoW inválido.")
+                # Sin detener: los ancestros ya encolados siguen hacia el estado y el commit
+                self._reject(run, block, halt=False)
+                return
+
+            # Se encola el Future: la etapa 3 lo espera en orden mientras el pool avanza
+            run.verified.put((block, executor.submit(BlockValidator.validate_body, block)))
+            parent = block
+
+    def _state_stage(self, run: 'BlockSyncPipeline._Run') -> None:
+        try:
+            while True:
+                item = run.verified.get()
+                if item is _END:
+                    return
+
+                block, body_check = item
+                if run.stop.is_set():
+                    body_check.cancel()
+                    continue
+
+                try:
+                    if not self._body_ok(body_check) or not self._validator.validate_contents(block):
+                        self._reject(run, block, halt=True)
+                        continue
+                    self._reorg_manager.apply_block_to_state(block, finalize=False)
+                except Exception:
+                    logger.exception(f"🐛 Sync: Error aplicando bloque #{block.index} al estado")
+                    self._reject(run, block, halt=True)
+                    continue
+
+                run.applied.put(block)
+        finally:
+            run.applied.put(_END)
+
+    def _commit_stage(self, run: 'BlockSyncPipeline._Run') -> None:
+        finished = False
+        while not finished:
+            item = run.applied.get()
+            if item is _END:
+                return
+
+            # Lote adaptativo: lo que ya esté listo, hasta 'commit_batch' bloques
+            batch: List[Block] = [item]
+            while len(batch) < self._commit_batch:
+                try:
+                    item = run.applied.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _END:
+                    finished = True
+                    break
+                batch.append(item)
+
+            if run.commit_failed:
+                continue
+            if self._blockchain.commit_blocks(batch):
+                run.committed += len(batch)
+                self._finalize(batch)
+            else:
+                # El estado ya incluye estos bloques: sin persistirlos no se sigue aplicando
+                logger.critical(f"💥 Sync: Lote #{batch[0].index}-#{batch[-1].index} aplicado al estado pero no persistido.")
+                run.commit_failed = True
+                run.stop.set()
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _body_ok(self, body_check: 'Future[bool]') -> bool:
+        try:
+            return body_check.result()
+        except Exception:
+            logger.exception("🐛 Sync: Error verificando el cuerpo del bloque")
+            return False
+
+    def _finalize(self, batch: List[Block]) -> None:
+        try:
+            self._reorg_manager.finalize_connected(batch)
+        except Exception:
+            logger.exception(f"🐛 Sync: Error finalizando lote #{batch[0].index}-#{batch[-1].index}")
+
+    def _rollback_state(self) -> None:
+        # Los bloques aplicados y no persistidos no tocaron el Mempool: basta con
+        # recalcular los UTXOs desde la cadena en disco
+        logger.warning("♻️  Sync: Descartando el estado de los bloques no persistidos...")
+        try:
+            self._reorg_manager.rebuild_state()
+        except Exception:
+            logger.critical("💥 Sync: No se pudo reconstruir el estado tras el fallo de persistencia.")
+
+    def _reject(self, run: 'BlockSyncPipeline._Run', block: Block, halt: bool) -> None:
+        # Se reporta el primero en altura: la etapa 3 puede rechazar un ancestro del de la etapa 1
+        if run.rejected is None or block.index < run.rejected.index:
+            run.rejected = block
+        if halt:
+            run.stop.set()
@@ -1,7 +1,7 @@
 # akm/core/managers/chain_reorg_manager.py
 
 import logging
-from typing import List
+from typing import Callable, List, Tuple
 
 # Modelos
 from akm.core.models.block import Block
@@ -12,14 +12,23 @@ from akm.core.services.mempool import Mempool
 
 logger = logging.getLogger(__name__)
 
+# Callback invocado con los bloques recién conectados al estado
+BlocksConnectedListener = Callable[[List[Block]], None]
+
 class ChainReorgManager:
     
     def __init__(self, blockchain: Blockchain, utxo_set: UTXOSet, mempool: Mempool):
         self._blockchain = blockchain
         self._utxo_set = utxo_set
         self._mempool = mempool
+        self._listeners: Tuple[BlocksConnectedListener, ...] = ()
+        self._rebuilding = False
         logger.info("Gestor de reorgs activo.")
 
+    def subscribe(self, on_blocks_connected: BlocksConnectedListener) -> None:
+        """Registra observadores de bloques aplicados al estado (Ej: pool de huérfanas)."""
+        self._listeners = self._listeners + (on_blocks_connected,)
+
     def handle_reorg(self, new_chain_blocks: List[Block]) -> bool:
         if not new_chain_blocks:
             return False
@@ -47,6 +56,7 @@ class ChainReorgManager:
 
             # 5. Devolver las TXs rescatadas al mempool
             restored_count = self._restore_mempool(orphaned_txs)
+            self._notify_connected(new_chain_blocks)
             
             logger.info(f"✅ Reorg finalizado. {restored_count} TXs rescatadas.")
             return True
@@ -55,9 +65,11 @@ class ChainReorgManager:
             logger.exception("Error crítico durante la reorganización")
             return False
 
-    def apply_block_to_state(self, block: Block) -> None:
-        
-        txs_to_remove: List[Transaction] = []
+    def apply_block_to_state(self, block: Block, finalize: bool = True) -> None:
+        """
+        Aplica el bloque al UTXOSet. Con finalize=False solo toca el estado: el llamador
+        (pipeline de Sync) llama a finalize_connected() cuando el bloque ya está persistido.
+        """
         for tx in block.transactions:
             if not self._is_coinbase(tx):
                 self._utxo_set.remove_inputs(tx.inputs)
@@ -65,10 +77,23 @@ class ChainReorgManager:
             tx_id = getattr(tx, 'tx_hash', None)
             if tx_id:
                 self._utxo_set.add_outputs(tx_id, tx.outputs)
-            txs_to_remove.append(tx)
-        
+
+        if finalize:
+            self.finalize_connected([block])
+
+    def finalize_connected(self, blocks: List[Block]) -> None:
+        """Limpia del Mempool las TXs minadas en 'blocks' y avisa a los observadores."""
+        txs_to_remove: List[Transaction] = [tx for block in blocks for tx in block.transactions]
         self._mempool.remove_mined_transactions(txs_to_remove)
 
+        # Durante la reconstrucción el estado es parcial: se notifica al final
+        if not self._rebuilding:
+            self._notify_connected(blocks)
+
+    def rebuild_state(self) -> None:
+        """Descarta el estado en memoria y lo recalcula desde la cadena persistida."""
+        self._rebuild_utxo_set_from_scratch()
+
     # --- MÉTODOS PRIVADOS ---
 
     def _find_fork_index_optimized(self, new_chain: List[Block]) -> int:
@@ -115,15 +140,26 @@ class ChainReorgManager:
             self._utxo_set.clear()
             
             processed_count = 0
-            for block in self._blockchain.get_history_iterator():
-                self.apply_block_to_state(block)
-                processed_count += 1
+            self._rebuilding = True
+            try:
+                for block in self._blockchain.get_history_iterator():
+                    self.apply_block_to_state(block)
+                    processed_count += 1
+            finally:
+                self._rebuilding = False
                 
             logger.info(f"Estado sincronizado ({processed_count} bloques).")
         except Exception:
             logger.exception("Fallo técnico reconstruyendo estado")
             raise
 
+    def _notify_connected(self, blocks: List[Block]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(blocks)
+            except Exception:
+                logger.exception("Error en observador de bloques conectados")
+
     def _is_coinbase(self, tx: Transaction) -> bool:
         if hasattr(tx, 'is_coinbase'):
             return tx.is_coinbase
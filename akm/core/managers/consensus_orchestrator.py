@@ -1,7 +1,7 @@
 # akm/core/managers/consensus_orchestrator.py
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 # Modelos
 from akm.core.models.block import Block
@@ -10,6 +10,7 @@ from akm.core.managers.utxo_set import UTXOSet
 from akm.core.services.mempool import Mempool
 from akm.core.validators.block_rules_validator import BlockRulesValidator
 from akm.core.managers.chain_reorg_manager import ChainReorgManager
+from akm.core.managers.block_sync_pipeline import BlockSyncPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,8 @@ class ConsensusOrchestrator:
         utxo_set: UTXOSet,
         mempool: Mempool,
         chain_reorg_manager: ChainReorgManager,
-        block_rules_validator: BlockRulesValidator
+        block_rules_validator: BlockRulesValidator,
+        sync_pipeline: Optional[BlockSyncPipeline] = None
     ) -> None:
         try:
             self._blockchain = blockchain
@@ -28,22 +30,31 @@ class ConsensusOrchestrator:
             self._mempool = mempool
             self._reorg_manager = chain_reorg_manager
             self._validator = block_rules_validator
+            # Sin pipeline, los lotes de Sync se importan bloque a bloque
+            self._sync_pipeline = sync_pipeline
             logger.info("Cerebro de consenso iniciado.")
         except Exception:
             logger.exception("Error al inicializar ConsensusOrchestrator")
 
-    def add_block(self, new_block: Block) -> bool:
+    def add_block(self, new_block: Block, trusted: bool = False) -> bool:
         """
         Intenta añadir un bloque a la cadena. 
         Maneja extensión normal, bloques génesis y bifurcaciones (forks).
+        'trusted': bloque propio de una plantilla pre-validada. Solo se aprovecha
+        si extiende el tip sobre el que se validó; si no, validación completa.
         """
         try:
+            last_block: Optional[Block] = self._blockchain.last_block
+
             # 1. Validación de Reglas de Consenso (PoW, Firmas, Estructura)
-            if not self._validator.validate(new_block):
+            if trusted and last_block is not None and new_block.previous_hash == last_block.hash:
+                valid = self._validator.validate_trusted(new_block)
+            else:
+                valid = self._validator.validate(new_block)
+
+            if not valid:
                 logger.warning(f"⛔ Bloque {new_block.hash[:8]} rechazado: Reglas inválidas.")
                 return False
-
-            last_block: Optional[Block] = self._blockchain.last_block
             
             # --- CASO A: Bloque Génesis ---
             if last_block is None:
@@ -70,6 +81,33 @@ class ConsensusOrchestrator:
             logger.exception(f"🐛 Bug procesando bloque #{new_block.index}: {e}")
             return False
 
+    def add_blocks(self, blocks: Sequence[Block]) -> int:
+        """
+        Importa un lote de Sync ordenado por altura. Los tramos que extienden el tip
+        pasan por el BlockSyncPipeline (validación y escritura solapadas); el resto
+        (bloques ya conocidos, forks, huérfanos) por add_block, uno a uno.
+        Retorna cuántos bloques se unieron a la cadena.
+        """
+        imported = 0
+        position = 0
+        while position < len(blocks):
+            block = blocks[position]
+
+            if self._sync_pipeline is not None:
+                tip: Optional[Block] = self._blockchain.last_block
+                if BlockSyncPipeline.links(block, tip):
+                    result = self._sync_pipeline.run(blocks[position:], tip)
+                    imported += result.committed
+                    if result.consumed:
+                        position += result.consumed
+                        continue
+
+            if self.add_block(block):
+                imported += 1
+            position += 1
+
+        return imported
+
     def _handle_potential_fork(self, new_block: Block, current_tip: Block) -> bool:
         try:
             # 1. ¿Es un bloque huérfano? (Padre desconocido)
@@ -1,11 +1,14 @@
 # akm/core/managers/gossip_manager.py
 
 import logging
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 
 # Configuración e Infraestructura
 from akm.core.config.protocol_constants import ProtocolConstants
 from akm.core.interfaces.i_network import INetworkService
+from akm.core.services.merkle_tree import MerkleTree
 from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
 
 if TYPE_CHECKING:
@@ -19,10 +22,15 @@ class GossipManager:
     respuestas a solicitudes de sincronización ligera (SPV).
     """
 
+    # Árboles Merkle recientes: varias pruebas del mismo bloque sin rehashear
+    MAX_PROOF_TREES = 32
+
     def __init__(self, p2p_service: INetworkService, blockchain: Optional['Blockchain'] = None):
         try:
             self.p2p = p2p_service
             self.blockchain = blockchain
+            self._proof_trees: 'OrderedDict[str, MerkleTree]' = OrderedDict()
+            self._proof_trees_lock = threading.Lock()
             
             # Registro del callback principal
             self.p2p.register_handler(self._handle_network_message)
@@ -89,7 +97,7 @@ class GossipManager:
             
             if target_block:
                 all_hashes = [getattr(tx, 'tx_hash', "") for tx in target_block.transactions]
-                proof = MerkleTreeBuilder.get_proof(all_hashes, tx_hash)
+                proof = self._get_proof(getattr(target_block, 'hash', ''), all_hashes, tx_hash)
                 
                 if proof:
                     response: Dict[str, Any] = {
@@ -109,6 +117,28 @@ class GossipManager:
         except Exception:
             logger.exception("Error procesando Merkle Proof Request")
 
+    def _get_proof(self, block_hash: str, all_hashes: List[str], tx_hash: str) -> Optional[List[str]]:
+        """Prueba Merkle desde el árbol en caché del bloque (se construye una sola vez)."""
+        with self._proof_trees_lock:
+            tree = self._proof_trees.get(block_hash)
+            if tree is not None:
+                self._proof_trees.move_to_end(block_hash)
+
+        if tree is None:
+            try:
+                tree = MerkleTree.from_hashes(all_hashes)
+            except ValueError:
+                return MerkleTreeBuilder.get_proof(all_hashes, tx_hash)
+
+            if not block_hash:
+                return tree.get_proof_for(tx_hash)
+            with self._proof_trees_lock:
+                self._proof_trees[block_hash] = tree
+                while len(self._proof_trees) > GossipManager.MAX_PROOF_TREES:
+                    self._proof_trees.popitem(last=False)
+
+        return tree.get_proof_for(tx_hash)
+
     # --- ENRUTADOR DE MENSAJES (ROUTER) ---
 
     def dispatch_message(self, msg_type: str, payload: Any, peer_id: str) -> None:
@@ -1,20 +1,26 @@
 # akm/core/managers/mining_manager.py
 
+import time
 import logging
 import threading
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 # Modelos y Configuración
 from akm.core.models.block import Block
+from akm.core.models.block_header import BlockHeader
 from akm.core.models.blockchain import Blockchain
 from akm.core.models.transaction import Transaction
 from akm.core.config.consensus_config import ConsensusConfig
 from akm.core.config.protocol_constants import ProtocolConstants # <--- IMPORTANTE
+from akm.core.config.mining_config import MiningConfig
 
 # Servicios del Dominio
 from akm.core.services.mempool import Mempool
+from akm.core.services.mining_telemetry import MiningTelemetry
 from akm.core.builders.block_builder import BlockBuilder
-from akm.core.factories.transaction_factory import TransactionFactory
+from akm.core.builders.block_template import BlockTemplate
+from akm.core.builders.mining_engine import MiningEngine
+from akm.core.validators.block_rules_validator import BlockRulesValidator
 
 # Componentes de Lógica de Negocio
 from akm.core.consensus.difficulty_adjuster import DifficultyAdjuster
@@ -23,13 +29,21 @@ from akm.core.consensus.subsidy_calculator import SubsidyCalculator
 logger = logging.getLogger(__name__)
 
 class MiningManager:
+
+    # Espera máxima por una plantilla que ya se está preparando en paralelo
+    PREPARE_TIMEOUT_SEC = 5.0
+
+    # Re-chequeo periódico de la pre-validación aunque no lleguen eventos
+    PREVALIDATION_POLL_SEC = 1.0
     
     def __init__(
         self,
         blockchain: Blockchain,
         mempool: Mempool,
         difficulty_adjuster: DifficultyAdjuster,
-        subsidy_calculator: SubsidyCalculator
+        subsidy_calculator: SubsidyCalculator,
+        mining_engine: Optional[MiningEngine] = None,
+        block_rules_validator: Optional[BlockRulesValidator] = None
     ) -> None:
         try:
             self._blockchain = blockchain
@@ -38,6 +52,32 @@ class MiningManager:
             self._subsidy_calculator = subsidy_calculator
             self._consensus_config = ConsensusConfig()
 
+            # Motor de búsqueda de nonces (procesos según 'threads' del config)
+            mining_config = MiningConfig()
+            self._engine = mining_engine or MiningEngine(
+                mining_config.mining_threads, mining_config.check_interval
+            )
+            self._batch_size = mining_config.batch_size
+            self._telemetry = MiningTelemetry(self._batch_size, self._engine.check_interval)
+
+            # Plantilla viva del próximo bloque (alimentada por eventos del Mempool)
+            self._template: Optional[BlockTemplate] = None
+            self._template_lock = threading.Lock()
+
+            # Plantilla especulativa sobre un tip anunciado (aún en validación)
+            self._next_template: Optional[BlockTemplate] = None
+            self._preparing: Optional[Tuple[str, threading.Thread]] = None
+
+            # Pre-validación de la plantilla en segundo plano (mientras se hashea)
+            self._validator = block_rules_validator
+            self._prevalidation_wakeup = threading.Event()
+            self._prevalidation_stop = threading.Event()
+            self._prevalidation_rejected: Optional[Tuple[int, int]] = None
+            if self._validator is not None:
+                threading.Thread(target=self._prevalidation_loop, daemon=True, name="TemplatePrevalidation").start()
+
+            self._mempool.subscribe(self._on_transaction_added, self._on_transactions_removed)
+
             logger.info("Gestor de minería listo.")
         except Exception:
             logger.exception("Error crítico al inicializar MiningManager")
@@ -45,42 +85,20 @@ class MiningManager:
     def mine_block(self, miner_address: str, interrupt_event: Optional[threading.Event] = None) -> Optional[Block]:
         
         try:
-            # 1. Obtener estado de la cadena
-            last_block = self._blockchain.last_block
-            if not last_block:
-                raise ValueError("Cadena vacía. Se requiere bloque Génesis.")
+            # 1. Plantilla viva (solo se reconstruye si cambió el tip o el minero)
+            template = self.get_block_template(miner_address)
 
-            new_height: int = last_block.index + 1
-
-            logger.info(f"Preparando bloque #{new_height}...")
-
-            # 2. Ajuste de Consenso (Dificultad)
-            bits = self._calculate_required_bits(last_block, new_height)
-
-            # 3. Selección de transacciones
-            # [FIX CRÍTICO]: Usamos un límite por BLOQUE, no el tamaño total del mempool.
-            # Si el mempool tiene 50.000 txs, solo tomamos 2.000 para que el bloque no pese 100MB.
-            max_txs_per_block = getattr(ProtocolConstants, 'MAX_TX_PER_BLOCK', 2000)
-            
-            pending_txs = self._mempool.get_transactions_for_block(
-                max_count=max_txs_per_block
-            )
-
-            # 4. Creación de recompensa (Coinbase)
-            coinbase_tx = self._create_coinbase_tx(miner_address, new_height, pending_txs)
-            block_transactions = [coinbase_tx] + pending_txs
-
-            # 5. Ejecución del minado
-            new_block = BlockBuilder.build(
-                transactions=block_transactions,
-                previous_hash=last_block.hash, 
-                bits=bits,
-                index=new_height,
-                interrupt_event=interrupt_event
+            # 2. Ejecución del minado (intercambia la plantilla entre lotes de nonces)
+            new_block = BlockBuilder.build_from_template(
+                template=template,
+                interrupt_event=interrupt_event,
+                batch_size=self._batch_size,
+                engine=self._engine,
+                telemetry=self._telemetry
             )
 
             if new_block:
-                logger.info(f"Bloque #{new_height} sellado y listo.")
+                logger.info(f"Bloque #{new_block.index} sellado y listo.")
             
             return new_block
 
@@ -88,9 +106,219 @@ class MiningManager:
             logger.exception("Fallo en la orquestación")
             return None
 
+    @property
+    def hashrate(self) -> float: return self._telemetry.hashrate
+    @property
+    def telemetry(self) -> MiningTelemetry: return self._telemetry
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Telemetría del minado local para la API y los logs."""
+        metrics = self._telemetry.snapshot()
+        metrics["processes"] = self._engine.threads
+
+        template = self._template
+        metrics["template_tx_count"] = template.tx_count if template else 0
+        metrics["template_extra_nonce"] = template.extra_nonce if template else 0
+        metrics["template_prevalidated"] = template.is_validated if template else False
+        return metrics
+
+    def is_prevalidated(self, block: Block) -> bool:
+        """Marca de confianza: el bloque propio sale de una plantilla ya validada."""
+        template = self._template
+        return template is not None and template.matches_validated(block)
+
+    def shutdown(self) -> None:
+        self._prevalidation_stop.set()
+        self._prevalidation_wakeup.set()
+        self._engine.shutdown()
+
+    def get_block_template(self, miner_address: str) -> BlockTemplate:
+        """
+        Devuelve la plantilla vigente. El re-escaneo del Mempool, el cálculo
+        de dificultad y la coinbase completa solo ocurren ante un tip nuevo.
+        """
+        # 1. Obtener estado de la cadena
+        last_block = self._blockchain.last_block
+        if not last_block:
+            raise ValueError("Cadena vacía. Se requiere bloque Génesis.")
+
+        # Si ya se está preparando la plantilla de este tip, esperarla es más barato que rehacerla
+        preparing = self._preparing
+        if preparing is not None and preparing[0] == last_block.hash:
+            preparing[1].join(timeout=self.PREPARE_TIMEOUT_SEC)
+
+        with self._template_lock:
+            current = self._template
+            if (
+                current is not None
+                and current.previous_hash == last_block.hash
+                and current.miner_address == miner_address
+            ):
+                return current
+
+            upcoming = self._next_template
+            self._next_template = None
+            if (
+                upcoming is not None
+                and upcoming.previous_hash == last_block.hash
+                and upcoming.miner_address == miner_address
+            ):
+                logger.info(f"⚡ Plantilla #{upcoming.index} preparada en paralelo: sin reconstrucción.")
+                self._template = upcoming
+            else:
+                self._template = self._build_template(miner_address, last_block)
+
+        self._prevalidation_wakeup.set()
+        return self._template
+
+    def prepare_next_template(self, header: BlockHeader, block_tx_hashes: Set[str], miner_address: str) -> None:
+        """
+        Arma en segundo plano la plantilla que minará sobre un tip anunciado
+        (header con PoW válido) mientras el bloque completo se valida.
+        Las TXs incluidas en ese bloque se excluyen de la selección.
+        """
+        def worker() -> None:
+            try:
+                template = self._build_template(miner_address, header, exclude=block_tx_hashes)
+                with self._template_lock:
+                    self._next_template = template
+            except Exception:
+                logger.exception(f"Error preparando la plantilla sobre el tip {header.hash[:8]}")
+
+        with self._template_lock:
+            # El mismo tip anunciado por varios peers: un solo prefetch (en curso o terminado)
+            preparing = self._preparing
+            if preparing is not None and preparing[0] == header.hash:
+                return
+            thread = threading.Thread(target=worker, daemon=True, name="TemplatePrefetch")
+            self._preparing = (header.hash, thread)
+        thread.start()
+
+    def required_bits_after(self, last_block: Union[Block, BlockHeader]) -> str:
+        """Dificultad que debe declarar el hijo de 'last_block'."""
+        return self._calculate_required_bits(last_block, last_block.index + 1)
+
+    def invalidate_template(self) -> None:
+        """Descarta la plantilla (Ej: llegó un bloque nuevo de la red)."""
+        with self._template_lock:
+            self._template = None
+
+    # --- EVENTOS DEL MEMPOOL ---
+
+    def _on_transaction_added(self, tx: Transaction) -> None:
+        template = self._template
+        if template is not None and template.add_transaction(tx):
+            logger.debug(f"Plantilla #{template.index}: +TX {tx.tx_hash[:8]} (fee {tx.fee}).")
+            self._prevalidation_wakeup.set()
+
+        upcoming = self._next_template
+        if upcoming is not None:
+            upcoming.add_transaction(tx)
+
+    def _on_transactions_removed(self, txs: List[Transaction]) -> None:
+        for template in (self._template, self._next_template):
+            if template is not None:
+                template.remove_transactions(txs)
+        self._prevalidation_wakeup.set()
+
     # --- MÉTODOS PRIVADOS ---
 
-    def _calculate_required_bits(self, last_block: Block, current_height: int) -> str:
+    def _prevalidation_loop(self) -> None:
+        while not self._prevalidation_stop.is_set():
+            self._prevalidation_wakeup.wait(timeout=self.PREVALIDATION_POLL_SEC)
+            self._prevalidation_wakeup.clear()
+            if self._prevalidation_stop.is_set():
+                break
+
+            template = self._template
+            if template is None or template.is_validated:
+                continue
+            if self._prevalidation_rejected == (id(template), template.version):
+                continue  # Mismo contenido ya rechazado: se minará con validación completa
+            try:
+                self._prevalidate(template)
+            except Exception:
+                logger.exception(f"Error pre-validando la plantilla #{template.index}")
+
+    def _prevalidate(self, template: BlockTemplate) -> bool:
+        """Reglas de contenido sobre la plantilla vigente; descarta las TXs que las rompen."""
+        if self._validator is None:
+            return False
+
+        last_block = self._blockchain.last_block
+        if not last_block or last_block.hash != template.previous_hash:
+            return False  # Plantilla vieja: la próxima ronda trae otra
+
+        snapshot = template.snapshot()
+        candidate = Block(
+            index=snapshot.index,
+            timestamp=int(time.time()),
+            previous_hash=snapshot.previous_hash,
+            bits=snapshot.bits,
+            merkle_root=snapshot.merkle_root,
+            nonce=0,
+            block_hash="",
+            transactions=list(snapshot.transactions)
+        )
+
+        invalid = self._validator.find_invalid_transactions(candidate)
+        if invalid:
+            # La versión cambia: el bucle de minado cambia de contenido en el próximo lote
+            template.remove_transactions(invalid)
+            self._prevalidation_wakeup.set()
+            logger.warning(f"🧹 Plantilla #{snapshot.index}: {len(invalid)} TXs inválidas descartadas antes de minar.")
+            return False
+
+        # Las TXs ya pasaron: solo falta la Coinbase (sin repetir la pasada de TXs)
+        if not self._validator.validate_coinbase(candidate):
+            self._prevalidation_rejected = (id(template), snapshot.version)
+            return False
+
+        template.mark_validated(snapshot)
+        logger.debug(f"Plantilla #{snapshot.index} v{snapshot.version} pre-validada ({len(snapshot.transactions)} TXs).")
+        return True
+
+    def _build_template(
+        self,
+        miner_address: str,
+        last_block: Union[Block, BlockHeader],
+        exclude: Optional[Set[str]] = None
+    ) -> BlockTemplate:
+        new_height: int = last_block.index + 1
+
+        logger.info(f"Preparando bloque #{new_height}...")
+
+        # 2. Ajuste de Consenso (Dificultad)
+        bits = self._calculate_required_bits(last_block, new_height)
+
+        # 3. Selección de transacciones
+        # [FIX CRÍTICO]: Usamos un límite por BLOQUE, no el tamaño total del mempool.
+        # Si el mempool tiene 50.000 txs, solo tomamos 2.000 para que el bloque no pese 100MB.
+        max_txs_per_block = getattr(ProtocolConstants, 'MAX_TX_PER_BLOCK', 2000)
+        
+        if exclude:
+            # Tip anunciado: sus TXs siguen en el Mempool hasta que el bloque se conecte
+            pending_txs = [
+                tx for tx in self._mempool.get_transactions_for_block(max_count=max_txs_per_block + len(exclude))
+                if tx.tx_hash not in exclude
+            ][:max_txs_per_block]
+        else:
+            pending_txs = self._mempool.get_transactions_for_block(
+                max_count=max_txs_per_block
+            )
+
+        # 4. Plantilla con recompensa (Coinbase) y Merkle cacheados
+        return BlockTemplate(
+            index=new_height,
+            previous_hash=last_block.hash,
+            bits=bits,
+            miner_address=miner_address,
+            subsidy=self._subsidy_calculator.get_subsidy(new_height),
+            max_tx_count=max_txs_per_block,
+            transactions=pending_txs
+        )
+
+    def _calculate_required_bits(self, last_block: Union[Block, BlockHeader], current_height: int) -> str:
         interval = self._consensus_config.difficulty_adjustment_interval
 
         if current_height % interval == 0:
@@ -104,15 +332,3 @@ class MiningManager:
             return self._difficulty_adjuster.calculate_new_bits(first_block_of_epoch, last_block)
         
         return last_block.bits
-
-    def _create_coinbase_tx(self, miner_address: str, height: int, txs: List[Transaction]) -> Transaction:
-        
-        base_subsidy = self._subsidy_calculator.get_subsidy(height)
-        total_fees = sum(tx.fee for tx in txs)
-        total_reward = base_subsidy + total_fees
-        
-        return TransactionFactory.create_coinbase(
-            miner_address=miner_address,
-            block_height=height,
-            total_reward=total_reward
-        )
\ No newline at end of file
@@ -1,15 +1,18 @@
 # akm/core/models/block.py
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence, Tuple
 
 from akm.core.models.block_header import BlockHeader
 from akm.core.models.transaction import Transaction
+from akm.core.services.block_hasher import BlockHasher
 
 logger = logging.getLogger(__name__)
 
 class Block(BlockHeader):
 
+    __slots__ = ("_transactions",)
+
     def __init__(
         self,
         index: int,
@@ -19,7 +22,7 @@ class Block(BlockHeader):
         merkle_root: str,
         nonce: int,
         block_hash: str,
-        transactions: List[Transaction]
+        transactions: Sequence[Transaction]
     ) -> None:
         try:
             super().__init__(
@@ -32,18 +35,24 @@ class Block(BlockHeader):
                 block_hash=block_hash
             )
             
-            self._transactions: List[Transaction] = transactions if transactions else []
+            # Tupla: el bloque es inmutable y 'transactions' se expone sin copiar
+            self._transactions: Tuple[Transaction, ...] = tuple(transactions) if transactions else ()
 
         except Exception:
             logger.exception(f"Error crítico en la estructura del Bloque #{index}")
 
     @property
-    def transactions(self) -> List[Transaction]: return self._transactions[:]
+    def transactions(self) -> Tuple[Transaction, ...]: return self._transactions
 
     @property
     def block_hash(self) -> str:
         return self._hash
 
+    @property
+    def size_bytes(self) -> int:
+        """Header + contador de TXs (4 bytes) + serialización canónica de cada TX (cacheada)."""
+        return BlockHasher.HEADER_SIZE + 4 + sum(tx.size_bytes for tx in self._transactions)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Estructura anidada para el Repositorio.
@@ -6,6 +6,8 @@ import logging
 logger = logging.getLogger(__name__) 
 
 class BlockHeader:
+
+    __slots__ = ("_index", "_timestamp", "_previous_hash", "_bits", "_merkle_root", "_nonce", "_hash")
     
     def __init__(
         self,
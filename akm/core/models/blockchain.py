@@ -1,7 +1,7 @@
 # akm/core/models/blockchain.py
 
 import logging
-from typing import List, Optional, Iterator, Dict, Any
+from typing import List, Optional, Iterator, Dict, Any, Sequence
 
 from akm.core.models.block import Block
 from akm.core.models.block_header import BlockHeader
@@ -17,6 +17,9 @@ class Blockchain(IChain):
     def __init__(self, repository: IBlockchainRepository, utxo_set: UTXOSet):
         self._repository = repository
         self.utxo_set = utxo_set # Guardamos referencia al Tesorero
+        # Hash del tip en memoria: se carga una vez y se actualiza en cada escritura
+        self._tip_hash: Optional[str] = None
+        self._tip_loaded = False
         logger.info(f"🚀 Sistema iniciado. Altura actual: {self.height}")
 
     # --- Getters ---
@@ -31,6 +34,15 @@ class Blockchain(IChain):
         data: Any = self._repository.get_last_block()
         return Block.from_dict(data) if data else None
 
+    @property
+    def tip_hash(self) -> Optional[str]:
+        """Hash del último bloque persistido sin decodificarlo desde la DB."""
+        if not self._tip_loaded:
+            tip = self.last_block
+            self._tip_hash = tip.hash if tip else None
+            self._tip_loaded = True
+        return self._tip_hash
+
     def add_header(self, header: BlockHeader) -> bool:
         return False 
 
@@ -50,6 +62,8 @@ class Blockchain(IChain):
             success = self._repository.save_block(block_data)
             
             if success:
+                self._set_tip(block)
+
                 # [CAMBIO CRÍTICO] 2. Actualizar el Estado (Quemar billetes viejos, crear nuevos)
                 self._update_utxo_state(block)
                 
@@ -63,6 +77,28 @@ class Blockchain(IChain):
             logger.exception("❌ Error fatal: El bloque no pudo unirse.")
             return False
 
+    def commit_blocks(self, blocks: Sequence[Block]) -> bool:
+        """
+        Persiste un lote de bloques contiguos cuyo estado UTXO ya aplicó el
+        ChainReorgManager (pipeline de Sync). No vuelve a tocar el UTXOSet: un
+        bloque posterior del lote ya pudo gastar los outputs de uno anterior.
+        """
+        if not blocks:
+            return True
+        try:
+            blocks_data: Any = [block.to_dict() for block in blocks]
+            if not self._repository.save_blocks(blocks_data):
+                logger.error(f"❌ Fallo al escribir lote #{blocks[0].index}-#{blocks[-1].index} en DB.")
+                return False
+
+            self._set_tip(blocks[-1])
+            logger.info(f"💾 Lote #{blocks[0].index}-#{blocks[-1].index} persistido ({len(blocks)} bloques).")
+            return True
+
+        except Exception:
+            logger.exception("❌ Error fatal persistiendo lote de bloques.")
+            return False
+
     def replace_chain(self, new_chain: List[Block]) -> None:
         try:
             # En un reemplazo de cadena (Reorg), lo ideal es recalcular todo el UTXO set.
@@ -71,6 +107,7 @@ class Blockchain(IChain):
             chain_data: Any = [b.to_dict() for b in new_chain]
             
             self._repository.save_blocks_atomic(chain_data)
+            self._tip_loaded = False
             
             # Reconstrucción forzada del estado (simple)
             logger.warning("🔄 Cadena reemplazada. Reconstruyendo estado UTXO...")
@@ -82,6 +119,14 @@ class Blockchain(IChain):
         except Exception:
             logger.exception("❌ Error crítico en reemplazo de cadena.")
 
+    def _set_tip(self, block: Block) -> None:
+        # Solo un hijo del tip en memoria lo avanza; cualquier otro caso (bloque ya
+        # conocido re-guardado con INSERT OR IGNORE) se relee de la DB al consultarlo
+        if self._tip_loaded and (self._tip_hash is None or block.previous_hash == self._tip_hash):
+            self._tip_hash = block.hash
+        else:
+            self._tip_loaded = False
+
     # --- [NUEVO MÉTODO] Lógica del Dinero ---
     def _update_utxo_state(self, block: Block) -> None:
         """
@@ -1,34 +1,51 @@
 # akm/core/models/transaction.py
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 from akm.core.models.tx_input import TxInput
 from akm.core.models.tx_output import TxOutput
 from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.services.sighash_context import SighashContext
 
 logger = logging.getLogger(__name__)
 
 class Transaction:
 
+    # '__weakref__': los TxInput avisan a su TX por referencia débil (ver TxInput.attach)
+    __slots__ = (
+        "_sighash_context", "_serialized", "_computed_hash", "_revision",
+        "_inputs", "_outputs", "_tx_hash", "_timestamp", "_fee", "__weakref__"
+    )
+
     def __init__(
         self,
         tx_hash: str, 
         timestamp: int,
-        inputs: Optional[List[TxInput]] = None,
-        outputs: Optional[List[TxOutput]] = None,
+        inputs: Optional[Sequence[TxInput]] = None,
+        outputs: Optional[Sequence[TxOutput]] = None,
         fee: int = 0 
     ) -> None:
+        # Imagen de firma compartida por todos los inputs (solo durante la validación)
+        self._sighash_context: Optional[SighashContext] = None
+        # Serialización canónica y su hash, calculados a demanda (ver 'serialized')
+        self._serialized: Optional[bytes] = None
+        self._computed_hash: Optional[str] = None
+        self._revision = 0
         try:
             if fee < 0: 
                 raise ValueError("Fee negativo.")
 
-            self._inputs: List[TxInput] = inputs if inputs is not None else []
-            self._outputs: List[TxOutput] = outputs if outputs is not None else []
+            # Tuplas: 'inputs'/'outputs' se exponen sin copiar en cada acceso
+            self._inputs: Tuple[TxInput, ...] = tuple(inputs) if inputs is not None else ()
+            self._outputs: Tuple[TxOutput, ...] = tuple(outputs) if outputs is not None else ()
             self._tx_hash: str = tx_hash
             self._timestamp: int = timestamp
             self._fee: int = fee
 
+            for inp in self._inputs:
+                inp.attach(self)
+
             if self._tx_hash:
                 logger.debug(f"TX {self._tx_hash[:8]}... instanciada.")
 
@@ -39,9 +56,9 @@ class Transaction:
     @property
     def tx_hash(self) -> str: return self._tx_hash
     @property
-    def inputs(self) -> List[TxInput]: return self._inputs[:]
+    def inputs(self) -> Tuple[TxInput, ...]: return self._inputs
     @property
-    def outputs(self) -> List[TxOutput]: return self._outputs[:]
+    def outputs(self) -> Tuple[TxOutput, ...]: return self._outputs
     @property
     def timestamp(self) -> int: return self._timestamp
     @property
@@ -51,6 +68,42 @@ class Transaction:
     def total_output_albas(self) -> int: 
         return sum(out.value_alba for out in self._outputs)
     
+    @property
+    def size_bytes(self) -> int:
+        """Tamaño de la serialización canónica (base del fee-rate)."""
+        return len(self.serialized)
+
+    @property
+    def serialized(self) -> bytes:
+        """
+        Serialización canónica, armada una vez. Timestamp, fee y outputs no
+        cambian; el script_sig de un input sí (firma en la wallet): el TxInput
+        avisa y la caché se descarta.
+        """
+        serialized = self._serialized
+        if serialized is None:
+            revision = self._revision
+            serialized = TransactionHasher.build(self)
+            # Si un input mutó mientras se serializaba, no se guarda la imagen vieja
+            if revision == self._revision:
+                self._serialized = serialized
+        return serialized
+
+    def calculate_hash(self) -> str:
+        """Doble SHA-256 de la serialización canónica (cacheado como ella)."""
+        computed = self._computed_hash
+        if computed is None:
+            revision = self._revision
+            computed = TransactionHasher.hash_bytes(self.serialized)
+            if revision == self._revision:
+                self._computed_hash = computed
+        return computed
+
+    def invalidate_serialization(self) -> None:
+        self._revision += 1
+        self._serialized = None
+        self._computed_hash = None
+    
     @property
     def is_coinbase(self) -> bool:
         if len(self._inputs) != 1: return False
@@ -68,44 +121,17 @@ class Transaction:
     def get_hash_for_signature(self, input_index: int, connected_script: Optional[bytes] = None) -> bytes:
         """
         [FIX INTEGRIDAD DE PREV_HASH] Calcula el hash de la transacción para ser firmado (SIGHASH_ALL).
+        La serialización común (prevouts, outputs, fee) se arma una vez por TX y se
+        reutiliza para cada input hasta release_sighash_context().
         """
-        # 1. Creamos inputs temporales (Listado de copias)
-        temp_inputs: List[TxInput] = []
-        
-        for i, inp in enumerate(self._inputs):
-            script_to_use: bytes = b''
-            
-            # Solo copiamos el script si es el input que estamos firmando actualmente
-            if i == input_index and connected_script:
-                script_to_use = connected_script
-            
-            # [FIX CRÍTICO AQUÍ] Aseguramos que el previous_tx_hash sea consistente para el hasher.
-            # Si es el input nulo de Coinbase, o si es vacío, debe ser 64 ceros.
-            prev_hash = inp.previous_tx_hash
-            if not prev_hash or prev_hash.lower() == '0' * 64:
-                 prev_hash = '0' * 64
-
-            # Creamos una copia del input para modificar el script_sig
-            temp_inputs.append(TxInput(
-                previous_tx_hash=prev_hash,
-                output_index=inp.output_index,
-                script_sig=script_to_use 
-            ))
-
-        # 2. Creamos la transacción temporal (TxID vacío)
-        temp_tx = Transaction(
-            tx_hash="",
-            timestamp=self._timestamp,
-            inputs=temp_inputs,
-            outputs=self._outputs, 
-            fee=self._fee
-        )
-
-        # 3. Calculamos el hash (que será la imagen a firmar)
-        tx_hash_hex = TransactionHasher.calculate(temp_tx)
-        
-        # 4. Devolvemos los bytes del hash para la firma.
-        return bytes.fromhex(tx_hash_hex)
+        # Referencia local: un release_sighash_context() concurrente no nos deja con None
+        ctx = self._sighash_context or SighashContext(self)
+        self._sighash_context = ctx
+        return ctx.digest(input_index, connected_script)
+
+    def release_sighash_context(self) -> None:
+        """Fin de la validación: la TX (ej. en el Mempool) no retiene la imagen serializada."""
+        self._sighash_context = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializa la transacción para DB/Red."""
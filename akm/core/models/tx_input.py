@@ -1,13 +1,18 @@
 # akm/core/models/tx_input.py
 
 import logging
-from typing import Dict, Any, Union
+import weakref
+from typing import Dict, Any, List, Union
 
 logger = logging.getLogger(__name__)
 
 class TxInput:
 
+    __slots__ = ("_owners", "_previous_tx_hash", "_output_index", "_script_sig")
+
     def __init__(self, previous_tx_hash: str, output_index: int, script_sig: Union[str, bytes]) -> None:
+        # Transacciones que contienen este input (su serialización cacheada depende del script_sig)
+        self._owners: List['weakref.ref[Any]'] = []
         try:
             if not previous_tx_hash:
                 raise ValueError("Referencia a hash previo vacía.")
@@ -48,6 +53,19 @@ class TxInput:
                 self._script_sig = bytes.fromhex(value)
              except ValueError:
                 self._script_sig = value.encode('utf-8')
+        self._notify_owners()
+
+    def attach(self, owner: Any) -> None:
+        """Registra una Transaction a invalidar cuando cambie el script_sig."""
+        if self._owners:
+            self._owners = [ref for ref in self._owners if ref() is not None]
+        self._owners.append(weakref.ref(owner))
+
+    def _notify_owners(self) -> None:
+        for ref in self._owners:
+            owner = ref()
+            if owner is not None:
+                owner.invalidate_serialization()
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializa la firma como HEX string."""
@@ -10,6 +10,8 @@ class TxOutput:
     Representa una salida de transacción (Un lock/candado con monedas).
     """
 
+    __slots__ = ("_value_alba", "_script_pubkey")
+
     def __init__(self, value_alba: int, script_pubkey: Union[str, bytes]): 
         # Validación defensiva
         if value_alba < 0:
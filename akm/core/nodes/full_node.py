@@ -1,7 +1,7 @@
 # akm/core/nodes/full_node.py
 
 import logging
-from typing import Dict, Any, cast, List
+from typing import Dict, Any, cast, List, Optional
 
 # Herencia y Utilería
 from akm.core.nodes.base_node import BaseNode
@@ -14,9 +14,14 @@ from akm.core.config.protocol_constants import ProtocolConstants
 
 # Core Managers y Modelos
 from akm.core.models.blockchain import Blockchain
+from akm.core.models.block import Block
 from akm.core.models.transaction import Transaction 
 from akm.core.managers.utxo_set import UTXOSet
 from akm.core.services.mempool import Mempool
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.signature_cache import SignatureCache
+from akm.core.services.fee_estimator import FeeEstimator
+from akm.core.services.orphan_pool import OrphanPool
 from akm.core.managers.consensus_orchestrator import ConsensusOrchestrator
 from akm.core.managers.chain_reorg_manager import ChainReorgManager
 from akm.core.factories.genesis_block_factory import GenesisBlockFactory
@@ -40,7 +45,10 @@ class FullNode(BaseNode):
         utxo_set: UTXOSet,
         mempool: Mempool,
         consensus: ConsensusOrchestrator,
-        reorg_manager: ChainReorgManager
+        reorg_manager: ChainReorgManager,
+        validation_cache: Optional[ValidationCache] = None,
+        fee_estimator: Optional[FeeEstimator] = None,
+        orphan_pool: Optional[OrphanPool] = None
     ):
         super().__init__(network_service=p2p_service, gossip_manager=gossip_manager)
         
@@ -50,10 +58,18 @@ class FullNode(BaseNode):
         self.mempool = mempool
         self.consensus = consensus
         self.reorg_manager = reorg_manager
+        self._validation_cache = validation_cache
+        self._tx_rules_validator = TransactionRulesValidator(utxo_set, validation_cache)
+        self.fee_estimator = fee_estimator
+        self.orphan_pool = orphan_pool if orphan_pool is not None else OrphanPool()
         
         self.p2p_service.set_height_provider(lambda: self.blockchain.height)
         
         self._hydrate_and_check_genesis()
+
+        # Las huérfanas se liberan cuando su padre se confirma en un bloque: las reglas
+        # de UTXO no permiten gastar outputs que solo están en el Mempool
+        self.reorg_manager.subscribe(self._on_blocks_connected)
         logger.info("🟢 FullNode inicializado y listo para la red.")
 
     def _hydrate_and_check_genesis(self) -> None:
@@ -109,19 +125,17 @@ class FullNode(BaseNode):
             raw_blocks.sort(key=lambda x: int(x.get('index', 0)))
 
             logger.info(f"📥 Procesando lote de {len(raw_blocks)} bloques...")
-            imported = 0
+            blocks: List[Block] = []
             
             for b_data in raw_blocks:
                 try:
-                    block = NodeMapper.reconstruct_block(b_data)
-                    if self.consensus.add_block(block): 
-                        imported += 1
-                    else:
-                        if block.index > self.blockchain.height + 1:
-                            pass
+                    blocks.append(NodeMapper.reconstruct_block(b_data))
                 except Exception as e: 
                     logger.error(f"Error importando bloque de lote: {e}")
                     break
+
+            # Validación por etapas: headers, cuerpo en paralelo, estado y commit por lotes
+            imported = self.consensus.add_blocks(blocks)
             
             logger.info(f"✅ Lote finalizado. +{imported} bloques. Altura: {self.blockchain.height}")
             
@@ -144,14 +158,17 @@ class FullNode(BaseNode):
         elif msg_type == ProtocolConstants.MSG_TX:
             try:
                 tx = NodeMapper.reconstruct_transaction(payload)
-                rules_validator = TransactionRulesValidator(self.utxo_set)
-                
-                if rules_validator.validate(tx):
-                    if self.mempool.add_transaction(tx):
-                        logger.info(f"🤑 TX {tx.tx_hash[:8]} válida en Mempool. Propagando.")
-                        self._gossip.propagate_transaction(tx.to_dict(), origin_peer=peer_id)
-            except Exception:
-                pass
+                self._accept_transaction(tx, peer_id)
+            except Exception as e:
+                logger.error(f"Error procesando TX Gossip de {peer_id[:8]}: {e}")
+
+        elif msg_type == ProtocolConstants.MSG_GET_FEE_ESTIMATE:
+            estimate = self.get_fee_estimate(int(payload.get("target_blocks", 6)))
+            if estimate:
+                self._network.send_message(peer_id, {
+                    "type": ProtocolConstants.MSG_FEE_ESTIMATE,
+                    "payload": estimate
+                })
 
         elif msg_type in [ProtocolConstants.MSG_GET_HEADERS, ProtocolConstants.MSG_GET_MERKLE_PROOF]:
             if msg_type == ProtocolConstants.MSG_GET_HEADERS:
@@ -159,6 +176,33 @@ class FullNode(BaseNode):
             else:
                 self._gossip.process_get_proof(payload, peer_id)
 
+    def _accept_transaction(self, tx: Transaction, peer_id: str) -> bool:
+        if self.mempool.contains(tx.tx_hash) or self.orphan_pool.contains(tx.tx_hash):
+            return False
+
+        if self._tx_rules_validator.validate(tx):
+            if self.mempool.add_transaction(tx):
+                logger.info(f"🤑 TX {tx.tx_hash[:8]} válida en Mempool. Propagando.")
+                self._gossip.propagate_transaction(tx.to_dict(), origin_peer=peer_id)
+                return True
+            return False
+
+        # ¿Falló porque el padre todavía no llegó? -> zona de espera
+        missing = self._tx_rules_validator.find_missing_inputs(tx)
+        if missing:
+            self.orphan_pool.add(tx, peer_id, missing)
+        return False
+
+    def _on_blocks_connected(self, blocks: List[Block]) -> None:
+        for block in blocks:
+            self._resolve_orphans(block.transactions)
+
+    def _resolve_orphans(self, parents: List[Transaction]) -> None:
+        for parent in parents:
+            for child, origin_peer in self.orphan_pool.pop_children(parent):
+                logger.info(f"🧩 Padre {parent.tx_hash[:8]} disponible. Reintentando TX {child.tx_hash[:8]}.")
+                self._accept_transaction(child, origin_peer)
+
     def _trigger_sync(self, peer_id: str, offset_back: int = 0) -> None:
         start = max(1, self.blockchain.height + 1 - offset_back)
         self._network.send_message(peer_id, {
@@ -167,8 +211,7 @@ class FullNode(BaseNode):
         })
 
     def submit_transaction(self, tx: Transaction) -> bool:
-        rules_validator = TransactionRulesValidator(self.utxo_set)
-        if not rules_validator.validate(tx):
+        if not self._tx_rules_validator.validate(tx):
              logger.warning(f"⚠️ TX Propia rechazada: {tx.tx_hash[:8]}")
              return False
         if self.mempool.add_transaction(tx):
@@ -178,4 +221,19 @@ class FullNode(BaseNode):
         return False
 
     def get_balance(self, address: str) -> int:
-        return self.utxo_set.get_balance_for_address(address)
\ No newline at end of file
+        return self.utxo_set.get_balance_for_address(address)
+
+    def get_validation_metrics(self) -> Dict[str, Any]:
+        """Aciertos de las cachés de validación (firmas y scripts) para la API."""
+        return {
+            "signature_cache": SignatureCache.shared().get_stats(),
+            "script_cache": self._validation_cache.get_stats() if self._validation_cache is not None else None
+        }
+
+    def get_fee_estimate(self, target_blocks: int = 6) -> Optional[Dict[str, Any]]:
+        """Comisión sugerida para confirmar en 'target_blocks' + histograma del Mempool."""
+        if self.fee_estimator is None:
+            return None
+        data = self.fee_estimator.estimate(target_blocks).to_dict()
+        data.update(self.fee_estimator.get_stats())
+        return data
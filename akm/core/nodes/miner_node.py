@@ -3,7 +3,7 @@
 import logging
 import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 # Herencia
 from akm.core.nodes.full_node import FullNode
@@ -14,13 +14,20 @@ from akm.core.config.protocol_constants import ProtocolConstants
 
 # Interfaces y Managers
 from akm.infra.network.p2p_service import P2PService 
+from akm.infra.network.work_server import WorkServer
 from akm.core.managers.mining_manager import MiningManager
 from akm.core.managers.gossip_manager import GossipManager
 from akm.core.models.blockchain import Blockchain
 from akm.core.managers.utxo_set import UTXOSet
 from akm.core.services.mempool import Mempool
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.fee_estimator import FeeEstimator
+from akm.core.services.orphan_pool import OrphanPool
 from akm.core.managers.consensus_orchestrator import ConsensusOrchestrator
 from akm.core.managers.chain_reorg_manager import ChainReorgManager
+from akm.core.models.block import Block
+from akm.core.utils.node_mapper import NodeMapper
+from akm.core.validators.block_validator import BlockValidator
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,9 @@ class MinerNode(FullNode):
     Solo agrega la capacidad de crear bloques (Proof of Work).
     """
 
+    # Espera máxima en pausa si la validación de un tip anunciado se demora
+    TIP_VALIDATION_TIMEOUT_SEC = 10.0
+
     def __init__(
         self, 
         p2p_service: P2PService,  
@@ -41,11 +51,15 @@ class MinerNode(FullNode):
         consensus: ConsensusOrchestrator, 
         reorg_manager: ChainReorgManager,
         mining_manager: MiningManager,
-        mining_config: MiningConfig 
+        mining_config: MiningConfig,
+        validation_cache: Optional[ValidationCache] = None,
+        fee_estimator: Optional[FeeEstimator] = None,
+        orphan_pool: Optional[OrphanPool] = None
     ):
         # 1. Inicializar al Padre (FullNode -> BaseNode)
         super().__init__(
-            p2p_service, gossip_manager, blockchain, utxo_set, mempool, consensus, reorg_manager
+            p2p_service, gossip_manager, blockchain, utxo_set, mempool, consensus, reorg_manager,
+            validation_cache, fee_estimator, orphan_pool
         )
         
         # [FIX TIPO] Explicitamos que self._gossip es del tipo GossipManager
@@ -59,9 +73,33 @@ class MinerNode(FullNode):
         # Evento para detener el minado actual si alguien más gana
         self._interrupt_mining = threading.Event()
 
+        # Tip anunciado (header con PoW válido) en validación: el minado queda en pausa
+        self._tip_settled = threading.Event()
+        self._tip_settled.set()
+        # (hash del tip, índice y bits que debe declarar su hijo): se calcula una vez por tip
+        self._expected_child: Optional[Tuple[str, int, str]] = None
+
+        # 3. Work Server opcional: reparte trabajo a workers externos
+        self._work_server: Optional[WorkServer] = None
+        if mining_config.work_server_port > 0:
+            self._work_server = WorkServer(
+                mining_manager=mining_manager,
+                address_provider=lambda: self._miner_address,
+                on_block_found=self._on_work_block_found,
+                host=mining_config.work_server_host,
+                port=mining_config.work_server_port,
+                share_bits=mining_config.work_share_bits or None
+            )
+
+    @property
+    def work_server(self) -> Optional[WorkServer]: return self._work_server
+
     def start(self):
         """Arranca la red (Padre) y luego el Minero."""
         super().start() 
+
+        if self._work_server:
+            self._work_server.start()
         
         if self._miner_address:
             logger.info(f"🔨 Auto-iniciando minería hacia: {self._miner_address}")
@@ -69,6 +107,14 @@ class MinerNode(FullNode):
         else:
             logger.warning("⚠️ Minero activo pero SIN dirección de pago configurada.")
 
+    def stop(self):
+        """Detiene la minería y libera los procesos del motor antes de la red."""
+        self.stop_mining()
+        self.miner.shutdown()
+        if self._work_server:
+            self._work_server.stop()
+        super().stop()
+
     # --- [NUEVO] Métodos requeridos por la API (dependencies.py) ---
     
     def stop_mining(self):
@@ -94,6 +140,14 @@ class MinerNode(FullNode):
         else:
             logger.info(f"⛏️ Dirección de minería actualizada en caliente: {address}")
 
+    def get_mining_metrics(self) -> Dict[str, Any]:
+        """Hashrate, nonces, edad de plantilla y bloques stale (para la API)."""
+        metrics = self.miner.get_metrics()
+        metrics["mining_active"] = self._mining_active
+        metrics["miner_address"] = self._miner_address or ""
+        metrics["work_server"] = self._work_server.get_stats() if self._work_server else None
+        return metrics
+
     # ---------------------------------------------------------------
 
     def _start_mining_thread(self):
@@ -107,18 +161,33 @@ class MinerNode(FullNode):
         Intercepta mensajes. Si llega un BLOQUE válido de la red,
         interrumpe el trabajo actual.
         """
-        # 1. Dejar que el FullNode procese el mensaje
-        super()._process_payload(msg_type, payload, peer_id)
-        
-        # 2. Reacción del Minero
-        if msg_type == ProtocolConstants.MSG_BLOCK:
-            # Si llegó un bloque, paramos de minar el actual
-            if self._mining_active:
-                self._interrupt_mining.set() 
+        # 0. Señal temprana: un header válido sobre nuestro tip pausa el hashing
+        #    y la próxima plantilla se prepara en paralelo a la validación completa
+        announced = msg_type == ProtocolConstants.MSG_BLOCK and self._on_tip_announced(payload)
+        previous_tip = self.blockchain.tip_hash if msg_type == ProtocolConstants.MSG_BLOCK else None
+
+        try:
+            # 1. Dejar que el FullNode procese el mensaje
+            super()._process_payload(msg_type, payload, peer_id)
+
+            # 2. Reacción del Minero
+            if msg_type == ProtocolConstants.MSG_BLOCK:
+                # Si llegó un bloque, paramos de minar el actual (si el header no lo hizo ya)
+                if self._mining_active and not announced:
+                    self._interrupt_mining.set() 
+                # Solo un tip nuevo invalida los trabajos: rechazados, duplicados y
+                # bloques de rama lateral no deben dejar viejas las shares de los workers
+                if self._work_server and self.blockchain.tip_hash != previous_tip:
+                    self._work_server.notify_new_tip()
+        finally:
+            if announced:
+                self._tip_settled.set()
 
     def _mining_loop(self):
         """Bucle infinito de intento de minado."""
         while self._mining_active:
+            # No minamos sobre un tip que está por quedar viejo
+            self._tip_settled.wait(timeout=self.TIP_VALIDATION_TIMEOUT_SEC)
             self._interrupt_mining.clear()
             
             if not self._miner_address:
@@ -133,15 +202,75 @@ class MinerNode(FullNode):
                 )
                 
                 # Si new_block existe, significa que NO fuimos interrumpidos y ganamos
-                if new_block:
-                    if self.consensus.add_block(new_block):
-                        tx_count = len(new_block.transactions)
-                        logger.info(f"💎 ¡BLOQUE #{new_block.index} MINADO! Hash: {new_block.hash[:8]} | TXs: {tx_count}")
-                        
-                        self._gossip.propagate_block(new_block.to_dict())
-                    else:
-                        logger.warning("Bloque propio rechazado (Stale/Viejo).")
+                if new_block and self._submit_mined_block(new_block):
+                    if self._work_server:
+                        self._work_server.notify_new_tip()
 
             except Exception as e:
                 logger.error(f"Error en hilo de minería: {e}")
-                time.sleep(1)
\ No newline at end of file
+                time.sleep(1)
+
+    def _on_tip_announced(self, payload: Dict[str, Any]) -> bool:
+        """
+        Chequeo a nivel header (sin TXs ni UTXOs): si el bloque extiende nuestro
+        tip, declara la dificultad que le corresponde y su PoW es válido,
+        se interrumpe el hashing de inmediato.
+        """
+        try:
+            header = NodeMapper.reconstruct_header(payload)
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        tip_hash = self.blockchain.tip_hash
+        if not tip_hash or header.previous_hash != tip_hash:
+            return False
+
+        # Los 'bits' los elige el emisor: un header con target máximo costaría nada
+        expected = self._expected_child_of(tip_hash)
+        if expected is None or (header.index, header.bits) != expected[1:]:
+            return False
+        if not BlockValidator.validate_header_pow(header):
+            return False
+
+        self._tip_settled.clear()
+        if self._mining_active:
+            self._interrupt_mining.set()
+            logger.info(f"⚡ Tip #{header.index} anunciado ({header.hash[:8]}): hashing en pausa durante la validación.")
+
+        if self._miner_address:
+            self.miner.prepare_next_template(header, NodeMapper.block_tx_hashes(payload), self._miner_address)
+        return True
+
+    def _expected_child_of(self, tip_hash: str) -> Optional[Tuple[str, int, str]]:
+        expected = self._expected_child
+        if expected is not None and expected[0] == tip_hash:
+            return expected
+
+        last_block = self.blockchain.last_block
+        if not last_block or last_block.hash != tip_hash:
+            return None
+        expected = (tip_hash, last_block.index + 1, self.miner.required_bits_after(last_block))
+        self._expected_child = expected
+        return expected
+
+    def _submit_mined_block(self, block: Block) -> bool:
+        """Conecta un bloque propio (hilo local o worker externo) y lo propaga."""
+        # Plantilla pre-validada mientras se hasheaba: sin re-validar TXs antes de propagar
+        trusted = self.miner.is_prevalidated(block)
+        if not self.consensus.add_block(block, trusted=trusted):
+            logger.warning("Bloque propio rechazado (Stale/Viejo).")
+            self.miner.telemetry.record_stale_block()
+            return False
+
+        self.miner.telemetry.record_block_found()
+        tx_count = len(block.transactions)
+        logger.info(f"💎 ¡BLOQUE #{block.index} MINADO! Hash: {block.hash[:8]} | TXs: {tx_count}")
+        self._gossip.propagate_block(block.to_dict())
+        return True
+
+    def _on_work_block_found(self, block: Block) -> bool:
+        accepted = self._submit_mined_block(block)
+        # El hilo local estaba minando sobre el tip que acaba de quedar viejo
+        if accepted and self._mining_active:
+            self._interrupt_mining.set()
+        return accepted
@@ -60,6 +60,9 @@ class SPVNode(BaseNode):
             "balance_alba": 0,
             "last_update": 0.0
         }
+
+        # Última estimación de comisiones recibida de un Full Node
+        self.fee_cache: Dict[str, Any] = {}
         
         # Logs de inicio
         if hasattr(self.p2p, 'config'):
@@ -75,6 +78,15 @@ class SPVNode(BaseNode):
         }
         self.p2p.broadcast(msg)
 
+    def request_fee_estimate(self, target_blocks: int = 6) -> None:
+        self.p2p.broadcast({
+            "type": ProtocolConstants.MSG_GET_FEE_ESTIMATE,
+            "payload": {"target_blocks": target_blocks}
+        })
+
+    def get_cached_fee_estimate(self) -> Dict[str, Any]:
+        return dict(self.fee_cache)
+
     def get_memory_utxo_set(self) -> Any:
         return self.MemoryUTXOAdapter(self.wallet_cache["utxos"])
 
@@ -138,6 +150,11 @@ class SPVNode(BaseNode):
             }
             logger.info(f"💰 Balance Recibido: {Monetary.to_akm(total_alba)} AKM ({len(utxos)} UTXOs)")
 
+        elif msg_type == ProtocolConstants.MSG_FEE_ESTIMATE:
+            self.fee_cache = dict(payload)
+            self.fee_cache["last_update"] = time.time()
+            logger.debug(f"Estimación de comisión recibida: {payload.get('fee_rate')} albas/byte")
+
         elif msg_type == ProtocolConstants.MSG_HANDSHAKE:
             peer_height = int(payload.get("height", 0))
             if peer_height > self.header_chain.height:
@@ -1,10 +1,11 @@
 # akm/core/scripting/engine.py
 
+import hashlib
 import logging
-from typing import List, Callable, Dict, Any, Optional
+from typing import List, Callable, Dict, Any, Optional, Tuple
 
 from akm.core.scripting.opcodes import Opcodes
-from akm.core.utils.crypto_utility import CryptoUtility
+from akm.core.scripting.script_parser import ScriptParser, ParsedScriptCache, OP_TRUNCATED_PUSH
 
 logger = logging.getLogger(__name__)
 
@@ -14,68 +15,95 @@ class ScriptError(Exception):
 
 SignatureVerifier = Callable[[bytes, bytes, Any, int], bool]
 
+# Plantilla P2PKH (ScriptBuilder): OP_DUP OP_HASH160 <20 bytes> OP_EQUALVERIFY OP_CHECKSIG
+_P2PKH_PREFIX = bytes([Opcodes.OP_DUP, Opcodes.OP_HASH160, 20])
+_P2PKH_SUFFIX = bytes([Opcodes.OP_EQUALVERIFY, Opcodes.OP_CHECKSIG])
+_P2PKH_SIZE = len(_P2PKH_PREFIX) + 20 + len(_P2PKH_SUFFIX)
+_MAX_DIRECT_PUSH = 0x4b
+_OP_CHECKSIG = int(Opcodes.OP_CHECKSIG)
+
 class ScriptEngine:
-    def __init__(self, signature_verifier: Optional[SignatureVerifier] = None) -> None:
-        try:
-            self.stack: List[bytes] = []
-            self._operations: Dict[int, Callable[[], None]] = {
-                Opcodes.OP_DUP: self._op_dup,
-                Opcodes.OP_HASH160: self._op_hash160,
-                Opcodes.OP_EQUALVERIFY: self._op_equalverify,
-                Opcodes.OP_CHECKSIG: self._op_checksig,
-                Opcodes.OP_DROP: self._op_drop,
-                Opcodes.OP_TRUE: self._op_true,
-            }
-            self._signature_verifier = signature_verifier
-            self._current_tx = None
-            self._current_input_index = 0
-            
-            logger.info("Motor de scripts (VM) listo.")
-        except Exception:
-            logger.exception("Error al inicializar ScriptEngine")
+    """
+    VM de scripts (pila). Los scripts P2PKH estándar (<sig> <pubkey> + plantilla)
+    se reconocen y validan por slicing directo: un hash160 y un checksig, con el
+    mismo veredicto que la VM. Cualquier otra forma pasa por el intérprete genérico,
+    que recorre operaciones ya decodificadas (los script_pubkey se parsean una vez
+    y quedan en ParsedScriptCache).
+    La pila y la TX en curso son locales a cada 'execute': una misma instancia
+    sirve para todos los inputs y todos los hilos.
+    """
+
+    def __init__(
+        self,
+        signature_verifier: Optional[SignatureVerifier] = None,
+        fast_path: bool = True,
+        script_cache: Optional[ParsedScriptCache] = None
+    ) -> None:
+        self._signature_verifier = signature_verifier
+        self._fast_path = fast_path
+        self._script_cache = script_cache if script_cache is not None else ParsedScriptCache.shared()
+        logger.debug("Motor de scripts (VM) listo.")
+
+    def execute(
+        self,
+        script_sig: bytes,
+        script_pubkey: bytes,
+        transaction: Any,
+        tx_input_index: int,
+        signature_verifier: Optional[SignatureVerifier] = None
+    ) -> bool:
+        """
+        Ejecuta script_sig + script_pubkey. 'signature_verifier' reemplaza, solo
+        para esta llamada, al verificador inyectado en el constructor.
+        """
+        verifier = signature_verifier if signature_verifier is not None else self._signature_verifier
+
+        if self._fast_path:
+            p2pkh = ScriptEngine.match_p2pkh(script_sig, script_pubkey)
+            if p2pkh is not None:
+                return ScriptEngine._execute_p2pkh(verifier, *p2pkh, transaction, tx_input_index)
 
-    def execute(self, script_sig: bytes, script_pubkey: bytes, transaction: Any, tx_input_index: int) -> bool:
-        self.stack.clear()
-        self._current_tx = transaction
-        self._current_input_index = tx_input_index
-        
         # El script completo es la unión del permiso (sig) y el candado (pubkey)
-        full_script = script_sig + script_pubkey
-        
+        sig_ops = ScriptParser.parse(script_sig)
+        if ScriptParser.is_truncated(sig_ops):
+            # El último PUSHDATA del sig invade el candado: se decodifica la unión (sin caché)
+            programs = (ScriptParser.parse(script_sig + script_pubkey),)
+        else:
+            programs = (sig_ops, self._script_cache.get(script_pubkey))
+
+        stack: List[bytes] = []
+        push = stack.append
+        operations = _OPERATIONS
         try:
-            pointer = 0
-            while pointer < len(full_script):
-                opcode = full_script[pointer]
-
-                # --- CASO A: PUSHDATA (0x01 a 0x4b) ---
-                if 0x01 <= opcode <= 0x4b:
-                    n_bytes = opcode
-                    if pointer + 1 + n_bytes > len(full_script):
-                        raise ScriptError("PUSHDATA fuera de límites.")
-                    
-                    data = full_script[pointer + 1 : pointer + 1 + n_bytes]
-                    self._push(data)
-                    pointer += 1 + n_bytes
-                    continue
-
-                # --- CASO B: OPCODES ---
-                pointer += 1
-                if opcode in self._operations:
-                    self._operations[opcode]()
-                else:
-                    logger.info(f"Script fallido: Opcode {hex(opcode)} desconocido.")
-                    return False
+            for ops in programs:
+                for opcode, data in ops:
+                    # --- CASO A: PUSHDATA (ya decodificado) ---
+                    if data is not None:
+                        push(data)
+                        continue
+
+                    # --- CASO B: OPCODES ---
+                    operation = operations.get(opcode)
+                    if operation is not None:
+                        operation(stack)
+                    elif opcode == _OP_CHECKSIG:
+                        ScriptEngine._op_checksig(stack, verifier, transaction, tx_input_index)
+                    else:
+                        if opcode == OP_TRUNCATED_PUSH:
+                            raise ScriptError("PUSHDATA fuera de límites.")
+                        logger.info(f"Script fallido: Opcode {hex(opcode)} desconocido.")
+                        return False
 
             # --- VALIDACIÓN FINAL ---
-            if not self.stack:
+            if not stack:
                 return False
             
             # El tope de la pila debe ser distinto de cero para ser válido
-            top = self.stack[-1]
+            top = stack[-1]
             success = (top == b'\x01') or (len(top) > 0 and any(b != 0 for b in top))
             
             if success:
-                logger.info(f"Script verificado para input {tx_input_index}.")
+                logger.debug(f"Script verificado para input {tx_input_index}.")
             else:
                 logger.info(f"Script fallido (Tope de pila falso) en input {tx_input_index}.")
                 
@@ -87,54 +115,106 @@ class ScriptEngine:
         except Exception:
             logger.exception("Error crítico en la ejecución del script")
             return False
-        finally:
-            self._current_tx = None
-
-    # --- MANIPULACIÓN DE PILA ---
-    def _push(self, data: bytes):
-        self.stack.append(data)
-
-    def _pop(self) -> bytes:
-        if not self.stack:
-            raise ScriptError("Stack Underflow (Intento de pop en pila vacía).")
-        return self.stack.pop()
-
-    # --- IMPLEMENTACIÓN DE OPCODES ---
-    def _op_true(self): self._push(b'\x01')
-    def _op_drop(self): self._pop()
-    def _op_dup(self):
-        val = self._pop()
-        self._push(val)
-        self._push(val)
-
-    def _op_equalverify(self):
-        elem1 = self._pop()
-        elem2 = self._pop()
-        if elem1 != elem2:
-            raise ScriptError("OP_EQUALVERIFY: Elementos no coinciden.")
-
-    def _op_hash160(self):
-        element = self._pop()
-        # CryptoUtility maneja str o bytes, pero normalizamos aquí para seguridad
-        hashed_hex = CryptoUtility.hash160(element)
-        self._push(bytes.fromhex(hashed_hex))
-
-    def _op_checksig(self):
-        if self._signature_verifier is None:
+
+    @staticmethod
+    def match_p2pkh(script_sig: bytes, script_pubkey: bytes) -> Optional[Tuple[bytes, bytes, bytes]]:
+        """
+        (firma, clave pública, hash160 esperado) si el par es P2PKH estándar:
+        candado exacto de la plantilla y script_sig formado por dos PUSHDATA directos
+        que lo consumen entero. None para cualquier otra forma.
+        """
+        if len(script_pubkey) != _P2PKH_SIZE:
+            return None
+        if script_pubkey[:3] != _P2PKH_PREFIX or script_pubkey[23:] != _P2PKH_SUFFIX:
+            return None
+        if not script_sig:
+            return None
+
+        sig_len = script_sig[0]
+        pub_at = 1 + sig_len
+        if not 0x01 <= sig_len <= _MAX_DIRECT_PUSH or pub_at >= len(script_sig):
+            return None
+
+        pub_len = script_sig[pub_at]
+        if not 0x01 <= pub_len <= _MAX_DIRECT_PUSH or pub_at + 1 + pub_len != len(script_sig):
+            return None
+
+        return script_sig[1:pub_at], script_sig[pub_at + 1:], script_pubkey[3:23]
+
+    # --- RUTA RÁPIDA P2PKH ---
+    @staticmethod
+    def _execute_p2pkh(
+        verifier: Optional[SignatureVerifier],
+        signature: bytes,
+        public_key: bytes,
+        key_hash: bytes,
+        transaction: Any,
+        tx_input_index: int
+    ) -> bool:
+        # OP_DUP OP_HASH160 <hash> OP_EQUALVERIFY
+        if _hash160(public_key) != key_hash:
+            logger.info("Script inválido: OP_EQUALVERIFY: Elementos no coinciden.")
+            return False
+
+        # OP_CHECKSIG
+        if verifier is None:
+            logger.info("Script inválido: Falta verificador de firmas inyectado.")
+            return False
+        try:
+            if not verifier(signature, public_key, transaction, tx_input_index):
+                logger.info("Script inválido: OP_CHECKSIG: Firma criptográfica inválida.")
+                return False
+            return True
+        except Exception:
+            logger.exception("Error crítico en la ejecución del script")
+            return False
+
+    # --- OP_CHECKSIG (única operación que necesita la TX) ---
+    @staticmethod
+    def _op_checksig(stack: List[bytes], verifier: Optional[SignatureVerifier], transaction: Any, tx_input_index: int) -> None:
+        if verifier is None:
             raise ScriptError("Falta verificador de firmas inyectado.")
 
-        pub_key_bytes = self._pop()
-        signature_bytes = self._pop()
+        pub_key_bytes = _pop(stack)
+        signature_bytes = _pop(stack)
         
         # Delegamos la verificación criptográfica pesada al servicio externo
-        is_valid = self._signature_verifier(
-            signature_bytes, 
-            pub_key_bytes, 
-            self._current_tx, 
-            self._current_input_index
-        )
-
-        if not is_valid:
+        if not verifier(signature_bytes, pub_key_bytes, transaction, tx_input_index):
             raise ScriptError("OP_CHECKSIG: Firma criptográfica inválida.")
         
-        self._push(b'\x01')
\ No newline at end of file
+        stack.append(b'\x01')
+
+# --- MANIPULACIÓN DE PILA ---
+def _pop(stack: List[bytes]) -> bytes:
+    if not stack:
+        raise ScriptError("Stack Underflow (Intento de pop en pila vacía).")
+    return stack.pop()
+
+def _hash160(data: bytes) -> bytes:
+    return hashlib.new('ripemd160', hashlib.sha256(data).digest()).digest()
+
+# --- IMPLEMENTACIÓN DE OPCODES ---
+def _op_true(stack: List[bytes]) -> None: stack.append(b'\x01')
+def _op_drop(stack: List[bytes]) -> None: _pop(stack)
+def _op_dup(stack: List[bytes]) -> None:
+    val = _pop(stack)
+    stack.append(val)
+    stack.append(val)
+
+def _op_equalverify(stack: List[bytes]) -> None:
+    elem1 = _pop(stack)
+    elem2 = _pop(stack)
+    if elem1 != elem2:
+        raise ScriptError("OP_EQUALVERIFY: Elementos no coinciden.")
+
+def _op_hash160(stack: List[bytes]) -> None:
+    stack.append(_hash160(_pop(stack)))
+
+# OP_CHECKSIG no está aquí: necesita la TX y el verificador (ver execute)
+_OPERATIONS: Dict[int, Callable[[List[bytes]], None]] = {
+    int(Opcodes.OP_DUP): _op_dup,
+    int(Opcodes.OP_HASH160): _op_hash160,
+    int(Opcodes.OP_EQUALVERIFY): _op_equalverify,
+    int(Opcodes.OP_DROP): _op_drop,
+    int(Opcodes.OP_TRUE): _op_true,
+}
@@ -0,0 +1,118 @@
+# akm/core/scripting/script_parser.py
+
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (opcode, datos del PUSHDATA o None)
+ParsedOp = Tuple[int, Optional[bytes]]
+ParsedScript = Tuple[ParsedOp, ...]
+
+# Pseudo-opcode: PUSHDATA que se sale del script (la VM lo rechaza al llegar a él)
+OP_TRUNCATED_PUSH = -1
+
+_MAX_DIRECT_PUSH = 0x4b
+
+class ScriptParser:
+    """
+    Decodifica un script una sola vez en una tupla inmutable de operaciones.
+    Los errores no se lanzan al parsear: quedan en su posición (OP_TRUNCATED_PUSH,
+    opcodes desconocidos) para que la VM falle en el mismo punto que antes.
+    """
+
+    @staticmethod
+    def parse(script: bytes) -> ParsedScript:
+        ops = []
+        pointer = 0
+        size = len(script)
+        while pointer < size:
+            opcode = script[pointer]
+
+            if 0x01 <= opcode <= _MAX_DIRECT_PUSH:
+                end = pointer + 1 + opcode
+                if end > size:
+                    ops.append((OP_TRUNCATED_PUSH, None))
+                    break
+                # bytes (no memoryview): los datos salen de la VM hacia verificadores,
+                # cachés y el pool de procesos; se copian una vez al parsear
+                ops.append((opcode, bytes(script[pointer + 1:end])))
+                pointer = end
+                continue
+
+            ops.append((opcode, None))
+            pointer += 1
+        return tuple(ops)
+
+    @staticmethod
+    def is_truncated(ops: ParsedScript) -> bool:
+        return bool(ops) and ops[-1][0] == OP_TRUNCATED_PUSH
+
+class ParsedScriptCache:
+    """
+    LRU de scripts ya decodificados, por bytes del script_pubkey.
+    Los candados se repiten entre inputs (misma dirección, mismo contrato):
+    se parsean una vez por proceso.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    _shared: Optional['ParsedScriptCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: 'OrderedDict[bytes, ParsedScript]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def shared(cls) -> 'ParsedScriptCache':
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = ParsedScriptCache()
+            return cls._shared
+
+    # --- Getters ---
+    @property
+    def hits(self) -> int: return self._hits
+    @property
+    def misses(self) -> int: return self._misses
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, script: bytes) -> ParsedScript:
+        script = bytes(script)
+        with self._lock:
+            ops = self._entries.get(script)
+            if ops is not None:
+                self._entries.move_to_end(script)
+                self._hits += 1
+                return ops
+            self._misses += 1
+
+        ops = ScriptParser.parse(script)
+        with self._lock:
+            self._entries[script] = ops
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return ops
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses
+            }
@@ -10,37 +10,50 @@ logger = logging.getLogger(__name__)
 
 class BlockHasher:
 
-    @staticmethod
-    def calculate(header: BlockHeaderProtocol) -> str:
-        try:
-            payload = bytearray()
+    # Índice (4) + hash previo (32) + Merkle (32) + timestamp (8) + bits (4) + nonce (4)
+    HEADER_SIZE = 84
 
-            # 1. Index / Altura (4 bytes unsigned int)
-            payload.extend(struct.pack('<I', header.index))
+    @staticmethod
+    def serialize_prefix(header: BlockHeaderProtocol) -> bytes:
+        """
+        Serializa todos los campos del header EXCEPTO el nonce (parte constante
+        durante la búsqueda de PoW). El header completo es prefijo + nonce '<I'.
+        """
+        payload = bytearray()
 
-            # 2. Previous Hash (32 bytes)
-            if header.previous_hash == "0": 
-                payload.extend(b'\x00' * 32)
-            else:
-                try:
-                    payload.extend(bytes.fromhex(header.previous_hash))
-                except ValueError:
-                    payload.extend(b'\x00' * 32)
+        # 1. Index / Altura (4 bytes unsigned int)
+        payload.extend(struct.pack('<I', header.index))
 
-            # 3. Merkle Root (32 bytes)
+        # 2. Previous Hash (32 bytes)
+        if header.previous_hash == "0": 
+            payload.extend(b'\x00' * 32)
+        else:
             try:
-                payload.extend(bytes.fromhex(header.merkle_root))
+                payload.extend(bytes.fromhex(header.previous_hash))
             except ValueError:
                 payload.extend(b'\x00' * 32)
 
-            # 4. Timestamp (8 bytes unsigned long long)
-            payload.extend(struct.pack('<Q', header.timestamp))
+        # 3. Merkle Root (32 bytes)
+        try:
+            payload.extend(bytes.fromhex(header.merkle_root))
+        except ValueError:
+            payload.extend(b'\x00' * 32)
 
-            # 5. Bits / Dificultad (4 bytes hex a bytes)
-            try:
-                payload.extend(bytes.fromhex(header.bits))
-            except ValueError:
-                payload.extend(b'\x00\x00\x00\x00')
+        # 4. Timestamp (8 bytes unsigned long long)
+        payload.extend(struct.pack('<Q', header.timestamp))
+
+        # 5. Bits / Dificultad (4 bytes hex a bytes)
+        try:
+            payload.extend(bytes.fromhex(header.bits))
+        except ValueError:
+            payload.extend(b'\x00\x00\x00\x00')
+
+        return bytes(payload)
+
+    @staticmethod
+    def calculate(header: BlockHeaderProtocol) -> str:
+        try:
+            payload = bytearray(BlockHasher.serialize_prefix(header))
 
             # 6. Nonce (4 bytes unsigned int)
             payload.extend(struct.pack('<I', header.nonce))
@@ -53,4 +66,4 @@ class BlockHasher:
             # Usamos getattr por seguridad si el objeto falla, aunque el protocolo lo garantiza
             idx = getattr(header, 'index', 'Unknown')
             logger.exception(f"Error crítico de serialización en Bloque #{idx}")
-            return ""
\ No newline at end of file
+            return ""
@@ -0,0 +1,249 @@
+# akm/core/services/fee_estimator.py
+
+import math
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Dependencias
+from akm.core.models.block import Block
+from akm.core.models.transaction import Transaction
+from akm.core.services.mempool import Mempool
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class FeeEstimate:
+    target_blocks: int
+    fee_rate: float          # Albas por byte
+    suggested_fee: int       # Albas para una TX típica (1 input, 2 outputs)
+    source: str              # "history" | "mempool" | "minimum"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "target_blocks": self.target_blocks,
+            "fee_rate": self.fee_rate,
+            "suggested_fee": self.suggested_fee,
+            "source": self.source
+        }
+
+class FeeEstimator:
+    """
+    Estimador de comisiones alimentado por eventos (sin escanear el Mempool).
+    - Admisión: la TX entra a su bucket de fee-rate (albas/byte) y al histograma.
+    - Inclusión en bloque: se registra cuántos bloques tardó en confirmarse,
+      medido contra la altura del bloque conectado (on_blocks_connected).
+    - Estimación: el bucket más barato que históricamente confirma dentro del
+      objetivo con probabilidad >= SUCCESS_THRESHOLD. Sin historia suficiente,
+      se usa la profundidad actual del Mempool.
+    """
+
+    MIN_FEE_RATE = 1.0
+    MAX_FEE_RATE = 1e7
+    BUCKET_SPACING = 1.25
+    MAX_TARGET_BLOCKS = 25
+    SUCCESS_THRESHOLD = 0.85
+    MIN_SAMPLES = 8
+    DECAY = 0.998
+    TYPICAL_TX_BYTES = 344
+
+    def __init__(
+        self,
+        mempool: Mempool,
+        height_provider: Callable[[], int],
+        block_capacity: int = 2000
+    ) -> None:
+        self._height_provider = height_provider
+        self._block_capacity = max(1, block_capacity)
+        self._lock = threading.Lock()
+
+        # Límites inferiores de cada bucket: [0, 1), [1, 1.25), [1.25, 1.56)...
+        self._bounds: List[float] = [0.0]
+        rate = FeeEstimator.MIN_FEE_RATE
+        while rate < FeeEstimator.MAX_FEE_RATE:
+            self._bounds.append(rate)
+            rate *= FeeEstimator.BUCKET_SPACING
+
+        bucket_count = len(self._bounds)
+        self._pending: List[int] = [0] * bucket_count
+        self._observed: List[float] = [0.0] * bucket_count
+        self._confirmed_within: List[List[float]] = [
+            [0.0] * FeeEstimator.MAX_TARGET_BLOCKS for _ in range(bucket_count)
+        ]
+        self._tracked: Dict[str, Tuple[int, int]] = {}
+        # Retiradas del Mempool a la espera del bloque que las confirma
+        self._confirming: Dict[str, Tuple[int, int]] = {}
+        self._last_height = -1
+
+        mempool.subscribe(self._on_transaction_added, self._on_transactions_removed)
+
+    # --- Consultas ---
+
+    def estimate(self, target_blocks: int) -> FeeEstimate:
+        target = min(max(1, int(target_blocks)), FeeEstimator.MAX_TARGET_BLOCKS)
+
+        with self._lock:
+            bucket = self._estimate_from_history(target)
+            source = "history"
+            if bucket is None:
+                bucket = self._estimate_from_mempool(target)
+                source = "mempool" if bucket is not None else "minimum"
+
+        fee_rate = self._bounds[bucket] if bucket is not None else FeeEstimator.MIN_FEE_RATE
+        fee_rate = max(fee_rate, FeeEstimator.MIN_FEE_RATE)
+        return FeeEstimate(
+            target_blocks=target,
+            fee_rate=round(fee_rate, 4),
+            suggested_fee=math.ceil(fee_rate * FeeEstimator.TYPICAL_TX_BYTES),
+            source=source
+        )
+
+    def get_histogram(self) -> List[Dict[str, Any]]:
+        """Histograma del Mempool por fee-rate (solo buckets no vacíos)."""
+        with self._lock:
+            histogram: List[Dict[str, Any]] = []
+            for i, count in enumerate(self._pending):
+                if count:
+                    histogram.append({
+                        "min_fee_rate": round(self._bounds[i], 4),
+                        "max_fee_rate": round(self._upper_bound(i), 4),
+                        "count": count
+                    })
+            return histogram
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending_count = len(self._tracked)
+            observed = sum(self._observed)
+        return {
+            "pending_count": pending_count,
+            "observed_confirmations": round(observed, 2),
+            "histogram": self.get_histogram()
+        }
+
+    # --- Eventos del Mempool ---
+
+    def _on_transaction_added(self, tx: Transaction) -> None:
+        bucket = self._bucket_for(self._fee_rate(tx))
+        height = self._height_provider()
+        with self._lock:
+            if tx.tx_hash in self._tracked:
+                return
+            self._tracked[tx.tx_hash] = (bucket, height)
+            self._pending[bucket] += 1
+
+    def _on_transactions_removed(self, txs: List[Transaction]) -> None:
+        # Salen del histograma ya; la confirmación se mide cuando llega su bloque
+        with self._lock:
+            for tx in txs:
+                entry = self._tracked.pop(tx.tx_hash, None)
+                if entry is None:
+                    continue
+                self._pending[entry[0]] -= 1
+                self._confirming[tx.tx_hash] = entry
+
+    # --- Eventos de la cadena ---
+
+    def on_blocks_connected(self, blocks: List[Block]) -> None:
+        """
+        Registra las confirmaciones con la altura de cada bloque que las incluye
+        (ChainReorgManager.subscribe). No depende de la altura persistida: el
+        pipeline de Sync aplica bloques antes de que la cadena los refleje.
+        """
+        with self._lock:
+            for block in blocks:
+                self._apply_decay(block.index)
+                for tx in block.transactions:
+                    entry = self._confirming.pop(tx.tx_hash, None)
+                    if entry is None:
+                        entry = self._tracked.pop(tx.tx_hash, None)
+                        if entry is None:
+                            continue
+                        self._pending[entry[0]] -= 1
+
+                    bucket, entry_height = entry
+                    # Bloques hasta confirmar, medidos contra el bloque que la incluye (mínimo 1)
+                    blocks_to_confirm = max(1, block.index - entry_height)
+                    self._observed[bucket] += 1
+                    row = self._confirmed_within[bucket]
+                    for t in range(blocks_to_confirm - 1, FeeEstimator.MAX_TARGET_BLOCKS):
+                        row[t] += 1
+
+            # Lo retirado sin bloque que lo confirme (Ej: reconstrucción) no es una muestra
+            self._confirming.clear()
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _estimate_from_history(self, target: int) -> Optional[int]:
+        # Recorremos de la comisión más alta a la más baja agrupando buckets
+        # hasta tener muestras suficientes; nos quedamos con el último que cumple.
+        best: Optional[int] = None
+        acc_observed = 0.0
+        acc_confirmed = 0.0
+
+        for bucket in range(len(self._bounds) - 1, -1, -1):
+            acc_observed += self._observed[bucket]
+            acc_confirmed += self._confirmed_within[bucket][target - 1]
+            if acc_observed < FeeEstimator.MIN_SAMPLES:
+                continue
+
+            if acc_confirmed / acc_observed < FeeEstimator.SUCCESS_THRESHOLD:
+                break
+
+            best = bucket
+            acc_observed = 0.0
+            acc_confirmed = 0.0
+
+        return best
+
+    def _estimate_from_mempool(self, target: int) -> Optional[int]:
+        # Hay que superar a las TXs que ya llenan los próximos 'target' bloques
+        capacity = target * self._block_capacity
+        ahead = 0
+        for bucket in range(len(self._bounds) - 1, -1, -1):
+            ahead += self._pending[bucket]
+            if ahead >= capacity:
+                return min(bucket + 1, len(self._bounds) - 1)
+        return None
+
+    def _apply_decay(self, height: int) -> None:
+        if self._last_height < 0:
+            self._last_height = height
+            return
+
+        elapsed = height - self._last_height
+        if elapsed <= 0:
+            return
+
+        factor = FeeEstimator.DECAY ** elapsed
+        for bucket in range(len(self._bounds)):
+            if not self._observed[bucket]:
+                continue
+            self._observed[bucket] *= factor
+            row = self._confirmed_within[bucket]
+            for t in range(FeeEstimator.MAX_TARGET_BLOCKS):
+                row[t] *= factor
+        self._last_height = height
+
+    def _fee_rate(self, tx: Transaction) -> float:
+        size = tx.size_bytes
+        return tx.fee / size if size > 0 else 0.0
+
+    def _bucket_for(self, fee_rate: float) -> int:
+        if fee_rate < FeeEstimator.MIN_FEE_RATE:
+            return 0
+        bucket = 1 + int(math.log(fee_rate / FeeEstimator.MIN_FEE_RATE, FeeEstimator.BUCKET_SPACING))
+        bucket = min(bucket, len(self._bounds) - 1)
+
+        # Corrección de redondeo en los bordes del logaritmo
+        while bucket > 1 and fee_rate < self._bounds[bucket]:
+            bucket -= 1
+        while bucket + 1 < len(self._bounds) and fee_rate >= self._bounds[bucket + 1]:
+            bucket += 1
+        return bucket
+
+    def _upper_bound(self, bucket: int) -> float:
+        if bucket + 1 < len(self._bounds):
+            return self._bounds[bucket + 1]
+        return FeeEstimator.MAX_FEE_RATE
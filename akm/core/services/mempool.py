@@ -1,8 +1,9 @@
 # akm/core/services/mempool.py
 
+import os
 import threading
 import logging
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Dependencias
 from akm.core.models.transaction import Transaction
@@ -10,56 +11,150 @@ from akm.core.config.consensus_config import ConsensusConfig
 
 logger = logging.getLogger(__name__)
 
+# Callbacks de eventos del Mempool (Ej: plantilla de bloque del minero)
+TxAddedListener = Callable[[Transaction], None]
+TxsRemovedListener = Callable[[List[Transaction]], None]
+
+class _MempoolShard:
+    """Fracción del pool con su propio candado (lock striping)."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.txs: Dict[str, Transaction] = {}
+
 class Mempool:
+    """
+    Pool de transacciones pendientes preparado para inundaciones de Gossip.
+    - Escrituras: candado por fracción (stripe) según el hash; TXs distintas no compiten.
+    - Lecturas (conteo, pertenencia, selección para bloque): sin candado global,
+      cada fracción se copia por separado y los escritores de las demás siguen.
+    - Logs y observadores se ejecutan FUERA de cualquier candado.
+    """
 
-    def __init__(self):
-        self._pending_txs: Dict[str, Transaction] = {}
+    def __init__(self, stripes: Optional[int] = None):
         self._config = ConsensusConfig()
-        self._lock = threading.RLock()
+        stripe_count = stripes or int(os.getenv("AKM_MEMPOOL_STRIPES", 16))
+        self._shards: Tuple[_MempoolShard, ...] = tuple(_MempoolShard() for _ in range(max(1, stripe_count)))
+
+        # Contador global (solo para el límite de capacidad)
+        self._size = 0
+        self._size_lock = threading.Lock()
+
+        # Copy-on-write: la tupla se reemplaza entera al suscribir
+        self._listeners: Tuple[Tuple[Optional[TxAddedListener], Optional[TxsRemovedListener]], ...] = ()
+        self._listeners_lock = threading.Lock()
+
+    def subscribe(
+        self,
+        on_added: Optional[TxAddedListener] = None,
+        on_removed: Optional[TxsRemovedListener] = None
+    ) -> None:
+        """
+        Registra observadores de admisión y salida de TXs.
+        Los callbacks se invocan FUERA del candado para no bloquear a otros hilos.
+        """
+        with self._listeners_lock:
+            self._listeners = self._listeners + ((on_added, on_removed),)
 
     def add_transaction(self, tx: Transaction) -> bool:
-        with self._lock:
-            try:
-                if tx.tx_hash in self._pending_txs:
+        try:
+            shard = self._shard_for(tx.tx_hash)
+            with shard.lock:
+                if tx.tx_hash in shard.txs:
                     return False
 
-                if len(self._pending_txs) >= self._config.mempool_max_size:
-                    logger.info("Mempool llena. TX rechazada.")
-                    return False
+                if not self._reserve_slot():
+                    full = True
+                else:
+                    full = False
+                    shard.txs[tx.tx_hash] = tx
 
-                self._pending_txs[tx.tx_hash] = tx
-                
-                logger.info(f"TX {tx.tx_hash[:]}... en espera.")
-                return True
+        except Exception:
+            logger.exception("Bug al procesar entrada en Mempool")
+            return False
 
-            except Exception:
-                logger.exception("Bug al procesar entrada en Mempool")
-                return False
+        if full:
+            logger.info("Mempool llena. TX rechazada.")
+            return False
+
+        logger.info(f"TX {tx.tx_hash[:]}... en espera.")
+        self._notify_added(self._listeners, tx)
+        return True
+
+    def contains(self, tx_hash: str) -> bool:
+        # Lectura de un dict: atómica, no requiere candado
+        return tx_hash in self._shard_for(tx_hash).txs
+
+    def get_transaction(self, tx_hash: str) -> Optional[Transaction]:
+        return self._shard_for(tx_hash).txs.get(tx_hash)
 
     def get_transactions_for_block(self, max_count: int = 2000) -> List[Transaction]:
-        with self._lock:
-            try:
-                all_txs = list(self._pending_txs.values())
-                all_txs.sort(key=lambda t: t.fee, reverse=True)
-                return all_txs[:max_count]
-            except Exception:
-                logger.exception("Error al recuperar transacciones para el bloque")
-                return []
+        try:
+            all_txs = self._snapshot()
+            all_txs.sort(key=lambda t: t.fee, reverse=True)
+            return all_txs[:max_count]
+        except Exception:
+            logger.exception("Error al recuperar transacciones para el bloque")
+            return []
 
     def remove_mined_transactions(self, mined_txs: List[Transaction]) -> None:
-        with self._lock:
+        removed: List[Transaction] = []
+        try:
+            for tx in mined_txs:
+                shard = self._shard_for(tx.tx_hash)
+                with shard.lock:
+                    pending = shard.txs.pop(tx.tx_hash, None)
+                if pending is not None:
+                    removed.append(pending)
+
+            if removed:
+                with self._size_lock:
+                    self._size -= len(removed)
+                logger.info(f"Mempool: -{len(removed)} TXs confirmadas.")
+        except Exception:
+            logger.exception("Bug durante la limpieza de Mempool")
+
+        if removed:
+            self._notify_removed(self._listeners, removed)
+
+    def get_pending_count(self) -> int:
+        return self._size
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _shard_for(self, tx_hash: str) -> _MempoolShard:
+        return self._shards[hash(tx_hash) % len(self._shards)]
+
+    def _reserve_slot(self) -> bool:
+        with self._size_lock:
+            if self._size >= self._config.mempool_max_size:
+                return False
+            self._size += 1
+            return True
+
+    def _snapshot(self) -> List[Transaction]:
+        txs: List[Transaction] = []
+        for shard in self._shards:
+            with shard.lock:
+                txs.extend(shard.txs.values())
+        return txs
+
+    # --- NOTIFICACIÓN DE EVENTOS ---
+
+    def _notify_added(self, listeners: Tuple[Tuple[Optional[TxAddedListener], Optional[TxsRemovedListener]], ...], tx: Transaction) -> None:
+        for on_added, _ in listeners:
+            if on_added is None:
+                continue
             try:
-                count = 0
-                for tx in mined_txs:
-                    if tx.tx_hash in self._pending_txs:
-                        del self._pending_txs[tx.tx_hash]
-                        count += 1
-                
-                if count > 0:
-                    logger.info(f"Mempool: -{count} TXs confirmadas.")
+                on_added(tx)
             except Exception:
-                logger.exception("Bug durante la limpieza de Mempool")
+                logger.exception("Error en observador de admisión del Mempool")
 
-    def get_pending_count(self) -> int:
-        with self._lock:
-            return len(self._pending_txs)
\ No newline at end of file
+    def _notify_removed(self, listeners: Tuple[Tuple[Optional[TxAddedListener], Optional[TxsRemovedListener]], ...], txs: List[Transaction]) -> None:
+        for _, on_removed in listeners:
+            if on_removed is None:
+                continue
+            try:
+                on_removed(txs)
+            except Exception:
+                logger.exception("Error en observador de limpieza del Mempool")
@@ -0,0 +1,211 @@
+# akm/core/services/merkle_tree.py
+
+import hashlib
+import logging
+from typing import Dict, List, Optional, Sequence, Union
+
+from akm.core.utils.crypto_utility import CryptoUtility
+
+logger = logging.getLogger(__name__)
+
+DIGEST_SIZE = 32
+
+class MerkleTree:
+    """
+    Árbol de Merkle con todos sus niveles en caché como digests crudos de 32 bytes
+    (un bytearray contiguo por nivel).
+    - Construcción: un lote de doble SHA-256 por nivel.
+    - Reemplazo, alta y baja de la última hoja: solo se recalcula la rama, O(log n).
+    - Pruebas de inclusión: lectura de hermanos ya calculados, O(log n) y sin hashear.
+    Mismas reglas de consenso que MerkleTreeBuilder: el último nodo impar se
+    duplica y cada par se hashea como texto hex concatenado.
+    """
+
+    def __init__(self, leaves: Union[Sequence[bytes], bytes, bytearray] = (), threads: int = 1) -> None:
+        """'leaves': lista de digests o un buffer contiguo de digests de 32 bytes."""
+        if isinstance(leaves, (bytes, bytearray)):
+            if len(leaves) % DIGEST_SIZE != 0:
+                raise ValueError("El buffer de hojas no es múltiplo de 32 bytes.")
+            level = bytearray(leaves)
+        else:
+            if any(len(leaf) != DIGEST_SIZE for leaf in leaves):
+                raise ValueError("Las hojas deben ser digests de 32 bytes.")
+            level = bytearray(b"".join(leaves))
+
+        self._levels: List[bytearray] = [level]
+        self._positions: Optional[Dict[bytes, int]] = None
+
+        # Construcción inicial de abajo hacia arriba: O(n)
+        while self._count(len(self._levels) - 1) > 1:
+            self._levels.append(MerkleTree._hash_level(self._levels[-1], threads))
+
+    @classmethod
+    def from_hashes(cls, tx_hashes: Sequence[str], threads: int = 1) -> 'MerkleTree':
+        """Desde hashes hex (minúsculas, 64 caracteres). ValueError si alguno no lo es."""
+        if not all(len(tx_hash) == 2 * DIGEST_SIZE for tx_hash in tx_hashes):
+            raise ValueError("Hash no canónico para Merkle (largo distinto de 64).")
+        # Una sola conversión para todas las hojas
+        return cls(MerkleTree.to_digest("".join(tx_hashes), DIGEST_SIZE * len(tx_hashes)), threads)
+
+    @staticmethod
+    def root_of(tx_hashes: Sequence[str], threads: int = 1) -> str:
+        """
+        Solo la raíz, sin guardar niveles (validación de bloques).
+        Cada nivel queda como texto hex contiguo: entrada directa del siguiente.
+        """
+        if not all(len(tx_hash) == 2 * DIGEST_SIZE for tx_hash in tx_hashes):
+            raise ValueError("Hash no canónico para Merkle (largo distinto de 64).")
+        if not tx_hashes:
+            return CryptoUtility.double_sha256("")
+
+        level = "".join(tx_hashes).encode('utf-8')
+        count = len(tx_hashes)
+        while count > 1:
+            if count % 2 != 0:
+                level += level[-2 * DIGEST_SIZE:]
+            digests = CryptoUtility.double_sha256_batch(level, item_size=4 * DIGEST_SIZE, threads=threads)
+            level = b"".join(digests).hex().encode('utf-8')
+            count = len(digests)
+        return level.decode('utf-8')
+
+    @staticmethod
+    def to_digest(tx_hash: str, size: int = DIGEST_SIZE) -> bytes:
+        digest = bytes.fromhex(tx_hash)
+        # El consenso hashea el texto: solo se acepta la forma hex canónica
+        if len(digest) != size or digest.hex() != tx_hash:
+            raise ValueError(f"Hash no canónico para Merkle: {tx_hash[:16]}")
+        return digest
+
+    # --- Lectura ---
+
+    @property
+    def leaf_count(self) -> int:
+        return self._count(0)
+
+    @property
+    def depth(self) -> int:
+        return len(self._levels) - 1
+
+    @property
+    def root(self) -> bytes:
+        if not self._levels[0]:
+            return bytes.fromhex(CryptoUtility.double_sha256(""))
+        return bytes(self._levels[-1][:DIGEST_SIZE])
+
+    @property
+    def root_hex(self) -> str:
+        return self.root.hex()
+
+    def leaf(self, index: int) -> bytes:
+        return self._node(0, index)
+
+    def index_of(self, tx_hash: str) -> Optional[int]:
+        """Posición de la primera hoja con ese hash (índice construido una vez)."""
+        if self._positions is None:
+            positions: Dict[bytes, int] = {}
+            for i in range(self.leaf_count - 1, -1, -1):
+                positions[self._node(0, i)] = i
+            self._positions = positions
+        try:
+            return self._positions.get(MerkleTree.to_digest(tx_hash))
+        except ValueError:
+            return None
+
+    def get_proof(self, index: int) -> List[str]:
+        """Prueba de inclusión de la hoja 'index' (formato 'L|hash' / 'R|hash')."""
+        if not 0 <= index < self.leaf_count:
+            raise IndexError(f"Hoja {index} fuera de rango ({self.leaf_count}).")
+
+        proof: List[str] = []
+        for level in range(len(self._levels) - 1):
+            is_right_child = index % 2 != 0
+            sibling = index - 1 if is_right_child else index + 1
+            if sibling >= self._count(level):
+                sibling = index  # Último impar: se empareja consigo mismo
+            proof.append(f"{'L' if is_right_child else 'R'}|{self._node(level, sibling).hex()}")
+            index //= 2
+        return proof
+
+    def get_proof_for(self, tx_hash: str) -> Optional[List[str]]:
+        index = self.index_of(tx_hash)
+        return self.get_proof(index) if index is not None else None
+
+    # --- Escritura: O(log n) ---
+
+    def set_leaf(self, index: int, leaf: bytes) -> None:
+        if not 0 <= index < self.leaf_count:
+            raise IndexError(f"Hoja {index} fuera de rango ({self.leaf_count}).")
+        self._check_leaf(leaf)
+        self._levels[0][index * DIGEST_SIZE:(index + 1) * DIGEST_SIZE] = leaf
+        self._positions = None
+        self._refresh_path(index)
+
+    def append_leaf(self, leaf: bytes) -> None:
+        self._check_leaf(leaf)
+        self._levels[0] += leaf
+        if self._positions is not None and leaf not in self._positions:
+            self._positions[leaf] = self.leaf_count - 1
+        self._refresh_path(self.leaf_count - 1)
+
+    def pop_leaf(self) -> None:
+        if not self._levels[0]:
+            raise IndexError("Árbol vacío.")
+        del self._levels[0][-DIGEST_SIZE:]
+        self._positions = None
+
+        # Cada nivel superior mide ceil(n/2) del inferior
+        for level in range(1, len(self._levels)):
+            expected = (self._count(level - 1) + 1) // 2
+            del self._levels[level][expected * DIGEST_SIZE:]
+
+        if self._levels[0]:
+            self._refresh_path(self.leaf_count - 1)
+        else:
+            del self._levels[1:]
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _count(self, level: int) -> int:
+        return len(self._levels[level]) // DIGEST_SIZE
+
+    def _node(self, level: int, index: int) -> bytes:
+        start = index * DIGEST_SIZE
+        return bytes(self._levels[level][start:start + DIGEST_SIZE])
+
+    def _refresh_path(self, index: int) -> None:
+        level = 0
+        while self._count(level) > 1:
+            parent = index // 2
+            left = self._node(level, parent * 2)
+            right = self._node(level, parent * 2 + 1) if parent * 2 + 1 < self._count(level) else left
+            parent_hash = MerkleTree._hash_pair(left, right)
+
+            if level + 1 == len(self._levels):
+                self._levels.append(bytearray())
+            upper = self._levels[level + 1]
+            start = parent * DIGEST_SIZE
+            upper[start:start + DIGEST_SIZE] = parent_hash
+
+            index = parent
+            level += 1
+
+        # El árbol pudo encogerse: descartamos niveles por encima de la raíz
+        del self._levels[level + 1:]
+
+    @staticmethod
+    def _check_leaf(leaf: bytes) -> None:
+        if len(leaf) != DIGEST_SIZE:
+            raise ValueError("Las hojas deben ser digests de 32 bytes.")
+
+    @staticmethod
+    def _hash_pair(left: bytes, right: bytes) -> bytes:
+        sha256 = hashlib.sha256
+        return sha256(sha256((left + right).hex().encode('utf-8')).digest()).digest()
+
+    @staticmethod
+    def _hash_level(nodes: bytearray, threads: int) -> bytearray:
+        if (len(nodes) // DIGEST_SIZE) % 2 != 0:
+            nodes = nodes + nodes[-DIGEST_SIZE:]
+        # Todo el nivel a texto hex de una vez: 128 bytes ASCII por par
+        digests = CryptoUtility.double_sha256_batch(nodes.hex().encode('utf-8'), item_size=128, threads=threads)
+        return bytearray(b"".join(digests))
@@ -1,8 +1,9 @@
 # akm/core/services/merkle_tree_builder.py
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from akm.core.services.merkle_tree import MerkleTree
 from akm.core.utils.crypto_utility import CryptoUtility
 
 logger = logging.getLogger(__name__)
@@ -10,67 +11,60 @@ logger = logging.getLogger(__name__)
 class MerkleTreeBuilder:
 
     @staticmethod
-    def build(transaction_hashes: List[str]) -> str:
+    def build(transaction_hashes: List[str], threads: int = 1) -> str:
 
         if not transaction_hashes:
             return CryptoUtility.double_sha256("")
 
-        hashes = transaction_hashes[:]
+        if len(transaction_hashes) == 1: return transaction_hashes[0]
 
-        if len(hashes) == 1: return hashes[0]
-
-        if len(hashes) % 2 != 0: hashes.append(hashes[-1])
+        try:
+            return MerkleTree.root_of(transaction_hashes, threads)
+        except ValueError:
+            # Hojas no canónicas (no son hex de 32 bytes): se hashea el texto tal cual
+            hashes = transaction_hashes
+            while len(hashes) > 1:
+                hashes = MerkleTreeBuilder.hash_level(hashes, threads)
+            return hashes[0]
 
-        new_level: List[str] = []
+    @staticmethod
+    def hash_level(nodes: List[str], threads: int = 1) -> List[str]:
+        """
+        Nivel superior del árbol: H(izq + der) por par, duplicando el último impar.
+        Consenso: se hashea el texto hex concatenado (128 bytes ASCII por par).
+        """
+        if len(nodes) % 2 != 0:
+            nodes = nodes + [nodes[-1]]
 
-        for i in range(0, len(hashes), 2):
-            left = hashes[i]
-            right = hashes[i+1]
-            combined = left + right
-            new_hash = CryptoUtility.double_sha256(combined)
-            new_level.append(new_hash)
+        if all(len(node) == 64 for node in nodes):
+            # Buffer contiguo: una sola codificación para todo el nivel
+            digests = CryptoUtility.double_sha256_batch("".join(nodes).encode('utf-8'), item_size=128, threads=threads)
+        else:
+            pairs = [(nodes[i] + nodes[i + 1]).encode('utf-8') for i in range(0, len(nodes), 2)]
+            digests = CryptoUtility.double_sha256_batch(pairs, threads=threads)
 
-        return MerkleTreeBuilder.build(new_level)
+        return [digest.hex() for digest in digests]
 
     @staticmethod
     def get_proof(tx_hashes: List[str], target_tx_hash: str) -> Optional[List[str]]:
 
         if target_tx_hash not in tx_hashes:
             return None
-            
-        proof: List[str] = []
-        
+
+        idx = tx_hashes.index(target_tx_hash)
         try:
-            idx = tx_hashes.index(target_tx_hash)
+            return MerkleTree.from_hashes(tx_hashes).get_proof(idx)
         except ValueError:
-            return None
-            
-        current_level = tx_hashes[:]
-        
-        while len(current_level) > 1:
-            if len(current_level) % 2 != 0:
-                current_level.append(current_level[-1])
-                
-            is_right_child = (idx % 2 != 0)
-            sibling_idx = idx - 1 if is_right_child else idx + 1
-            
-            sibling_hash = current_level[sibling_idx]
-            
-            direction = "L" if is_right_child else "R" 
-            proof.append(f"{direction}|{sibling_hash}")
-            
-            next_level: List[str] = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                right = current_level[i+1]
-                combined = left + right
-                new_hash = CryptoUtility.double_sha256(combined)
-                next_level.append(new_hash)
-            
-            current_level = next_level
-            idx = idx // 2
-            
-        return proof
+            return MerkleTreeBuilder._get_proof_from_text(tx_hashes, idx)
+
+    @staticmethod
+    def get_proofs(tx_hashes: List[str], target_tx_hashes: List[str]) -> Dict[str, Optional[List[str]]]:
+        """Varias pruebas del mismo bloque con un solo árbol (sin rehashear por prueba)."""
+        try:
+            tree = MerkleTree.from_hashes(tx_hashes)
+        except ValueError:
+            return {target: MerkleTreeBuilder.get_proof(tx_hashes, target) for target in target_tx_hashes}
+        return {target: tree.get_proof_for(target) for target in target_tx_hashes}
 
     @staticmethod
     def verify_proof(tx_hash: str, merkle_root: str, proof: List[str]) -> bool:
@@ -89,4 +83,24 @@ class MerkleTreeBuilder:
             return is_valid
         except Exception:
             logger.exception("Error en verificación técnica de Merkle Proof")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _get_proof_from_text(tx_hashes: List[str], idx: int) -> List[str]:
+        proof: List[str] = []
+        current_level = tx_hashes[:]
+
+        while len(current_level) > 1:
+            if len(current_level) % 2 != 0:
+                current_level.append(current_level[-1])
+
+            is_right_child = (idx % 2 != 0)
+            sibling_idx = idx - 1 if is_right_child else idx + 1
+
+            direction = "L" if is_right_child else "R"
+            proof.append(f"{direction}|{current_level[sibling_idx]}")
+
+            current_level = MerkleTreeBuilder.hash_level(current_level)
+            idx = idx // 2
+
+        return proof
@@ -0,0 +1,55 @@
+# akm/core/services/mining_hasher.py
+
+import struct
+import hashlib
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class MiningHasher:
+    """
+    Hasher especializado para el bucle de PoW.
+    El prefijo del header (80 bytes: todo menos el nonce) se serializa y se
+    absorbe UNA vez en un estado SHA-256; por cada nonce solo se copia ese
+    estado, se empacan 4 bytes en un buffer reutilizado y se compara el digest
+    crudo contra el objetivo en bytes (big-endian), sin hex ni int().
+    """
+
+    _MAX_TARGET = (1 << 256) - 1
+
+    def __init__(self, prefix: bytes, target: int) -> None:
+        self._prefix_len = len(prefix)
+        self._midstate = hashlib.sha256(prefix)
+        self._target_bytes = min(max(0, target), MiningHasher._MAX_TARGET).to_bytes(32, 'big')
+        self._nonce_buffer = bytearray(4)
+
+    @property
+    def prefix_len(self) -> int: return self._prefix_len
+    @property
+    def target_bytes(self) -> bytes: return self._target_bytes
+
+    def hash_nonce(self, nonce: int) -> bytes:
+        """Doble SHA-256 del header completo (digest crudo, big-endian como el hex)."""
+        struct.pack_into('<I', self._nonce_buffer, 0, nonce)
+        inner = self._midstate.copy()
+        inner.update(self._nonce_buffer)
+        return hashlib.sha256(inner.digest()).digest()
+
+    def scan(self, start: int, end: int) -> Optional[int]:
+        """Primer nonce en [start, end) cuyo hash cumple el objetivo, o None."""
+        # Referencias locales: evitan búsquedas de atributos en el bucle caliente
+        copy_midstate = self._midstate.copy
+        sha256 = hashlib.sha256
+        pack_into = struct.pack_into
+        buffer = self._nonce_buffer
+        target = self._target_bytes
+
+        for nonce in range(start, end):
+            pack_into('<I', buffer, 0, nonce)
+            inner = copy_midstate()
+            inner.update(buffer)
+            # Comparar bytes big-endian de igual largo equivale a comparar enteros
+            if sha256(inner.digest()).digest() <= target:
+                return nonce
+        return None
@@ -0,0 +1,105 @@
+# akm/core/services/mining_telemetry.py
+
+import time
+import threading
+from typing import Any, Dict, Optional
+
+class MiningTelemetry:
+    """
+    Métricas vivas del bucle de minado (se actualizan por lote, no por nonce).
+    - Hashrate: media móvil exponencial del ritmo de cada lote.
+    - Nonces probados, rondas iniciadas e interrumpidas.
+    - Bloques propios aceptados y rechazados por viejos (stale).
+    - Edad de la plantilla vigente.
+    Pensado para detectar equipos lentos y ajustar el tamaño de lote desde la API.
+    """
+
+    # Peso del último lote en la media móvil del hashrate
+    SMOOTHING = 0.3
+
+    def __init__(self, batch_size: int = 0, check_interval: int = 0) -> None:
+        self._lock = threading.Lock()
+        self._batch_size = batch_size
+        self._check_interval = check_interval
+        self._started_at = time.time()
+
+        self._hashrate = 0.0
+        self._last_batch_hashrate = 0.0
+        self._nonces_tried = 0
+        self._batches = 0
+        self._rounds_started = 0
+        self._rounds_interrupted = 0
+        self._blocks_found = 0
+        self._stale_blocks = 0
+        self._template_created_at: Optional[float] = None
+        self._current_height: Optional[int] = None
+        self._last_batch_at: Optional[float] = None
+
+    @property
+    def hashrate(self) -> float:
+        with self._lock:
+            return self._hashrate
+
+    @property
+    def nonces_tried(self) -> int:
+        with self._lock:
+            return self._nonces_tried
+
+    # --- Eventos del bucle de minado ---
+
+    def record_round_started(self, height: int, template_created_at: float) -> None:
+        with self._lock:
+            self._rounds_started += 1
+            self._current_height = height
+            self._template_created_at = template_created_at
+
+    def record_batch(self, hashes: int, elapsed: float) -> None:
+        with self._lock:
+            self._nonces_tried += hashes
+            self._batches += 1
+            self._last_batch_at = time.time()
+            if elapsed <= 0:
+                return
+
+            rate = hashes / elapsed
+            self._last_batch_hashrate = rate
+            if self._hashrate == 0.0:
+                self._hashrate = rate
+            else:
+                self._hashrate += MiningTelemetry.SMOOTHING * (rate - self._hashrate)
+
+    def record_round_interrupted(self) -> None:
+        with self._lock:
+            self._rounds_interrupted += 1
+
+    def record_block_found(self) -> None:
+        with self._lock:
+            self._blocks_found += 1
+
+    def record_stale_block(self) -> None:
+        with self._lock:
+            self._stale_blocks += 1
+
+    # --- Lectura (API / logs) ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            template_age = now - self._template_created_at if self._template_created_at else None
+            idle = now - self._last_batch_at if self._last_batch_at else None
+            return {
+                "hashrate": round(self._hashrate, 2),
+                "last_batch_hashrate": round(self._last_batch_hashrate, 2),
+                "nonces_tried": self._nonces_tried,
+                "batches": self._batches,
+                "batch_size": self._batch_size,
+                "check_interval": self._check_interval,
+                "current_height": self._current_height,
+                "template_age_sec": round(template_age, 3) if template_age is not None else None,
+                "seconds_since_last_batch": round(idle, 3) if idle is not None else None,
+                "rounds_started": self._rounds_started,
+                "rounds_interrupted": self._rounds_interrupted,
+                "blocks_found": self._blocks_found,
+                "stale_blocks": self._stale_blocks,
+                "uptime_sec": round(now - self._started_at, 1)
+            }
@@ -0,0 +1,136 @@
+# akm/core/services/orphan_pool.py
+
+import time
+import threading
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+# Dependencias
+from akm.core.models.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Referencia a un output: (hash_tx_padre, índice)
+OutPoint = Tuple[str, int]
+
+class OrphanPool:
+    """
+    Zona de espera acotada para TXs que llegan antes que su padre (Gossip desordenado).
+    Indexada por outpoint faltante: cuando el padre se confirma en un bloque,
+    se liberan solo los hijos que esperaban alguno de sus outputs.
+
+    Límites anti-abuso:
+    - Global (max_orphans): se expulsa la más antigua.
+    - Por peer (max_per_peer): el peer que excede su cupo ve rechazadas sus TXs.
+    - Edad (expiry_sec): las huérfanas vencidas se descartan al insertar.
+    """
+
+    @dataclass
+    class _Entry:
+        tx: Transaction
+        peer_id: str
+        missing: Tuple[OutPoint, ...]
+        added_at: float
+
+    def __init__(self, max_orphans: int = 100, max_per_peer: int = 20, expiry_sec: int = 1200) -> None:
+        self._max_orphans = max(1, max_orphans)
+        self._max_per_peer = max(1, max_per_peer)
+        self._expiry_sec = expiry_sec
+        self._lock = threading.Lock()
+
+        self._entries: 'OrderedDict[str, OrphanPool._Entry]' = OrderedDict()
+        self._by_outpoint: Dict[OutPoint, Set[str]] = {}
+        self._per_peer: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def contains(self, tx_hash: str) -> bool:
+        with self._lock:
+            return tx_hash in self._entries
+
+    def count_for_peer(self, peer_id: str) -> int:
+        with self._lock:
+            return self._per_peer.get(peer_id, 0)
+
+    def add(self, tx: Transaction, peer_id: str, missing: List[OutPoint]) -> bool:
+        if not missing:
+            return False
+
+        with self._lock:
+            if tx.tx_hash in self._entries:
+                return False
+
+            self._expire_old(time.time())
+
+            if self._per_peer.get(peer_id, 0) >= self._max_per_peer:
+                logger.info(f"Huérfana {tx.tx_hash[:8]} rechazada: peer {peer_id[:8]} excede su cupo.")
+                return False
+
+            while len(self._entries) >= self._max_orphans:
+                oldest_hash = next(iter(self._entries))
+                self._remove(oldest_hash)
+
+            entry = OrphanPool._Entry(tx, peer_id, tuple(missing), time.time())
+            self._entries[tx.tx_hash] = entry
+            for outpoint in entry.missing:
+                self._by_outpoint.setdefault(outpoint, set()).add(tx.tx_hash)
+            self._per_peer[peer_id] = self._per_peer.get(peer_id, 0) + 1
+
+        logger.info(f"🧩 TX {tx.tx_hash[:8]} en espera de su padre {missing[0][0][:8]} (huérfana).")
+        return True
+
+    def pop_children(self, parent: Transaction) -> List[Tuple[Transaction, str]]:
+        """Extrae las huérfanas que esperaban algún output de 'parent'."""
+        with self._lock:
+            children: List[str] = []
+            for index in range(len(parent.outputs)):
+                for tx_hash in self._by_outpoint.get((parent.tx_hash, index), ()):
+                    if tx_hash not in children:
+                        children.append(tx_hash)
+
+            released: List[Tuple[Transaction, str]] = []
+            for tx_hash in children:
+                entry = self._remove(tx_hash)
+                if entry is not None:
+                    released.append((entry.tx, entry.peer_id))
+            return released
+
+    def remove_for_peer(self, peer_id: str) -> int:
+        with self._lock:
+            hashes = [h for h, e in self._entries.items() if e.peer_id == peer_id]
+            for tx_hash in hashes:
+                self._remove(tx_hash)
+            return len(hashes)
+
+    # --- MÉTODOS PRIVADOS (requieren el candado) ---
+
+    def _remove(self, tx_hash: str) -> Optional['OrphanPool._Entry']:
+        entry = self._entries.pop(tx_hash, None)
+        if entry is None:
+            return None
+
+        for outpoint in entry.missing:
+            waiting = self._by_outpoint.get(outpoint)
+            if waiting is not None:
+                waiting.discard(tx_hash)
+                if not waiting:
+                    del self._by_outpoint[outpoint]
+
+        remaining = self._per_peer.get(entry.peer_id, 1) - 1
+        if remaining > 0:
+            self._per_peer[entry.peer_id] = remaining
+        else:
+            self._per_peer.pop(entry.peer_id, None)
+        return entry
+
+    def _expire_old(self, now: float) -> None:
+        # OrderedDict conserva el orden de llegada: las vencidas están al principio
+        while self._entries:
+            oldest_hash, oldest = next(iter(self._entries.items()))
+            if now - oldest.added_at < self._expiry_sec:
+                break
+            self._remove(oldest_hash)
@@ -0,0 +1,68 @@
+# akm/core/services/sighash_context.py
+
+import struct
+import hashlib
+import logging
+from typing import TYPE_CHECKING, List, Optional
+
+from akm.core.services.transaction_hasher import TransactionHasher
+
+if TYPE_CHECKING:
+    from akm.core.models.transaction import Transaction # type: ignore
+
+logger = logging.getLogger(__name__)
+
+NULL_PREV_HASH = '0' * 64
+
+class SighashContext:
+    """
+    Imagen de firma (SIGHASH_ALL) de una transacción, serializada UNA vez.
+    La imagen de cada input es la serialización de la TX con todos los script_sig
+    vacíos salvo, opcionalmente, el del input firmado. Se guarda:
+    - La serialización con todos los scripts vacíos y el offset de cada input.
+    - El digest de esa imagen, que es el de todo input sin 'connected_script'
+      (el caso de la verificación): calculado una sola vez para toda la TX.
+    Con 'connected_script' solo se re-serializa el segmento del input firmado y
+    el resto se hashea desde la imagen ya armada (sin copias de TxInput).
+    """
+
+    def __init__(self, transaction: 'Transaction') -> None:
+        inputs = transaction.inputs
+
+        blank = bytearray(TransactionHasher.serialize_header(transaction.timestamp, len(inputs)))
+        self._offsets: List[int] = []
+        self._prevouts: List[bytes] = []
+        for inp in inputs:
+            self._offsets.append(len(blank))
+            # Input nulo de Coinbase o vacío: 64 ceros
+            prev_hash = inp.previous_tx_hash
+            if not prev_hash or prev_hash.lower() == NULL_PREV_HASH:
+                prev_hash = NULL_PREV_HASH
+            segment = TransactionHasher.serialize_input(prev_hash, inp.output_index, b'')
+            self._prevouts.append(segment[:36])  # Hash previo + índice
+            blank.extend(segment)
+        self._offsets.append(len(blank))
+        blank.extend(TransactionHasher.serialize_outputs(transaction.outputs, transaction.fee))
+
+        self._image = bytes(blank)
+        self._blank_digest: Optional[bytes] = None
+
+    @property
+    def input_count(self) -> int:
+        return len(self._prevouts)
+
+    def digest(self, input_index: int, connected_script: Optional[bytes] = None) -> bytes:
+        if not connected_script or not 0 <= input_index < len(self._prevouts):
+            # Sin script conectado (o índice ajeno a la TX) la imagen es la misma para todos
+            if self._blank_digest is None:
+                self._blank_digest = hashlib.sha256(hashlib.sha256(self._image).digest()).digest()
+            return self._blank_digest
+
+        # Prefijo y sufijo salen de la imagen ya armada, sin copiarlos
+        image = memoryview(self._image)
+        first = hashlib.sha256(image[:self._offsets[input_index]])
+        first.update(self._prevouts[input_index])
+        first.update(struct.pack('<I', len(connected_script)))
+        first.update(connected_script)
+        first.update(image[self._offsets[input_index + 1]:])
+        return hashlib.sha256(first.digest()).digest()
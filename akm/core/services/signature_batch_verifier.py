@@ -0,0 +1,159 @@
+# akm/core/services/signature_batch_verifier.py
+
+import os
+import math
+import logging
+import threading
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from akm.core.services.signature_cache import SignatureCache
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
+
+logger = logging.getLogger(__name__)
+
+# (sighash, clave pública, firma DER): lo único que viaja a los procesos
+SignatureTriple = Tuple[bytes, bytes, bytes]
+
+@dataclass(frozen=True)
+class SignatureCheck:
+    """OP_CHECKSIG diferido: el script ya corrió, solo falta el ECDSA."""
+    sighash: bytes
+    public_key: bytes
+    signature: bytes
+    tx_hash: str
+    input_index: int
+    script_pubkey: bytes
+
+    @property
+    def triple(self) -> SignatureTriple:
+        return (self.sighash, self.public_key, self.signature)
+
+def _verify_chunk(triples: Sequence[SignatureTriple], stop_at_first: bool, backend_name: str) -> List[int]:
+    """Corre en los procesos del pool: posiciones (dentro del lote) con firma inválida."""
+    # Mismo backend que el proceso principal (el worker no hereda el instalado)
+    backend = SignatureBackendFactory.get(backend_name)
+    failed: List[int] = []
+    for position, (sighash, public_key, signature) in enumerate(triples):
+        if not backend.verify(sighash, public_key, signature):
+            failed.append(position)
+            if stop_at_first:
+                break
+    return failed
+
+class SignatureBatchVerifier:
+    """
+    Verificación ECDSA por lotes para la validación de bloques.
+    El validador de reglas hace la pasada serial barata (UTXOs, doble gasto,
+    scripts con OP_CHECKSIG diferido) y entrega aquí todas las firmas juntas:
+    - Con varios núcleos, se reparten en lotes pequeños a un pool de procesos
+      (el ECDSA en Python puro retiene el GIL, los hilos no escalan).
+    - Con 'stop_at_first', el primer fallo cancela los lotes pendientes.
+    - Pocas firmas o un solo worker: se verifican en línea, sin IPC.
+    - Las firmas presentes en la SignatureCache no se re-verifican; las válidas se agregan.
+    """
+
+    PARALLEL_MIN_CHECKS = 16
+    MAX_CHUNK = 32
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, workers: int = 1, signature_cache: Optional[SignatureCache] = None) -> None:
+        # 0: un proceso por núcleo
+        self._workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self._signature_cache = signature_cache
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # --- Getters ---
+    @property
+    def workers(self) -> int: return self._workers
+
+    @staticmethod
+    def verify_one(sighash: bytes, public_key: bytes, signature: bytes) -> bool:
+        # El backend nunca lanza: clave o firma mal codificada es simplemente inválida
+        return SignatureBackendFactory.active().verify(sighash, public_key, signature)
+
+    def verify(self, checks: Sequence[SignatureCheck], stop_at_first: bool = False) -> List[int]:
+        """
+        Índices (en 'checks') de las firmas inválidas; lista vacía si todas son válidas.
+        Con 'stop_at_first' se devuelve como mucho un índice.
+        """
+        if not checks:
+            return []
+
+        # Solo viajan las firmas que la caché no conoce
+        cache = self._signature_cache if self._signature_cache is not None else SignatureCache.shared()
+        pending = [i for i, check in enumerate(checks) if not cache.contains(*check.triple)]
+        triples = [checks[i].triple for i in pending]
+
+        failed = [pending[position] for position in self._verify_triples(triples, stop_at_first)]
+        if failed and stop_at_first:
+            # Lote abortado: el resto no llegó a verificarse
+            return failed
+
+        rejected = set(failed)
+        for i in pending:
+            if i not in rejected:
+                cache.add(*checks[i].triple)
+        return failed
+
+    def shutdown(self) -> None:
+        self._reset_executor()
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _verify_triples(self, triples: List[SignatureTriple], stop_at_first: bool) -> List[int]:
+        if not triples:
+            return []
+        backend_name = SignatureBackendFactory.active().name
+        if self._workers <= 1 or len(triples) < SignatureBatchVerifier.PARALLEL_MIN_CHECKS:
+            return _verify_chunk(triples, stop_at_first, backend_name)
+
+        try:
+            return self._verify_parallel(triples, stop_at_first, backend_name)
+        except Exception as e:
+            # Pool roto (ej. un worker murió): la validación no puede depender de él
+            logger.error(f"⚠️ Pool de verificación no disponible ({e}). Verificando en línea.")
+            self._reset_executor()
+            return _verify_chunk(triples, stop_at_first, backend_name)
+
+    def _verify_parallel(self, triples: List[SignatureTriple], stop_at_first: bool, backend_name: str) -> List[int]:
+        executor = self._get_executor()
+
+        # Lotes chicos: el aborto temprano solo espera a los que ya están corriendo
+        chunk_size = min(SignatureBatchVerifier.MAX_CHUNK, math.ceil(len(triples) / (self._workers * SignatureBatchVerifier.CHUNKS_PER_WORKER)))
+        offsets: Dict[Future, int] = {}
+        pending: Set[Future] = set()
+        for start in range(0, len(triples), chunk_size):
+            future = executor.submit(_verify_chunk, triples[start:start + chunk_size], stop_at_first, backend_name)
+            offsets[future] = start
+            pending.add(future)
+
+        failed: List[int] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                failed.extend(offsets[future] + position for position in future.result())
+
+            if failed and stop_at_first:
+                for future in pending:
+                    future.cancel()
+                return [min(failed)]
+
+        return sorted(failed)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 'spawn': el nodo ya tiene hilos (P2P, API); fork podría heredar candados tomados
+                self._executor = ProcessPoolExecutor(max_workers=self._workers, mp_context=mp.get_context("spawn"))
+                logger.info(f"🔏 Verificación de firmas: {self._workers} procesos.")
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,109 @@
+# akm/core/services/signature_cache.py
+
+import os
+import struct
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class SignatureCache:
+    """
+    Caché acotada (LRU) de firmas ECDSA ya verificadas, compartida entre la
+    admisión al Mempool y la validación de bloques.
+    - Clave: SHA-256(sal || sighash || len(pubkey) || pubkey || firma). La sal es
+      aleatoria por proceso: un atacante no puede fabricar colisiones ni predecir
+      qué entradas expulsa la LRU.
+    - Solo se guardan resultados POSITIVOS: una firma inválida nunca se cachea.
+    A diferencia de ValidationCache (por tx_hash/input), una misma firma se
+    reconoce aunque llegue en otra TX o con otro script (ej. tras un reorg).
+    """
+
+    DEFAULT_MAX_ENTRIES = 100_000
+
+    _shared: Optional['SignatureCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._salt = os.urandom(32)
+        self._entries: 'OrderedDict[bytes, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def shared(cls) -> 'SignatureCache':
+        """Instancia del proceso (los verificadores de firma son estáticos)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = SignatureCache()
+            return cls._shared
+
+    @classmethod
+    def install_shared(cls, cache: 'SignatureCache') -> None:
+        """El NodeFactory instala la caché dimensionada por configuración."""
+        with cls._shared_lock:
+            cls._shared = cache
+
+    # --- Getters ---
+    @property
+    def max_entries(self) -> int: return self._max_entries
+    @property
+    def hits(self) -> int: return self._hits
+    @property
+    def misses(self) -> int: return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def contains(self, sighash: bytes, public_key: bytes, signature: bytes) -> bool:
+        key = self._key(sighash, public_key, signature)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True
+            self._misses += 1
+            return False
+
+    def add(self, sighash: bytes, public_key: bytes, signature: bytes) -> None:
+        key = self._key(sighash, public_key, signature)
+        with self._lock:
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self.hit_rate, 4)
+            }
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _key(self, sighash: bytes, public_key: bytes, signature: bytes) -> bytes:
+        # El largo de la clave pública fija la frontera con la firma
+        return hashlib.sha256(
+            self._salt + bytes(sighash) + struct.pack('<H', len(public_key)) + bytes(public_key) + bytes(signature)
+        ).digest()
@@ -3,11 +3,10 @@
 import logging
 from typing import Any
 
-# Importamos librería criptográfica (silenciando errores de tipado legacy)
-from ecdsa import VerifyingKey, SECP256k1, util, BadSignatureError # type: ignore
-
 # Importamos el modelo para poder llamar a get_hash_for_signature
 from akm.core.models.transaction import Transaction
+from akm.core.services.signature_cache import SignatureCache
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
 
 logger = logging.getLogger(__name__)
 
@@ -35,20 +34,18 @@ class SignatureVerifierService:
             # Nota: Al usar connected_script=b'', estamos validando la firma sobre la estructura
             # de la transacción, excluyendo el script previo.
             message_hash_bytes = tx.get_hash_for_signature(input_index, connected_script=b'')
+
+            # Firma ya verificada (caché compartida con la validación de bloques)
+            cache = SignatureCache.shared()
+            if cache.contains(message_hash_bytes, public_key, signature):
+                return True
             
-            # 3. Decodificar Clave Pública
-            try:
-                vk = VerifyingKey.from_string(public_key, curve=SECP256k1) # type: ignore
-            except Exception:
-                logger.warning(f"Clave pública inválida en input {input_index}.")
+            # 3. Verificar Firma (ECDSA) con el backend activo
+            if not SignatureBackendFactory.active().verify(message_hash_bytes, public_key, signature):
                 return False
+            cache.add(message_hash_bytes, public_key, signature)
+            return True
 
-            # 4. Verificar Firma (ECDSA)
-            return vk.verify_digest(signature, message_hash_bytes, sigdecode=util.sigdecode_der) # type: ignore
-
-        except BadSignatureError:
-            return False # Firma incorrecta
-            
         except Exception as e:
             logger.error(f"Error inesperado en verificador de firmas: {e}")
             return False
\ No newline at end of file
@@ -62,63 +62,90 @@ class TransactionHasher:
         return b''
 
     @staticmethod
-    def calculate(transaction: Any) -> str: 
+    def serialize(transaction: Any) -> bytes:
         """
-        Calcula el hash doble SHA-256 de la transacción.
+        Serialización canónica (binaria) de la transacción.
+        Es la imagen que se hashea y la base para medir su tamaño en bytes.
+        Un Transaction la calcula una vez y la reutiliza hasta que muta.
         """
-        try:
-            payload = bytearray()
+        if TransactionHasher._is_memoized(transaction):
+            return transaction.serialized
+        return TransactionHasher.build(transaction)
 
-            # 1. Timestamp (8 bytes, Little Endian)
-            payload.extend(struct.pack('<Q', int(transaction.timestamp)))
+    @staticmethod
+    def build(transaction: Any) -> bytes:
+        """Arma la serialización canónica desde cero (sin caché)."""
+        inputs = transaction.inputs
+        payload = bytearray()
 
-            # 2. Inputs Count (4 bytes)
-            payload.extend(struct.pack('<I', len(transaction.inputs)))
-            
-            # --- CORRECCIÓN LÍNEA 82 ---
-            # Quitamos 'enumerate' porque 'i' no se usa
-            for inp in transaction.inputs:
-                
-                # A. Previous TX Hash (32 bytes fijos)
-                prev_tx_bytes = TransactionHasher._safe_hex_to_bytes(
-                    inp.previous_tx_hash, 32
-                )
-                payload.extend(prev_tx_bytes)
-
-                # B. Output Index (4 bytes)
-                payload.extend(struct.pack('<I', inp.output_index))
-                
-                # C. Script Sig (Var Int / Length Prefixed)
-                script_sig_bytes = TransactionHasher._ensure_script_bytes(inp.script_sig)
-                
-                payload.extend(struct.pack('<I', len(script_sig_bytes)))
-                payload.extend(script_sig_bytes)
+        # 1. Timestamp (8 bytes, Little Endian) + Inputs Count (4 bytes)
+        payload.extend(TransactionHasher.serialize_header(transaction.timestamp, len(inputs)))
+
+        # 2. Inputs
+        for inp in inputs:
+            payload.extend(TransactionHasher.serialize_input(inp.previous_tx_hash, inp.output_index, inp.script_sig))
+
+        # 3. Outputs + Fee
+        payload.extend(TransactionHasher.serialize_outputs(transaction.outputs, getattr(transaction, 'fee', 0)))
+
+        return bytes(payload)
+
+    @staticmethod
+    def hash_bytes(payload: bytes) -> str:
+        """Doble SHA-256 (hex) de una serialización ya armada."""
+        return hashlib.sha256(hashlib.sha256(payload).digest()).hexdigest()
+
+    @staticmethod
+    def serialize_header(timestamp: int, input_count: int) -> bytes:
+        return struct.pack('<QI', int(timestamp), input_count)
+
+    @staticmethod
+    def serialize_input(previous_tx_hash: Union[str, bytes], output_index: int, script_sig: Union[str, bytes]) -> bytes:
+        # A. Previous TX Hash (32 bytes fijos) + B. Output Index (4 bytes)
+        prev_tx_bytes = TransactionHasher._safe_hex_to_bytes(previous_tx_hash, 32)
+
+        # C. Script Sig (Length Prefixed)
+        script_sig_bytes = TransactionHasher._ensure_script_bytes(script_sig)
+
+        return prev_tx_bytes + struct.pack('<II', output_index, len(script_sig_bytes)) + script_sig_bytes
+
+    @staticmethod
+    def serialize_outputs(outputs: Any, fee: int) -> bytes:
+        """Outputs Count (4 bytes), cada output (valor + script) y Fee (8 bytes)."""
+        payload = bytearray(struct.pack('<I', len(outputs)))
 
-            # 3. Outputs Count (4 bytes)
-            payload.extend(struct.pack('<I', len(transaction.outputs)))
+        for out in outputs:
+            # A. Value (8 bytes)
+            payload.extend(struct.pack('<Q', int(out.value_alba)))
             
-            # --- CORRECCIÓN LÍNEA 107 ---
-            # Quitamos 'enumerate' aquí también
-            for out in transaction.outputs:
-                # A. Value (8 bytes)
-                payload.extend(struct.pack('<Q', int(out.value_alba)))
-                
-                # B. Script Pubkey (Var Int / Length Prefixed)
-                script_pubkey_bytes = TransactionHasher._ensure_script_bytes(out.script_pubkey)
+            # B. Script Pubkey (Length Prefixed)
+            script_pubkey_bytes = TransactionHasher._ensure_script_bytes(out.script_pubkey)
 
-                payload.extend(struct.pack('<I', len(script_pubkey_bytes)))
-                payload.extend(script_pubkey_bytes)
+            payload.extend(struct.pack('<I', len(script_pubkey_bytes)))
+            payload.extend(script_pubkey_bytes)
 
-            # 4. Fee (8 bytes)
-            fee_val = int(getattr(transaction, 'fee', 0))
-            payload.extend(struct.pack('<Q', fee_val))
+        payload.extend(struct.pack('<Q', int(fee)))
+        return bytes(payload)
+
+    @staticmethod
+    def calculate(transaction: Any) -> str: 
+        """
+        Calcula el hash doble SHA-256 de la transacción.
+        """
+        try:
+            if TransactionHasher._is_memoized(transaction):
+                return transaction.calculate_hash()
 
             # --- DOUBLE SHA-256 ---
-            h1 = hashlib.sha256(payload).digest()
-            tx_hash = hashlib.sha256(h1).hexdigest()
-            
-            return tx_hash
+            return TransactionHasher.hash_bytes(TransactionHasher.build(transaction))
 
         except Exception as e:
             logger.exception(f"❌ [Hasher] Error CRÍTICO calculando hash: {e}")
-            return ""
\ No newline at end of file
+            return ""
+
+    @staticmethod
+    def _is_memoized(transaction: Any) -> bool:
+        # Import diferido: el modelo importa este módulo (ciclo).
+        # type() y no isinstance(): un Mock con spec=Transaction no tiene la caché real
+        from akm.core.models.transaction import Transaction
+        return issubclass(type(transaction), Transaction)
@@ -0,0 +1,74 @@
+# akm/core/services/validation_cache.py
+
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Clave de caché: (tx_hash, índice de input, script_pubkey bloqueante)
+ScriptCheckKey = Tuple[str, int, bytes]
+
+class ValidationCache:
+    """
+    Caché acotada (LRU) de verificaciones de script/firma exitosas.
+    Una TX validada al entrar al Mempool no repite el ECDSA cuando llega minada
+    en un bloque: el tx_hash (ya verificado por integridad) fija el script_sig y
+    el script_pubkey del UTXO fija la condición, así que el resultado no cambia.
+    Solo se guardan resultados POSITIVOS.
+    """
+
+    def __init__(self, max_entries: int = 50_000) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: 'OrderedDict[ScriptCheckKey, None]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # --- Getters ---
+    @property
+    def max_entries(self) -> int: return self._max_entries
+    @property
+    def hits(self) -> int: return self._hits
+    @property
+    def misses(self) -> int: return self._misses
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def contains(self, tx_hash: str, input_index: int, script_pubkey: bytes) -> bool:
+        key = (tx_hash, input_index, bytes(script_pubkey))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True
+            self._misses += 1
+            return False
+
+    def add(self, tx_hash: str, input_index: int, script_pubkey: bytes) -> None:
+        key = (tx_hash, input_index, bytes(script_pubkey))
+        with self._lock:
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,127 @@
+# akm/core/services/verifying_key_cache.py
+
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Librería criptográfica (silenciando errores de tipado legacy)
+from ecdsa import VerifyingKey, SECP256k1 # type: ignore
+from ecdsa.ellipticcurve import PointJacobi # type: ignore
+
+logger = logging.getLogger(__name__)
+
+class _Entry:
+    __slots__ = ("key", "uses", "precomputed")
+
+    def __init__(self, key: VerifyingKey) -> None:
+        self.key = key
+        self.uses = 0
+        self.precomputed = False
+
+class VerifyingKeyCache:
+    """
+    LRU de claves públicas ya parseadas (VerifyingKey), por bytes de la clave.
+    - Evita decodificar y validar el punto en cada OP_CHECKSIG.
+    - Claves "calientes" (HOT_THRESHOLD usos): se precalculan sus tablas de
+      multiplicación; cuestan ~3 verificaciones y reducen cada verificación ~2x.
+    Las claves mal formadas no se cachean: from_string lanza como siempre.
+    """
+
+    DEFAULT_MAX_ENTRIES = 4096
+    HOT_THRESHOLD = 8
+
+    _shared: Optional['VerifyingKeyCache'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, hot_threshold: int = HOT_THRESHOLD) -> None:
+        self._max_entries = max(1, max_entries)
+        self._hot_threshold = hot_threshold
+        self._entries: 'OrderedDict[bytes, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._precomputed = 0
+
+    @classmethod
+    def shared(cls) -> 'VerifyingKeyCache':
+        """Instancia del proceso (cada worker del pool de firmas tiene la suya)."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = VerifyingKeyCache()
+            return cls._shared
+
+    # --- Getters ---
+    @property
+    def hits(self) -> int: return self._hits
+    @property
+    def misses(self) -> int: return self._misses
+    @property
+    def precomputed(self) -> int: return self._precomputed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, public_key: bytes) -> VerifyingKey:
+        """VerifyingKey para 'public_key'. MalformedPointError si no es un punto válido."""
+        public_key = bytes(public_key)
+        with self._lock:
+            entry = self._entries.get(public_key)
+            if entry is not None:
+                self._entries.move_to_end(public_key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is None:
+            # Parseo fuera del candado: si falla, la excepción sube sin cachear nada
+            entry = _Entry(VerifyingKey.from_string(public_key, curve=SECP256k1))
+            with self._lock:
+                entry = self._entries.setdefault(public_key, entry)
+                self._entries.move_to_end(public_key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+        entry.uses += 1
+        if not entry.precomputed and entry.uses >= self._hot_threshold:
+            entry.precomputed = True
+            if VerifyingKeyCache._precompute(entry.key):
+                self._precomputed += 1
+
+        return entry.key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._precomputed = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "precomputed": self._precomputed
+            }
+
+    # --- MÉTODOS PRIVADOS ---
+
+    @staticmethod
+    def _precompute(key: VerifyingKey) -> bool:
+        """
+        VerifyingKey.precompute() no sirve para claves leídas de bytes (el punto
+        no conoce el orden de la curva): se re-crea el punto con el orden y
+        marcado como generador, que es lo que habilita las tablas.
+        """
+        point = key.pubkey.point
+        try:
+            hot_point = PointJacobi(SECP256k1.curve, point.x(), point.y(), 1, SECP256k1.order, generator=True)
+            hot_point * 2  # Fuerza el cálculo ahora y no en la próxima verificación
+            key.pubkey.point = hot_point
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ No se pudo precalcular la clave pública: {e}")
+            return False
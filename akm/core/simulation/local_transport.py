@@ -0,0 +1,63 @@
+# akm/core/simulation/local_transport.py
+
+import heapq
+import random
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class LocalTransport:
+    """
+    Transporte en memoria con reloj simulado (eventos discretos).
+    - Cada entrega se agenda a 'ahora + latencia + jitter' (jitter uniforme y sembrado).
+    - Eventos del mismo instante se ejecutan en orden de agenda: misma semilla,
+      misma corrida.
+    """
+
+    def __init__(self, latency_sec: float = 0.0, jitter_sec: float = 0.0, rng: Optional[random.Random] = None) -> None:
+        self._latency = max(0.0, latency_sec)
+        self._jitter = max(0.0, jitter_sec)
+        self._rng = rng or random.Random(0)
+
+        self._now = 0.0
+        self._seq = 0
+        self._queue: List[Tuple[float, int, Callable[..., None], Tuple[Any, ...]]] = []
+        self._handlers: Dict[str, Callable[[str, Any], None]] = {}
+        self._messages_delivered = 0
+
+    @property
+    def now(self) -> float: return self._now
+    @property
+    def messages_delivered(self) -> int: return self._messages_delivered
+
+    def register(self, node_id: str, handler: Callable[[str, Any], None]) -> None:
+        self._handlers[node_id] = handler
+
+    def call_at(self, at: float, callback: Callable[..., None], *args: Any) -> None:
+        self._seq += 1
+        heapq.heappush(self._queue, (max(at, self._now), self._seq, callback, args))
+
+    def broadcast(self, sender_id: str, message: Any) -> None:
+        """Envía a todos los nodos registrados salvo al emisor, cada uno con su demora."""
+        for node_id in self._handlers:
+            if node_id == sender_id:
+                continue
+            delay = self._latency + (self._rng.uniform(0.0, self._jitter) if self._jitter else 0.0)
+            self.call_at(self._now + delay, self._deliver, node_id, sender_id, message)
+
+    def run(self, until: float, stop: Optional[Callable[[], bool]] = None) -> None:
+        """Procesa eventos hasta el instante 'until' o hasta que 'stop()' sea verdadero."""
+        while self._queue and self._queue[0][0] <= until:
+            at, _, callback, args = heapq.heappop(self._queue)
+            self._now = at
+            callback(*args)
+            if stop is not None and stop():
+                return
+        self._now = max(self._now, until) if until != float("inf") else self._now
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _deliver(self, node_id: str, sender_id: str, message: Any) -> None:
+        self._messages_delivered += 1
+        self._handlers[node_id](sender_id, message)
@@ -0,0 +1,360 @@
+# akm/core/simulation/mining_simulator.py
+
+import math
+import random
+import logging
+import statistics
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Configuración y Modelos
+from akm.core.config.consensus_config import ConsensusConfig
+from akm.core.models.block import Block
+
+# Lógica de consenso real (la que se quiere calibrar)
+from akm.core.consensus.difficulty_adjuster import DifficultyAdjuster
+from akm.core.consensus.subsidy_calculator import SubsidyCalculator
+from akm.core.managers.mining_manager import MiningManager
+from akm.core.builders.block_template import BlockTemplate
+from akm.core.builders.mining_engine import MiningEngine
+from akm.core.services.mempool import Mempool
+from akm.core.simulation.local_transport import LocalTransport
+from akm.core.utils.crypto_utility import CryptoUtility
+from akm.core.utils.difficulty_utils import DifficultyUtils
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class MinerSpec:
+    name: str
+    hashrate: float  # hashes por segundo simulado
+
+class _ChainView:
+    """Lo mínimo de Blockchain que usa MiningManager, sobre la cadena principal del nodo simulado."""
+
+    def __init__(self, genesis: Block) -> None:
+        self._main: List[Block] = [genesis]
+
+    @property
+    def last_block(self) -> Block: return self._main[-1]
+
+    def get_block_by_index(self, index: int) -> Optional[Block]:
+        return self._main[index] if 0 <= index < len(self._main) else None
+
+    def replace_from(self, fork_index: int, branch: List[Block]) -> None:
+        del self._main[fork_index + 1:]
+        self._main.extend(branch)
+
+class _SimulatedMiner:
+    """
+    MinerNode simulado: misma regla de cadena más larga que ConsensusOrchestrator
+    (primero visto gana en empate) y plantillas del MiningManager real.
+    El PoW no se calcula: el tiempo hasta el próximo bloque es exponencial con
+    tasa hashrate * (target + 1) / 2^256.
+    """
+
+    def __init__(
+        self,
+        spec: MinerSpec,
+        genesis: Block,
+        transport: LocalTransport,
+        rng: random.Random,
+        start_timestamp: int,
+        on_block_mined: Callable[['_SimulatedMiner', Block], None],
+        on_reorg: Callable[['_SimulatedMiner', int], None]
+    ) -> None:
+        self._spec = spec
+        self._hashrate = spec.hashrate
+        self._transport = transport
+        self._rng = rng
+        self._start_timestamp = start_timestamp
+        self._on_block_mined = on_block_mined
+        self._on_reorg = on_reorg
+
+        self._chain = _ChainView(genesis)
+        self._blocks: Dict[str, Block] = {genesis.hash: genesis}
+        self._orphans: Dict[str, List[Block]] = {}
+        self._round = 0
+        self._mined = 0
+
+        self._manager = MiningManager(
+            self._chain,  # type: ignore[arg-type]
+            Mempool(stripes=1),
+            DifficultyAdjuster(),
+            SubsidyCalculator(ConsensusConfig()),
+            MiningEngine(threads=1)
+        )
+        transport.register(spec.name, lambda sender, block: self.accept(block))
+
+    @property
+    def name(self) -> str: return self._spec.name
+    @property
+    def tip(self) -> Block: return self._chain.last_block
+
+    def main_chain_block(self, index: int) -> Optional[Block]:
+        return self._chain.get_block_by_index(index)
+
+    def set_hashrate(self, hashrate: float) -> None:
+        self._hashrate = hashrate
+        # Proceso sin memoria: reiniciar la espera no sesga el resultado
+        self.start_round()
+
+    def start_round(self) -> None:
+        self._round += 1
+        if self._hashrate <= 0:
+            return
+
+        template = self._manager.get_block_template(self._spec.name)
+        target = DifficultyUtils.bits_to_target(template.bits)
+        blocks_per_sec = self._hashrate * (target + 1) / 2 ** 256
+        delay = self._rng.expovariate(blocks_per_sec)
+        self._transport.call_at(self._transport.now + delay, self._on_solution, self._round, template)
+
+    def accept(self, block: Block) -> bool:
+        if block.hash in self._blocks:
+            return False
+
+        if block.previous_hash not in self._blocks:
+            # Llegó antes que su padre (jitter): espera a que se conecte
+            self._orphans.setdefault(block.previous_hash, []).append(block)
+            return False
+
+        self._blocks[block.hash] = block
+        if block.index > self.tip.index:
+            self._switch_tip(block)
+
+        for child in self._orphans.pop(block.hash, []):
+            self.accept(child)
+        return True
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _on_solution(self, round_id: int, template: BlockTemplate) -> None:
+        if round_id != self._round:
+            return  # El tip cambió: esta búsqueda quedó vieja
+
+        self._mined += 1
+        snapshot = template.snapshot()
+        block = Block(
+            index=snapshot.index,
+            timestamp=self._start_timestamp + int(self._transport.now),
+            previous_hash=snapshot.previous_hash,
+            bits=snapshot.bits,
+            merkle_root=snapshot.merkle_root,
+            nonce=self._mined,
+            block_hash=CryptoUtility.double_sha256(f"{self.name}:{snapshot.index}:{snapshot.previous_hash}:{self._mined}"),
+            transactions=[]
+        )
+        self._on_block_mined(self, block)
+        self.accept(block)
+        self._transport.broadcast(self.name, block)
+
+    def _switch_tip(self, new_tip: Block) -> None:
+        old_tip = self.tip
+
+        branch: List[Block] = []
+        current = new_tip
+        while True:
+            main_block = self._chain.get_block_by_index(current.index)
+            if main_block is not None and main_block.hash == current.hash:
+                break
+            branch.append(current)
+            current = self._blocks[current.previous_hash]
+
+        fork_index = current.index
+        branch.reverse()
+        self._chain.replace_from(fork_index, branch)
+
+        depth = old_tip.index - fork_index
+        if depth > 0:
+            self._on_reorg(self, depth)
+        self.start_round()
+
+class MiningSimulator:
+    """
+    Arnés determinista para calibrar AKM_BLOCK_TIME / AKM_DIFF_INTERVAL.
+    N mineros simulados sobre un transporte local con latencia, usando el
+    MiningManager y el DifficultyAdjuster reales. Reporta varianza del
+    intervalo entre bloques, tasa de bloques viejos, profundidad de reorgs
+    y convergencia del reajuste de dificultad.
+    """
+
+    # Una época converge si su intervalo medio queda dentro de ±25% del objetivo
+    CONVERGENCE_TOLERANCE = 0.25
+
+    def __init__(
+        self,
+        miners: List[MinerSpec],
+        latency_sec: float = 0.5,
+        jitter_sec: float = 0.0,
+        seed: int = 0,
+        initial_bits: Optional[str] = None,
+        start_timestamp: int = 1_700_000_000
+    ) -> None:
+        if not miners:
+            raise ValueError("Se requiere al menos un minero.")
+        if len({spec.name for spec in miners}) != len(miners):
+            raise ValueError("Los nombres de los mineros deben ser únicos.")
+
+        self._config = ConsensusConfig()
+        self._specs = miners
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._transport = LocalTransport(latency_sec, jitter_sec, self._rng)
+        self._latency = latency_sec
+        self._jitter = jitter_sec
+
+        bits = initial_bits or self._config.initial_difficulty_bits
+        self._genesis = Block(
+            index=0,
+            timestamp=start_timestamp,
+            previous_hash="0" * 64,
+            bits=bits,
+            merkle_root="0" * 64,
+            nonce=0,
+            block_hash=CryptoUtility.double_sha256(f"genesis:{seed}:{bits}"),
+            transactions=[]
+        )
+
+        # Estadísticas globales
+        self._found_at: Dict[str, float] = {self._genesis.hash: 0.0}
+        self._mined_by: Dict[str, str] = {}
+        self._mined_index: Dict[str, int] = {}
+        self._reorg_depths: List[int] = []
+
+        self._miners = [
+            _SimulatedMiner(
+                spec, self._genesis, self._transport, self._rng, start_timestamp,
+                self._record_block, self._record_reorg
+            )
+            for spec in miners
+        ]
+        self._by_name = {miner.name: miner for miner in self._miners}
+
+    @staticmethod
+    def calibrated_bits(total_hashrate: float, block_time_sec: float) -> str:
+        """Bits cuyo tiempo esperado por bloque, con ese hashrate total, es el objetivo."""
+        target = int(2 ** 256 / max(total_hashrate * block_time_sec, 1.0)) - 1
+        return DifficultyUtils.target_to_bits(max(1, min(target, ConsensusConfig().max_target)))
+
+    def schedule_hashrate(self, at_sec: float, name: str, hashrate: float) -> None:
+        """Cambio de hashrate de un minero en un instante simulado (entrada/salida de potencia)."""
+        miner = self._by_name[name]
+        self._transport.call_at(at_sec, miner.set_hashrate, hashrate)
+
+    def run(self, blocks: int, max_time_sec: float = float("inf")) -> Dict[str, Any]:
+        """Simula hasta que la mejor cadena alcanza 'blocks' de altura (o se agota el tiempo)."""
+        for miner in self._miners:
+            miner.start_round()
+
+        self._transport.run(until=max_time_sec, stop=lambda: self._best_tip().index >= blocks)
+
+        # Dejamos llegar los mensajes en vuelo para que los nodos converjan
+        for miner in self._miners:
+            miner.set_hashrate(0)
+        self._transport.run(until=self._transport.now + self._latency + self._jitter)
+        return self._report()
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _record_block(self, miner: _SimulatedMiner, block: Block) -> None:
+        self._found_at[block.hash] = self._transport.now
+        self._mined_by[block.hash] = miner.name
+        self._mined_index[block.hash] = block.index
+
+    def _record_reorg(self, miner: _SimulatedMiner, depth: int) -> None:
+        self._reorg_depths.append(depth)
+
+    def _best_tip(self) -> Block:
+        # Empate: el primer minero registrado (igual de determinista)
+        return max((miner.tip for miner in self._miners), key=lambda block: block.index)
+
+    def _report(self) -> Dict[str, Any]:
+        best = max(self._miners, key=lambda miner: miner.tip.index)
+        height = best.tip.index
+        chain = [best.main_chain_block(i) for i in range(height + 1)]
+        main_hashes = {block.hash for block in chain if block is not None}
+
+        times = [self._found_at[block.hash] for block in chain if block is not None]
+        intervals = [b - a for a, b in zip(times, times[1:])]
+        mean = statistics.fmean(intervals) if intervals else 0.0
+        variance = statistics.pvariance(intervals) if len(intervals) > 1 else 0.0
+
+        mined = [h for h, index in self._mined_index.items() if index <= height]
+        stale = [h for h in mined if h not in main_hashes]
+
+        depths: Dict[int, int] = {}
+        for depth in self._reorg_depths:
+            depths[depth] = depths.get(depth, 0) + 1
+
+        epochs = self._epochs(chain, intervals)
+
+        total_hashrate = sum(spec.hashrate for spec in self._specs) or 1.0
+        shares: Dict[str, Dict[str, float]] = {}
+        for spec in self._specs:
+            won = sum(1 for block in chain[1:] if block is not None and self._mined_by.get(block.hash) == spec.name)
+            shares[spec.name] = {
+                "hashrate_share": round(spec.hashrate / total_hashrate, 4),
+                "block_share": round(won / height, 4) if height else 0.0
+            }
+
+        return {
+            "seed": self._seed,
+            "miners": len(self._miners),
+            "latency_sec": self._latency,
+            "jitter_sec": self._jitter,
+            "target_block_time_sec": self._config.target_block_time_sec,
+            "difficulty_interval": self._config.difficulty_adjustment_interval,
+            "height": height,
+            "sim_time_sec": round(times[-1], 3) if times else 0.0,
+            "mean_interval_sec": round(mean, 3),
+            "interval_variance": round(variance, 3),
+            "interval_stdev_sec": round(math.sqrt(variance), 3),
+            "interval_cv": round(math.sqrt(variance) / mean, 3) if mean else 0.0,
+            "blocks_mined": len(mined),
+            "stale_blocks": len(stale),
+            "stale_rate": round(len(stale) / len(mined), 4) if mined else 0.0,
+            "reorgs": len(self._reorg_depths),
+            "max_reorg_depth": max(self._reorg_depths, default=0),
+            "reorg_depths": dict(sorted(depths.items())),
+            "epochs": epochs,
+            "converged_at_epoch": self._convergence(epochs),
+            "miner_share": shares,
+            "messages": self._transport.messages_delivered
+        }
+
+    def _epochs(self, chain: List[Optional[Block]], intervals: List[float]) -> List[Dict[str, Any]]:
+        """Intervalo medio por época de dificultad (bloques que comparten 'bits')."""
+        interval = self._config.difficulty_adjustment_interval
+        target_time = self._config.target_block_time_sec
+        epochs: List[Dict[str, Any]] = []
+
+        # intervals[h - 1] es el tiempo hasta el bloque h
+        for start in range(0, len(intervals) + 1, interval):
+            heights = [h for h in range(max(1, start), start + interval) if h - 1 < len(intervals)]
+            if not heights:
+                continue
+            first = chain[heights[0]]
+            mean = statistics.fmean(intervals[h - 1] for h in heights)
+            epochs.append({
+                "epoch": start // interval,
+                "start_height": start,
+                "blocks": len(heights),
+                "complete": heights[-1] == start + interval - 1,
+                "bits": first.bits if first is not None else "",
+                "mean_interval_sec": round(mean, 3),
+                "ratio": round(mean / target_time, 3) if target_time else 0.0
+            })
+        return epochs
+
+    def _convergence(self, epochs: List[Dict[str, Any]]) -> Optional[int]:
+        """Primera época a partir de la cual todas las épocas completas quedan en tolerancia."""
+        complete = [epoch for epoch in epochs if epoch["complete"]]
+        converged: Optional[int] = None
+        for epoch in complete:
+            if abs(epoch["ratio"] - 1.0) <= MiningSimulator.CONVERGENCE_TOLERANCE:
+                if converged is None:
+                    converged = epoch["epoch"]
+            else:
+                converged = None
+        return converged
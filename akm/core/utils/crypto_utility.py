@@ -2,11 +2,20 @@
 
 import hashlib
 import logging
-from typing import Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Union
 
 logger = logging.getLogger(__name__)
 
 class CryptoUtility:
+
+    # Por debajo de esta cantidad de entradas el pool de hilos no compensa
+    PARALLEL_MIN_ITEMS = 1024
+
+    _executors: Dict[int, ThreadPoolExecutor] = {}
+    _executors_lock = threading.Lock()
+
     @staticmethod
     def sha256(data: Union[str, bytes]) -> str:
         """Retorna el hash SHA-256 hexadecimal."""
@@ -28,6 +37,38 @@ class CryptoUtility:
             logger.exception("Error en cálculo Double SHA256")
             return ""
 
+    @staticmethod
+    def double_sha256_batch(
+        data: Union[Sequence[bytes], bytes, bytearray, memoryview],
+        item_size: int = 64,
+        threads: int = 1
+    ) -> List[bytes]:
+        """
+        Doble SHA-256 de muchas entradas en una sola llamada (digests crudos de 32 bytes).
+        - data: lista de entradas, o un buffer contiguo de entradas de 'item_size' bytes.
+        - threads > 1: reparte el lote en un pool de hilos (hashlib libera el GIL
+          en entradas grandes; con entradas chicas la ganancia es menor).
+        """
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data).cast('B')
+            if item_size <= 0 or len(view) % item_size != 0:
+                raise ValueError(f"Buffer de {len(view)} bytes no divisible en entradas de {item_size}")
+            items: Sequence[Union[bytes, memoryview]] = [
+                view[i:i + item_size] for i in range(0, len(view), item_size)
+            ]
+        else:
+            items = data
+
+        if threads <= 1 or len(items) < CryptoUtility.PARALLEL_MIN_ITEMS:
+            return CryptoUtility._double_sha256_chunk(items)
+
+        chunk = -(-len(items) // threads)
+        chunks = [items[i:i + chunk] for i in range(0, len(items), chunk)]
+        digests: List[bytes] = []
+        for part in CryptoUtility._executor(threads).map(CryptoUtility._double_sha256_chunk, chunks):
+            digests.extend(part)
+        return digests
+
     @staticmethod
     def hash160(data: Union[str, bytes]) -> str:
         """RIPEMD160(SHA256(data)) para direcciones."""
@@ -47,6 +88,21 @@ class CryptoUtility:
             logger.exception("Error en cálculo HASH160")
             return ""
 
+    @staticmethod
+    def _double_sha256_chunk(items: Sequence[Union[bytes, memoryview]]) -> List[bytes]:
+        sha256 = hashlib.sha256
+        return [sha256(sha256(item).digest()).digest() for item in items]
+
+    @staticmethod
+    def _executor(threads: int) -> ThreadPoolExecutor:
+        """Un pool persistente por tamaño: crearlo en cada lote costaría más que el hashing."""
+        with CryptoUtility._executors_lock:
+            executor = CryptoUtility._executors.get(threads)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="Sha256d")
+                CryptoUtility._executors[threads] = executor
+            return executor
+
     @staticmethod
     def _to_bytes(data: Union[str, bytes]) -> bytes:
         """Normaliza entrada a bytes de forma segura."""
@@ -1,10 +1,11 @@
 # akm/core/utils/node_mapper.py
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 
 # Modelos
 from akm.core.models.block import Block
+from akm.core.models.block_header import BlockHeader
 from akm.core.models.transaction import Transaction
 from akm.core.models.tx_input import TxInput
 from akm.core.models.tx_output import TxOutput
@@ -61,6 +62,25 @@ class NodeMapper:
             logger.exception(f"❌ Fallo al reconstruir Block desde el payload: {e}")
             raise
 
+    @staticmethod
+    def reconstruct_header(data: Dict[str, Any]) -> BlockHeader:
+        """Solo el encabezado de un payload de bloque (sin reconstruir TXs)."""
+        header_data = data.get("header", data)
+        return BlockHeader(
+            index=int(header_data["index"]),
+            timestamp=int(header_data["timestamp"]),
+            previous_hash=str(header_data["previous_hash"]),
+            bits=str(header_data.get("bits") or header_data.get("difficulty") or ""),
+            merkle_root=str(header_data["merkle_root"]),
+            nonce=int(header_data["nonce"]),
+            block_hash=str(header_data.get("hash") or header_data.get("block_hash") or "")
+        )
+
+    @staticmethod
+    def block_tx_hashes(data: Dict[str, Any]) -> Set[str]:
+        """Hashes de las TXs de un payload de bloque, sin reconstruirlas."""
+        return {str(tx.get("tx_hash", "")) for tx in data.get("transactions", [])}
+
     @staticmethod
     def reconstruct_transaction(data: Dict[str, Any]) -> Transaction:
         try:
@@ -1,10 +1,13 @@
 # akm/core/validators/block_rules_validator.py
 import logging
-from typing import Set  # <--- [FIX 1] Importante para el tipado
+from typing import List, Optional, Set, Tuple  # <--- [FIX 1] Importante para el tipado
 
 # Dependencias de Estado y Modelos
 from akm.core.models.block import Block
+from akm.core.models.transaction import Transaction
 from akm.core.managers.utxo_set import UTXOSet
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.signature_batch_verifier import SignatureBatchVerifier, SignatureCheck
 
 # Especialistas
 from akm.core.validators.block_validator import BlockValidator
@@ -16,9 +19,18 @@ logger = logging.getLogger(__name__)
 
 class BlockRulesValidator:
 
-    def __init__(self, utxo_set: UTXOSet):
+    def __init__(
+        self,
+        utxo_set: UTXOSet,
+        validation_cache: Optional[ValidationCache] = None,
+        signature_verifier: Optional[SignatureBatchVerifier] = None
+    ):
         self._utxo_set = utxo_set
-        self._tx_rules_validator = TransactionRulesValidator(utxo_set)
+        # Caché compartida con la admisión al Mempool: las TXs ya vistas
+        # solo re-verifican disponibilidad de UTXOs, integridad y balance.
+        self._tx_rules_validator = TransactionRulesValidator(utxo_set, validation_cache)
+        # Firmas del bloque en lote (pool de procesos si hay varios núcleos)
+        self._signature_verifier = signature_verifier or SignatureBatchVerifier()
         self._coinbase_validator = CoinbaseValidator() 
         self._difficulty_adjuster = DifficultyAdjuster()
 
@@ -30,49 +42,44 @@ class BlockRulesValidator:
             if not BlockValidator.validate_pow(block): 
                 return False
 
+            # 2. Contenido: TXs, doble gasto interno y Coinbase
+            return self.validate_contents(block)
+
+        except Exception as e:
+            logger.exception(f"🐛 Bug crítico validando Bloque {block.index}: {e}")
+            return False
+
+    def validate_trusted(self, block: Block) -> bool:
+        """
+        Bloque propio minado sobre una plantilla ya pre-validada (mismo tip, mismas TXs):
+        solo estructura y PoW; el contenido se verificó mientras se hasheaba.
+        """
+        try:
+            if not BlockValidator.validate_structure(block):
+                return False
+            if not BlockValidator.validate_pow(block):
+                return False
+
+            logger.info(f"✅ Bloque {block.index} ({block.hash[:8]}) verificado (plantilla pre-validada).")
+            return True
+
+        except Exception as e:
+            logger.exception(f"🐛 Bug crítico validando Bloque {block.index}: {e}")
+            return False
+
+    def validate_contents(self, block: Block) -> bool:
+        """Reglas de contenido (sin PoW): sirve también para pre-validar una plantilla."""
+        try:
             if not block.transactions:
                 logger.info(f"Bloque {block.hash[:8]} rechazado: Vacío.")
                 return False
 
-            # 2. Inicialización de contadores
-            coinbase_tx = block.transactions[0]
-            total_fees = 0
-            
-            # [FIX 2] Conjunto TIPADO para rastrear inputs gastados en ESTE bloque.
-            # Esto evita que la TX #2 gaste el mismo UTXO que la TX #1.
-            spent_in_this_block: Set[str] = set()
-
             # 3. Iterar transacciones (saltando la Coinbase)
-            for i in range(1, len(block.transactions)):
-                tx = block.transactions[i]
-                
-                # A. Validación Individual (Firmas y UTXO existente en DB)
-                if not self._tx_rules_validator.validate(tx):
-                    logger.info(f"Bloque {block.hash[:8]} rechazado: TX {tx.tx_hash[:8]} inválida.")
-                    return False
-                
-                # B. Validación de Doble Gasto INTERNO (Critical Security Fix)
-                for inp in tx.inputs:
-                    # Creamos una clave única para el UTXO: "hash_tx_previa:indice"
-                    utxo_key = f"{inp.previous_tx_hash}:{inp.output_index}"
-                    
-                    if utxo_key in spent_in_this_block:
-                        logger.warning(f"⛔ DOBLE GASTO DETECTADO en bloque {block.index}: UTXO {utxo_key} usado dos veces.")
-                        return False
-                    
-                    # [FIX 3] Ahora 'add' sabe que recibe un str gracias al tipado de arriba
-                    spent_in_this_block.add(utxo_key)
-                
-                total_fees += tx.fee
+            if self.find_invalid_transactions(block, stop_at_first=True):
+                return False
 
             # 4. Validar Coinbase (Recompensa + Fees)
-            block_height = block.index 
-            if not self._coinbase_validator.validate_coinbase_transaction(
-                tx=coinbase_tx,
-                block_height=block_height,
-                block_fees=total_fees
-            ):
-                logger.info(f"Bloque {block.hash[:8]} rechazado: Coinbase inválida.")
+            if not self.validate_coinbase(block):
                 return False
 
             logger.info(f"✅ Bloque {block.index} ({block.hash[:8]}) verificado exitosamente.")
@@ -80,4 +87,107 @@ class BlockRulesValidator:
 
         except Exception as e:
             logger.exception(f"🐛 Bug crítico validando Bloque {block.index}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def validate_coinbase(self, block: Block) -> bool:
+        """Recompensa + fees de la Coinbase, con las TXs del bloque ya validadas."""
+        if not block.transactions:
+            return False
+
+        total_fees = sum(tx.fee for tx in block.transactions[1:])
+        if not self._coinbase_validator.validate_coinbase_transaction(
+            tx=block.transactions[0],
+            block_height=block.index,
+            block_fees=total_fees
+        ):
+            logger.info(f"Bloque {block.hash[:8]} rechazado: Coinbase inválida.")
+            return False
+        return True
+
+    def find_invalid_transactions(self, block: Block, stop_at_first: bool = False) -> List[Transaction]:
+        """
+        TXs (sin la Coinbase) que invalidan el bloque: reglas individuales, firmas o doble gasto interno.
+        1. Pasada serial barata: integridad, UTXOs, balance y scripts (OP_CHECKSIG diferido).
+        2. Todas las firmas del bloque en un solo lote al SignatureBatchVerifier.
+        Con 'stop_at_first' el doble gasto se revisa antes de las firmas y el primer fallo aborta.
+        """
+        invalid: List[Transaction] = []
+        prepared: List[Tuple[Transaction, List[SignatureCheck]]] = []
+
+        for i in range(1, len(block.transactions)):
+            tx = block.transactions[i]
+            
+            # A. Validación Individual (UTXO existente en DB; firmas vía caché)
+            checks = self._tx_rules_validator.prepare(tx)
+            if checks is None:
+                logger.info(f"Bloque {block.hash[:8]} rechazado: TX {tx.tx_hash[:8]} inválida.")
+                invalid.append(tx)
+                if stop_at_first:
+                    return invalid
+                continue
+            prepared.append((tx, checks))
+
+        # B. Doble gasto interno antes de pagar el ECDSA: el bloque ya es inválido
+        if stop_at_first:
+            double_spends = self._find_double_spends(block, [tx for tx, _ in prepared])
+            if double_spends:
+                return double_spends[:1]
+
+        # C. Firmas en lote
+        bad_signatures = self._verify_signatures(block, prepared, stop_at_first)
+        if stop_at_first:
+            return bad_signatures
+
+        invalid.extend(bad_signatures)
+        rejected = {id(tx) for tx in bad_signatures}
+        invalid.extend(self._find_double_spends(block, [tx for tx, _ in prepared if id(tx) not in rejected]))
+        return invalid
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _verify_signatures(
+        self,
+        block: Block,
+        prepared: List[Tuple[Transaction, List[SignatureCheck]]],
+        stop_at_first: bool
+    ) -> List[Transaction]:
+        checks: List[SignatureCheck] = []
+        owners: List[Transaction] = []
+        for tx, tx_checks in prepared:
+            checks.extend(tx_checks)
+            owners.extend([tx] * len(tx_checks))
+
+        failed = self._signature_verifier.verify(checks, stop_at_first)
+        if not failed:
+            self._tx_rules_validator.mark_verified(checks)
+            return []
+
+        bad: List[Transaction] = []
+        for index in failed:
+            tx = owners[index]
+            if not bad or bad[-1] is not tx:
+                logger.info(f"Bloque {block.hash[:8]} rechazado: TX {tx.tx_hash[:8]} con firma inválida (input {checks[index].input_index}).")
+                bad.append(tx)
+
+        rejected = {id(tx) for tx in bad}
+        self._tx_rules_validator.mark_verified([check for check, tx in zip(checks, owners) if id(tx) not in rejected])
+        return bad
+
+    def _find_double_spends(self, block: Block, txs: List[Transaction]) -> List[Transaction]:
+        # [FIX 2] Conjunto TIPADO para rastrear inputs gastados en ESTE bloque.
+        # Esto evita que la TX #2 gaste el mismo UTXO que la TX #1.
+        spent_in_this_block: Set[str] = set()
+        double_spends: List[Transaction] = []
+
+        for tx in txs:
+            # Creamos una clave única para el UTXO: "hash_tx_previa:indice"
+            utxo_keys = [f"{inp.previous_tx_hash}:{inp.output_index}" for inp in tx.inputs]
+            double_spent = next((key for key in utxo_keys if key in spent_in_this_block), None)
+            if double_spent is not None:
+                logger.warning(f"⛔ DOBLE GASTO DETECTADO en bloque {block.index}: UTXO {double_spent} usado dos veces.")
+                double_spends.append(tx)
+                continue
+            
+            spent_in_this_block.update(utxo_keys)
+
+        return double_spends
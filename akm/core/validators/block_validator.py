@@ -4,9 +4,11 @@ import logging
 
 # Dependencias del Proyecto
 from akm.core.models.block import Block
+from akm.core.models.block_header import BlockHeader
 from akm.core.services.block_hasher import BlockHasher
 from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
 from akm.core.utils.difficulty_utils import DifficultyUtils
+from akm.core.validators.transaction_validator import TransactionValidator
 
 logger = logging.getLogger(__name__)
 
@@ -51,4 +53,38 @@ class BlockValidator:
 
         except Exception:
             logger.exception(f"Bug en validación de PoW para bloque {block.index}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def validate_header_pow(header: BlockHeader) -> bool:
+        """Chequeo barato (sin TXs): el hash declarado es el del header y cumple su target."""
+        try:
+            if BlockHasher.calculate(header) != header.hash:
+                return False
+            return int(header.hash, 16) <= DifficultyUtils.bits_to_target(header.bits)
+        except Exception:
+            logger.exception(f"Bug en validación de header #{header.index}")
+            return False
+
+    @staticmethod
+    def validate_body(block: Block) -> bool:
+        """
+        Chequeo sin contexto del cuerpo (sin UTXOs): Merkle y el tx_hash de cada TX
+        (sin la Coinbase, igual que la validación de contenido). No depende de otros
+        bloques: el pipeline de Sync lo corre en paralelo; el hash queda memoizado.
+        """
+        try:
+            if not block.transactions:
+                logger.info(f"Fallo Estructura: Bloque {block.hash[:8]} sin transacciones.")
+                return False
+
+            calculated_root = MerkleTreeBuilder.build([tx.tx_hash for tx in block.transactions])
+            if calculated_root != block.merkle_root:
+                logger.info(f"Fallo Merkle: {block.merkle_root[:8]} (Calculada: {calculated_root[:8]})")
+                return False
+
+            return all(TransactionValidator.verify_integrity(tx) for tx in block.transactions[1:])
+
+        except Exception:
+            logger.exception(f"Bug en validación del cuerpo del bloque {block.index}")
+            return False
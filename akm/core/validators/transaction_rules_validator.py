@@ -2,47 +2,40 @@
 
 import logging
 import binascii
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 # Dependencias del Proyecto
 from akm.core.models.transaction import Transaction
 from akm.core.managers.utxo_set import UTXOSet
 from akm.core.validators.transaction_validator import TransactionValidator
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.signature_batch_verifier import SignatureCheck
 
 
 logger = logging.getLogger(__name__)
 
 class TransactionRulesValidator:
 
-    def __init__(self, utxo_set: UTXOSet):
+    def __init__(self, utxo_set: UTXOSet, validation_cache: Optional[ValidationCache] = None):
         self._utxo_set = utxo_set
+        self._validation_cache = validation_cache
 
     def validate(self, tx: Transaction) -> bool:
         if tx.is_coinbase: 
             return True
 
         try:
-            # 1. Verificar Integridad (Hash correcto)
-            if not TransactionValidator.verify_integrity(tx):
-                logger.info(f"Rechazo TX {tx.tx_hash[:]}: Integridad fallida.")
-                return False
-
-            # 2. Obtener contexto de UTXOs (Inputs previos)
-            try:
-                total_input_value, previous_scripts = self._fetch_utxo_context(tx)
-            except ValueError as e:
-                logger.info(f"Rechazo TX {tx.tx_hash[:]}: {e}")
+            # 1-3. Integridad, contexto de UTXOs y balance
+            previous_scripts = self._check_context(tx)
+            if previous_scripts is None:
                 return False
             
-            # 3. Verificar Scripts (Firmas válidas)
-            if not TransactionValidator.verify_scripts(tx, previous_scripts):
+            # 4. Verificar Scripts (Firmas válidas). Los inputs ya verificados
+            # al entrar al Mempool salen de la caché sin repetir el ECDSA.
+            if not TransactionValidator.verify_scripts(tx, previous_scripts, self._validation_cache):
                 logger.info(f"Rechazo TX {tx.tx_hash[:]}: Firma/Script inválido.")
                 return False
 
-            # 4. Verificar Balance (No crear dinero de la nada)
-            if not TransactionValidator.validate_monetary_balance(tx, total_input_value):
-                return False
-
             logger.info(f"TX {tx.tx_hash[:]} validada correctamente.")
             return True
 
@@ -50,6 +43,66 @@ class TransactionRulesValidator:
             logger.exception(f"Bug detectado validando TX {tx.tx_hash[:8]}")
             return False
 
+    def prepare(self, tx: Transaction) -> Optional[List[SignatureCheck]]:
+        """
+        Pasada barata para la validación de bloques: mismas reglas que validate(),
+        pero las firmas se devuelven pendientes para verificarlas todas en lote.
+        None si la TX es inválida por cualquier otra regla.
+        """
+        if tx.is_coinbase:
+            return []
+
+        try:
+            previous_scripts = self._check_context(tx)
+            if previous_scripts is None:
+                return None
+
+            checks = TransactionValidator.collect_signature_checks(tx, previous_scripts, self._validation_cache)
+            if checks is None:
+                logger.info(f"Rechazo TX {tx.tx_hash[:]}: Script inválido.")
+            return checks
+
+        except Exception:
+            logger.exception(f"Bug detectado validando TX {tx.tx_hash[:8]}")
+            return None
+
+    def mark_verified(self, checks: List[SignatureCheck]) -> None:
+        """Firmas del lote ya verificadas: a la caché compartida con el Mempool."""
+        if self._validation_cache is None:
+            return
+        for check in checks:
+            self._validation_cache.add(check.tx_hash, check.input_index, check.script_pubkey)
+
+    def find_missing_inputs(self, tx: Transaction) -> List[Tuple[str, int]]:
+        """Outpoints que la TX gasta y que aún no existen en el UTXO Set (padre desconocido)."""
+        if tx.is_coinbase:
+            return []
+        return [
+            (inp.previous_tx_hash, inp.output_index)
+            for inp in tx.inputs
+            if self._utxo_set.get_utxo_by_reference(inp.previous_tx_hash, inp.output_index) is None
+        ]
+
+    def _check_context(self, tx: Transaction) -> Optional[Dict[int, bytes]]:
+        """Integridad, UTXOs gastados y balance: scripts previos por input, o None si la TX es inválida."""
+        # 1. Verificar Integridad (Hash correcto)
+        if not TransactionValidator.verify_integrity(tx):
+            logger.info(f"Rechazo TX {tx.tx_hash[:]}: Integridad fallida.")
+            return None
+
+        # 2. Obtener contexto de UTXOs (Inputs previos)
+        try:
+            total_input_value, previous_scripts = self._fetch_utxo_context(tx)
+        except ValueError as e:
+            logger.info(f"Rechazo TX {tx.tx_hash[:]}: {e}")
+            return None
+
+        # 3. Verificar Balance (No crear dinero de la nada)
+        if not TransactionValidator.validate_monetary_balance(tx, total_input_value):
+            return None
+
+        return previous_scripts
+
     def _fetch_utxo_context(self, tx: Transaction) -> tuple[int, Dict[int, bytes]]:
         
         total_value = 0
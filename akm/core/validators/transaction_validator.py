@@ -2,20 +2,24 @@
 
 import logging
 import binascii
-from typing import Dict, Any, Union
-
-# Dependencias Criptográficas
-from ecdsa import VerifyingKey, SECP256k1, util, BadSignatureError # type: ignore
+from typing import Dict, Any, List, Optional, Union
 
 # Dependencias del Proyecto
 from akm.core.models.transaction import Transaction
 from akm.core.services.transaction_hasher import TransactionHasher
 from akm.core.scripting.engine import ScriptEngine
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.signature_batch_verifier import SignatureCheck
+from akm.core.services.signature_cache import SignatureCache
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
 
 logger = logging.getLogger(__name__)
 
 class TransactionValidator:
 
+    # ScriptEngine compartido: la VM no guarda estado entre ejecuciones ni entre hilos
+    _engine: Optional[ScriptEngine] = None
+
     @staticmethod
     def verify_integrity(transaction: Transaction) -> bool:
         try:
@@ -63,16 +67,15 @@ class TransactionValidator:
             else:
                 hash_bytes = tx_hash
 
-            # 3. Verificar con librería ECDSA
-            vk = VerifyingKey.from_string(pub_key_bytes, curve=SECP256k1) # type: ignore
-            return vk.verify_digest(signature_bytes, hash_bytes, sigdecode=util.sigdecode_der) # type: ignore
+            # 3. Verificar con el backend de firmas activo (ecdsa, OpenSSL...)
+            if not SignatureBackendFactory.active().verify(hash_bytes, pub_key_bytes, signature_bytes):
+                logger.info("Firma criptográfica no válida para esta llave pública.")
+                return False
+            return True
 
         except (ValueError, binascii.Error) as e:
             logger.error(f"Error de formato en verificación de firma: {e}")
             return False
-        except BadSignatureError:
-            logger.info("Firma criptográfica no válida para esta llave pública.")
-            return False
         except Exception:
             logger.exception("Error técnico no controlado en motor ECDSA")
             return False
@@ -82,20 +85,38 @@ class TransactionValidator:
         try:
             # El ScriptEngine pasa bytes, TransactionValidator espera Hex strings o bytes controlados
             tx_hash_bytes = tx.get_hash_for_signature(input_idx)
+
+            # Firma ya verificada (Mempool o bloque anterior): sin ECDSA
+            cache = SignatureCache.shared()
+            if cache.contains(tx_hash_bytes, pub_key, signature):
+                return True
             
-            return TransactionValidator.verify_signature(
+            is_valid = TransactionValidator.verify_signature(
                 public_key_hex=pub_key.hex(),
                 tx_hash=tx_hash_bytes, # Pasamos bytes directo
                 signature_hex=signature.hex()
             )
+            if is_valid:
+                cache.add(tx_hash_bytes, pub_key, signature)
+            return is_valid
         except Exception as e:
             logger.error(f"Error en adaptador de firma: {e}")
             return False
 
     @staticmethod
-    def verify_scripts(transaction: Transaction, previous_outputs: Dict[int, bytes]) -> bool:
+    def _get_engine() -> ScriptEngine:
+        if TransactionValidator._engine is None:
+            TransactionValidator._engine = ScriptEngine(signature_verifier=TransactionValidator._engine_signature_adapter)
+        return TransactionValidator._engine
+
+    @staticmethod
+    def verify_scripts(
+        transaction: Transaction,
+        previous_outputs: Dict[int, bytes],
+        cache: Optional[ValidationCache] = None
+    ) -> bool:
         try:
-            engine = ScriptEngine(signature_verifier=TransactionValidator._engine_signature_adapter)
+            engine = TransactionValidator._get_engine()
             
             for i, inp in enumerate(transaction.inputs):
                 script_pubkey = previous_outputs.get(i)
@@ -104,6 +125,10 @@ class TransactionValidator:
                     logger.error(f"TX {transaction.tx_hash[:8]}: UTXO {i} no encontrado para ejecutar script.")
                     return False
 
+                # Firma ya verificada (Ej: al admitir la TX en el Mempool)
+                if cache is not None and cache.contains(transaction.tx_hash, i, script_pubkey):
+                    continue
+
                 if not engine.execute(
                     script_sig=inp.script_sig,
                     script_pubkey=script_pubkey,
@@ -112,8 +137,70 @@ class TransactionValidator:
                 ):
                     logger.info(f"TX {transaction.tx_hash[:8]}: Script fallido en input {i}.")
                     return False
+
+                if cache is not None:
+                    cache.add(transaction.tx_hash, i, script_pubkey)
                     
             return True
         except Exception:
             logger.exception(f"Bug en ejecución de scripts para TX {transaction.tx_hash[:8]}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            transaction.release_sighash_context()
+
+    @staticmethod
+    def collect_signature_checks(
+        transaction: Transaction,
+        previous_outputs: Dict[int, bytes],
+        cache: Optional[ValidationCache] = None
+    ) -> Optional[List[SignatureCheck]]:
+        """
+        Ejecuta los scripts difiriendo el ECDSA: cada OP_CHECKSIG se registra como
+        SignatureCheck y se da por válido. Correcto porque un OP_CHECKSIG fallido
+        siempre aborta el script (no hay opcodes que ramifiquen sobre su resultado):
+        el input es válido si el script pasa Y todas sus firmas diferidas pasan.
+        None si algún script falla por otra razón.
+        """
+        try:
+            checks: List[SignatureCheck] = []
+            script_pubkey = b''
+
+            def deferred_verifier(signature: bytes, pub_key: bytes, tx: Any, input_idx: int) -> bool:
+                checks.append(SignatureCheck(
+                    sighash=tx.get_hash_for_signature(input_idx),
+                    public_key=pub_key,
+                    signature=signature,
+                    tx_hash=tx.tx_hash,
+                    input_index=input_idx,
+                    script_pubkey=script_pubkey
+                ))
+                return True
+
+            engine = TransactionValidator._get_engine()
+
+            for i, inp in enumerate(transaction.inputs):
+                script_pubkey = previous_outputs.get(i) or b''
+
+                if not script_pubkey:
+                    logger.error(f"TX {transaction.tx_hash[:8]}: UTXO {i} no encontrado para ejecutar script.")
+                    return None
+
+                if cache is not None and cache.contains(transaction.tx_hash, i, script_pubkey):
+                    continue
+
+                if not engine.execute(
+                    script_sig=inp.script_sig,
+                    script_pubkey=script_pubkey,
+                    transaction=transaction,
+                    tx_input_index=i,
+                    signature_verifier=deferred_verifier
+                ):
+                    logger.info(f"TX {transaction.tx_hash[:8]}: Script fallido en input {i}.")
+                    return None
+
+            return checks
+        except Exception:
+            logger.exception(f"Bug en ejecución de scripts para TX {transaction.tx_hash[:8]}")
+            return None
+        finally:
+            transaction.release_sighash_context()
@@ -0,0 +1,31 @@
+# akm/infra/crypto/ecdsa_signature_backend.py
+
+import logging
+
+from ecdsa import util # type: ignore
+
+# Importación del contrato
+from akm.core.interfaces.i_signature_backend import ISignatureBackend
+from akm.core.services.verifying_key_cache import VerifyingKeyCache
+
+logger = logging.getLogger(__name__)
+
+class EcdsaSignatureBackend(ISignatureBackend):
+    """
+    Backend de referencia: ecdsa en Python puro.
+    Define qué firmas son válidas; los demás backends se comparan contra este.
+    """
+
+    NAME = "ecdsa"
+
+    @property
+    def name(self) -> str: return EcdsaSignatureBackend.NAME
+
+    def verify(self, sighash: bytes, public_key: bytes, signature: bytes) -> bool:
+        try:
+            # Claves repetidas (y calientes: precalculadas) salen de la LRU del proceso
+            vk = VerifyingKeyCache.shared().get(public_key)
+            return bool(vk.verify_digest(signature, sighash, sigdecode=util.sigdecode_der)) # type: ignore
+        except Exception:
+            # BadSignatureError, clave o firma mal codificada: inválida
+            return False
@@ -0,0 +1,121 @@
+# akm/infra/crypto/openssl_signature_backend.py
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# Importación del contrato
+from akm.core.interfaces.i_signature_backend import ISignatureBackend
+from akm.infra.crypto.ecdsa_signature_backend import EcdsaSignatureBackend
+
+# Dependencia opcional (OpenSSL vía 'cryptography')
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, utils
+    _CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    _CRYPTOGRAPHY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class OpenSSLSignatureBackend(ISignatureBackend):
+    """
+    Backend acelerado: verificación SECP256k1 en C (OpenSSL, paquete 'cryptography').
+    Para aceptar exactamente lo mismo que la referencia:
+    - La firma se decodifica con el mismo parser DER de ecdsa y se re-codifica.
+    - Codificaciones de clave que OpenSSL no soporta (híbridas) y digests que
+      no miden 32 bytes se delegan al backend ecdsa.
+    """
+
+    NAME = "openssl"
+    DEFAULT_MAX_KEYS = 4096
+
+    # Prefijos SEC1 que OpenSSL parsea igual que ecdsa
+    _COMPRESSED_PREFIXES = (2, 3)
+    _UNCOMPRESSED_PREFIX = 4
+
+    _self_test: Optional[bool] = None
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS) -> None:
+        self._reference = EcdsaSignatureBackend()
+        self._max_keys = max(1, max_keys)
+        self._keys: 'OrderedDict[bytes, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str: return OpenSSLSignatureBackend.NAME
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """'cryptography' instalado y con soporte SECP256k1 (se comprueba una vez)."""
+        if cls._self_test is None:
+            cls._self_test = _CRYPTOGRAPHY_AVAILABLE and cls._run_self_test()
+        return cls._self_test
+
+    def verify(self, sighash: bytes, public_key: bytes, signature: bytes) -> bool:
+        encoded_point = OpenSSLSignatureBackend._to_sec1(public_key)
+        if encoded_point is None or len(sighash) != 32:
+            return self._reference.verify(sighash, public_key, signature)
+
+        try:
+            r, s = util.sigdecode_der(signature, SECP256k1.order)
+        except Exception:
+            return False
+
+        try:
+            key = self._get_key(encoded_point)
+            key.verify(utils.encode_dss_signature(r, s), sighash, ec.ECDSA(utils.Prehashed(hashes.SHA256())))
+            return True
+        except InvalidSignature:
+            return False
+        except Exception:
+            # Punto fuera de la curva o r/s fuera de rango
+            return False
+
+    # --- MÉTODOS PRIVADOS ---
+
+    @staticmethod
+    def _to_sec1(public_key: bytes) -> Optional[bytes]:
+        """Clave en SEC1 para OpenSSL; None si hay que delegar a la referencia."""
+        public_key = bytes(public_key)
+        if len(public_key) == 64:
+            return bytes([OpenSSLSignatureBackend._UNCOMPRESSED_PREFIX]) + public_key
+        if len(public_key) == 33 and public_key[0] in OpenSSLSignatureBackend._COMPRESSED_PREFIXES:
+            return public_key
+        if len(public_key) == 65 and public_key[0] == OpenSSLSignatureBackend._UNCOMPRESSED_PREFIX:
+            return public_key
+        return None
+
+    def _get_key(self, encoded_point: bytes) -> Any:
+        with self._lock:
+            key = self._keys.get(encoded_point)
+            if key is not None:
+                self._keys.move_to_end(encoded_point)
+                return key
+
+        # Fuera del candado: si el punto es inválido la excepción sube sin cachear
+        key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), encoded_point)
+        with self._lock:
+            self._keys[encoded_point] = key
+            while len(self._keys) > self._max_keys:
+                self._keys.popitem(last=False)
+        return key
+
+    @classmethod
+    def _run_self_test(cls) -> bool:
+        try:
+            signer = SigningKey.from_secret_exponent(7, curve=SECP256k1)
+            digest = hashlib.sha256(b"akm-signature-backend").digest()
+            signature = signer.sign_digest_deterministic(digest, sigencode=util.sigencode_der)
+            public_key = signer.get_verifying_key().to_string("compressed")
+
+            backend = cls()
+            return backend.verify(digest, public_key, signature) and not backend.verify(digest[::-1], public_key, signature)
+        except Exception as e:
+            logger.warning(f"⚠️ Backend OpenSSL no disponible: {e}")
+            return False
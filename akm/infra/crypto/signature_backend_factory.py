@@ -0,0 +1,79 @@
+# akm/infra/crypto/signature_backend_factory.py
+
+import logging
+import threading
+from typing import Dict, List, Optional, Type
+
+from akm.core.interfaces.i_signature_backend import ISignatureBackend
+from akm.core.config.config_manager import ConfigManager
+
+# Backends de verificación
+from akm.infra.crypto.ecdsa_signature_backend import EcdsaSignatureBackend
+from akm.infra.crypto.openssl_signature_backend import OpenSSLSignatureBackend
+
+logger = logging.getLogger(__name__)
+
+class SignatureBackendFactory:
+    """
+    Selección del backend de verificación de firmas (AKM_SIG_BACKEND).
+    - "auto": el más rápido disponible según PREFERENCE.
+    - Un nombre desconocido o no instalado cae a la referencia (ecdsa).
+    El backend activo es único por proceso; los workers del pool lo reciben por nombre.
+    """
+
+    AUTO = "auto"
+    REFERENCE = EcdsaSignatureBackend.NAME
+    PREFERENCE = (OpenSSLSignatureBackend.NAME, EcdsaSignatureBackend.NAME)
+
+    _registry: Dict[str, Type[ISignatureBackend]] = {
+        EcdsaSignatureBackend.NAME: EcdsaSignatureBackend,
+        OpenSSLSignatureBackend.NAME: OpenSSLSignatureBackend
+    }
+    _instances: Dict[str, ISignatureBackend] = {}
+    _active: Optional[ISignatureBackend] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def available() -> List[str]:
+        """Backends registrados cuyas dependencias funcionan en esta máquina."""
+        return [name for name, backend in SignatureBackendFactory._registry.items() if backend.is_available()]
+
+    @staticmethod
+    def create(name: str) -> ISignatureBackend:
+        """Resuelve 'name' (o "auto") a una instancia; nunca falla: cae a ecdsa."""
+        requested = (name or SignatureBackendFactory.AUTO).lower()
+
+        if requested == SignatureBackendFactory.AUTO:
+            available = SignatureBackendFactory.available()
+            requested = next(n for n in SignatureBackendFactory.PREFERENCE if n in available)
+        elif requested not in SignatureBackendFactory._registry:
+            logger.warning(f"⚠️ Backend de firmas '{requested}' desconocido. Usando {SignatureBackendFactory.REFERENCE}.")
+            requested = SignatureBackendFactory.REFERENCE
+        elif not SignatureBackendFactory._registry[requested].is_available():
+            logger.warning(f"⚠️ Backend de firmas '{requested}' no instalado. Usando {SignatureBackendFactory.REFERENCE}.")
+            requested = SignatureBackendFactory.REFERENCE
+
+        return SignatureBackendFactory.get(requested)
+
+    @staticmethod
+    def get(name: str) -> ISignatureBackend:
+        """Instancia cacheada del backend registrado 'name' (KeyError si no existe)."""
+        with SignatureBackendFactory._lock:
+            backend = SignatureBackendFactory._instances.get(name)
+            if backend is None:
+                backend = SignatureBackendFactory._registry[name]()
+                SignatureBackendFactory._instances[name] = backend
+            return backend
+
+    @staticmethod
+    def active() -> ISignatureBackend:
+        """Backend del proceso; si nadie lo instaló, se resuelve desde la configuración."""
+        backend = SignatureBackendFactory._active
+        if backend is None:
+            backend = SignatureBackendFactory.create(ConfigManager().consensus.signature_backend)
+            SignatureBackendFactory.install(backend)
+        return backend
+
+    @staticmethod
+    def install(backend: ISignatureBackend) -> None:
+        SignatureBackendFactory._active = backend
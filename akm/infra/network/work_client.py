@@ -0,0 +1,160 @@
+# akm/infra/network/work_client.py
+
+import json
+import socket
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+# Configuración y Servicios
+from akm.core.config.protocol_constants import ProtocolConstants
+from akm.core.services.mining_hasher import MiningHasher
+
+logger = logging.getLogger(__name__)
+
+class WorkClient:
+    """
+    Worker remoto (o local) del WorkServer.
+    Un hilo lee los mensajes del servidor; otro recorre el rango de nonces de
+    la unidad vigente con MiningHasher contra el objetivo de share. Una unidad
+    nueva (tip nuevo) reemplaza a la actual en el siguiente chequeo.
+    """
+
+    CHECK_INTERVAL = 4096
+
+    def __init__(self, host: str, port: int, agent: str = "AlphaMark/Worker") -> None:
+        self._host = host
+        self._port = port
+        self._agent = agent
+        self._sock: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._running = False
+
+        self._job_lock = threading.Lock()
+        self._job: Optional[Dict[str, Any]] = None
+        self._job_ready = threading.Event()
+
+        # Telemetría
+        self._hashes = 0
+        self._shares_sent = 0
+        self._shares_accepted = 0
+        self._blocks_found = 0
+
+    @property
+    def hashes(self) -> int: return self._hashes
+    @property
+    def shares_sent(self) -> int: return self._shares_sent
+    @property
+    def shares_accepted(self) -> int: return self._shares_accepted
+    @property
+    def blocks_found(self) -> int: return self._blocks_found
+
+    @property
+    def current_job_id(self) -> Optional[int]:
+        job = self._job
+        return job["job_id"] if job else None
+
+    def start(self) -> None:
+        self._sock = socket.create_connection((self._host, self._port), timeout=5.0)
+        self._sock.settimeout(None)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._running = True
+
+        threading.Thread(target=self._read_loop, daemon=True, name="WorkClientReader").start()
+        threading.Thread(target=self._hash_loop, daemon=True, name="WorkClientHasher").start()
+        self._send(ProtocolConstants.MSG_WORK_SUBSCRIBE, {"agent": self._agent})
+        logger.info(f"🛠️ Worker conectado a {self._host}:{self._port}")
+
+    def stop(self) -> None:
+        self._running = False
+        self._job_ready.set()
+        if self._sock:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+    # --- MÉTODOS PRIVADOS ---
+
+    def _read_loop(self) -> None:
+        sock = self._sock
+        if sock is None:
+            return
+        try:
+            for line in sock.makefile('rb'):
+                if not self._running:
+                    break
+                if not line.strip():
+                    continue
+                self._handle_message(json.loads(line.decode('utf-8')))
+        except (OSError, ValueError):
+            if self._running:
+                logger.warning("🛠️ Conexión con el WorkServer perdida.")
+        finally:
+            self._running = False
+            self._job_ready.set()
+
+    def _handle_message(self, data: Dict[str, Any]) -> None:
+        msg_type = data.get("type")
+        payload = data.get("payload") or {}
+
+        if msg_type == ProtocolConstants.MSG_WORK_JOB:
+            with self._job_lock:
+                self._job = payload
+            self._job_ready.set()
+
+        elif msg_type == ProtocolConstants.MSG_WORK_RESULT:
+            if payload.get("accepted"):
+                self._shares_accepted += 1
+            if payload.get("block"):
+                self._blocks_found += 1
+
+    def _hash_loop(self) -> None:
+        while self._running:
+            self._job_ready.wait()
+            with self._job_lock:
+                job = self._job
+                self._job_ready.clear()
+            if not self._running or job is None:
+                continue
+
+            if self._scan_job(job):
+                # Rango agotado sin reemplazo: pedimos otra unidad (nuevo extra-nonce)
+                self._send(ProtocolConstants.MSG_WORK_GET, {})
+
+    def _scan_job(self, job: Dict[str, Any]) -> bool:
+        """Recorre la unidad. True si se agotó; False si fue reemplazada o se detuvo."""
+        hasher = MiningHasher(bytes.fromhex(job["prefix"]), int(job["share_target"], 16))
+        nonce = int(job["nonce_start"])
+        end = int(job["nonce_end"])
+
+        while nonce < end:
+            if not self._running or self._job_ready.is_set():
+                return False
+
+            chunk_end = min(nonce + WorkClient.CHECK_INTERVAL, end)
+            found = hasher.scan(nonce, chunk_end)
+            if found is not None:
+                self._hashes += found - nonce + 1
+                self._shares_sent += 1
+                self._send(ProtocolConstants.MSG_WORK_SUBMIT, {"job_id": job["job_id"], "nonce": found})
+                nonce = found + 1
+                continue
+
+            self._hashes += chunk_end - nonce
+            nonce = chunk_end
+        return True
+
+    def _send(self, msg_type: str, payload: Dict[str, Any]) -> None:
+        sock = self._sock
+        if sock is None:
+            return
+        packet = json.dumps({"type": msg_type, "payload": payload}).encode('utf-8') + b'\n'
+        try:
+            with self._send_lock:
+                sock.sendall(packet)
+        except OSError:
+            logger.warning("🛠️ No se pudo enviar al WorkServer.")
+            self._running = False
@@ -0,0 +1,276 @@
+# akm/infra/network/work_server.py
+
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+# Configuración y Constantes
+from akm.core.config.consensus_config import ConsensusConfig
+from akm.core.config.protocol_constants import ProtocolConstants
+
+# Modelos y Servicios
+from akm.core.models.block import Block
+from akm.core.models.transaction import Transaction
+from akm.core.managers.mining_manager import MiningManager
+from akm.core.services.block_hasher import BlockHasher
+from akm.core.utils.difficulty_utils import DifficultyUtils
+from akm.infra.network.connection_manager import ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+class WorkServer:
+    """
+    Servidor de trabajo local (estilo Stratum) sobre el transporte TCP del nodo.
+    Un solo MinerNode reparte unidades de trabajo a procesos/equipos remotos:
+    - Cada unidad lleva el prefijo del header (80 bytes), el objetivo del bloque,
+      el objetivo de share y el rango completo de nonces.
+    - Cada unidad usa un extra-nonce propio en la coinbase: los workers nunca
+      recorren el mismo espacio de búsqueda.
+    - Un tip nuevo invalida todas las unidades y se reparte trabajo limpio.
+    Protocolo: JSON delimitado por líneas ({"type", "payload"}), igual que el P2P.
+    """
+
+    MAX_JOBS = 1024
+
+    @dataclass(frozen=True)
+    class _Job:
+        job_id: int
+        peer_id: str
+        index: int
+        timestamp: int
+        previous_hash: str
+        bits: str
+        merkle_root: str
+        transactions: Tuple[Transaction, ...]
+        extra_nonce: int
+        target: int
+        share_target: int
+        nonce: int = 0
+
+    def __init__(
+        self,
+        mining_manager: MiningManager,
+        address_provider: Callable[[], Optional[str]],
+        on_block_found: Callable[[Block], bool],
+        host: str = "127.0.0.1",
+        port: int = 3333,
+        max_connections: int = 32,
+        share_bits: Optional[str] = None
+    ) -> None:
+        self._mining_manager = mining_manager
+        self._address_provider = address_provider
+        self._on_block_found = on_block_found
+        self._share_bits = share_bits
+        self._max_nonce = ConsensusConfig().max_nonce
+        self._lock = threading.Lock()
+
+        self._jobs: 'OrderedDict[int, WorkServer._Job]' = OrderedDict()
+        # Nonces ya enviados por unidad: se descartan junto con la unidad
+        self._seen_shares: Dict[int, Set[int]] = {}
+        self._subscribers: Set[str] = set()
+        self._next_job_id = 0
+
+        # Telemetría
+        self._shares_accepted = 0
+        self._shares_rejected = 0
+        self._blocks_found = 0
+
+        self._connection = ConnectionManager(
+            host=host,
+            port=port,
+            max_connections=max_connections,
+            max_buffer_size=64 * 1024,
+            on_message_received=self._on_message_received
+        )
+
+    @property
+    def port(self) -> int: return self._connection.port
+
+    # --- Ciclo de Vida ---
+
+    def start(self) -> None:
+        self._connection.start_server()
+        logger.info(f"🛠️ WorkServer escuchando en {self._connection.host}:{self._connection.port}")
+
+    def stop(self) -> None:
+        self._connection.stop()
+
+    def notify_new_tip(self) -> None:
+        """Invalida todo el trabajo repartido y envía unidades limpias a cada worker."""
+        with self._lock:
+            self._jobs.clear()
+            self._seen_shares.clear()
+            subscribers = list(self._subscribers)
+
+        logger.info(f"🛠️ Tip nuevo: trabajo invalidado para {len(subscribers)} workers.")
+        for peer_id in subscribers:
+            self._send_job(peer_id, clean=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": len(self._subscribers),
+                "active_jobs": len(self._jobs),
+                "shares_accepted": self._shares_accepted,
+                "shares_rejected": self._shares_rejected,
+                "blocks_found": self._blocks_found
+            }
+
+    # --- Protocolo ---
+
+    def _on_message_received(self, peer_id: str, message_str: str) -> None:
+        try:
+            data = json.loads(message_str)
+        except json.JSONDecodeError:
+            logger.warning(f"🗑️ JSON corrupto recibido del worker {peer_id}")
+            return
+
+        msg_type = data.get("type")
+        payload = data.get("payload") or {}
+
+        if msg_type == ProtocolConstants.MSG_WORK_SUBSCRIBE:
+            with self._lock:
+                self._subscribers.add(peer_id)
+            logger.info(f"🛠️ Worker suscrito: {peer_id} ({payload.get('agent', 'desconocido')})")
+            self._send_job(peer_id, clean=True)
+
+        elif msg_type == ProtocolConstants.MSG_WORK_GET:
+            self._send_job(peer_id, clean=False)
+
+        elif msg_type == ProtocolConstants.MSG_WORK_SUBMIT:
+            self._handle_submit(peer_id, payload)
+
+    def _send_job(self, peer_id: str, clean: bool) -> None:
+        job = self._create_job(peer_id)
+        if job is None:
+            return
+
+        self._send(peer_id, ProtocolConstants.MSG_WORK_JOB, {
+            "job_id": job.job_id,
+            "prefix": BlockHasher.serialize_prefix(job).hex(),
+            "target": f"{job.target:064x}",
+            "share_target": f"{job.share_target:064x}",
+            "nonce_start": 0,
+            "nonce_end": self._max_nonce + 1,
+            "extra_nonce": job.extra_nonce,
+            "clean": clean
+        })
+
+    def _create_job(self, peer_id: str) -> Optional['WorkServer._Job']:
+        address = self._address_provider()
+        if not address:
+            logger.warning("🛠️ WorkServer sin dirección de pago: no se reparte trabajo.")
+            return None
+
+        try:
+            template = self._mining_manager.get_block_template(address)
+        except Exception:
+            logger.exception("Error obteniendo plantilla para el WorkServer")
+            return None
+
+        # Extra-nonce exclusivo de esta unidad (solo cambia la rama izquierda del Merkle)
+        snapshot = template.roll_extra_nonce()
+        target = DifficultyUtils.bits_to_target(snapshot.bits)
+        share_target = DifficultyUtils.bits_to_target(self._share_bits) if self._share_bits else target
+
+        with self._lock:
+            self._next_job_id += 1
+            job = WorkServer._Job(
+                job_id=self._next_job_id,
+                peer_id=peer_id,
+                index=snapshot.index,
+                timestamp=int(time.time()),
+                previous_hash=snapshot.previous_hash,
+                bits=snapshot.bits,
+                merkle_root=snapshot.merkle_root,
+                transactions=snapshot.transactions,
+                extra_nonce=snapshot.extra_nonce,
+                target=target,
+                share_target=max(share_target, target)
+            )
+            self._jobs[job.job_id] = job
+            self._seen_shares[job.job_id] = set()
+            while len(self._jobs) > WorkServer.MAX_JOBS:
+                evicted_id, _ = self._jobs.popitem(last=False)
+                self._seen_shares.pop(evicted_id, None)
+        return job
+
+    def _handle_submit(self, peer_id: str, payload: Dict[str, Any]) -> None:
+        job_id = int(payload.get("job_id", -1))
+        nonce = int(payload.get("nonce", -1))
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            seen = self._seen_shares.get(job_id)
+            duplicated = seen is not None and nonce in seen
+            if seen is not None and not duplicated:
+                seen.add(nonce)
+
+        reason = self._check_share(job, peer_id, nonce, duplicated)
+        block_hash = ""
+        if job is not None and reason is None:
+            block_hash = BlockHasher.calculate(replace(job, nonce=nonce))
+            if int(block_hash, 16) > job.share_target:
+                reason = "low-difficulty"
+
+        if job is None or reason is not None:
+            with self._lock:
+                self._shares_rejected += 1
+            logger.info(f"🛠️ Share rechazado de {peer_id}: {reason}")
+            self._send_result(peer_id, job_id, nonce, accepted=False, block=False, reason=reason or "stale")
+            return
+
+        with self._lock:
+            self._shares_accepted += 1
+
+        is_block = int(block_hash, 16) <= job.target
+        if is_block:
+            block = Block(
+                index=job.index,
+                timestamp=job.timestamp,
+                previous_hash=job.previous_hash,
+                bits=job.bits,
+                merkle_root=job.merkle_root,
+                nonce=nonce,
+                block_hash=block_hash,
+                transactions=list(job.transactions)
+            )
+            logger.info(f"💎 Worker {peer_id} encontró el bloque #{job.index} | Hash: {block_hash[:10]}...")
+            is_block = self._on_block_found(block)
+            if is_block:
+                with self._lock:
+                    self._blocks_found += 1
+
+        self._send_result(peer_id, job_id, nonce, accepted=True, block=is_block, reason="")
+        if is_block:
+            self.notify_new_tip()
+
+    def _check_share(self, job: Optional['WorkServer._Job'], peer_id: str, nonce: int, duplicated: bool) -> Optional[str]:
+        if job is None:
+            return "stale"
+        if job.peer_id != peer_id:
+            return "unknown-job"
+        if duplicated:
+            return "duplicate"
+        if not 0 <= nonce <= self._max_nonce:
+            return "bad-nonce"
+        return None
+
+    def _send_result(self, peer_id: str, job_id: int, nonce: int, accepted: bool, block: bool, reason: str) -> None:
+        self._send(peer_id, ProtocolConstants.MSG_WORK_RESULT, {
+            "job_id": job_id,
+            "nonce": nonce,
+            "accepted": accepted,
+            "block": block,
+            "reason": reason
+        })
+
+    def _send(self, peer_id: str, msg_type: str, payload: Dict[str, Any]) -> None:
+        message = {"type": msg_type, "payload": payload}
+        if not self._connection.send_direct(peer_id, json.dumps(message).encode('utf-8')):
+            with self._lock:
+                self._subscribers.discard(peer_id)
@@ -3,6 +3,7 @@
 import sqlite3
 import logging
 import os
+import threading
 from akm.core.config.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,9 @@ class DatabaseManager:
 
         # Conexión
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Una sola conexión para todos los hilos: la transacción es de la conexión,
+        # así que las escrituras (estado UTXO y bloques) se serializan con este candado
+        self._write_lock = threading.RLock()
         
         # [SOLUCIÓN] 👇 ESTAS LÍNEAS OBLIGAN A ESCRIBIR EN EL ARCHIVO REAL 👇
         # Desactivamos el modo WAL y forzamos escritura síncrona
@@ -80,6 +84,9 @@ class DatabaseManager:
     def get_connection(self):
         return self.conn
 
+    def get_write_lock(self) -> threading.RLock:
+        return self._write_lock
+
     def close(self):
         if self.conn:
             try:
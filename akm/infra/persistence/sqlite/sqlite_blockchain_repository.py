@@ -2,7 +2,7 @@
 import json
 import logging
 import sqlite3
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Interface
 from akm.core.interfaces.i_repository import IBlockchainRepository
@@ -17,12 +17,17 @@ class SqliteBlockchainRepository(IBlockchainRepository):
     def __init__(self):
         self.db_manager = DatabaseManager()
         self.conn = self.db_manager.get_connection()
+        self._write_lock = self.db_manager.get_write_lock()
         logger.debug("🔌 SqliteBlockchainRepository vinculado al DatabaseManager.")
 
     def save_block(self, block_data: Dict[str, Any]) -> bool:
         """
         Guarda un bloque (que llega como Diccionario) en la base de datos.
         """
+        with self._write_lock:
+            return self._save_block(block_data)
+
+    def _save_block(self, block_data: Dict[str, Any]) -> bool:
         try:
             cursor = self.conn.cursor()
             
@@ -59,8 +64,32 @@ class SqliteBlockchainRepository(IBlockchainRepository):
             logger.error(f"❌ Error crítico guardando bloque #{idx} en SQLite: {e}")
             return False
 
+    def save_blocks(self, blocks_data: List[Dict[str, Any]]) -> bool:
+        """Agrega bloques contiguos al final de la cadena con un solo commit (Sync por lotes)."""
+        if not blocks_data:
+            return True
+        with self._write_lock:
+            try:
+                rows = [self._to_row(block_data) for block_data in blocks_data]
+                self.conn.cursor().executemany("""
+                    INSERT OR IGNORE INTO blocks 
+                    (hash, height, prev_hash, merkle_root, timestamp, nonce, difficulty, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                self.conn.commit()
+                return True
+            except Exception as e:
+                self.conn.rollback()
+                first = blocks_data[0].get('header', {}).get('index', '???')
+                logger.error(f"❌ Rollback ejecutado. Error guardando lote desde bloque #{first}: {e}")
+                return False
+
     def save_blocks_atomic(self, chain_data: List[Dict[str, Any]]) -> bool:
         """Guarda múltiples bloques en una sola transacción."""
+        with self._write_lock:
+            return self._save_blocks_atomic(chain_data)
+
+    def _save_blocks_atomic(self, chain_data: List[Dict[str, Any]]) -> bool:
         try:
             cursor = self.conn.cursor()
             cursor.execute("BEGIN TRANSACTION")
@@ -90,6 +119,19 @@ class SqliteBlockchainRepository(IBlockchainRepository):
             logger.error(f"❌ Rollback ejecutado. Error guardando cadena: {e}")
             raise
 
+    def _to_row(self, block_data: Dict[str, Any]) -> Tuple[Any, ...]:
+        header = block_data['header']
+        return (
+            header['hash'],
+            header['index'],
+            header['previous_hash'],
+            header['merkle_root'],
+            header['timestamp'],
+            header['nonce'],
+            str(header.get('difficulty', header.get('bits', ''))),
+            json.dumps(block_data)
+        )
+
     def get_last_block(self) -> Optional[Dict[str, Any]]:
         """Recupera el último bloque como Diccionario."""
         try:
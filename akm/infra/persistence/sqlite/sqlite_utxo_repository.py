@@ -13,6 +13,7 @@ class SqliteUTXORepository(IUTXORepository):
     def __init__(self):
         self.db_manager = DatabaseManager()
         self.conn = self.db_manager.get_connection()
+        self._write_lock = self.db_manager.get_write_lock()
         self._create_table()
         logger.debug("🏦 SqliteUTXORepository inicializado (Estado UTXO).")
 
@@ -59,6 +60,10 @@ class SqliteUTXORepository(IUTXORepository):
 
     # --- Métodos básicos ---
     def add_utxo(self, tx_hash: str, index: int, output: TxOutput) -> None:
+        with self._write_lock:
+            self._add_utxo(tx_hash, index, output)
+
+    def _add_utxo(self, tx_hash: str, index: int, output: TxOutput) -> None:
         try:
             cursor = self.conn.cursor()
             script_blob = output.script_pubkey
@@ -76,6 +81,10 @@ class SqliteUTXORepository(IUTXORepository):
             self.conn.rollback()
 
     def remove_utxo(self, tx_hash: str, index: int) -> None:
+        with self._write_lock:
+            self._remove_utxo(tx_hash, index)
+
+    def _remove_utxo(self, tx_hash: str, index: int) -> None:
         try:
             cursor = self.conn.cursor()
             cursor.execute('DELETE FROM utxos WHERE tx_hash = ? AND output_index = ?', (tx_hash, index))
@@ -86,6 +95,10 @@ class SqliteUTXORepository(IUTXORepository):
             self.conn.rollback()
 
     def update_batch(self, new_utxos: List[Tuple[str, int, TxOutput]], spent_utxos: List[Tuple[str, int]]) -> None:
+        with self._write_lock:
+            self._update_batch(new_utxos, spent_utxos)
+
+    def _update_batch(self, new_utxos: List[Tuple[str, int, TxOutput]], spent_utxos: List[Tuple[str, int]]) -> None:
         cursor = self.conn.cursor()
         
         try:
@@ -1,6 +1,6 @@
 # akm/interface/api/schemas.py
 from pydantic import BaseModel, Field, SecretStr, ConfigDict
-from typing import Optional
+from typing import List, Optional
 
 class ImmutableModel(BaseModel):
     """
@@ -37,7 +37,8 @@ class TransactionRequest(ImmutableModel):
     # Ya no pedimos clave privada, la API la tiene en memoria tras el login.
     recipient_address: str = Field(..., description="Dirección Base58 del destinatario")
     amount: float = Field(..., gt=0)
-    fee: float = Field(1.0, ge=0)
+    # Si se omite, se usa la estimación de la red (ver /fees/estimate)
+    fee: Optional[float] = Field(None, ge=0)
 
 class TransactionResponse(ImmutableModel):
     tx_hash: str
@@ -63,4 +64,64 @@ class NodeStatusResponse(ImmutableModel):
     height: int
     peers_count: int
     is_syncing: bool
-    environment: str
\ No newline at end of file
+    environment: str
+
+# --- TELEMETRÍA DE MINERÍA ---
+
+class WorkServerStatsResponse(ImmutableModel):
+    workers: int
+    active_jobs: int
+    shares_accepted: int
+    shares_rejected: int
+    blocks_found: int
+
+class MiningMetricsResponse(ImmutableModel):
+    mining_active: bool
+    miner_address: str
+    processes: int
+    hashrate: float
+    last_batch_hashrate: float
+    nonces_tried: int
+    batches: int
+    batch_size: int
+    check_interval: int
+    current_height: Optional[int] = None
+    template_age_sec: Optional[float] = None
+    seconds_since_last_batch: Optional[float] = None
+    template_tx_count: int
+    template_extra_nonce: int
+    template_prevalidated: bool = False
+    rounds_started: int
+    rounds_interrupted: int
+    blocks_found: int
+    stale_blocks: int
+    uptime_sec: float
+    work_server: Optional[WorkServerStatsResponse] = None
+
+# --- CACHÉS DE VALIDACIÓN ---
+
+class CacheStatsResponse(ImmutableModel):
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+class ValidationMetricsResponse(ImmutableModel):
+    signature_cache: CacheStatsResponse
+    script_cache: Optional[CacheStatsResponse] = None
+
+# --- ESTIMACIÓN DE COMISIONES ---
+
+class FeeBucketResponse(ImmutableModel):
+    min_fee_rate: float
+    max_fee_rate: float
+    count: int
+
+class FeeEstimateResponse(ImmutableModel):
+    target_blocks: int
+    fee_rate: float = Field(..., description="Albas por byte")
+    suggested_fee: float = Field(..., description="AKM para una TX típica (1 input, 2 outputs)")
+    source: str
+    pending_count: int = 0
+    histogram: List[FeeBucketResponse] = []
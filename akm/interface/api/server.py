@@ -3,7 +3,7 @@
 import sys
 import os
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # --- Configuración de Path ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -24,12 +24,16 @@ from akm.interface.api.dependencies import (
 from akm.interface.api.config import settings
 from akm.core.utils.monetary import Monetary 
 from akm.core.nodes.spv_node import SPVNode
+from akm.core.nodes.full_node import FullNode
+from akm.core.nodes.miner_node import MinerNode
 from akm.core.managers.wallet_manager import WalletManager
 from akm.infra.crypto.software_signer import SoftwareSigner
 from akm.core.factories.node_factory import NodeFactory
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FEE_AKM = 1.0
+
 # ==============================================================================
 # 🏗️ SERVICE LAYER (POO / SRP)
 # ==============================================================================
@@ -71,7 +75,7 @@ class WalletService:
             signer = SoftwareSigner(priv_key)
             wallet_manager = WalletManager(signer)
             amount_alba = Monetary.to_albas(req.amount)
-            fee_alba = Monetary.to_albas(req.fee)
+            fee_alba = self._resolve_fee(req.fee)
             required_total = amount_alba + fee_alba
 
             # 2. Obtener UTXOs (Adapter de Memoria)
@@ -123,6 +127,36 @@ class WalletService:
             logger.exception("Error crítico en transacción")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno procesando transacción.")
 
+    def get_fee_estimate(self, target_blocks: int) -> schemas.FeeEstimateResponse:
+        # Pedimos una estimación fresca y respondemos con la última conocida
+        self.node.request_fee_estimate(target_blocks)
+        cached = self.node.get_cached_fee_estimate()
+        if not cached:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Sin estimación de comisiones todavía. Intente en unos segundos."
+            )
+
+        return schemas.FeeEstimateResponse(
+            target_blocks=int(cached.get("target_blocks", target_blocks)),
+            fee_rate=float(cached.get("fee_rate", 0)),
+            suggested_fee=float(Monetary.to_akm(int(cached.get("suggested_fee", 0)))),
+            source=str(cached.get("source", "")),
+            pending_count=int(cached.get("pending_count", 0)),
+            histogram=[schemas.FeeBucketResponse(**b) for b in cached.get("histogram", [])]
+        )
+
+    def _resolve_fee(self, fee_akm: Optional[float]) -> int:
+        if fee_akm is not None:
+            return Monetary.to_albas(fee_akm)
+
+        # Sin comisión explícita: usamos la estimación de la red (o el valor histórico de 1 AKM)
+        cached = self.node.get_cached_fee_estimate()
+        if cached.get("suggested_fee"):
+            return int(cached["suggested_fee"])
+        self.node.request_fee_estimate()
+        return Monetary.to_albas(DEFAULT_FEE_AKM)
+
 # ... (El resto del archivo lifespan, FastAPI setup, etc. se mantiene igual) ...
 
 @asynccontextmanager
@@ -165,6 +199,22 @@ def get_balance(address: str, service: WalletService = Depends(get_wallet_servic
 def send_transaction(req: schemas.TransactionRequest, service: WalletService = Depends(get_wallet_service), identity: Dict[str, Any] = Depends(get_identity_dependency)):
     return service.process_transaction(req, identity)
 
+@app.get("/fees/estimate", response_model=schemas.FeeEstimateResponse, tags=["Wallet"])
+def get_fee_estimate(target_blocks: int = 6, service: WalletService = Depends(get_wallet_service)):
+    return service.get_fee_estimate(target_blocks)
+
+@app.get("/mining/metrics", response_model=schemas.MiningMetricsResponse, tags=["Minería"])
+def get_mining_metrics(node: Any = Depends(get_node_dependency)):
+    if not isinstance(node, MinerNode):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="El nodo activo no es un minero.")
+    return schemas.MiningMetricsResponse(**node.get_mining_metrics())
+
+@app.get("/validation/metrics", response_model=schemas.ValidationMetricsResponse, tags=["Sistema"])
+def get_validation_metrics(node: Any = Depends(get_node_dependency)):
+    if not isinstance(node, FullNode):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="El nodo activo no valida bloques.")
+    return schemas.ValidationMetricsResponse(**node.get_validation_metrics())
+
 @app.post("/wallet/create", response_model=schemas.WalletResponse, tags=["Keystore"])
 def create_wallet(req: schemas.WalletCreateRequest):
     try:
@@ -0,0 +1,235 @@
+# akm/tests/unit/test_block_sync_pipeline.py
+'''
+Test Suite para BlockSyncPipeline:
+    Verifica que la importación por etapas de un SYNC_BATCH aplique el estado en orden,
+    persista en lotes y corte el tramo en el primer bloque inválido o que no enlaza.
+
+    Functions::
+        test_pipeline_applies_in_order_and_commits_in_batches(): Estado en orden, commits agrupados.
+        test_pipeline_stops_at_invalid_or_unlinked_block(): Rechazo en contexto, en header y enlace roto.
+        test_orchestrator_routes_batch(): Conocidos/forks por add_block, el tramo que extiende el tip al pipeline.
+        test_commit_blocks_does_not_touch_state(): Persistencia del lote sin re-aplicar UTXOs.
+        test_commit_failure_rebuilds_state(): Sin persistir no se notifica y el estado se recalcula.
+'''
+
+import sys
+import os
+import time
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.managers.block_sync_pipeline import BlockSyncPipeline, SyncBatchResult
+from akm.core.managers.consensus_orchestrator import ConsensusOrchestrator
+from akm.core.interfaces.i_repository import IBlockchainRepository
+from akm.core.models.blockchain import Blockchain
+from akm.core.models.block import Block
+
+VALIDATOR = 'akm.core.managers.block_sync_pipeline.BlockValidator'
+
+def make_chain(start: int, count: int, parent_hash: str = "genesis") -> List[Any]:
+    blocks = []
+    for index in range(start, start + count):
+        block = MagicMock(spec=Block)
+        block.index = index
+        block.hash = f"hash_{index}"
+        block.previous_hash = parent_hash
+        parent_hash = block.hash
+        blocks.append(block)
+    return blocks
+
+def make_pipeline(contents_ok=lambda block: True, commit_delay: float = 0.0, commit_ok=lambda batch: True, **kwargs):
+    applied: List[Any] = []
+    batches: List[List[Any]] = []
+
+    def commit(batch):
+        time.sleep(commit_delay)
+        if not commit_ok(batch):
+            return False
+        batches.append(list(batch))
+        return True
+
+    def finalize(batch):
+        # Mempool y observadores solo ven lotes ya persistidos
+        assert list(batch) in batches
+
+    blockchain = MagicMock()
+    blockchain.commit_blocks.side_effect = commit
+    reorg_manager = MagicMock()
+    reorg_manager.apply_block_to_state.side_effect = lambda block, finalize=True: applied.append(block)
+    reorg_manager.finalize_connected.side_effect = finalize
+    validator = MagicMock()
+    validator.validate_contents.side_effect = contents_ok
+
+    pipeline = BlockSyncPipeline(blockchain, reorg_manager, validator, **kwargs)
+    return pipeline, applied, batches, reorg_manager
+
+def test_pipeline_applies_in_order_and_commits_in_batches():
+    print(">> Ejecutando: test_pipeline_applies_in_order_and_commits_in_batches...")
+
+    tip = make_chain(0, 1)[0]
+    blocks = make_chain(1, 20, parent_hash=tip.hash)
+    pipeline, applied, batches, reorg_manager = make_pipeline(commit_delay=0.02, depth=4, commit_batch=8, workers=2)
+
+    with patch(VALIDATOR) as validator:
+        validator.validate_header_pow.return_value = True
+        validator.validate_body.return_value = True
+        result = pipeline.run(blocks, tip)
+
+    assert result == SyncBatchResult(consumed=20, committed=20, rejected=None)
+    assert applied == blocks
+    assert [block for batch in batches for block in batch] == blocks
+    # Mientras un lote se escribe, los siguientes se validan y se agrupan
+    assert len(batches) < len(blocks)
+    assert all(len(batch) <= 8 for batch in batches)
+    # El estado se aplica sin finalizar; Mempool y observadores van lote a lote tras el commit
+    assert all(call.kwargs == {"finalize": False} for call in reorg_manager.apply_block_to_state.call_args_list)
+    assert [call.args[0] for call in reorg_manager.finalize_connected.call_args_list] == batches
+    print("[SUCCESS] Estado aplicado en orden y persistido por lotes.\n")
+
+def test_pipeline_stops_at_invalid_or_unlinked_block():
+    print(">> Ejecutando: test_pipeline_stops_at_invalid_or_unlinked_block...")
+
+    blocks = make_chain(0, 10)
+
+    # A. Contenido inválido en #4: los ancestros se persisten, los descendientes se descartan
+    pipeline, applied, batches, _ = make_pipeline(contents_ok=lambda block: block.index != 4, depth=2)
+    with patch(VALIDATOR) as validator:
+        validator.validate_header_pow.return_value = True
+        validator.validate_body.return_value = True
+        result = pipeline.run(blocks, None)
+
+    assert result.rejected is blocks[4] and result.committed == 4
+    assert result.consumed >= 5
+    assert applied == blocks[:4]
+    assert [block for batch in batches for block in batch] == blocks[:4]
+
+    # B. Header con PoW inválido en #6: corta sin detener a los ya encolados
+    pipeline, applied, _, _ = make_pipeline(depth=2)
+    with patch(VALIDATOR) as validator:
+        validator.validate_header_pow.side_effect = lambda block: block.index != 6
+        validator.validate_body.return_value = True
+        result = pipeline.run(blocks, None)
+
+    assert result == SyncBatchResult(consumed=7, committed=6, rejected=blocks[6])
+    assert applied == blocks[:6]
+
+    # C. Enlace roto en #3: el tramo termina ahí y #3 queda sin consumir
+    broken = blocks[:3] + make_chain(3, 2, parent_hash="otra_rama")
+    pipeline, applied, _, _ = make_pipeline()
+    with patch(VALIDATOR) as validator:
+        validator.validate_header_pow.return_value = True
+        validator.validate_body.return_value = True
+        result = pipeline.run(broken, None)
+
+    assert result == SyncBatchResult(consumed=3, committed=3, rejected=None)
+    print("[SUCCESS] El tramo se corta en el primer bloque inválido o sin enlace.\n")
+
+def test_orchestrator_routes_batch():
+    print(">> Ejecutando: test_orchestrator_routes_batch...")
+
+    chain = make_chain(0, 14)
+    tip = chain[10]
+    blockchain = MagicMock()
+    blockchain.last_block = tip
+    sync_pipeline = MagicMock()
+    sync_pipeline.run.return_value = SyncBatchResult(consumed=3, committed=3)
+
+    orchestrator = ConsensusOrchestrator(blockchain, MagicMock(), MagicMock(), MagicMock(), MagicMock(), sync_pipeline)
+    batch = chain[9:14]  # #9 y #10 ya conocidos; #11-#13 extienden el tip
+
+    with patch.object(orchestrator, 'add_block', return_value=False) as add_block:
+        assert orchestrator.add_blocks(batch) == 3
+
+    assert [call.args[0] for call in add_block.call_args_list] == chain[9:11]
+    sync_pipeline.run.assert_called_once_with(chain[11:14], tip)
+
+    # Sin pipeline: bloque a bloque, como antes
+    serial = ConsensusOrchestrator(blockchain, MagicMock(), MagicMock(), MagicMock(), MagicMock())
+    with patch.object(serial, 'add_block', return_value=True) as add_block:
+        assert serial.add_blocks(batch) == 5
+    assert add_block.call_count == 5
+    print("[SUCCESS] Solo el tramo que extiende el tip pasa por el pipeline.\n")
+
+def test_commit_blocks_does_not_touch_state():
+    print(">> Ejecutando: test_commit_blocks_does_not_touch_state...")
+
+    class OneByOneRepository(IBlockchainRepository):
+        def __init__(self) -> None:
+            self.saved: List[Dict[str, Any]] = []
+        def save_block(self, block_data: Dict[str, Any]) -> bool:
+            self.saved.append(block_data)
+            return True
+        def save_blocks_atomic(self, chain_data: List[Dict[str, Any]]) -> bool: return True
+        def get_block_by_hash(self, block_hash: str) -> Optional[Dict[str, Any]]: return None
+        def get_last_block(self) -> Optional[Dict[str, Any]]: return None
+        def get_blocks_range(self, start_index: int, limit: int) -> List[Dict[str, Any]]: return []
+        def count(self) -> int: return len(self.saved)
+        def get_headers_range(self, start_hash: str, limit: int = 2000) -> List[Dict[str, Any]]: return []
+
+    repository = OneByOneRepository()
+    utxo_set = MagicMock()
+    blockchain = Blockchain(repository, utxo_set)
+
+    blocks = make_chain(0, 3)
+    for block in blocks:
+        block.to_dict.return_value = {"header": {"index": block.index, "hash": block.hash}}
+
+    assert blockchain.commit_blocks(blocks)
+    assert [data["header"]["index"] for data in repository.saved] == [0, 1, 2]
+    assert not utxo_set.add_outputs.called and not utxo_set.remove_inputs.called
+    assert blockchain.commit_blocks([])
+    print("[SUCCESS] El lote se persiste sin re-aplicar el estado UTXO.\n")
+
+def test_commit_failure_rebuilds_state():
+    print(">> Ejecutando: test_commit_failure_rebuilds_state...")
+
+    blocks = make_chain(0, 12)
+    pipeline, applied, batches, reorg_manager = make_pipeline(
+        commit_ok=lambda batch: batch[-1].index < 4, depth=2, commit_batch=4
+    )
+    with patch(VALIDATOR) as validator:
+        validator.validate_header_pow.return_value = True
+        validator.validate_body.return_value = True
+        result = pipeline.run(blocks, None)
+
+    persisted = [block for batch in batches for block in batch]
+    assert result.committed == len(persisted) < len(applied)
+    # Las TXs de los bloques no persistidos siguen en el Mempool y nadie los vio conectarse
+    finalized = [block for call in reorg_manager.finalize_connected.call_args_list for block in call.args[0]]
+    assert finalized == persisted
+    # Los UTXOs aplicados de más se descartan recalculando desde la cadena persistida
+    reorg_manager.rebuild_state.assert_called_once()
+
+    pipeline, _, _, reorg_manager = make_pipeline()
+    with patch(VALIDATOR) as validator:
+        validator.validate_header_pow.return_value = True
+        validator.validate_body.return_value = True
+        pipeline.run(blocks, None)
+    reorg_manager.rebuild_state.assert_not_called()
+    print("[SUCCESS] Un commit fallido no deja el estado divergente.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("  EJECUTANDO TESTS SYNC PIPELINE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_pipeline_applies_in_order_and_commits_in_batches()
+        test_pipeline_stops_at_invalid_or_unlinked_block()
+        test_orchestrator_routes_batch()
+        test_commit_blocks_does_not_touch_state()
+        test_commit_failure_rebuilds_state()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -0,0 +1,211 @@
+# akm/tests/unit/test_block_template.py
+'''
+Test Suite para BlockTemplate:
+    Verifica que la plantilla incremental del minero produzca la misma raíz Merkle
+    que una reconstrucción completa y que respete la prioridad por comisión.
+
+    Functions::
+        test_merkle_matches_full_rebuild(): Altas/bajas aleatorias vs MerkleTreeBuilder.
+        test_full_template_replaces_cheapest(): Desplazamiento de la TX más barata.
+        test_coinbase_tracks_fees(): La recompensa incluye subsidio + comisiones vigentes.
+        test_version_bumps_on_change(): El minero detecta cambios entre lotes.
+        test_roll_extra_nonce(): Nueva coinbase y raíz sin tocar las TXs.
+        test_builder_rolls_when_nonce_exhausted(): El minado sigue tras agotar el nonce.
+'''
+
+import sys
+import os
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.builders.block_template import BlockTemplate
+from akm.core.builders.block_builder import BlockBuilder
+from akm.core.builders.mining_engine import MiningEngine
+from akm.core.services.block_hasher import BlockHasher
+from akm.core.utils.difficulty_utils import DifficultyUtils
+from akm.core.models.transaction import Transaction
+from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
+from akm.core.utils.crypto_utility import CryptoUtility
+
+MINER = "1MinerAddressTest"
+
+def create_dummy_tx(seed: int, fee: int) -> Transaction:
+    return Transaction(
+        tx_hash=CryptoUtility.double_sha256(f"tx-{seed}"),
+        timestamp=int(time.time()),
+        inputs=[],
+        outputs=[],
+        fee=fee
+    )
+
+def create_template(txs, max_tx_count: int = 2000) -> BlockTemplate:
+    return BlockTemplate(
+        index=10,
+        previous_hash="ab" * 32,
+        bits="1f0fffff",
+        miner_address=MINER,
+        subsidy=5000,
+        max_tx_count=max_tx_count,
+        transactions=txs
+    )
+
+def assert_consistent(template: BlockTemplate) -> None:
+    snap = template.snapshot()
+    expected = MerkleTreeBuilder.build([tx.tx_hash for tx in snap.transactions])
+    assert snap.merkle_root == expected
+
+def test_merkle_matches_full_rebuild():
+    print(">> Ejecutando: test_merkle_matches_full_rebuild...")
+
+    rng = random.Random(7)
+    txs = [create_dummy_tx(i, rng.randint(1, 100)) for i in range(5)]
+    template = create_template(txs, max_tx_count=12)
+    assert_consistent(template)
+
+    live = list(txs)
+    for step in range(200):
+        if live and rng.random() < 0.45:
+            victims = rng.sample(live, k=min(len(live), rng.randint(1, 3)))
+            template.remove_transactions(victims)
+            live = [tx for tx in live if tx not in victims]
+        else:
+            tx = create_dummy_tx(1000 + step, rng.randint(1, 100))
+            if template.add_transaction(tx):
+                live.append(tx)
+        assert_consistent(template)
+
+    print("[SUCCESS] Raíz incremental idéntica a la reconstrucción completa.\n")
+
+def test_full_template_replaces_cheapest():
+    print(">> Ejecutando: test_full_template_replaces_cheapest...")
+
+    cheap = create_dummy_tx(1, 5)
+    rich = create_dummy_tx(2, 50)
+    template = create_template([rich, cheap], max_tx_count=2)
+
+    # Menor o igual comisión: rechazada
+    assert template.add_transaction(create_dummy_tx(3, 5)) is False
+
+    # Mayor comisión: desplaza a la más barata
+    better = create_dummy_tx(4, 20)
+    assert template.add_transaction(better) is True
+
+    hashes = {tx.tx_hash for tx in template.snapshot().transactions[1:]}
+    assert hashes == {rich.tx_hash, better.tx_hash}
+    assert template.tx_count == 2
+    assert_consistent(template)
+    print("[SUCCESS] Prioridad por comisión respetada.\n")
+
+def test_coinbase_tracks_fees():
+    print(">> Ejecutando: test_coinbase_tracks_fees...")
+
+    template = create_template([create_dummy_tx(1, 10), create_dummy_tx(2, 20)])
+    template.add_transaction(create_dummy_tx(3, 30))
+
+    coinbase = template.snapshot().transactions[0]
+    assert coinbase.is_coinbase
+    assert template.total_fees == 60
+    assert coinbase.total_output_albas == 5000 + 60
+    print("[SUCCESS] Coinbase actualizada con las comisiones.\n")
+
+def test_version_bumps_on_change():
+    print(">> Ejecutando: test_version_bumps_on_change...")
+
+    tx = create_dummy_tx(1, 10)
+    template = create_template([])
+    v0 = template.version
+
+    template.add_transaction(tx)
+    assert template.version == v0 + 1
+
+    # TX desconocida: no hay cambio
+    template.remove_transactions([create_dummy_tx(99, 1)])
+    assert template.version == v0 + 1
+
+    template.remove_transactions([tx])
+    assert template.version == v0 + 2
+    assert_consistent(template)
+    print("[SUCCESS] Versionado de la plantilla verificado.\n")
+
+def test_roll_extra_nonce():
+    print(">> Ejecutando: test_roll_extra_nonce...")
+
+    template = create_template([create_dummy_tx(i, 10 + i) for i in range(9)])
+    before = template.snapshot()
+
+    after = template.roll_extra_nonce()
+    assert template.extra_nonce == 1
+    assert after.version == before.version
+    assert after.transactions[1:] == before.transactions[1:]
+    assert after.transactions[0].tx_hash != before.transactions[0].tx_hash
+    assert after.merkle_root != before.merkle_root
+    assert_consistent(template)
+
+    # El extra-nonce viaja en el script_sig de la coinbase (altura + extra-nonce)
+    assert after.transactions[0].inputs[0].script_sig[4:] == b"1"
+    assert (before.extra_nonce, after.extra_nonce) == (0, 1)
+
+    # Rotaciones concurrentes: cada snapshot trae su propio extra-nonce, el de su coinbase
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        rolled = list(pool.map(lambda _: template.roll_extra_nonce(), range(32)))
+    assert sorted(s.extra_nonce for s in rolled) == list(range(2, 34))
+    assert all(s.transactions[0].inputs[0].script_sig[4:] == str(s.extra_nonce).encode() for s in rolled)
+    print("[SUCCESS] Extra-nonce rotado sin reconstruir la plantilla.\n")
+
+class ExhaustingEngine(MiningEngine):
+    """Motor en proceso que 'agota' las primeras rondas sin buscar."""
+
+    def __init__(self, exhausted_rounds: int) -> None:
+        super().__init__(threads=1)
+        self.exhausted_rounds = exhausted_rounds
+
+    def search(self, prefix, target, start_nonce, end_nonce, interrupt_event=None):
+        if self.exhausted_rounds:
+            self.exhausted_rounds -= 1
+            return None
+        return super().search(prefix, target, start_nonce, end_nonce, interrupt_event)
+
+def test_builder_rolls_when_nonce_exhausted():
+    print(">> Ejecutando: test_builder_rolls_when_nonce_exhausted...")
+
+    template = create_template([create_dummy_tx(i, 5) for i in range(3)])
+    engine = ExhaustingEngine(exhausted_rounds=2)
+
+    with patch.dict(os.environ, {"AKM_MAX_NONCE": "99999"}):
+        block = BlockBuilder.build_from_template(template, engine=engine, batch_size=100_000)
+
+    assert block is not None
+    assert template.extra_nonce == 2
+    assert block.merkle_root == MerkleTreeBuilder.build([tx.tx_hash for tx in block.transactions])
+    assert block.hash == BlockHasher.calculate(block)
+    assert int(block.hash, 16) <= DifficultyUtils.bits_to_target(block.bits)
+    print("[SUCCESS] Rotación de extra-nonce dentro del bucle de minado.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("   EJECUTANDO TESTS BLOCK TEMPLATE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_merkle_matches_full_rebuild()
+        test_full_template_replaces_cheapest()
+        test_coinbase_tracks_fees()
+        test_version_bumps_on_change()
+        test_roll_extra_nonce()
+        test_builder_rolls_when_nonce_exhausted()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -114,7 +114,7 @@ def test_validate_bad_merkle_root():
     
     # SABOTAJE: Cambiamos una transacción sin actualizar la Raíz Merkle
     fake_tx = TransactionFactory.create_coinbase("HACKER", 1, 1000)
-    block._transactions[0] = fake_tx # type: ignore 
+    block._transactions = (fake_tx,) + block._transactions[1:] # type: ignore
     
     original_max = DifficultyUtils.MAX_TARGET
     DifficultyUtils.MAX_TARGET = 2**256 - 1
@@ -0,0 +1,141 @@
+# akm/tests/unit/test_fee_estimator.py
+'''
+Test Suite para FeeEstimator:
+    Verifica que el histograma y la estimación se alimenten de los eventos del
+    Mempool (admisión / retiro) y de los bloques conectados, sin escanear el pool.
+
+    Functions::
+        test_histogram_tracks_mempool_events(): Altas y bajas actualizan los buckets.
+        test_estimate_from_mempool_depth(): Sin historia, hay que superar a la cola.
+        test_estimate_from_confirmation_history(): El bucket barato que confirma a tiempo.
+'''
+
+import sys
+import os
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.services.mempool import Mempool
+from akm.core.services.fee_estimator import FeeEstimator
+from akm.core.models.block import Block
+from akm.core.models.transaction import Transaction
+from akm.core.utils.crypto_utility import CryptoUtility
+
+class ChainHeight:
+    def __init__(self) -> None:
+        self.value = 100
+
+# Una TX sin inputs/outputs mide 24 bytes (timestamp + contadores + fee)
+EMPTY_TX_BYTES = 24
+
+def create_tx(seed: int, fee_rate: int) -> Transaction:
+    return Transaction(
+        tx_hash=CryptoUtility.double_sha256(f"fee-{seed}"),
+        timestamp=int(time.time()),
+        inputs=[],
+        outputs=[],
+        fee=fee_rate * EMPTY_TX_BYTES
+    )
+
+def connect_block(estimator: FeeEstimator, mempool: Mempool, index: int, txs: List[Transaction]) -> None:
+    # Orden real (ChainReorgManager.finalize_connected): se limpia el Mempool y luego se notifica
+    block = MagicMock(spec=Block)
+    block.index = index
+    block.transactions = txs
+    mempool.remove_mined_transactions(txs)
+    estimator.on_blocks_connected([block])
+
+def test_histogram_tracks_mempool_events():
+    print(">> Ejecutando: test_histogram_tracks_mempool_events...")
+
+    mempool = Mempool()
+    height = ChainHeight()
+    estimator = FeeEstimator(mempool, height_provider=lambda: height.value)
+
+    cheap = [create_tx(i, 2) for i in range(3)]
+    rich = create_tx(99, 500)
+    for tx in cheap + [rich]:
+        mempool.add_transaction(tx)
+
+    histogram = estimator.get_histogram()
+    assert sum(b["count"] for b in histogram) == 4
+    assert len(histogram) == 2
+
+    connect_block(estimator, mempool, height.value + 1, [rich])
+    histogram = estimator.get_histogram()
+    assert sum(b["count"] for b in histogram) == 3
+    assert histogram[0]["min_fee_rate"] <= 2 < histogram[0]["max_fee_rate"]
+    print("[SUCCESS] Histograma incremental verificado.\n")
+
+def test_estimate_from_mempool_depth():
+    print(">> Ejecutando: test_estimate_from_mempool_depth...")
+
+    mempool = Mempool()
+    estimator = FeeEstimator(mempool, height_provider=lambda: 100, block_capacity=5)
+
+    # Pool vacío: basta el mínimo
+    assert estimator.estimate(1).source == "minimum"
+
+    # 5 TXs de 50 albas/byte llenan el próximo bloque
+    for i in range(5):
+        mempool.add_transaction(create_tx(i, 50))
+
+    estimate = estimator.estimate(1)
+    assert estimate.source == "mempool"
+    assert estimate.fee_rate > 50
+    # Con 2 bloques de margen hay espacio de sobra
+    assert estimator.estimate(2).source == "minimum"
+    print("[SUCCESS] Estimación por profundidad del Mempool.\n")
+
+def test_estimate_from_confirmation_history():
+    print(">> Ejecutando: test_estimate_from_confirmation_history...")
+
+    mempool = Mempool()
+    height = ChainHeight()
+    estimator = FeeEstimator(mempool, height_provider=lambda: height.value)
+
+    fast = [create_tx(i, 100) for i in range(20)]
+    slow = [create_tx(100 + i, 3) for i in range(20)]
+    for tx in fast + slow:
+        mempool.add_transaction(tx)
+
+    # Las caras entran en el bloque siguiente; las baratas tardan 10 bloques.
+    # La altura persistida no avanza (pipeline de Sync): manda la del bloque que las incluye.
+    connect_block(estimator, mempool, 101, fast)
+    connect_block(estimator, mempool, 110, slow)
+    assert estimator.get_stats()["pending_count"] == 0
+
+    quick = estimator.estimate(2)
+    patient = estimator.estimate(12)
+    assert quick.source == "history"
+    assert 80 <= quick.fee_rate <= 100
+    assert patient.fee_rate <= 3
+    # Las baratas tardaron 10 bloques (no 9): con 9 de margen no alcanzan
+    assert estimator.estimate(9).fee_rate > 3
+    assert patient.suggested_fee < quick.suggested_fee
+    print("[SUCCESS] Estimación por historial de confirmaciones.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("   EJECUTANDO TESTS FEE ESTIMATOR (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_histogram_tracks_mempool_events()
+        test_estimate_from_mempool_depth()
+        test_estimate_from_confirmation_history()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -10,11 +10,13 @@ Test Suite para Mempool:
         test_priority_by_fee(): Verifica que el minero seleccione las TXs más rentables.
         test_mempool_capacity_limit(): Verifica el rechazo cuando la memoria está llena.
         test_remove_mined_transactions(): Verifica la limpieza del pool tras confirmar un bloque.
+        test_concurrent_producers_respect_capacity(): Verifica el límite bajo escrituras paralelas.
 '''
 
 import sys
 import os
 import time
+import threading
 
 # --- AJUSTE DE RUTA PARA EJECUCIÓN DIRECTA ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -145,6 +147,28 @@ def test_remove_mined_transactions():
     
     print("[SUCCESS] Limpieza post-minado correcta.\n")
 
+def test_concurrent_producers_respect_capacity():
+    print(">> Ejecutando: test_concurrent_producers_respect_capacity...")
+    
+    mempool = Mempool()
+    mempool._config._mempool_max_size = 150 # type: ignore
+
+    # 4 hilos de Gossip compiten por 200 TXs distintas (+ duplicados cruzados)
+    batches = [[create_dummy_tx(f"tx_{(p * 50 + i) % 200}", i) for i in range(100)] for p in range(4)]
+    threads = [threading.Thread(target=lambda b=b: [mempool.add_transaction(tx) for tx in b]) for b in batches]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Ni duplicados ni desborde: el conteo coincide con la selección
+    selection = mempool.get_transactions_for_block(max_count=1000)
+    assert mempool.get_pending_count() == 150
+    assert len(selection) == 150
+    assert len({tx.tx_hash for tx in selection}) == 150
+    assert mempool.contains(selection[0].tx_hash)
+    print("[SUCCESS] Capacidad respetada con productores concurrentes.\n")
+
 # --- PUNTO DE ENTRADA PARA EJECUCIÓN MANUAL ---
 if __name__ == "__main__":
     print("==========================================")
@@ -157,6 +181,7 @@ if __name__ == "__main__":
         test_priority_by_fee()
         test_mempool_capacity_limit()
         test_remove_mined_transactions()
+        test_concurrent_producers_respect_capacity()
 
         print("==========================================")
         print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
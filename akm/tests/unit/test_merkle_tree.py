@@ -8,10 +8,17 @@ Test Suite para MerkleTreeBuilder:
         test_build_single_transaction(): Verifica raíz directa.
         test_build_even_transactions(): Verifica pares.
         test_build_odd_transactions(): Verifica duplicación impar.
+        test_double_sha256_batch(): Lote (lista, buffer y pool de hilos) vs llamada individual.
+        test_build_matches_pairwise(): Raíz por lotes vs construcción par a par.
+        test_tree_updates_match_rebuild(): Reemplazo/alta/baja O(log n) vs reconstrucción.
+        test_proofs_served_without_rehashing(): Pruebas desde niveles en caché.
 '''
 
 import sys
 import os
+import random
+import hashlib
+from unittest.mock import patch
 
 # Ajuste de ruta para ejecución directa
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,6 +26,7 @@ root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
 if root_dir not in sys.path:
     sys.path.append(root_dir)
 
+from akm.core.services.merkle_tree import MerkleTree
 from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
 from akm.core.utils.crypto_utility import CryptoUtility
 
@@ -75,6 +83,90 @@ def test_build_odd_transactions():
     assert root == expected_root
     print("[SUCCESS] Árbol impar (duplicación) verificado.\n")
 
+def test_double_sha256_batch():
+    print(">> Ejecutando: test_double_sha256_batch...")
+
+    items = [bytes(random.getrandbits(8) for _ in range(64)) for _ in range(1500)]
+    expected = [bytes.fromhex(CryptoUtility.double_sha256(item)) for item in items]
+
+    assert CryptoUtility.double_sha256_batch(items) == expected
+    assert CryptoUtility.double_sha256_batch(b"".join(items), item_size=64) == expected
+    assert CryptoUtility.double_sha256_batch(items, threads=4) == expected
+
+    try:
+        CryptoUtility.double_sha256_batch(b"x" * 65, item_size=64)
+        assert False, "Un buffer incompleto debe rechazarse"
+    except ValueError:
+        pass
+    print("[SUCCESS] Lote de doble SHA-256 equivalente al individual.\n")
+
+def test_build_matches_pairwise():
+    print(">> Ejecutando: test_build_matches_pairwise...")
+
+    def pairwise(hashes):
+        # Referencia: la construcción original, una llamada por par
+        while len(hashes) > 1:
+            if len(hashes) % 2 != 0:
+                hashes = hashes + [hashes[-1]]
+            hashes = [CryptoUtility.double_sha256(hashes[i] + hashes[i + 1]) for i in range(0, len(hashes), 2)]
+        return hashes[0]
+
+    for count in (2, 3, 7, 64, 1001):
+        leaves = [hashlib.sha256(f"tx-{count}-{i}".encode()).hexdigest() for i in range(count)]
+        assert MerkleTreeBuilder.build(leaves) == pairwise(leaves)
+        assert MerkleTreeBuilder.build(leaves, threads=2) == pairwise(leaves)
+
+    # Hojas de largo no estándar: se hashean por pares sueltos
+    assert MerkleTreeBuilder.build(["ab", "cd", "ef"]) == pairwise(["ab", "cd", "ef"])
+    print("[SUCCESS] Raíz por lotes idéntica a la construcción par a par.\n")
+
+def test_tree_updates_match_rebuild():
+    print(">> Ejecutando: test_tree_updates_match_rebuild...")
+
+    rng = random.Random(42)
+    leaves = [hashlib.sha256(f"leaf-{i}".encode()).hexdigest() for i in range(37)]
+    tree = MerkleTree.from_hashes(leaves)
+    assert tree.root_hex == MerkleTreeBuilder.build(leaves)
+
+    for step in range(300):
+        new_leaf = hashlib.sha256(f"step-{step}".encode()).hexdigest()
+        action = rng.choice(("set", "append", "pop")) if leaves else "append"
+        if action == "set":
+            i = rng.randrange(len(leaves))
+            leaves[i] = new_leaf
+            tree.set_leaf(i, bytes.fromhex(new_leaf))
+        elif action == "append":
+            leaves.append(new_leaf)
+            tree.append_leaf(bytes.fromhex(new_leaf))
+        else:
+            leaves.pop()
+            tree.pop_leaf()
+
+        assert tree.leaf_count == len(leaves)
+        assert tree.root_hex == MerkleTreeBuilder.build(leaves)
+    print("[SUCCESS] Actualizaciones incrementales idénticas a la reconstrucción.\n")
+
+def test_proofs_served_without_rehashing():
+    print(">> Ejecutando: test_proofs_served_without_rehashing...")
+
+    leaves = [hashlib.sha256(f"tx-{i}".encode()).hexdigest() for i in range(23)]
+    tree = MerkleTree.from_hashes(leaves)
+    root = tree.root_hex
+
+    # Con los niveles en caché, ninguna prueba vuelve a hashear
+    with patch('akm.core.services.merkle_tree.hashlib.sha256', side_effect=AssertionError("rehash")), \
+         patch.object(CryptoUtility, 'double_sha256_batch', side_effect=AssertionError("rehash")):
+        proofs = {tx_hash: tree.get_proof_for(tx_hash) for tx_hash in leaves}
+        assert tree.get_proof_for("ff" * 32) is None
+
+    for i, tx_hash in enumerate(leaves):
+        assert proofs[tx_hash] == MerkleTreeBuilder._get_proof_from_text(leaves, i)
+        assert MerkleTreeBuilder.verify_proof(tx_hash, root, proofs[tx_hash])
+
+    batch = MerkleTreeBuilder.get_proofs(leaves, leaves[:3])
+    assert batch == {tx_hash: proofs[tx_hash] for tx_hash in leaves[:3]}
+    print("[SUCCESS] Pruebas O(log n) servidas desde el árbol en caché.\n")
+
 if __name__ == "__main__":
     print("==========================================")
     print("   EJECUTANDO TESTS MERKLE TREE (MANUAL)  ")
@@ -85,6 +177,10 @@ if __name__ == "__main__":
         test_build_single_transaction()
         test_build_even_transactions()
         test_build_odd_transactions()
+        test_double_sha256_batch()
+        test_build_matches_pairwise()
+        test_tree_updates_match_rebuild()
+        test_proofs_served_without_rehashing()
 
         print("==========================================")
         print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
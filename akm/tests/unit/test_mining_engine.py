@@ -0,0 +1,102 @@
+# akm/tests/unit/test_mining_engine.py
+'''
+Test Suite para MiningEngine:
+    Verifica la búsqueda de nonces repartida entre procesos y su cancelación.
+
+    Functions::
+        test_parallel_search_matches_block_hasher(): El nonce hallado cumple el PoW del header.
+        test_interrupt_stops_workers_quickly(): interrupt_event corta la búsqueda en milisegundos.
+'''
+
+import sys
+import os
+import time
+import threading
+from dataclasses import dataclass
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.builders.mining_engine import MiningEngine
+from akm.core.services.block_hasher import BlockHasher
+
+@dataclass
+class Header:
+    index: int = 7
+    timestamp: int = 1_700_000_000
+    previous_hash: str = "ab" * 32
+    bits: str = "1f0fffff"
+    merkle_root: str = "cd" * 32
+    nonce: int = 0
+
+# 1 de cada 4096 hashes es válido: se encuentra rápido en cualquier rango
+EASY_TARGET = (1 << 256) >> 12
+
+def test_parallel_search_matches_block_hasher():
+    print(">> Ejecutando: test_parallel_search_matches_block_hasher...")
+
+    header = Header()
+    prefix = BlockHasher.serialize_prefix(header)
+    assert len(prefix) == 80
+
+    engine = MiningEngine(threads=2)
+    try:
+        nonce = engine.search(prefix, EASY_TARGET, 0, 200_000)
+        assert nonce is not None
+        header.nonce = nonce
+        assert int(BlockHasher.calculate(header), 16) <= EASY_TARGET
+        assert engine.total_hashes > 0
+        assert engine.hashrate > 0
+
+        # El motor en proceso (threads=1) valida el mismo criterio
+        local = MiningEngine(threads=1).search(prefix, EASY_TARGET, 0, 200_000)
+        header.nonce = local
+        assert int(BlockHasher.calculate(header), 16) <= EASY_TARGET
+    finally:
+        engine.shutdown()
+    print("[SUCCESS] Nonce multiproceso válido para el BlockHasher.\n")
+
+def test_interrupt_stops_workers_quickly():
+    print(">> Ejecutando: test_interrupt_stops_workers_quickly...")
+
+    prefix = BlockHasher.serialize_prefix(Header())
+    engine = MiningEngine(threads=2)
+    interrupt = threading.Event()
+    try:
+        # Arranque de procesos fuera de la medición
+        engine.search(prefix, EASY_TARGET, 0, 100_000)
+
+        threading.Timer(0.2, interrupt.set).start()
+        t0 = time.perf_counter()
+        # Objetivo imposible: solo la interrupción termina la búsqueda
+        result = engine.search(prefix, 0, 0, 1 << 32, interrupt)
+        stopped_after = time.perf_counter() - t0
+
+        assert result is None
+        assert stopped_after < 0.5
+
+        # Los workers abandonaron el trabajo cancelado y aceptan uno nuevo
+        assert engine.search(prefix, EASY_TARGET, 0, 200_000) is not None
+    finally:
+        engine.shutdown()
+    print("[SUCCESS] Cancelación propagada a los workers.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("   EJECUTANDO TESTS MINING ENGINE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_parallel_search_matches_block_hasher()
+        test_interrupt_stops_workers_quickly()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -0,0 +1,94 @@
+# akm/tests/unit/test_mining_hasher.py
+'''
+Test Suite para MiningHasher:
+    Verifica que el hasher con prefijo precalculado sea equivalente al BlockHasher.
+
+    Functions::
+        test_digest_matches_block_hasher(): Mismo hash que la serialización completa.
+        test_scan_matches_naive_loop(): Mismo primer nonce válido que el bucle clásico.
+        test_target_boundary_is_inclusive(): hash == target cumple el PoW.
+'''
+
+import sys
+import os
+from dataclasses import dataclass
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.services.mining_hasher import MiningHasher
+from akm.core.services.block_hasher import BlockHasher
+
+@dataclass
+class Header:
+    index: int = 42
+    timestamp: int = 1_700_000_123
+    previous_hash: str = "0f" * 32
+    bits: str = "1f0fffff"
+    merkle_root: str = "e1" * 32
+    nonce: int = 0
+
+def test_digest_matches_block_hasher():
+    print(">> Ejecutando: test_digest_matches_block_hasher...")
+
+    header = Header()
+    hasher = MiningHasher(BlockHasher.serialize_prefix(header), target=0)
+    assert hasher.prefix_len == 80
+
+    for nonce in (0, 1, 255, 65_536, 0xFFFFFFFF):
+        header.nonce = nonce
+        assert hasher.hash_nonce(nonce).hex() == BlockHasher.calculate(header)
+    print("[SUCCESS] Digest idéntico al BlockHasher.\n")
+
+def test_scan_matches_naive_loop():
+    print(">> Ejecutando: test_scan_matches_naive_loop...")
+
+    header = Header()
+    target = (1 << 256) >> 10
+
+    expected = None
+    for nonce in range(50_000):
+        header.nonce = nonce
+        if int(BlockHasher.calculate(header), 16) <= target:
+            expected = nonce
+            break
+
+    hasher = MiningHasher(BlockHasher.serialize_prefix(header), target)
+    assert expected is not None
+    assert hasher.scan(0, 50_000) == expected
+    assert hasher.scan(0, expected) is None
+    print("[SUCCESS] Mismo nonce que el bucle clásico.\n")
+
+def test_target_boundary_is_inclusive():
+    print(">> Ejecutando: test_target_boundary_is_inclusive...")
+
+    prefix = BlockHasher.serialize_prefix(Header())
+    digest = MiningHasher(prefix, 0).hash_nonce(7)
+    exact = int.from_bytes(digest, 'big')
+
+    assert MiningHasher(prefix, exact).scan(7, 8) == 7
+    assert MiningHasher(prefix, exact - 1).scan(7, 8) is None
+    # Objetivos fuera de rango se recortan a 256 bits
+    assert MiningHasher(prefix, 1 << 300).scan(0, 1) == 0
+    print("[SUCCESS] Frontera del objetivo verificada.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("   EJECUTANDO TESTS MINING HASHER (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_digest_matches_block_hasher()
+        test_scan_matches_naive_loop()
+        test_target_boundary_is_inclusive()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
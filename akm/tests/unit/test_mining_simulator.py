@@ -0,0 +1,95 @@
+# akm/tests/unit/test_mining_simulator.py
+'''
+Test Suite para MiningSimulator:
+    Verifica que el arnés de simulación sea determinista y que sus métricas
+    reflejen el reajuste de dificultad y la latencia de la red.
+
+    Functions::
+        test_same_seed_same_report(): Misma semilla, mismo reporte.
+        test_retarget_corrects_initial_error(): El DifficultyAdjuster real corrige una dificultad 16x más fácil.
+        test_latency_causes_stale_blocks(): Sin latencia no hay bloques viejos; con latencia alta sí.
+'''
+
+import sys
+import os
+import statistics
+from unittest.mock import patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.simulation.mining_simulator import MiningSimulator, MinerSpec
+from akm.core.utils.difficulty_utils import DifficultyUtils
+
+MINERS = [MinerSpec("a", 1_000_000), MinerSpec("b", 500_000), MinerSpec("c", 250_000)]
+TOTAL_HASHRATE = sum(spec.hashrate for spec in MINERS)
+ENV = {"AKM_BLOCK_TIME": "60", "AKM_DIFF_INTERVAL": "10"}
+
+def test_same_seed_same_report():
+    print(">> Ejecutando: test_same_seed_same_report...")
+
+    with patch.dict(os.environ, ENV):
+        bits = MiningSimulator.calibrated_bits(TOTAL_HASHRATE, 60)
+        first = MiningSimulator(MINERS, latency_sec=5.0, jitter_sec=3.0, seed=7, initial_bits=bits).run(120)
+        second = MiningSimulator(MINERS, latency_sec=5.0, jitter_sec=3.0, seed=7, initial_bits=bits).run(120)
+        other = MiningSimulator(MINERS, latency_sec=5.0, jitter_sec=3.0, seed=8, initial_bits=bits).run(120)
+
+    assert first == second
+    assert first["sim_time_sec"] != other["sim_time_sec"]
+    assert first["height"] == 120
+    print("[SUCCESS] Corridas reproducibles por semilla.\n")
+
+def test_retarget_corrects_initial_error():
+    print(">> Ejecutando: test_retarget_corrects_initial_error...")
+
+    with patch.dict(os.environ, ENV):
+        easy_bits = MiningSimulator.calibrated_bits(TOTAL_HASHRATE / 16, 60)
+        report = MiningSimulator(MINERS, latency_sec=0.0, seed=3, initial_bits=easy_bits).run(200)
+
+    epochs = report["epochs"]
+    # Época 0: bloques ~16x más rápidos que el objetivo
+    assert epochs[0]["ratio"] < 0.25
+    # El ajuste (limitado a 4x por época) endurece el objetivo
+    assert DifficultyUtils.bits_to_target(epochs[2]["bits"]) < DifficultyUtils.bits_to_target(easy_bits) // 8
+
+    settled = [epoch["ratio"] for epoch in epochs[4:] if epoch["complete"]]
+    assert 0.6 < statistics.fmean(settled) < 1.6
+    print("[SUCCESS] El reajuste converge hacia el tiempo objetivo.\n")
+
+def test_latency_causes_stale_blocks():
+    print(">> Ejecutando: test_latency_causes_stale_blocks...")
+
+    with patch.dict(os.environ, ENV):
+        bits = MiningSimulator.calibrated_bits(TOTAL_HASHRATE, 60)
+        instant = MiningSimulator(MINERS, latency_sec=0.0, seed=1, initial_bits=bits).run(150)
+        slow = MiningSimulator(MINERS, latency_sec=30.0, jitter_sec=10.0, seed=1, initial_bits=bits).run(150)
+
+    assert instant["stale_blocks"] == 0
+    assert instant["reorgs"] == 0
+
+    assert slow["stale_blocks"] > 0
+    assert slow["stale_rate"] > instant["stale_rate"]
+    assert slow["max_reorg_depth"] >= 1
+    assert sum(slow["reorg_depths"].values()) == slow["reorgs"]
+    print("[SUCCESS] La latencia se refleja en bloques viejos y reorgs.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("  EJECUTANDO TESTS MINING SIMULATOR (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_same_seed_same_report()
+        test_retarget_corrects_initial_error()
+        test_latency_causes_stale_blocks()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -0,0 +1,142 @@
+# akm/tests/unit/test_orphan_pool.py
+'''
+Test Suite para OrphanPool:
+    Verifica la zona de espera de TXs cuyo padre aún no llegó por Gossip.
+
+    Functions::
+        test_children_released_by_parent_outpoint(): Solo se liberan los hijos del padre.
+        test_per_peer_and_global_limits(): Cupos anti-abuso (por peer y total).
+        test_full_node_resolves_orphan_on_block(): Integración con FullNode (TX de peer + bloque).
+'''
+
+import sys
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.services.orphan_pool import OrphanPool
+from akm.core.services.mempool import Mempool
+from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.models.transaction import Transaction
+from akm.core.models.tx_input import TxInput
+from akm.core.models.tx_output import TxOutput
+from akm.core.nodes.full_node import FullNode
+
+LOCK_SCRIPT = b'\x76\xa9\x04ALBA\x88\xac'
+
+def create_tx(parent_hash: str, seed: int, outputs: int = 1) -> Transaction:
+    tx = Transaction(
+        tx_hash="",
+        timestamp=1_700_000_000 + seed,
+        inputs=[TxInput(parent_hash, 0, b'\x01\xaa')],
+        outputs=[TxOutput(10, LOCK_SCRIPT) for _ in range(outputs)],
+        fee=1
+    )
+    tx.tx_hash = TransactionHasher.calculate(tx)
+    return tx
+
+def test_children_released_by_parent_outpoint():
+    print(">> Ejecutando: test_children_released_by_parent_outpoint...")
+
+    pool = OrphanPool()
+    parent = create_tx("aa" * 32, 1, outputs=2)
+    other_parent = create_tx("bb" * 32, 2)
+
+    child_a = create_tx(parent.tx_hash, 3)
+    child_b = create_tx(parent.tx_hash, 4)
+    stranger = create_tx(other_parent.tx_hash, 5)
+
+    assert pool.add(child_a, "peer_1", [(parent.tx_hash, 0)])
+    assert pool.add(child_b, "peer_2", [(parent.tx_hash, 1)])
+    assert pool.add(stranger, "peer_1", [(other_parent.tx_hash, 0)])
+
+    released = pool.pop_children(parent)
+    assert {tx.tx_hash for tx, _ in released} == {child_a.tx_hash, child_b.tx_hash}
+    assert len(pool) == 1
+    assert pool.contains(stranger.tx_hash)
+    assert pool.count_for_peer("peer_2") == 0
+    print("[SUCCESS] Resolución por outpoint faltante verificada.\n")
+
+def test_per_peer_and_global_limits():
+    print(">> Ejecutando: test_per_peer_and_global_limits...")
+
+    pool = OrphanPool(max_orphans=3, max_per_peer=2)
+    txs = [create_tx("cc" * 32, 10 + i) for i in range(5)]
+    missing = [("cc" * 32, 0)]
+
+    assert pool.add(txs[0], "spammer", missing)
+    assert pool.add(txs[1], "spammer", missing)
+    # Tercera del mismo peer: excede su cupo
+    assert pool.add(txs[2], "spammer", missing) is False
+
+    # Otros peers llenan el total: se expulsa la más antigua
+    assert pool.add(txs[3], "honest_1", missing)
+    assert pool.add(txs[4], "honest_2", missing)
+    assert len(pool) == 3
+    assert pool.contains(txs[0].tx_hash) is False
+    assert pool.count_for_peer("spammer") == 1
+    print("[SUCCESS] Límites por peer y globales verificados.\n")
+
+def test_full_node_resolves_orphan_on_block():
+    print(">> Ejecutando: test_full_node_resolves_orphan_on_block...")
+
+    parent = create_tx("dd" * 32, 20)
+    child = create_tx(parent.tx_hash, 21)
+    known_utxos = {}
+
+    utxo_set = MagicMock()
+    utxo_set.get_utxo_by_reference.side_effect = lambda h, i: known_utxos.get((h, i))
+    blockchain = MagicMock()
+    blockchain.__len__.return_value = 1
+    reorg = MagicMock()
+    mempool = Mempool()
+
+    node = FullNode(MagicMock(), MagicMock(), blockchain, utxo_set, mempool, MagicMock(), reorg)
+    on_blocks_connected = reorg.subscribe.call_args[0][0]
+
+    with patch('akm.core.scripting.engine.ScriptEngine.execute', return_value=True):
+        # 1. El hijo llega antes que el padre: queda en espera, no se pierde
+        assert node._accept_transaction(child, "peer_x") is False
+        assert mempool.get_pending_count() == 0
+        assert node.orphan_pool.contains(child.tx_hash)
+
+        # 2. El padre entra al Mempool: su output aún no es gastable, el hijo sigue esperando
+        with patch.object(node.orphan_pool, 'pop_children', wraps=node.orphan_pool.pop_children) as pop_children:
+            assert mempool.add_transaction(parent)
+        pop_children.assert_not_called()
+        assert node.orphan_pool.contains(child.tx_hash)
+        assert not mempool.contains(child.tx_hash)
+
+        # 3. El padre se confirma en un bloque: su output ya es gastable
+        known_utxos[(parent.tx_hash, 0)] = TxOutput(50, LOCK_SCRIPT)
+        block = MagicMock()
+        block.transactions = [parent]
+        on_blocks_connected([block])
+
+    assert mempool.contains(child.tx_hash)
+    assert len(node.orphan_pool) == 0
+    print("[SUCCESS] Huérfana resuelta automáticamente al conectar el bloque.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("   EJECUTANDO TESTS ORPHAN POOL (MANUAL)  ")
+    print("==========================================\n")
+
+    try:
+        test_children_released_by_parent_outpoint()
+        test_per_peer_and_global_limits()
+        test_full_node_resolves_orphan_on_block()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
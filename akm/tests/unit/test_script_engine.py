@@ -0,0 +1,166 @@
+# akm/tests/unit/test_script_engine.py
+'''
+Test Suite para ScriptEngine:
+    Verifica que la ruta rápida P2PKH dé el mismo veredicto que la VM genérica
+    y que todo script fuera de la plantilla siga pasando por el intérprete,
+    que ejecuta operaciones pre-decodificadas y cacheadas por script_pubkey.
+
+    Functions::
+        test_p2pkh_template_recognition(): Solo el par estándar (2 PUSHDATA + plantilla) es reconocido.
+        test_fast_path_matches_vm(): Firma válida, firma inválida, clave ajena y verificador que lanza.
+        test_parsed_scripts_cached(): El candado se parsea una vez; PUSHDATA truncados fallan igual.
+        test_engine_shared_across_threads(): Un solo motor para inputs e hilos concurrentes.
+'''
+
+import sys
+import os
+import hashlib
+import threading
+from unittest.mock import MagicMock, patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.scripting.engine import ScriptEngine
+from akm.core.scripting.script_parser import ParsedScriptCache, ScriptParser, OP_TRUNCATED_PUSH
+from akm.core.validators.transaction_validator import TransactionValidator
+
+PUBLIC_KEY = b'\x02' + b'\x11' * 32
+SIGNATURE = b'\x30' + b'\x22' * 70
+
+def push(data: bytes) -> bytes:
+    return bytes([len(data)]) + data
+
+def p2pkh_lock(public_key: bytes) -> bytes:
+    key_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
+    return b'\x76\xa9\x14' + key_hash + b'\x88\xac'
+
+def run_both(script_sig: bytes, script_pubkey: bytes, verifier):
+    fast = ScriptEngine(signature_verifier=verifier).execute(script_sig, script_pubkey, None, 0)
+    generic = ScriptEngine(signature_verifier=verifier, fast_path=False).execute(script_sig, script_pubkey, None, 0)
+    return fast, generic
+
+def test_p2pkh_template_recognition():
+    print(">> Ejecutando: test_p2pkh_template_recognition...")
+
+    lock = p2pkh_lock(PUBLIC_KEY)
+    script_sig = push(SIGNATURE) + push(PUBLIC_KEY)
+    assert ScriptEngine.match_p2pkh(script_sig, lock) == (SIGNATURE, PUBLIC_KEY, lock[3:23])
+
+    # Fuera de la plantilla: la VM genérica decide
+    assert ScriptEngine.match_p2pkh(script_sig + b'\x75', lock) is None      # opcode extra en el sig
+    assert ScriptEngine.match_p2pkh(push(SIGNATURE), lock) is None           # falta la clave
+    assert ScriptEngine.match_p2pkh(script_sig[:-1], lock) is None           # PUSHDATA truncado
+    assert ScriptEngine.match_p2pkh(b'', lock) is None
+    assert ScriptEngine.match_p2pkh(script_sig, lock + b'\x51') is None      # candado alterado
+    assert ScriptEngine.match_p2pkh(script_sig, b'\x51') is None
+    assert ScriptEngine.match_p2pkh(b'\x00' + push(PUBLIC_KEY), lock) is None
+    print("[SUCCESS] Solo el P2PKH estándar toma la ruta rápida.\n")
+
+def test_fast_path_matches_vm():
+    print(">> Ejecutando: test_fast_path_matches_vm...")
+
+    lock = p2pkh_lock(PUBLIC_KEY)
+    script_sig = push(SIGNATURE) + push(PUBLIC_KEY)
+
+    def raising(*args):
+        raise RuntimeError("fallo del backend")
+
+    cases = {
+        "firma valida": (script_sig, lock, lambda *a: True, True),
+        "firma invalida": (script_sig, lock, lambda *a: False, False),
+        "clave ajena": (push(SIGNATURE) + push(b'\x03' + b'\x11' * 32), lock, lambda *a: True, False),
+        "sin verificador": (script_sig, lock, None, False),
+        "verificador lanza": (script_sig, lock, raising, False),
+        "no estandar": (push(b'\x01') + b'\x75', b'\x51', lambda *a: True, True)
+    }
+    for label, (sig, pubkey, verifier, expected) in cases.items():
+        fast, generic = run_both(sig, pubkey, verifier)
+        assert fast == generic == expected, f"Veredicto distinto en '{label}'"
+
+    # El verificador recibe exactamente lo mismo que desde OP_CHECKSIG
+    calls = []
+    ScriptEngine(signature_verifier=lambda *a: calls.append(a) or True).execute(script_sig, lock, "tx", 3)
+    ScriptEngine(signature_verifier=lambda *a: calls.append(a) or True, fast_path=False).execute(script_sig, lock, "tx", 3)
+    assert calls[0] == calls[1] == (SIGNATURE, PUBLIC_KEY, "tx", 3)
+    print("[SUCCESS] La ruta rápida coincide con la VM genérica.\n")
+
+def test_parsed_scripts_cached():
+    print(">> Ejecutando: test_parsed_scripts_cached...")
+
+    # Candado no estándar (fuera de la ruta rápida): <x> OP_DROP OP_TRUE
+    lock = push(b'\x07') + b'\x75\x51'
+    assert ScriptParser.parse(lock) == ((1, b'\x07'), (0x75, None), (0x51, None))
+    assert ScriptParser.parse(b'\x05\x01') == ((OP_TRUNCATED_PUSH, None),)
+
+    cache = ParsedScriptCache(max_entries=8)
+    engine = ScriptEngine(fast_path=False, script_cache=cache)
+    for i in range(5):
+        assert engine.execute(push(bytes([i + 1])), lock, None, i)
+    assert cache.misses == 1 and cache.hits == 4
+
+    # PUSHDATA del sig que invade el candado: se interpreta la unión, como antes
+    assert engine.execute(b'\x02\x01', b'\x01', None, 0)
+    assert not engine.execute(b'\x02\x01', b'', None, 0)
+    assert not engine.execute(b'', b'\x51\x03\x01', None, 0)
+    # Opcode desconocido y pila vacía
+    assert not engine.execute(push(b'\x01'), b'\xff', None, 0)
+    assert not engine.execute(push(b'\x01'), b'\x75', None, 0)
+    print("[SUCCESS] Scripts parseados una vez y mismos veredictos.\n")
+
+def test_engine_shared_across_threads():
+    print(">> Ejecutando: test_engine_shared_across_threads...")
+
+    lock = p2pkh_lock(PUBLIC_KEY)
+    tx = MagicMock()
+    tx.tx_hash = "ab" * 32
+    tx.get_hash_for_signature.return_value = hashlib.sha256(b"sighash-reuse").digest()
+    tx.inputs = [MagicMock(script_sig=push(SIGNATURE) + push(PUBLIC_KEY))]
+
+    with patch.object(TransactionValidator, 'verify_signature', return_value=True):
+        assert TransactionValidator.verify_scripts(tx, {0: lock})
+        engine = TransactionValidator._get_engine()
+        assert TransactionValidator.verify_scripts(tx, {0: lock})
+        assert TransactionValidator._get_engine() is engine
+
+    # Scripts genéricos en paralelo sobre el mismo motor: cada hilo ve su propia pila
+    shared = ScriptEngine(fast_path=False)
+    errors = []
+
+    def worker(value: int):
+        for _ in range(200):
+            expected = value % 2 == 1
+            script_sig = push(bytes([value % 2])) + push(bytes([value]))
+            if shared.execute(script_sig, b'\x75', None, 0) != expected:
+                errors.append(value)
+
+    threads = [threading.Thread(target=worker, args=(v,)) for v in range(1, 9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    print("[SUCCESS] Un solo motor de scripts para todos los hilos.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("  EJECUTANDO TESTS SCRIPT ENGINE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_p2pkh_template_recognition()
+        test_fast_path_matches_vm()
+        test_parsed_scripts_cached()
+        test_engine_shared_across_threads()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
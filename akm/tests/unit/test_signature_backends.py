@@ -0,0 +1,141 @@
+# akm/tests/unit/test_signature_backends.py
+'''
+Test Suite diferencial para los backends de firmas:
+    Todo backend debe dar el mismo veredicto que la referencia (ecdsa) para
+    firmas válidas, adulteradas y mal codificadas; si no, partiría el consenso.
+
+    Functions::
+        test_backends_agree_on_signatures(): Firmas válidas, digest ajeno, firma adulterada, high-S, DER inválido.
+        test_backends_agree_on_key_encodings(): Claves raw, comprimidas, sin comprimir, híbridas y fuera de la curva.
+        test_factory_selection_and_fallback(): "auto" elige el más rápido; nombres desconocidos caen a ecdsa.
+'''
+
+import sys
+import os
+import hashlib
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.infra.crypto.ecdsa_signature_backend import EcdsaSignatureBackend
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
+
+ORDER = SECP256k1.order
+REFERENCE = EcdsaSignatureBackend()
+
+def other_backends():
+    return [SignatureBackendFactory.get(name) for name in SignatureBackendFactory.available() if name != REFERENCE.name]
+
+def assert_same_verdict(sighash: bytes, public_key: bytes, signature: bytes, label: str) -> bool:
+    expected = REFERENCE.verify(sighash, public_key, signature)
+    for backend in other_backends():
+        assert backend.verify(sighash, public_key, signature) == expected, f"{backend.name} difiere en '{label}'"
+    return expected
+
+def signature_cases(signer: SigningKey, digest: bytes):
+    der = signer.sign_digest(digest, sigencode=util.sigencode_der)
+    r, s = util.sigdecode_der(der, ORDER)
+    high_s = util.sigencode_der(r, ORDER - s, ORDER)
+    # r con un cero de relleno: DER no mínimo
+    r_bytes = r.to_bytes(32, 'big')
+    padded_r = b'\x02' + bytes([len(r_bytes) + 1]) + b'\x00' + r_bytes
+    s_part = der[4 + der[3]:]
+    non_minimal = b'\x30' + bytes([len(padded_r) + len(s_part)]) + padded_r + s_part
+
+    return {
+        "valida": (digest, der, True),
+        "digest ajeno": (hashlib.sha256(b"otro").digest(), der, False),
+        "firma adulterada": (digest, der[:-1] + bytes([der[-1] ^ 1]), False),
+        "high-S": (digest, high_s, True),
+        "basura al final": (digest, der + b'\x01', False),
+        "DER no minimo": (digest, non_minimal, None),
+        "s fuera de rango": (digest, util.sigencode_der(r, ORDER + s, ORDER), False),
+        "r cero": (digest, util.sigencode_der(0, s, ORDER), False),
+        "vacia": (digest, b'', False),
+        "digest corto": (digest[:20], signer.sign_digest(digest[:20], sigencode=util.sigencode_der), True)
+    }
+
+def test_backends_agree_on_signatures():
+    print(">> Ejecutando: test_backends_agree_on_signatures...")
+
+    for round_ in range(5):
+        signer = SigningKey.generate(curve=SECP256k1)
+        public_key = signer.get_verifying_key().to_string("compressed")
+        digest = hashlib.sha256(f"sighash-{round_}".encode()).digest()
+
+        for label, (sighash, signature, expected) in signature_cases(signer, digest).items():
+            verdict = assert_same_verdict(sighash, public_key, signature, label)
+            if expected is not None:
+                assert verdict == expected, f"Referencia inesperada en '{label}'"
+
+    print(f"[SUCCESS] Veredictos idénticos ({', '.join(SignatureBackendFactory.available())}).\n")
+
+def test_backends_agree_on_key_encodings():
+    print(">> Ejecutando: test_backends_agree_on_key_encodings...")
+
+    signer = SigningKey.generate(curve=SECP256k1)
+    verifying_key = signer.get_verifying_key()
+    digest = hashlib.sha256(b"encodings").digest()
+    signature = signer.sign_digest(digest, sigencode=util.sigencode_der)
+
+    for encoding in ("raw", "compressed", "uncompressed", "hybrid"):
+        assert assert_same_verdict(digest, verifying_key.to_string(encoding), signature, encoding)
+
+    raw = verifying_key.to_string("raw")
+    compressed = verifying_key.to_string("compressed")
+    invalid_keys = {
+        "x fuera de la curva": b'\x02' + b'\xff' * 32,
+        "punto alterado": raw[:-1] + bytes([raw[-1] ^ 1]),
+        "prefijo erroneo": b'\x05' + compressed[1:],
+        "paridad opuesta": bytes([compressed[0] ^ 1]) + compressed[1:],
+        "vacia": b'',
+        "truncada": compressed[:-1]
+    }
+    for label, public_key in invalid_keys.items():
+        assert not assert_same_verdict(digest, public_key, signature, label)
+
+    print("[SUCCESS] Todas las codificaciones de clave coinciden con la referencia.\n")
+
+def test_factory_selection_and_fallback():
+    print(">> Ejecutando: test_factory_selection_and_fallback...")
+
+    available = SignatureBackendFactory.available()
+    assert REFERENCE.name in available
+
+    fastest = next(name for name in SignatureBackendFactory.PREFERENCE if name in available)
+    assert SignatureBackendFactory.create("auto").name == fastest
+    assert SignatureBackendFactory.create("ECDSA").name == "ecdsa"
+    assert SignatureBackendFactory.create("inexistente").name == "ecdsa"
+    # Instancias cacheadas por nombre
+    assert SignatureBackendFactory.get("ecdsa") is SignatureBackendFactory.get("ecdsa")
+
+    previous = SignatureBackendFactory._active
+    try:
+        SignatureBackendFactory.install(REFERENCE)
+        assert SignatureBackendFactory.active() is REFERENCE
+    finally:
+        SignatureBackendFactory._active = previous
+    print("[SUCCESS] Selección por configuración con caída a la referencia.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print(" EJECUTANDO TESTS SIGNATURE BACKENDS (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_backends_agree_on_signatures()
+        test_backends_agree_on_key_encodings()
+        test_factory_selection_and_fallback()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
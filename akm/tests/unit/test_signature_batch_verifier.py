@@ -0,0 +1,159 @@
+# akm/tests/unit/test_signature_batch_verifier.py
+'''
+Test Suite para SignatureBatchVerifier:
+    Verifica que las firmas de un bloque se verifiquen en un solo lote (en línea
+    o en el pool de procesos) con el mismo veredicto que la verificación serial.
+
+    Functions::
+        test_pool_matches_inline(): Mismos índices inválidos con y sin procesos.
+        test_block_signatures_single_batch(): Un lote por bloque; la firma adulterada invalida su TX.
+        test_double_spend_aborts_before_signatures(): Con aborto temprano no se paga el ECDSA.
+        test_collect_mode_keeps_valid_conflicting_tx(): Solo se descarta la TX con firma inválida.
+'''
+
+import sys
+import os
+import time
+import hashlib
+from unittest.mock import MagicMock, patch
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.models.transaction import Transaction
+from akm.core.models.tx_input import TxInput
+from akm.core.models.tx_output import TxOutput
+from akm.core.services.signature_batch_verifier import SignatureBatchVerifier, SignatureCheck
+from akm.core.services.signature_cache import SignatureCache
+from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.validators.block_rules_validator import BlockRulesValidator
+
+SIGNING_KEY = SigningKey.generate(curve=SECP256k1)
+PUBLIC_KEY = SIGNING_KEY.get_verifying_key().to_string()
+
+def p2pkh_script(public_key: bytes) -> bytes:
+    key_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
+    return b'\x76\xa9' + bytes([len(key_hash)]) + key_hash + b'\x88\xac'
+
+LOCK_SCRIPT = p2pkh_script(PUBLIC_KEY)
+
+def create_signed_tx(outpoints, tamper: bool = False) -> Transaction:
+    unsigned = Transaction(
+        tx_hash="",
+        timestamp=int(time.time()),
+        inputs=[TxInput(prev, index, b'') for prev, index in outpoints],
+        outputs=[TxOutput(90 * len(outpoints), LOCK_SCRIPT)],
+        fee=10 * len(outpoints)
+    )
+
+    inputs = []
+    for i, (prev, index) in enumerate(outpoints):
+        signature = SIGNING_KEY.sign_digest(unsigned.get_hash_for_signature(i), sigencode=util.sigencode_der)
+        if tamper:
+            signature = SIGNING_KEY.sign_digest(b'\x00' * 32, sigencode=util.sigencode_der)
+        script_sig = bytes([len(signature)]) + signature + bytes([len(PUBLIC_KEY)]) + PUBLIC_KEY
+        inputs.append(TxInput(prev, index, script_sig))
+
+    tx = Transaction(tx_hash="", timestamp=unsigned.timestamp, inputs=inputs, outputs=unsigned.outputs, fee=unsigned.fee)
+    tx.tx_hash = TransactionHasher.calculate(tx)
+    return tx
+
+def create_block(txs) -> MagicMock:
+    coinbase = MagicMock(spec=Transaction)
+    coinbase.is_coinbase = True
+    block = MagicMock()
+    block.transactions = [coinbase] + list(txs)
+    block.hash = "cd" * 32
+    block.index = 5
+    return block
+
+def create_validator(workers: int = 1) -> BlockRulesValidator:
+    utxo_set = MagicMock()
+    utxo_set.get_utxo_by_reference.return_value = TxOutput(100, LOCK_SCRIPT)
+    return BlockRulesValidator(utxo_set, ValidationCache(), SignatureBatchVerifier(workers, SignatureCache()))
+
+def test_pool_matches_inline():
+    print(">> Ejecutando: test_pool_matches_inline...")
+
+    checks = []
+    for i in range(40):
+        digest = hashlib.sha256(f"msg-{i}".encode()).digest()
+        signature = SIGNING_KEY.sign_digest(digest, sigencode=util.sigencode_der)
+        if i in (23, 31):
+            digest = hashlib.sha256(b"otro mensaje").digest()
+        checks.append(SignatureCheck(digest, PUBLIC_KEY, signature, f"tx-{i}", 0, LOCK_SCRIPT))
+
+    # Cachés propias: cada verificador paga su ECDSA
+    inline = SignatureBatchVerifier(workers=1, signature_cache=SignatureCache())
+    pool = SignatureBatchVerifier(workers=2, signature_cache=SignatureCache())
+    try:
+        assert inline.verify(checks) == [23, 31]
+        assert pool.verify(checks, stop_at_first=True)[0] in (23, 31)
+        assert pool.verify(checks) == [23, 31]
+        assert pool.verify(checks[:20]) == []
+    finally:
+        pool.shutdown()
+    print("[SUCCESS] El pool de procesos coincide con la verificación en línea.\n")
+
+def test_block_signatures_single_batch():
+    print(">> Ejecutando: test_block_signatures_single_batch...")
+
+    good = [create_signed_tx([(f"{i:064x}", 0), (f"{i:064x}", 1)]) for i in range(1, 4)]
+    bad = create_signed_tx([("ff" * 32, 0)], tamper=True)
+
+    validator = create_validator()
+    with patch.object(SignatureBatchVerifier, 'verify', autospec=True, side_effect=SignatureBatchVerifier.verify) as verify:
+        assert validator.find_invalid_transactions(create_block(good), stop_at_first=True) == []
+        assert verify.call_count == 1
+        assert len(verify.call_args[0][1]) == 6
+
+    assert create_validator().find_invalid_transactions(create_block(good + [bad]), stop_at_first=True) == [bad]
+    assert create_validator().find_invalid_transactions(create_block([good[0], bad, good[1]])) == [bad]
+    print("[SUCCESS] Firmas del bloque verificadas en un solo lote.\n")
+
+def test_double_spend_aborts_before_signatures():
+    print(">> Ejecutando: test_double_spend_aborts_before_signatures...")
+
+    first = create_signed_tx([("aa" * 32, 0)])
+    second = create_signed_tx([("bb" * 32, 0), ("aa" * 32, 0)])
+
+    validator = create_validator()
+    with patch.object(SignatureBatchVerifier, 'verify') as verify:
+        assert validator.find_invalid_transactions(create_block([first, second]), stop_at_first=True) == [second]
+        verify.assert_not_called()
+    print("[SUCCESS] Doble gasto interno detectado sin verificar firmas.\n")
+
+def test_collect_mode_keeps_valid_conflicting_tx():
+    print(">> Ejecutando: test_collect_mode_keeps_valid_conflicting_tx...")
+
+    forged = create_signed_tx([("aa" * 32, 0)], tamper=True)
+    honest = create_signed_tx([("aa" * 32, 0)])
+
+    # La TX falsificada no reserva el UTXO: la honesta que lo gasta después es válida
+    assert create_validator().find_invalid_transactions(create_block([forged, honest])) == [forged]
+    print("[SUCCESS] Solo se descarta la TX con firma inválida.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print(" EJECUTANDO TESTS SIGNATURE BATCH VERIFIER (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_pool_matches_inline()
+        test_block_signatures_single_batch()
+        test_double_spend_aborts_before_signatures()
+        test_collect_mode_keeps_valid_conflicting_tx()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -0,0 +1,145 @@
+# akm/tests/unit/test_signature_cache.py
+'''
+Test Suite para SignatureCache:
+    Verifica que una firma verificada al admitir la TX en el Mempool no repita
+    el ECDSA al validar el bloque, y que la caché sea acotada y salada.
+
+    Functions::
+        test_cache_is_bounded_and_salted(): LRU acotada; claves distintas por proceso/instancia.
+        test_mempool_signatures_reused_by_block(): El lote del bloque sale de la caché.
+        test_verifier_service_caches_only_valid(): Las firmas inválidas nunca se cachean.
+'''
+
+import sys
+import os
+import time
+import hashlib
+from unittest.mock import MagicMock, patch
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.models.transaction import Transaction
+from akm.core.models.tx_input import TxInput
+from akm.core.models.tx_output import TxOutput
+from akm.core.services.signature_batch_verifier import SignatureBatchVerifier
+from akm.core.services.signature_cache import SignatureCache
+from akm.core.services.signature_verifier_service import SignatureVerifierService
+from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.validators.block_rules_validator import BlockRulesValidator
+from akm.core.validators.transaction_rules_validator import TransactionRulesValidator
+
+SIGNING_KEY = SigningKey.generate(curve=SECP256k1)
+PUBLIC_KEY = SIGNING_KEY.get_verifying_key().to_string()
+KEY_HASH = hashlib.new('ripemd160', hashlib.sha256(PUBLIC_KEY).digest()).digest()
+LOCK_SCRIPT = b'\x76\xa9' + bytes([len(KEY_HASH)]) + KEY_HASH + b'\x88\xac'
+
+def create_signed_tx(prev_hash: str) -> Transaction:
+    unsigned = Transaction("", int(time.time()), [TxInput(prev_hash, 0, b'')], [TxOutput(90, LOCK_SCRIPT)], 10)
+    signature = SIGNING_KEY.sign_digest(unsigned.get_hash_for_signature(0), sigencode=util.sigencode_der)
+    script_sig = bytes([len(signature)]) + signature + bytes([len(PUBLIC_KEY)]) + PUBLIC_KEY
+    tx = Transaction("", unsigned.timestamp, [TxInput(prev_hash, 0, script_sig)], unsigned.outputs, 10)
+    tx.tx_hash = TransactionHasher.calculate(tx)
+    return tx
+
+def create_utxo_set() -> MagicMock:
+    utxo_set = MagicMock()
+    utxo_set.get_utxo_by_reference.return_value = TxOutput(100, LOCK_SCRIPT)
+    return utxo_set
+
+def test_cache_is_bounded_and_salted():
+    print(">> Ejecutando: test_cache_is_bounded_and_salted...")
+
+    cache = SignatureCache(max_entries=2)
+    cache.add(b'\x01' * 32, b'pk', b'sig-a')
+    cache.add(b'\x01' * 32, b'pk', b'sig-b')
+    assert cache.contains(b'\x01' * 32, b'pk', b'sig-a')
+    cache.add(b'\x01' * 32, b'pk', b'sig-c')
+
+    assert len(cache) == 2
+    assert not cache.contains(b'\x01' * 32, b'pk', b'sig-b')
+    # La frontera clave/firma forma parte de la clave
+    assert not cache.contains(b'\x01' * 32, b'pksig-', b'a')
+
+    # Sal por instancia: la misma firma produce otra clave
+    other = SignatureCache()
+    assert cache._key(b'\x01' * 32, b'pk', b'sig-a') != other._key(b'\x01' * 32, b'pk', b'sig-a')
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert abs(stats["hit_rate"] - 1 / 3) < 1e-3
+    print("[SUCCESS] Caché acotada, LRU y salada.\n")
+
+def test_mempool_signatures_reused_by_block():
+    print(">> Ejecutando: test_mempool_signatures_reused_by_block...")
+
+    cache = SignatureCache()
+    previous = SignatureCache._shared
+    SignatureCache.install_shared(cache)
+    try:
+        txs = [create_signed_tx(f"{i:064x}") for i in range(1, 5)]
+
+        # Admisión al Mempool (sin ValidationCache): el adaptador verifica y cachea
+        mempool_validator = TransactionRulesValidator(create_utxo_set())
+        assert all(mempool_validator.validate(tx) for tx in txs)
+        assert len(cache) == 4
+
+        coinbase = MagicMock(spec=Transaction)
+        coinbase.is_coinbase = True
+        block = MagicMock(transactions=[coinbase] + txs, hash="ab" * 32, index=3)
+
+        block_validator = BlockRulesValidator(create_utxo_set(), None, SignatureBatchVerifier(1))
+        with patch.object(SignatureBatchVerifier, 'verify_one') as verify_one:
+            assert block_validator.find_invalid_transactions(block, stop_at_first=True) == []
+            verify_one.assert_not_called()
+
+        assert cache.hits == 4
+    finally:
+        SignatureCache._shared = previous
+    print("[SUCCESS] El bloque reutiliza las firmas verificadas en el Mempool.\n")
+
+def test_verifier_service_caches_only_valid():
+    print(">> Ejecutando: test_verifier_service_caches_only_valid...")
+
+    cache = SignatureCache()
+    previous = SignatureCache._shared
+    SignatureCache.install_shared(cache)
+    try:
+        tx = create_signed_tx("cd" * 32)
+        sighash = tx.get_hash_for_signature(0, connected_script=b'')
+        signature = SIGNING_KEY.sign_digest(sighash, sigencode=util.sigencode_der)
+        forged = SIGNING_KEY.sign_digest(b'\x07' * 32, sigencode=util.sigencode_der)
+
+        assert SignatureVerifierService.verify(signature, PUBLIC_KEY, tx, 0)
+        assert SignatureVerifierService.verify(signature, PUBLIC_KEY, tx, 0)
+        assert cache.hits == 1
+
+        assert not SignatureVerifierService.verify(forged, PUBLIC_KEY, tx, 0)
+        assert not SignatureVerifierService.verify(forged, PUBLIC_KEY, tx, 0)
+        assert len(cache) == 1
+    finally:
+        SignatureCache._shared = previous
+    print("[SUCCESS] Solo las firmas válidas entran a la caché.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("  EJECUTANDO TESTS SIGNATURE CACHE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_cache_is_bounded_and_salted()
+        test_mempool_signatures_reused_by_block()
+        test_verifier_service_caches_only_valid()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
@@ -0,0 +1,171 @@
+# akm/tests/unit/test_template_prevalidation.py
+'''
+Test Suite para la pre-validación de plantillas:
+    Verifica que el minero valide su plantilla en segundo plano y que un bloque
+    propio de contenido pre-validado se conecte sin re-validar sus TXs.
+
+    Functions::
+        test_template_prevalidated_in_background(): Marca de confianza sobre el bloque minado.
+        test_invalid_txs_dropped_before_mining(): Las TXs inválidas salen de la plantilla.
+        test_trusted_block_skips_content_checks(): Solo estructura y PoW para bloques de confianza.
+        test_trusted_flag_ignored_off_tip(): Fuera del tip validado, validación completa.
+'''
+
+import sys
+import os
+import time
+from unittest.mock import MagicMock
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.builders.block_builder import BlockBuilder
+from akm.core.builders.mining_engine import MiningEngine
+from akm.core.managers.consensus_orchestrator import ConsensusOrchestrator
+from akm.core.managers.mining_manager import MiningManager
+from akm.core.models.transaction import Transaction
+from akm.core.utils.crypto_utility import CryptoUtility
+from akm.core.validators.block_rules_validator import BlockRulesValidator
+
+MINER = "1MinerAddressTest"
+TIP_HASH = "ab" * 32
+
+def create_dummy_tx(seed: int, fee: int) -> Transaction:
+    return Transaction(
+        tx_hash=CryptoUtility.double_sha256(f"tx-{seed}"),
+        timestamp=int(time.time()),
+        inputs=[],
+        outputs=[],
+        fee=fee
+    )
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+def create_manager(pending, validator) -> MiningManager:
+    blockchain = MagicMock()
+    blockchain.last_block = MagicMock(hash=TIP_HASH, index=7, bits="1f0fffff")
+    mempool = MagicMock()
+    mempool.get_transactions_for_block.return_value = list(pending)
+    subsidy = MagicMock()
+    subsidy.get_subsidy.return_value = 5000
+    return MiningManager(blockchain, mempool, MagicMock(), subsidy, MiningEngine(threads=1), validator)
+
+def test_template_prevalidated_in_background():
+    print(">> Ejecutando: test_template_prevalidated_in_background...")
+
+    validator = MagicMock()
+    validator.find_invalid_transactions.return_value = []
+    validator.validate_coinbase.return_value = True
+    manager = create_manager([create_dummy_tx(i, 10 + i) for i in range(4)], validator)
+
+    try:
+        template = manager.get_block_template(MINER)
+        assert wait_until(lambda: template.is_validated)
+
+        block = BlockBuilder.build_from_template(template, engine=MiningEngine(threads=1))
+        assert block is not None
+        assert manager.is_prevalidated(block)
+        assert manager.get_metrics()["template_prevalidated"] is True
+        # Tras la pasada de TXs solo se revisa la Coinbase
+        validator.validate_contents.assert_not_called()
+
+        # Contenido nuevo: la marca ya no cubre la versión vigente
+        template.add_transaction(create_dummy_tx(99, 500))
+        assert not template.is_validated
+        other = BlockBuilder.build_from_template(template, engine=MiningEngine(threads=1))
+        assert other is not None
+        assert wait_until(lambda: template.is_validated)
+        assert manager.is_prevalidated(other)
+        assert not manager.is_prevalidated(block)
+    finally:
+        manager.shutdown()
+    print("[SUCCESS] Plantilla pre-validada mientras se hashea.\n")
+
+def test_invalid_txs_dropped_before_mining():
+    print(">> Ejecutando: test_invalid_txs_dropped_before_mining...")
+
+    txs = [create_dummy_tx(i, 10 + i) for i in range(4)]
+    validator = MagicMock()
+    validator.find_invalid_transactions.side_effect = lambda block: [tx for tx in block.transactions[1:] if tx is txs[2]]
+    validator.validate_coinbase.return_value = True
+    manager = create_manager(txs, validator)
+
+    try:
+        template = manager.get_block_template(MINER)
+        assert wait_until(lambda: template.is_validated)
+
+        included = {tx.tx_hash for tx in template.snapshot().transactions[1:]}
+        assert txs[2].tx_hash not in included
+        assert len(included) == 3
+    finally:
+        manager.shutdown()
+    print("[SUCCESS] TXs inválidas descartadas antes de minar.\n")
+
+def test_trusted_block_skips_content_checks():
+    print(">> Ejecutando: test_trusted_block_skips_content_checks...")
+
+    validator = BlockRulesValidator(MagicMock())
+    validator._tx_rules_validator = MagicMock()  # type: ignore
+    validator._coinbase_validator = MagicMock()  # type: ignore
+
+    manager = create_manager([create_dummy_tx(i, 10 + i) for i in range(3)], None)
+    block = BlockBuilder.build_from_template(manager.get_block_template(MINER), engine=MiningEngine(threads=1))
+    assert block is not None
+
+    assert validator.validate_trusted(block)
+    validator._tx_rules_validator.validate.assert_not_called()
+    validator._coinbase_validator.validate_coinbase_transaction.assert_not_called()
+
+    # Un header adulterado sigue siendo rechazado
+    block._nonce += 1
+    assert not validator.validate_trusted(block)
+    manager.shutdown()
+    print("[SUCCESS] Bloque de confianza: solo estructura y PoW.\n")
+
+def test_trusted_flag_ignored_off_tip():
+    print(">> Ejecutando: test_trusted_flag_ignored_off_tip...")
+
+    validator = MagicMock()
+    validator.validate.return_value = False
+    validator.validate_trusted.return_value = True
+    blockchain = MagicMock()
+    blockchain.last_block = MagicMock(hash=TIP_HASH, index=7)
+    orchestrator = ConsensusOrchestrator(blockchain, MagicMock(), MagicMock(), MagicMock(), validator)
+
+    block = MagicMock(index=8, previous_hash=TIP_HASH, hash="cd" * 32)
+    assert orchestrator.add_block(block, trusted=True)
+    validator.validate.assert_not_called()
+
+    # La plantilla se validó sobre otro tip: no hay atajo
+    block.previous_hash = "ef" * 32
+    assert not orchestrator.add_block(block, trusted=True)
+    validator.validate.assert_called_once_with(block)
+    print("[SUCCESS] La marca de confianza solo aplica sobre el tip validado.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print(" EJECUTANDO TESTS TEMPLATE PREVALIDATION (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_template_prevalidated_in_background()
+        test_invalid_txs_dropped_before_mining()
+        test_trusted_block_skips_content_checks()
+        test_trusted_flag_ignored_off_tip()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
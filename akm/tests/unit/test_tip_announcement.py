@@ -0,0 +1,197 @@
+# akm/tests/unit/test_tip_announcement.py
+'''
+Test Suite para el anuncio temprano de tips:
+    Verifica que un header con PoW válido pause el hashing y que la próxima
+    plantilla se prepare en paralelo a la validación completa del bloque.
+
+    Functions::
+        test_header_pow_check(): Hash declarado y objetivo verificados sin TXs.
+        test_next_template_prefetched(): La plantilla preparada excluye las TXs del bloque y se adopta.
+        test_announcement_pauses_mining(): Solo un header válido (bits esperados) sobre el tip pausa el minado.
+        test_work_server_notified_only_on_new_tip(): Bloques rechazados o duplicados no invalidan trabajos.
+'''
+
+import sys
+import os
+import time
+import threading
+from unittest.mock import MagicMock, patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.builders.block_builder import BlockBuilder
+from akm.core.builders.block_template import BlockTemplate
+from akm.core.config.protocol_constants import ProtocolConstants
+from akm.core.builders.mining_engine import MiningEngine
+from akm.core.managers.mining_manager import MiningManager
+from akm.core.models.block import Block
+from akm.core.models.transaction import Transaction
+from akm.core.nodes.full_node import FullNode
+from akm.core.nodes.miner_node import MinerNode
+from akm.core.utils.crypto_utility import CryptoUtility
+from akm.core.utils.node_mapper import NodeMapper
+from akm.core.validators.block_validator import BlockValidator
+
+MINER = "1MinerAddressTest"
+TIP_HASH = "ab" * 32
+
+def create_dummy_tx(seed: int, fee: int) -> Transaction:
+    return Transaction(
+        tx_hash=CryptoUtility.double_sha256(f"tx-{seed}"),
+        timestamp=int(time.time()),
+        inputs=[],
+        outputs=[],
+        fee=fee
+    )
+
+def mine_on_tip(txs, bits: str = "1f0fffff") -> Block:
+    template = BlockTemplate(
+        index=8,
+        previous_hash=TIP_HASH,
+        bits=bits,
+        miner_address="1OtherMiner",
+        subsidy=5000,
+        max_tx_count=100,
+        transactions=txs
+    )
+    block = BlockBuilder.build_from_template(template, engine=MiningEngine(threads=1))
+    assert block is not None
+    return block
+
+def create_manager(pending) -> MiningManager:
+    blockchain = MagicMock()
+    blockchain.last_block = MagicMock(hash=TIP_HASH, index=7, bits="1f0fffff")
+    mempool = MagicMock()
+    mempool.get_transactions_for_block.side_effect = lambda max_count=2000: list(pending)[:max_count]
+    subsidy = MagicMock()
+    subsidy.get_subsidy.return_value = 5000
+    return MiningManager(blockchain, mempool, MagicMock(), subsidy, MiningEngine(threads=1))
+
+def test_header_pow_check():
+    print(">> Ejecutando: test_header_pow_check...")
+
+    block = mine_on_tip([])
+    payload = block.to_dict()
+    assert BlockValidator.validate_header_pow(NodeMapper.reconstruct_header(payload))
+
+    # Hash declarado que no corresponde al header
+    payload["header"]["nonce"] += 1
+    assert not BlockValidator.validate_header_pow(NodeMapper.reconstruct_header(payload))
+    print("[SUCCESS] PoW de header verificado sin reconstruir TXs.\n")
+
+def test_next_template_prefetched():
+    print(">> Ejecutando: test_next_template_prefetched...")
+
+    pending = [create_dummy_tx(i, fee=10 + i) for i in range(6)]
+    block = mine_on_tip(pending[:3])
+    payload = block.to_dict()
+    manager = create_manager(pending)
+
+    header = NodeMapper.reconstruct_header(payload)
+    manager.prepare_next_template(header, NodeMapper.block_tx_hashes(payload), MINER)
+    # El mismo tip anunciado otra vez (otro peer): no se lanza otro prefetch
+    preparing = manager._preparing
+    manager.prepare_next_template(header, NodeMapper.block_tx_hashes(payload), MINER)
+    assert manager._preparing is preparing
+
+    # El bloque se conecta: el tip pasa a ser el anunciado
+    manager._blockchain.last_block = block
+    template = manager.get_block_template(MINER)
+
+    assert template.index == block.index + 1
+    assert template.previous_hash == block.hash
+    included = {tx.tx_hash for tx in template.snapshot().transactions}
+    assert included.isdisjoint({tx.tx_hash for tx in pending[:3]})
+    assert {tx.tx_hash for tx in pending[3:]} <= included
+    # Adoptada, no reconstruida
+    assert manager.get_block_template(MINER) is template
+    print("[SUCCESS] Plantilla preparada en paralelo y adoptada.\n")
+
+def test_announcement_pauses_mining():
+    print(">> Ejecutando: test_announcement_pauses_mining...")
+
+    node = object.__new__(MinerNode)
+    node.blockchain = MagicMock()
+    node.blockchain.tip_hash = TIP_HASH
+    node.blockchain.last_block = MagicMock(hash=TIP_HASH, index=7)
+    node.miner = MagicMock()
+    node.miner.required_bits_after.return_value = "1f0fffff"
+    node._expected_child = None
+    node._miner_address = MINER
+    node._mining_active = True
+    node._interrupt_mining = threading.Event()
+    node._tip_settled = threading.Event()
+    node._tip_settled.set()
+
+    payload = mine_on_tip([]).to_dict()
+
+    # PoW inválido: se ignora hasta la validación completa
+    forged = {"header": dict(payload["header"], nonce=payload["header"]["nonce"] + 1), "transactions": []}
+    assert node._on_tip_announced(forged) is False
+
+    # PoW válido pero sobre un target elegido por el emisor (máximo): se ignora
+    cheap = mine_on_tip([], bits="207fffff").to_dict()
+    assert BlockValidator.validate_header_pow(NodeMapper.reconstruct_header(cheap))
+    assert node._on_tip_announced(cheap) is False
+
+    # No extiende nuestro tip
+    node.blockchain.tip_hash = "cd" * 32
+    assert node._on_tip_announced(payload) is False
+    assert node._tip_settled.is_set() and not node._interrupt_mining.is_set()
+
+    node.blockchain.tip_hash = TIP_HASH
+    assert node._on_tip_announced(payload) is True
+    assert node._interrupt_mining.is_set()
+    assert not node._tip_settled.is_set()
+    node.miner.prepare_next_template.assert_called_once()
+    # Los bits esperados se calculan una vez por tip
+    node.miner.required_bits_after.assert_called_once()
+    print("[SUCCESS] Hashing en pausa ante un tip anunciado.\n")
+
+def test_work_server_notified_only_on_new_tip():
+    print(">> Ejecutando: test_work_server_notified_only_on_new_tip...")
+
+    node = object.__new__(MinerNode)
+    node.blockchain = MagicMock()
+    node.blockchain.tip_hash = TIP_HASH
+    node._work_server = MagicMock()
+    node._mining_active = False
+    node._interrupt_mining = threading.Event()
+    node._tip_settled = threading.Event()
+    node._on_tip_announced = MagicMock(return_value=False)
+
+    def connect_block(msg_type, payload, peer_id):
+        node.blockchain.tip_hash = "cd" * 32
+
+    # Rechazado, duplicado o de rama lateral: el tip no cambia
+    with patch.object(FullNode, '_process_payload'):
+        node._process_payload(ProtocolConstants.MSG_BLOCK, {}, "peer")
+    node._work_server.notify_new_tip.assert_not_called()
+
+    with patch.object(FullNode, '_process_payload', side_effect=connect_block):
+        node._process_payload(ProtocolConstants.MSG_BLOCK, {}, "peer")
+    node._work_server.notify_new_tip.assert_called_once()
+    print("[SUCCESS] Solo un tip nuevo invalida los trabajos de los workers.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("  EJECUTANDO TESTS TIP ANNOUNCEMENT (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_header_pow_check()
+        test_next_template_prefetched()
+        test_announcement_pauses_mining()
+        test_work_server_notified_only_on_new_tip()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
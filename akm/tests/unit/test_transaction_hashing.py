@@ -13,13 +13,22 @@ Test Suite para Hashing y Validación de Transacciones:
             Verifica que una transacción válida pase la prueba de integridad.
         test_transaction_validator_verify_integrity_fails_if_data_altered():
             Verifica que cualquier cambio en los datos invalide el hash.
+        test_sighash_context_matches_full_rebuild():
+            Verifica que el SIGHASH por contexto coincida con reconstruir la TX por input.
+        test_sighash_context_serializes_once():
+            Verifica que los inputs se serialicen una sola vez por TX, no una por input.
+        test_serialization_memoized_until_mutation():
+            Verifica que la serialización y el hash se calculen una vez y se invaliden al firmar.
+        test_block_size_from_cached_serialization():
+            Verifica el tamaño del bloque a partir de las serializaciones cacheadas.
 '''
 
 import json
 import hashlib
 import sys
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from unittest.mock import patch
 
 # --- AJUSTE DE RUTA PARA EJECUCIÓN DIRECTA ---
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -28,6 +37,7 @@ if root_dir not in sys.path:
     sys.path.append(root_dir)
 
 # Importaion de arquitectura
+from akm.core.models.block import Block
 from akm.core.models.transaction import Transaction 
 from akm.core.models.tx_input import TxInput
 from akm.core.models.tx_output import TxOutput
@@ -35,6 +45,7 @@ from akm.core.models.tx_output import TxOutput
 # Servicios de Hashing
 from akm.core.utils.crypto_utility import CryptoUtility
 from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.services.sighash_context import SighashContext
 from akm.core.validators.transaction_validator import TransactionValidator
 
 # --- CONFIGURACIÓN DE DATOS DETERMINISTAS (SETUP) ---
@@ -105,6 +116,85 @@ def test_transaction_validator_verify_integrity_fails_if_data_altered():
     
     assert TransactionValidator.verify_integrity(tx_altered) is False
 
+def rebuild_sighash(tx: Transaction, input_index: int, connected_script: Optional[bytes] = None) -> bytes:
+    """Referencia: la TX completa re-armada con copias de inputs (costo O(inputs) por input)."""
+    temp_inputs = []
+    for i, inp in enumerate(tx.inputs):
+        script = connected_script if (i == input_index and connected_script) else b''
+        prev_hash = inp.previous_tx_hash if inp.previous_tx_hash.lower() != '0' * 64 else '0' * 64
+        temp_inputs.append(TxInput(prev_hash, inp.output_index, script))
+    temp_tx = Transaction("", tx.timestamp, temp_inputs, tx.outputs, tx.fee)
+    return bytes.fromhex(TransactionHasher.calculate(temp_tx))
+
+def create_consolidation_tx(inputs: int) -> Transaction:
+    return Transaction(
+        tx_hash="",
+        timestamp=1678886400,
+        inputs=[TxInput(hashlib.sha256(str(i).encode()).hexdigest(), i, b'\x01' * 72) for i in range(inputs)] + [TxInput('0' * 64, 7, b'')],
+        outputs=[TxOutput(1000, b'\x76\xa9\x14' + b'\x02' * 20 + b'\x88\xac'), TEST_OUTPUT],
+        fee=25
+    )
+
+def test_sighash_context_matches_full_rebuild():
+    tx = create_consolidation_tx(12)
+    connected = b'\x76\xa9\x14' + b'\x05' * 20 + b'\x88\xac'
+
+    for i in range(len(tx.inputs)):
+        assert tx.get_hash_for_signature(i) == rebuild_sighash(tx, i)
+        assert tx.get_hash_for_signature(i, connected_script=b'') == rebuild_sighash(tx, i)
+        assert tx.get_hash_for_signature(i, connected_script=connected) == rebuild_sighash(tx, i, connected)
+
+    # Índice fuera de rango: todos los scripts vacíos, como antes
+    assert tx.get_hash_for_signature(99, connected) == rebuild_sighash(tx, 99, connected)
+
+def test_sighash_context_serializes_once():
+    tx = create_consolidation_tx(200)
+
+    with patch.object(TransactionHasher, 'serialize_input', wraps=TransactionHasher.serialize_input) as serialize_input, \
+         patch.object(SighashContext, '__init__', autospec=True, side_effect=SighashContext.__init__) as build:
+        digests = {tx.get_hash_for_signature(i) for i in range(len(tx.inputs))}
+        assert build.call_count == 1
+        assert serialize_input.call_count == len(tx.inputs)
+
+        # Tras la validación se libera; el siguiente uso lo re-arma
+        tx.release_sighash_context()
+        tx.get_hash_for_signature(0)
+        assert build.call_count == 2
+
+    assert len(digests) == 1
+
+def test_serialization_memoized_until_mutation():
+    tx = create_consolidation_tx(50)
+    twin = Transaction("", tx.timestamp, tx.inputs, tx.outputs, tx.fee)
+
+    with patch.object(TransactionHasher, 'build', wraps=TransactionHasher.build) as build:
+        first_hash = TransactionHasher.calculate(tx)
+        assert TransactionHasher.calculate(tx) == tx.calculate_hash() == first_hash
+        assert tx.size_bytes == len(TransactionHasher.serialize(tx))
+        assert build.call_count == 1
+
+        # Firmar un input (como la Wallet) descarta la caché de TODAS las TX que lo contienen
+        assert TransactionHasher.calculate(twin) == first_hash
+        tx.inputs[0].script_sig = b'\x02' * 72
+        signed_hash = TransactionHasher.calculate(tx)
+        assert signed_hash != first_hash
+        assert TransactionHasher.calculate(twin) == signed_hash
+        assert build.call_count == 4
+
+    # Mismo resultado que serializar desde cero
+    assert signed_hash == TransactionHasher.hash_bytes(TransactionHasher.build(tx))
+    assert tx.size_bytes == len(TransactionHasher.build(tx))
+
+def test_block_size_from_cached_serialization():
+    txs = [create_consolidation_tx(n) for n in (1, 5, 20)]
+    block = Block(3, 1678886400, "ab" * 32, "1d00ffff", "cd" * 32, 0, "ef" * 32, txs)
+
+    expected = 84 + 4 + sum(len(TransactionHasher.build(tx)) for tx in txs)
+    with patch.object(TransactionHasher, 'build', wraps=TransactionHasher.build) as build:
+        assert block.size_bytes == expected
+        assert block.size_bytes == expected
+        assert build.call_count == len(txs)
+
 if __name__ == "__main__":
     print("==========================================")
     print("   EJECUTANDO TESTS DE HASHING (MANUAL)   ")
@@ -127,6 +217,22 @@ if __name__ == "__main__":
         test_transaction_validator_verify_integrity_fails_if_data_altered()
         print("[SUCCESS]\n")
 
+        print(">> test_sighash_context_matches_full_rebuild...")
+        test_sighash_context_matches_full_rebuild()
+        print("[SUCCESS]\n")
+
+        print(">> test_sighash_context_serializes_once...")
+        test_sighash_context_serializes_once()
+        print("[SUCCESS]\n")
+
+        print(">> test_serialization_memoized_until_mutation...")
+        test_serialization_memoized_until_mutation()
+        print("[SUCCESS]\n")
+
+        print(">> test_block_size_from_cached_serialization...")
+        test_block_size_from_cached_serialization()
+        print("[SUCCESS]\n")
+
         print("==========================================")
         print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
         print("==========================================")
@@ -0,0 +1,119 @@
+# akm/tests/unit/test_validation_cache.py
+'''
+Test Suite para ValidationCache:
+    Verifica que las firmas verificadas en la admisión al Mempool no se
+    re-ejecuten al validar el bloque, sin saltarse la consulta de UTXOs.
+
+    Functions::
+        test_cache_is_bounded_lru(): Expulsión de la entrada menos usada.
+        test_scripts_skipped_when_cached(): El motor de scripts no se repite.
+        test_utxo_still_checked_when_cached(): Un UTXO gastado sigue invalidando la TX.
+'''
+
+import sys
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.services.validation_cache import ValidationCache
+from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.models.transaction import Transaction
+from akm.core.models.tx_input import TxInput
+from akm.core.models.tx_output import TxOutput
+from akm.core.validators.transaction_rules_validator import TransactionRulesValidator
+
+LOCK_SCRIPT = b'\x76\xa9\x04ALBA\x88\xac'
+
+def create_spend_tx() -> Transaction:
+    tx = Transaction(
+        tx_hash="",
+        timestamp=int(time.time()),
+        inputs=[TxInput("cafebabe" * 8, 0, b'\x01\xaa'), TxInput("cafebabe" * 8, 1, b'\x01\xbb')],
+        outputs=[TxOutput(150, LOCK_SCRIPT)],
+        fee=10
+    )
+    tx.tx_hash = TransactionHasher.calculate(tx)
+    return tx
+
+def create_utxo_set() -> MagicMock:
+    utxo_set = MagicMock()
+    utxo_set.get_utxo_by_reference.return_value = TxOutput(100, LOCK_SCRIPT)
+    return utxo_set
+
+def test_cache_is_bounded_lru():
+    print(">> Ejecutando: test_cache_is_bounded_lru...")
+
+    cache = ValidationCache(max_entries=2)
+    cache.add("a", 0, b'x')
+    cache.add("b", 0, b'x')
+
+    # Tocar 'a' la convierte en la más reciente
+    assert cache.contains("a", 0, b'x') is True
+    cache.add("c", 0, b'x')
+
+    assert len(cache) == 2
+    assert cache.contains("b", 0, b'x') is False
+    assert cache.contains("a", 0, b'x') is True
+    # El script forma parte de la clave
+    assert cache.contains("a", 0, b'y') is False
+    print("[SUCCESS] Caché acotada con política LRU.\n")
+
+def test_scripts_skipped_when_cached():
+    print(">> Ejecutando: test_scripts_skipped_when_cached...")
+
+    cache = ValidationCache()
+    tx = create_spend_tx()
+    mempool_validator = TransactionRulesValidator(create_utxo_set(), cache)
+    block_validator = TransactionRulesValidator(create_utxo_set(), cache)
+
+    with patch('akm.core.scripting.engine.ScriptEngine.execute', return_value=True) as execute:
+        # Admisión al Mempool: ejecuta ambos inputs
+        assert mempool_validator.validate(tx) is True
+        assert execute.call_count == 2
+
+        # Validación del bloque: solo UTXOs, sin motor de scripts
+        assert block_validator.validate(tx) is True
+        assert execute.call_count == 2
+
+    assert cache.hits == 2
+    print("[SUCCESS] Firmas reutilizadas desde la caché.\n")
+
+def test_utxo_still_checked_when_cached():
+    print(">> Ejecutando: test_utxo_still_checked_when_cached...")
+
+    cache = ValidationCache()
+    tx = create_spend_tx()
+
+    with patch('akm.core.scripting.engine.ScriptEngine.execute', return_value=True):
+        assert TransactionRulesValidator(create_utxo_set(), cache).validate(tx) is True
+
+        # El UTXO fue gastado por otro bloque en el intertanto
+        spent_set = MagicMock()
+        spent_set.get_utxo_by_reference.return_value = None
+        assert TransactionRulesValidator(spent_set, cache).validate(tx) is False
+
+    print("[SUCCESS] Disponibilidad de UTXOs re-verificada.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("  EJECUTANDO TESTS VALIDATION CACHE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_cache_is_bounded_lru()
+        test_scripts_skipped_when_cached()
+        test_utxo_still_checked_when_cached()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
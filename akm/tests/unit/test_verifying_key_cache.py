@@ -0,0 +1,102 @@
+# akm/tests/unit/test_verifying_key_cache.py
+'''
+Test Suite para VerifyingKeyCache:
+    Verifica que las claves públicas se parseen una sola vez, que las claves
+    calientes se precalculen sin alterar el veredicto y que la LRU sea acotada.
+
+    Functions::
+        test_parsed_key_reused(): Misma clave, mismo VerifyingKey; LRU acotada.
+        test_hot_key_precomputed_same_verdict(): Tablas precalculadas, mismas firmas válidas/inválidas.
+        test_malformed_key_not_cached(): Una clave inválida lanza y no ocupa la caché.
+'''
+
+import sys
+import os
+import hashlib
+
+from ecdsa import SigningKey, SECP256k1, util, BadSignatureError # type: ignore
+from ecdsa.keys import MalformedPointError # type: ignore
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.services.verifying_key_cache import VerifyingKeyCache
+
+def create_key(encoding: str = "compressed"):
+    signer = SigningKey.generate(curve=SECP256k1)
+    return signer, signer.get_verifying_key().to_string(encoding)
+
+def test_parsed_key_reused():
+    print(">> Ejecutando: test_parsed_key_reused...")
+
+    cache = VerifyingKeyCache(max_entries=2)
+    keys = [create_key()[1] for _ in range(3)]
+
+    first = cache.get(keys[0])
+    assert cache.get(keys[0]) is first
+    cache.get(keys[1])
+    cache.get(keys[2])
+
+    assert len(cache) == 2
+    assert cache.hits == 1 and cache.misses == 3
+    # keys[0] fue expulsada: se vuelve a parsear
+    assert cache.get(keys[0]) is not first
+    print("[SUCCESS] Claves parseadas reutilizadas desde la LRU.\n")
+
+def test_hot_key_precomputed_same_verdict():
+    print(">> Ejecutando: test_hot_key_precomputed_same_verdict...")
+
+    cache = VerifyingKeyCache(hot_threshold=3)
+    signer, public_key = create_key("raw")
+    digest = hashlib.sha256(b"sighash").digest()
+    signature = signer.sign_digest(digest, sigencode=util.sigencode_der)
+    other_digest = hashlib.sha256(b"otro").digest()
+
+    for use in range(5):
+        key = cache.get(public_key)
+        assert key.verify_digest(signature, digest, sigdecode=util.sigdecode_der)
+        try:
+            accepted = key.verify_digest(signature, other_digest, sigdecode=util.sigdecode_der)
+        except BadSignatureError:
+            accepted = False
+        assert not accepted
+        assert cache.precomputed == (1 if use >= 2 else 0)
+
+    # La clave sigue serializando igual tras el precálculo
+    assert cache.get(public_key).to_string("raw") == public_key
+    print("[SUCCESS] Clave caliente precalculada con el mismo veredicto.\n")
+
+def test_malformed_key_not_cached():
+    print(">> Ejecutando: test_malformed_key_not_cached...")
+
+    cache = VerifyingKeyCache()
+    try:
+        cache.get(b'\x02' + b'\xff' * 32)
+        parsed = True
+    except MalformedPointError:
+        parsed = False
+
+    assert not parsed
+    assert len(cache) == 0
+    print("[SUCCESS] Clave mal formada rechazada sin cachear.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print(" EJECUTANDO TESTS VERIFYING KEY CACHE (MANUAL)")
+    print("==========================================\n")
+
+    try:
+        test_parsed_key_reused()
+        test_hot_key_precomputed_same_verdict()
+        test_malformed_key_not_cached()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
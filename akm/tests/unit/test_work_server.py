@@ -0,0 +1,204 @@
+# akm/tests/unit/test_work_server.py
+'''
+Test Suite para WorkServer / WorkClient:
+    Verifica el reparto de trabajo por TCP en localhost con workers en proceso.
+
+    Functions::
+        test_workers_find_block(): Dos workers envían shares y uno encuentra el bloque.
+        test_new_tip_invalidates_work(): Tras un tip nuevo, los shares viejos son 'stale'.
+        test_seen_shares_evicted_with_jobs(): Los nonces vistos no sobreviven a su unidad.
+'''
+
+import sys
+import os
+import json
+import time
+import socket
+import threading
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+# Ajuste de ruta para ejecución directa
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '../../..'))
+if root_dir not in sys.path:
+    sys.path.append(root_dir)
+
+from akm.core.builders.block_template import BlockTemplate
+from akm.core.config.protocol_constants import ProtocolConstants
+from akm.core.models.block import Block
+from akm.core.services.block_hasher import BlockHasher
+from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
+from akm.core.utils.difficulty_utils import DifficultyUtils
+from akm.infra.network.work_server import WorkServer
+from akm.infra.network.work_client import WorkClient
+
+MINER = "1MinerAddressTest"
+
+class FakeMiningManager:
+    """Solo expone la plantilla (1 de cada 4096 hashes cumple el bloque)."""
+    def __init__(self) -> None:
+        self.template = BlockTemplate(
+            index=5,
+            previous_hash="ab" * 32,
+            bits="1f0fffff",
+            miner_address=MINER,
+            subsidy=5000,
+            max_tx_count=100,
+            transactions=[]
+        )
+
+    def get_block_template(self, miner_address: str) -> BlockTemplate:
+        return self.template
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def connect(port: int) -> socket.socket:
+    # El servidor abre su socket en un hilo: reintentamos brevemente
+    for _ in range(50):
+        try:
+            return socket.create_connection(("127.0.0.1", port), timeout=5.0)
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+    raise AssertionError("WorkServer no disponible")
+
+def wait_until(condition, timeout: float = 20.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+def test_workers_find_block():
+    print(">> Ejecutando: test_workers_find_block...")
+
+    found: List[Block] = []
+    server = WorkServer(
+        mining_manager=FakeMiningManager(),
+        address_provider=lambda: MINER,
+        on_block_found=lambda block: found.append(block) is None,
+        port=free_port(),
+        share_bits="2000ffff"
+    )
+    server.start()
+    connect(server.port).close()
+
+    workers = [WorkClient("127.0.0.1", server.port, agent=f"test-{i}") for i in range(2)]
+    try:
+        for worker in workers:
+            worker.start()
+
+        assert wait_until(lambda: len(found) >= 1)
+        assert wait_until(lambda: sum(w.blocks_found for w in workers) >= 1)
+    finally:
+        for worker in workers:
+            worker.stop()
+        server.stop()
+
+    block = found[0]
+    assert block.hash == BlockHasher.calculate(block)
+    assert int(block.hash, 16) <= DifficultyUtils.bits_to_target(block.bits)
+    assert block.merkle_root == MerkleTreeBuilder.build([tx.tx_hash for tx in block.transactions])
+
+    stats = server.get_stats()
+    assert stats["blocks_found"] >= 1
+    # El objetivo de share es más fácil que el del bloque: llegan shares sin bloque
+    assert stats["shares_accepted"] > stats["blocks_found"]
+    print("[SUCCESS] Workers en localhost encontraron un bloque válido.\n")
+
+def test_new_tip_invalidates_work():
+    print(">> Ejecutando: test_new_tip_invalidates_work...")
+
+    server = WorkServer(
+        mining_manager=FakeMiningManager(),
+        address_provider=lambda: MINER,
+        on_block_found=lambda block: True,
+        port=free_port()
+    )
+    server.start()
+    sock = connect(server.port)
+    reader = sock.makefile('rb')
+
+    def send(msg_type: str, payload: Dict[str, Any]) -> None:
+        sock.sendall(json.dumps({"type": msg_type, "payload": payload}).encode('utf-8') + b'\n')
+
+    def receive() -> Dict[str, Any]:
+        return json.loads(reader.readline().decode('utf-8'))
+
+    try:
+        send(ProtocolConstants.MSG_WORK_SUBSCRIBE, {"agent": "raw"})
+        first = receive()["payload"]
+        assert first["clean"] is True
+        assert len(bytes.fromhex(first["prefix"])) == 80
+
+        # Cada unidad trae su propio extra-nonce
+        send(ProtocolConstants.MSG_WORK_GET, {})
+        second = receive()["payload"]
+        assert second["extra_nonce"] != first["extra_nonce"]
+        assert second["prefix"] != first["prefix"]
+
+        server.notify_new_tip()
+        fresh = receive()["payload"]
+        assert fresh["clean"] is True
+
+        send(ProtocolConstants.MSG_WORK_SUBMIT, {"job_id": first["job_id"], "nonce": 0})
+        result = receive()
+        assert result["type"] == ProtocolConstants.MSG_WORK_RESULT
+        assert result["payload"]["accepted"] is False
+        assert result["payload"]["reason"] == "stale"
+    finally:
+        reader.close()
+        sock.close()
+        server.stop()
+    print("[SUCCESS] Trabajo invalidado ante un tip nuevo.\n")
+
+def test_seen_shares_evicted_with_jobs():
+    print(">> Ejecutando: test_seen_shares_evicted_with_jobs...")
+
+    server = WorkServer(
+        mining_manager=FakeMiningManager(),
+        address_provider=lambda: MINER,
+        on_block_found=lambda block: False,
+        port=free_port()
+    )
+    reasons: List[str] = []
+
+    def capture(peer_id: str, msg_type: str, payload: Dict[str, Any]) -> None:
+        reasons.append(payload.get("reason", ""))
+
+    with patch.object(WorkServer, 'MAX_JOBS', 4), patch.object(server, '_send', side_effect=capture):
+        for _ in range(20):
+            job = server._create_job("worker")
+            assert job is not None
+            server._handle_submit("worker", {"job_id": job.job_id, "nonce": 0})
+
+        # Mismo nonce en la misma unidad: duplicado
+        server._handle_submit("worker", {"job_id": job.job_id, "nonce": 0})
+        assert reasons[-1] == "duplicate"
+        assert "duplicate" not in reasons[:-1]
+
+    # Acotado como las unidades (antes crecía hasta el próximo tip)
+    assert len(server._seen_shares) == server.get_stats()["active_jobs"] == 4
+    print("[SUCCESS] Shares vistos acotados por MAX_JOBS.\n")
+
+if __name__ == "__main__":
+    print("==========================================")
+    print("   EJECUTANDO TESTS WORK SERVER (MANUAL)  ")
+    print("==========================================\n")
+
+    try:
+        test_workers_find_block()
+        test_new_tip_invalidates_work()
+        test_seen_shares_evicted_with_jobs()
+
+        print("==========================================")
+        print("   TODOS LOS TESTS PASARON EXITOSAMENTE   ")
+        print("==========================================")
+    except AssertionError as e:
+        print(f"\nFALLO DE ASERCIÓN: {e}")
+    except Exception as e:
+        print(f"\nERROR INESPERADO: {e}")
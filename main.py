@@ -100,6 +100,14 @@ def inject_environment(config: dict[str, Any], instance_name: str, overrides: di
     cons = config.get("consensus", {})
     os.environ["AKM_MINING_ENABLED"] = str(cons.get("mining_enabled", False))
     os.environ["AKM_MINER_ADDRESS"] = cons.get("miner_address", "")
+    if "threads" in cons:
+        os.environ["AKM_MINING_THREADS"] = str(cons["threads"])
+    if "batch_size" in cons:
+        os.environ["AKM_MINING_BATCH_SIZE"] = str(cons["batch_size"])
+    if "check_interval" in cons:
+        os.environ["AKM_MINING_CHECK_INTERVAL"] = str(cons["check_interval"])
+    if "work_server_port" in cons:
+        os.environ["AKM_WORK_SERVER_PORT"] = str(cons["work_server_port"])
     
     pers = config.get("persistence", {})
     os.environ["AKM_STORAGE_ENGINE"] = pers.get("engine", "sqlite")
@@ -0,0 +1,84 @@
+import sys
+import os
+import gc
+import time
+import hashlib
+import logging
+import argparse
+import tracemalloc
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.models.block import Block
+
+def build_block_dict(tx_count: int, inputs_per_tx: int, outputs_per_tx: int):
+    """Bloque como llega del repositorio o de la red (dict con scripts en hex)."""
+    lock = (b'\x76\xa9\x14' + b'\x02' * 20 + b'\x88\xac').hex()
+    script_sig = (bytes([72]) + b'\x30' * 72 + bytes([33]) + b'\x02' * 33).hex()
+
+    transactions = []
+    for i in range(tx_count):
+        transactions.append({
+            "tx_hash": hashlib.sha256(f"tx-{i}".encode()).hexdigest(),
+            "timestamp": 1700000000 + i,
+            "fee": 100,
+            "inputs": [{
+                "previous_tx_hash": hashlib.sha256(f"prev-{i}-{j}".encode()).hexdigest(),
+                "output_index": j,
+                "script_sig": script_sig
+            } for j in range(inputs_per_tx)],
+            "outputs": [{"value_alba": 1000 + k, "script_pubkey": lock} for k in range(outputs_per_tx)]
+        })
+
+    header = {
+        "index": 1, "timestamp": 1700000000, "previous_hash": "ab" * 32, "bits": "1d00ffff",
+        "merkle_root": "cd" * 32, "nonce": 0, "hash": "ef" * 32
+    }
+    return {"header": header, "transactions": transactions}
+
+def iterate(block: Block, rounds: int) -> int:
+    """Recorrido tipo _update_utxo_state / validadores: inputs y outputs de cada TX."""
+    touched = 0
+    for _ in range(rounds):
+        for tx in block.transactions:
+            for inp in tx.inputs:
+                touched += inp.output_index
+            for out in tx.outputs:
+                touched += out.value_alba
+    return touched
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria y latencia de decodificar y recorrer un bloque")
+    parser.add_argument("--txs", type=int, default=2000)
+    parser.add_argument("--inputs", type=int, default=2, help="Inputs por TX")
+    parser.add_argument("--outputs", type=int, default=2, help="Outputs por TX")
+    parser.add_argument("--rounds", type=int, default=20, help="Recorridos completos del bloque")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    data = build_block_dict(args.txs, args.inputs, args.outputs)
+    print(f"📊 Bloque de {args.txs} TXs ({args.inputs} inputs, {args.outputs} outputs c/u)...\n")
+
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    block = Block.from_dict(data)
+    decode_ms = (time.perf_counter() - t0) * 1000
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    iterate(block, args.rounds)
+    iterate_ms = (time.perf_counter() - t0) * 1000 / args.rounds
+
+    print(f"{'Decodificación':<26} | {decode_ms:>9.1f} ms")
+    print(f"{'Memoria del bloque':<26} | {memory / 1024:>9.1f} KiB ({memory / args.txs:,.0f} B/TX)")
+    print(f"{'Recorrido inputs/outputs':<26} | {iterate_ms:>9.2f} ms")
+
+if __name__ == "__main__":
+    main()
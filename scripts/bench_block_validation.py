@@ -0,0 +1,87 @@
+import sys
+import os
+import time
+import hashlib
+import logging
+import argparse
+from typing import List
+from unittest.mock import MagicMock
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.models.transaction import Transaction
+from akm.core.models.tx_input import TxInput
+from akm.core.models.tx_output import TxOutput
+from akm.core.services.signature_batch_verifier import SignatureBatchVerifier
+from akm.core.services.transaction_hasher import TransactionHasher
+from akm.core.validators.block_rules_validator import BlockRulesValidator
+
+def build_block(tx_count: int):
+    """Bloque sintético de TXs P2PKH de 1 input firmadas con la misma llave."""
+    key = SigningKey.generate(curve=SECP256k1)
+    public_key = key.get_verifying_key().to_string()
+    key_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
+    lock_script = b'\x76\xa9' + bytes([len(key_hash)]) + key_hash + b'\x88\xac'
+
+    txs: List[Transaction] = []
+    for i in range(tx_count):
+        prev = hashlib.sha256(f"utxo-{i}".encode()).hexdigest()
+        unsigned = Transaction("", 1_700_000_000, [TxInput(prev, 0, b'')], [TxOutput(90, lock_script)], 10)
+        signature = key.sign_digest(unsigned.get_hash_for_signature(0), sigencode=util.sigencode_der)
+        script_sig = bytes([len(signature)]) + signature + bytes([len(public_key)]) + public_key
+        tx = Transaction("", unsigned.timestamp, [TxInput(prev, 0, script_sig)], unsigned.outputs, 10)
+        tx.tx_hash = TransactionHasher.calculate(tx)
+        txs.append(tx)
+
+    coinbase = MagicMock(spec=Transaction)
+    coinbase.is_coinbase = True
+    block = MagicMock()
+    block.transactions = [coinbase] + txs
+    block.hash = "00" * 32
+    block.index = 1
+
+    utxo_set = MagicMock()
+    utxo_set.get_utxo_by_reference.return_value = TxOutput(100, lock_script)
+    return block, utxo_set
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de validación de TXs de un bloque (firmas en lote)")
+    parser.add_argument("--txs", type=int, default=2_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"📊 Generando bloque de {args.txs:,} TXs firmadas...")
+    block, utxo_set = build_block(args.txs)
+
+    print(f"\n{'Procesos':>9} | {'Tiempo':>9} | {'Firmas/s':>9} | {'Mejora':>7}")
+    print("-" * 44)
+
+    baseline = None
+    for workers in args.workers:
+        verifier = SignatureBatchVerifier(workers)
+        validator = BlockRulesValidator(utxo_set, None, verifier)
+        try:
+            # Calentamiento: arranque del pool fuera de la medición
+            if workers > 1:
+                verifier._get_executor().submit(abs, 0).result()
+
+            t0 = time.perf_counter()
+            invalid = validator.find_invalid_transactions(block, stop_at_first=True)
+            elapsed = time.perf_counter() - t0
+        finally:
+            verifier.shutdown()
+
+        assert not invalid
+        baseline = baseline or elapsed
+        print(f"{workers:>9} | {elapsed:>8.2f}s | {args.txs / elapsed:>9,.0f} | {baseline / elapsed:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import sys
+import os
+import time
+import logging
+import argparse
+import threading
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.models.transaction import Transaction
+from akm.core.services.mempool import Mempool
+from akm.core.utils.crypto_utility import CryptoUtility
+
+def build_txs(count: int, tag: str):
+    return [
+        Transaction(
+            tx_hash=CryptoUtility.double_sha256(f"{tag}-{i}"),
+            timestamp=int(time.time()),
+            inputs=[],
+            outputs=[],
+            fee=i % 97
+        )
+        for i in range(count)
+    ]
+
+def run_scenario(producers: int, txs_per_producer: int, stripes: int):
+    """
+    N productores insertan en paralelo mientras un lector (API/minero)
+    consulta conteo, pertenencia y selección para bloque en bucle.
+    """
+    os.environ["AKM_MEMPOOL_MAX"] = str(producers * txs_per_producer + 1)
+    mempool = Mempool(stripes=stripes)
+
+    batches = [build_txs(txs_per_producer, f"p{p}") for p in range(producers)]
+    start_gate = threading.Barrier(producers + 1)
+    stop_reader = threading.Event()
+    reads = [0]
+
+    def producer(batch):
+        start_gate.wait()
+        for tx in batch:
+            mempool.add_transaction(tx)
+
+    def reader():
+        probe = batches[0][0].tx_hash
+        while not stop_reader.is_set():
+            mempool.get_pending_count()
+            mempool.contains(probe)
+            if reads[0] % 50 == 0:
+                mempool.get_transactions_for_block(max_count=100)
+            reads[0] += 1
+
+    threads = [threading.Thread(target=producer, args=(b,)) for b in batches]
+    reader_thread = threading.Thread(target=reader)
+    for t in threads:
+        t.start()
+    reader_thread.start()
+
+    t0 = time.perf_counter()
+    start_gate.wait()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    stop_reader.set()
+    reader_thread.join()
+
+    total = producers * txs_per_producer
+    assert mempool.get_pending_count() == total
+    return total / elapsed, reads[0] / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de concurrencia del Mempool")
+    parser.add_argument("--txs", type=int, default=5000, help="TXs por productor")
+    parser.add_argument("--producers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    # Silenciamos los logs INFO por TX para medir solo el pool
+    logging.disable(logging.INFO)
+
+    print(f"📊 Mempool: {args.txs} TXs por productor + 1 lector concurrente\n")
+    print(f"{'Productores':>12} | {'Stripes':>7} | {'Altas/s':>12} | {'Lecturas/s':>12}")
+    print("-" * 53)
+    for producers in args.producers:
+        for stripes in (1, 16):
+            adds, reads = run_scenario(producers, args.txs, stripes)
+            print(f"{producers:>12} | {stripes:>7} | {adds:>12,.0f} | {reads:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import sys
+import os
+import time
+import hashlib
+import logging
+import argparse
+from typing import List
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.services.merkle_tree_builder import MerkleTreeBuilder
+from akm.core.utils.crypto_utility import CryptoUtility
+
+def pairwise_root(hashes: List[str]) -> str:
+    """Construcción original: una llamada a double_sha256 por par."""
+    while len(hashes) > 1:
+        if len(hashes) % 2 != 0:
+            hashes = hashes + [hashes[-1]]
+        hashes = [CryptoUtility.double_sha256(hashes[i] + hashes[i + 1]) for i in range(0, len(hashes), 2)]
+    return hashes[0]
+
+def measure(fn, rounds: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - t0) / rounds * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la raíz Merkle (par a par vs por lotes)")
+    parser.add_argument("--leaves", type=int, nargs="+", default=[100, 2_000, 20_000])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"📊 Raíz Merkle: {args.rounds} rondas por escenario (ms por raíz)\n")
+    print(f"{'Hojas':>8} | {'Par a par':>10} | {'Lote x1':>10} | {f'Lote x{args.threads}':>10} | {'Mejora':>7}")
+    print("-" * 58)
+
+    for count in args.leaves:
+        leaves = [hashlib.sha256(f"tx-{i}".encode()).hexdigest() for i in range(count)]
+        assert MerkleTreeBuilder.build(leaves) == pairwise_root(leaves)
+
+        before = measure(lambda: pairwise_root(leaves), args.rounds)
+        batch = measure(lambda: MerkleTreeBuilder.build(leaves), args.rounds)
+        batch_mt = measure(lambda: MerkleTreeBuilder.build(leaves, threads=args.threads), args.rounds)
+        print(f"{count:>8,} | {before:>10.3f} | {batch:>10.3f} | {batch_mt:>10.3f} | {before / batch:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import sys
+import os
+import time
+import logging
+import argparse
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.builders.mining_engine import MiningEngine
+
+# Header de 84 bytes sin el nonce: índice, prev, merkle, timestamp, bits
+PREFIX = bytes(4) + b'\xab' * 32 + b'\xcd' * 32 + bytes(8) + bytes.fromhex("1d00ffff")
+
+def run_scenario(threads: int, nonces: int) -> float:
+    """Recorre 'nonces' con un objetivo imposible y mide h/s agregados."""
+    engine = MiningEngine(threads=threads)
+    try:
+        # Calentamiento: arranque de procesos fuera de la medición
+        engine.search(PREFIX, 0, 0, threads * 1000)
+
+        t0 = time.perf_counter()
+        engine.search(PREFIX, 0, 0, nonces)
+        elapsed = time.perf_counter() - t0
+        return nonces / elapsed
+    finally:
+        engine.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escalado del motor de minado")
+    parser.add_argument("--nonces", type=int, default=2_000_000, help="Nonces por escenario")
+    parser.add_argument("--threads", type=int, nargs="+", default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    cores = os.cpu_count() or 1
+    threads_list = args.threads or sorted({1, 2, 4, cores})
+
+    print(f"📊 Motor de minado: {args.nonces:,} nonces por escenario ({cores} núcleos)\n")
+    print(f"{'Procesos':>9} | {'Hashrate':>14} | {'Escalado':>9}")
+    print("-" * 39)
+    base = None
+    for threads in threads_list:
+        rate = run_scenario(threads, args.nonces)
+        base = base or rate
+        print(f"{threads:>9} | {rate:>10,.0f} h/s | {rate / base:>8.2f}x")
+
+if __name__ == "__main__":
+    main()
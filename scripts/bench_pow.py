@@ -0,0 +1,82 @@
+import sys
+import os
+import time
+import logging
+import struct
+import argparse
+from dataclasses import dataclass
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.services.block_hasher import BlockHasher
+from akm.core.services.mining_hasher import MiningHasher
+from akm.core.utils.crypto_utility import CryptoUtility
+
+@dataclass
+class Header:
+    index: int = 1000
+    timestamp: int = 1_700_000_000
+    previous_hash: str = "00" * 4 + "ab" * 28
+    bits: str = "1d00ffff"
+    merkle_root: str = "cd" * 32
+    nonce: int = 0
+
+def bench_block_hasher(nonces: int) -> float:
+    """Bucle original: serialización completa + hex + int() por nonce."""
+    header = Header()
+    target = 0
+    t0 = time.perf_counter()
+    for nonce in range(nonces):
+        header.nonce = nonce
+        if int(BlockHasher.calculate(header), 16) <= target:
+            break
+    return nonces / (time.perf_counter() - t0)
+
+def bench_mining_hasher(nonces: int) -> float:
+    """Prefijo precalculado + copia del estado SHA-256 + comparación en bytes."""
+    hasher = MiningHasher(BlockHasher.serialize_prefix(Header()), target=0)
+    t0 = time.perf_counter()
+    hasher.scan(0, nonces)
+    return nonces / (time.perf_counter() - t0)
+
+def bench_batch(nonces: int, threads: int, chunk: int = 4096) -> float:
+    """Headers completos (84 bytes) en un buffer contiguo, hasheados con la API por lotes."""
+    prefix = BlockHasher.serialize_prefix(Header())
+    item = len(prefix) + 4
+    buffer = bytearray(prefix + bytes(4)) * chunk
+    t0 = time.perf_counter()
+    for base in range(0, nonces, chunk):
+        for slot in range(chunk):
+            struct.pack_into("<I", buffer, slot * item + len(prefix), base + slot)
+        CryptoUtility.double_sha256_batch(buffer, item_size=item, threads=threads)
+    done = -(-nonces // chunk) * chunk
+    return done / (time.perf_counter() - t0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del bucle de PoW (un proceso)")
+    parser.add_argument("--nonces", type=int, default=500_000)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    before = bench_block_hasher(args.nonces)
+    after = bench_mining_hasher(args.nonces)
+    batch = bench_batch(args.nonces, threads=1)
+    batch_mt = bench_batch(args.nonces, threads=args.threads)
+
+    print(f"📊 PoW: {args.nonces:,} nonces en un solo proceso\n")
+    print(f"{'Hasher':>14} | {'Hashrate':>14}")
+    print("-" * 33)
+    print(f"{'BlockHasher':>14} | {before:>10,.0f} h/s")
+    print(f"{'MiningHasher':>14} | {after:>10,.0f} h/s")
+    print(f"{'Lote x1':>14} | {batch:>10,.0f} h/s")
+    print(f"{f'Lote x{args.threads}':>14} | {batch_mt:>10,.0f} h/s")
+    print(f"\nMejora: {after / before:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import sys
+import os
+import time
+import hashlib
+import logging
+import argparse
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.scripting.engine import ScriptEngine
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
+
+def build_workload(inputs: int):
+    """Pares (script_sig, script_pubkey, sighash) P2PKH estándar con firmas reales."""
+    signer = SigningKey.generate(curve=SECP256k1)
+    public_key = signer.get_verifying_key().to_string("compressed")
+    key_hash = hashlib.new('ripemd160', hashlib.sha256(public_key).digest()).digest()
+    lock = b'\x76\xa9\x14' + key_hash + b'\x88\xac'
+
+    workload = []
+    for i in range(inputs):
+        sighash = hashlib.sha256(f"sighash-{i}".encode()).digest()
+        signature = signer.sign_digest(sighash, sigencode=util.sigencode_der)
+        script_sig = bytes([len(signature)]) + signature + bytes([len(public_key)]) + public_key
+        workload.append((script_sig, lock, sighash))
+    return workload
+
+def run(workload, fast_path: bool, verify_ecdsa: bool) -> float:
+    backend = SignatureBackendFactory.active()
+
+    def verifier(signature, public_key, sighash, input_index):
+        return backend.verify(sighash, public_key, signature) if verify_ecdsa else True
+
+    engine = ScriptEngine(signature_verifier=verifier, fast_path=fast_path)
+    t0 = time.perf_counter()
+    for script_sig, lock, sighash in workload:
+        assert engine.execute(script_sig, lock, sighash, 0)
+    return (time.perf_counter() - t0) / len(workload) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Ruta rápida P2PKH vs VM genérica del ScriptEngine")
+    parser.add_argument("--inputs", type=int, default=2000)
+    parser.add_argument("--ecdsa", action="store_true", help="Incluir la verificación real de la firma")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    mode = f"con ECDSA ({SignatureBackendFactory.active().name})" if args.ecdsa else "sin ECDSA (solo script)"
+    print(f"📊 {args.inputs} inputs P2PKH, {mode}...\n")
+    workload = build_workload(args.inputs)
+
+    generic = run(workload, fast_path=False, verify_ecdsa=args.ecdsa)
+    fast = run(workload, fast_path=True, verify_ecdsa=args.ecdsa)
+
+    print(f"{'Ruta':<14} | {'µs/input':>9} | {'Mejora':>7}")
+    print("-" * 37)
+    print(f"{'VM genérica':<14} | {generic:>9.2f} | {1:>6.2f}x")
+    print(f"{'P2PKH directa':<14} | {fast:>9.2f} | {generic / fast:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import sys
+import os
+import time
+import hashlib
+import logging
+import argparse
+
+from ecdsa import SigningKey, SECP256k1, util # type: ignore
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.infra.crypto.signature_backend_factory import SignatureBackendFactory
+
+def build_workload(keys: int, signatures: int, encoding: str):
+    """Firmas válidas repartidas en 'keys' claves."""
+    signers = [SigningKey.generate(curve=SECP256k1) for _ in range(keys)]
+    public_keys = [signer.get_verifying_key().to_string(encoding) for signer in signers]
+
+    workload = []
+    for i in range(signatures):
+        digest = hashlib.sha256(f"sighash-{i}".encode()).digest()
+        signature = signers[i % keys].sign_digest(digest, sigencode=util.sigencode_der)
+        workload.append((digest, public_keys[i % keys], signature))
+    return workload
+
+def run(workload, backend) -> float:
+    t0 = time.perf_counter()
+    for digest, public_key, signature in workload:
+        assert backend.verify(digest, public_key, signature)
+    return len(workload) / (time.perf_counter() - t0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput de verificación por backend de firmas")
+    parser.add_argument("--keys", type=int, default=50, help="Claves distintas en la carga")
+    parser.add_argument("--signatures", type=int, default=1000)
+    parser.add_argument("--encoding", default="compressed", choices=["raw", "compressed", "uncompressed"])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    available = SignatureBackendFactory.available()
+    print(f"📊 {args.signatures} firmas sobre {args.keys} claves ({args.encoding}). Backends: {', '.join(available)}\n")
+    workload = build_workload(args.keys, args.signatures, args.encoding)
+
+    reference = run(workload, SignatureBackendFactory.get(SignatureBackendFactory.REFERENCE))
+    print(f"{'Backend':<10} | {'Verif./s':>9} | {'Mejora':>7}")
+    print("-" * 33)
+    for name in available:
+        rate = reference if name == SignatureBackendFactory.REFERENCE else run(workload, SignatureBackendFactory.get(name))
+        print(f"{name:<10} | {rate:>9,.0f} | {rate / reference:>6.2f}x")
+    print(f"\n'auto' selecciona: {SignatureBackendFactory.create('auto').name}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import sys
+import os
+import time
+import hashlib
+import logging
+import argparse
+
+from ecdsa import SigningKey, VerifyingKey, SECP256k1, util # type: ignore
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.services.verifying_key_cache import VerifyingKeyCache
+
+def build_workload(keys: int, signatures: int, encoding: str):
+    """Firmas repartidas en pocas claves (un procesador de pagos reutiliza las suyas)."""
+    signers = [SigningKey.generate(curve=SECP256k1) for _ in range(keys)]
+    public_keys = [signer.get_verifying_key().to_string(encoding) for signer in signers]
+
+    workload = []
+    for i in range(signatures):
+        digest = hashlib.sha256(f"sighash-{i}".encode()).digest()
+        signature = signers[i % keys].sign_digest(digest, sigencode=util.sigencode_der)
+        workload.append((digest, public_keys[i % keys], signature))
+    return workload
+
+def run(workload, parse) -> float:
+    t0 = time.perf_counter()
+    for digest, public_key, signature in workload:
+        assert parse(public_key).verify_digest(signature, digest, sigdecode=util.sigdecode_der)
+    return len(workload) / (time.perf_counter() - t0)
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de verificación ECDSA con claves parseadas en caché")
+    parser.add_argument("--keys", type=int, default=5, help="Claves distintas en la carga")
+    parser.add_argument("--signatures", type=int, default=400)
+    parser.add_argument("--encoding", default="compressed", choices=["raw", "compressed", "uncompressed"])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"📊 {args.signatures} firmas sobre {args.keys} claves ({args.encoding})...\n")
+    workload = build_workload(args.keys, args.signatures, args.encoding)
+
+    before = run(workload, lambda key: VerifyingKey.from_string(key, curve=SECP256k1))
+    parsed_only = run(workload, VerifyingKeyCache(hot_threshold=sys.maxsize).get)
+    hot = VerifyingKeyCache()
+    precomputed = run(workload, hot.get)
+
+    print(f"{'Escenario':<28} | {'Verif./s':>9} | {'Mejora':>7}")
+    print("-" * 51)
+    print(f"{'from_string por firma':<28} | {before:>9,.0f} | {1:>6.2f}x")
+    print(f"{'LRU de claves parseadas':<28} | {parsed_only:>9,.0f} | {parsed_only / before:>6.2f}x")
+    print(f"{'LRU + tablas precalculadas':<28} | {precomputed:>9,.0f} | {precomputed / before:>6.2f}x")
+    print(f"\nClaves precalculadas: {hot.precomputed} | aciertos LRU: {hot.hits}/{hot.hits + hot.misses}")
+
+if __name__ == "__main__":
+    main()
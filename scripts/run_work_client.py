@@ -0,0 +1,42 @@
+import sys
+import os
+import time
+import logging
+import argparse
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.infra.network.work_client import WorkClient
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker de minado para el WorkServer de un MinerNode")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3333)
+    parser.add_argument("--agent", default=f"AlphaMark/Worker@{os.uname().nodename}")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    client = WorkClient(args.host, args.port, agent=args.agent)
+    client.start()
+
+    last_hashes, last_time = 0, time.time()
+    try:
+        while True:
+            time.sleep(10)
+            now = time.time()
+            rate = (client.hashes - last_hashes) / (now - last_time)
+            last_hashes, last_time = client.hashes, now
+            print(
+                f"⛏️ {rate:,.0f} h/s | Job: {client.current_job_id} | "
+                f"Shares: {client.shares_accepted}/{client.shares_sent} | Bloques: {client.blocks_found}"
+            )
+    except KeyboardInterrupt:
+        client.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import sys
+import os
+import logging
+import argparse
+
+# --- AJUSTE DE RUTAS ---
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, root_dir)
+
+# --- IMPORTACIONES ---
+from akm.core.simulation.mining_simulator import MiningSimulator, MinerSpec
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación determinista de minado (calibración de AKM_BLOCK_TIME / AKM_DIFF_INTERVAL)")
+    parser.add_argument("--hashrates", type=float, nargs="+", default=[1_000_000, 500_000, 250_000], help="h/s de cada minero")
+    parser.add_argument("--blocks", type=int, default=500, help="Altura a alcanzar")
+    parser.add_argument("--latency", type=float, default=0.5, help="Latencia de propagación (s)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Jitter uniforme adicional (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--block-time", type=int, default=None, help="Sobrescribe AKM_BLOCK_TIME")
+    parser.add_argument("--diff-interval", type=int, default=None, help="Sobrescribe AKM_DIFF_INTERVAL")
+    parser.add_argument("--init-bits", default="auto", help="'auto' (calibrado al hashrate), 'config' (AKM_INIT_BITS) o bits hex")
+    parser.add_argument("--difficulty-factor", type=float, default=1.0, help="Con 'auto': dificultad inicial multiplicada por N (N < 1: más fácil)")
+    parser.add_argument("--step", action="append", default=[], help="Cambio de hashrate 'SEG:MINERO:HS' (ej. 3600:0:4000000)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    # La configuración de consenso se lee del entorno al construir los componentes
+    if args.block_time is not None:
+        os.environ["AKM_BLOCK_TIME"] = str(args.block_time)
+    if args.diff_interval is not None:
+        os.environ["AKM_DIFF_INTERVAL"] = str(args.diff_interval)
+    block_time = int(os.getenv("AKM_BLOCK_TIME", 60))
+
+    miners = [MinerSpec(f"miner-{i}", rate) for i, rate in enumerate(args.hashrates)]
+    if args.init_bits == "auto":
+        initial_bits = MiningSimulator.calibrated_bits(sum(args.hashrates) * args.difficulty_factor, block_time)
+    elif args.init_bits == "config":
+        initial_bits = None
+    else:
+        initial_bits = args.init_bits
+
+    sim = MiningSimulator(miners, args.latency, args.jitter, args.seed, initial_bits)
+    for step in args.step:
+        at, miner, rate = step.split(":")
+        sim.schedule_hashrate(float(at), f"miner-{int(miner)}", float(rate))
+
+    report = sim.run(args.blocks)
+
+    print(f"📊 Simulación: {report['miners']} mineros | semilla {report['seed']} | "
+          f"latencia {report['latency_sec']}s (+{report['jitter_sec']}s)")
+    print(f"   Objetivo: {report['target_block_time_sec']}s por bloque | reajuste cada {report['difficulty_interval']} bloques\n")
+
+    print(f"Altura:                {report['height']:,} ({report['sim_time_sec']:,.0f}s simulados)")
+    print(f"Intervalo medio:       {report['mean_interval_sec']:.2f}s (σ {report['interval_stdev_sec']:.2f}s, CV {report['interval_cv']:.2f})")
+    print(f"Bloques viejos:        {report['stale_blocks']}/{report['blocks_mined']} ({report['stale_rate']:.2%})")
+    print(f"Reorgs:                {report['reorgs']} (máx. profundidad {report['max_reorg_depth']}) {report['reorg_depths']}")
+    converged = report['converged_at_epoch']
+    print(f"Convergencia (±{MiningSimulator.CONVERGENCE_TOLERANCE:.0%}): "
+          f"{'época ' + str(converged) if converged is not None else 'no alcanzada'}\n")
+
+    print(f"{'Época':>6} | {'Bits':>9} | {'Intervalo':>10} | {'Ratio':>6}")
+    print("-" * 41)
+    for epoch in report["epochs"]:
+        print(f"{epoch['epoch']:>6} | {epoch['bits']:>9} | {epoch['mean_interval_sec']:>9.1f}s | {epoch['ratio']:>6.2f}")
+
+    print(f"\n{'Minero':>10} | {'Hashrate':>9} | {'Bloques':>8}")
+    print("-" * 34)
+    for name, share in report["miner_share"].items():
+        print(f"{name:>10} | {share['hashrate_share']:>9.2%} | {share['block_share']:>8.2%}")
+
+if __name__ == "__main__":
+    main()